@@ -82,6 +82,7 @@ class Predictor(BaseClass):
                               gm.range_low
                           """
         
+        self._session.flush_writes()
         game_start_time, game_end_time, high_range, low_range, total_hints = self._db.run_query(game_info_query, fetch='all')[0]
         
         range_size = int(high_range) - int(low_range) + 1
@@ -112,12 +112,10 @@ class HintChessScore(UserMetric):
         super().__init__(objects)
         self._name = "hint chess score"
         self._hints = self
-        self._original_hint_count = 0
         self._previous_values = []
     
     def _set_default_value(self):
         self._hints = self._objects.get_object("hints")
-        self._original_hint_count = self._hints.get_hint_count("relevant")
         return 1
     
     def _derive_metric(self):
@@ -135,8 +133,10 @@ class HintChessScore(UserMetric):
         return current_hint_chess_score
     
     def _calc_current_hint_chess_score(self):
+        # Hints are pulled as the game goes on, so the hints captured are counted out of every hint relevant so far.
         hints_given = self._hints.get_hint_count("given")
-        percent_hints_captured = (self._original_hint_count - self._hints.get_hint_count("relevant")) / self._original_hint_count
+        relevant_hint_total = self._hints.get_relevant_hint_total()
+        percent_hints_captured = (relevant_hint_total - self._hints.get_hint_count("relevant")) / relevant_hint_total
         current_hint_chess_score = percent_hints_captured / hints_given
         
         self._log_metric_calculation(percent_hints_captured, hints_given)
@@ -11,4 +11,5 @@ Modules:
     guess_data_storers.py
     outcome_data_storers.py
     data_storer_components.py
+    db_writer.py
 """
\ No newline at end of file
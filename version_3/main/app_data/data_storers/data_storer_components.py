@@ -20,7 +20,10 @@ class DataStorer:
     The DataStorer class defines a template for updating the database with information from a game.  It is
     not meant to be instantiated.  Instead, its subclasses, in most cases multiple levels down, are instantiated
     to update a table in the database based on a specific situation.  The update_db_table method is used to
-    run the query.  The _set_parameters method is used to customize the variables needed for the query.
+    run the query.  The _set_parameters method is used to customize the variables needed for the query.  The query
+    is run right away, unless a WriteBehindWriter object is set with the set_writer method, in which case it is added
+    to the writer to be written in the background.  Inserts whose id is needed later are run right away with the
+    _insert method instead, and the id of the new row is kept in memory.
     """
     
     _update_query = ""
@@ -30,6 +33,8 @@ class DataStorer:
         self._db = self._session.get_database()
         self._session_id = self._session.session_id
         self._parameters = {"session_id": int(self._session_id)}
+        self._writer = None
+        self._row_id = None
     
     def update_db_table(self):
         pass
@@ -39,6 +44,27 @@ class DataStorer:
     
     def get_parameters(self):
         return self._parameters
+    
+    def get_row_id(self):
+        return self._row_id
+    
+    def set_writer(self, writer):
+        self._writer = writer
+    
+    def _write(self, query, parameters=None):
+        if self._writer:
+            self._writer.add(query, parameters)
+        else:
+            self._db.run_query(query, parameters, _db_path=self._session._db_path)
+    
+    def _insert(self, query, parameters=None):
+        """This method runs an insert query right away, after any queries waiting in the writer, and saves the id
+        of the new row."""
+        
+        if self._writer:
+            self._row_id = self._writer.insert(query, parameters)
+        else:
+            self._row_id = self._db.run_insert(query, parameters, _db_path=self._session._db_path)
 
 
 
@@ -87,7 +113,8 @@ class StorageManager:
     """
     The StorageManager class is the base class for the manager classes for each type of database update.
     Its main method, update_database is used to delegate the specific implementation of the update to the
-    appropriate data storer object.
+    appropriate data storer object.  The updates are written in the background by the session's WriteBehindWriter
+    object.  The id of a new row is returned when the data storer inserts it right away.
     """
     
     def __init__(self, session, objects):
@@ -102,9 +129,13 @@ class StorageManager:
     
     def _process_update(self, db_update_obj, entry_type="Entered"):
         """This method standardizes database updates of all types by running the specific data storer object's
-        update_db_table method and then logging the entry in the database log."""
+        update_db_table method, with its query added to the session's writer, and then logging the entry in the
+        database log.  It returns the id of the new row, if the data storer saved one."""
         
+        db_update_obj.set_writer(self._session.get_writer())
         db_update_obj.update_db_table()
         if self._logs:
             db_record_log_entry = DBRecordLogEntry(self._logs, self._record_type, entry_type, db_update_obj.get_parameters())
-            db_record_log_entry.add_log_entry("database")
\ No newline at end of file
+            db_record_log_entry.add_log_entry("database")
+        
+        return db_update_obj.get_row_id()
\ No newline at end of file
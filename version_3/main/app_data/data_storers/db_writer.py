@@ -0,0 +1,136 @@
+"""
+The db_writer.py module is part of the data_storers package.  It is for writing the records of a session to the
+database in the background, so the app does not wait on the database each time a guess or an update to an
+outcome is stored.
+
+Classes:
+    WriteBehindWriter
+"""
+
+
+import atexit
+import itertools
+import threading
+
+
+
+class WriteBehindWriter:
+    """
+    The WriteBehindWriter class holds the queries the data storers would run and writes them to the database from a
+    background thread.  The queries are written once the number waiting reaches the batch size, or once they have
+    waited for the flush interval.  Each write groups the queries in order, runs each group of the same query with
+    executemany, and runs all of the groups in one transaction.
+    
+    The flush method writes everything waiting right away, on the calling thread.  It is called before any query that
+    reads back the current game, so those queries see every record added so far, and at the end of each game, once
+    the feedback for it has been recorded.  The close method flushes and stops the background thread.  It is also run
+    when the app exits.  If a write from the background thread fails, the error is raised by the next call to flush.
+    
+    The insert method is for records whose id is needed right away, which are the game and outcome records.  It
+    flushes, so the records are written in the order they were added, and then runs the insert on the calling thread
+    and returns the id of the new row.  So the writer flushes synchronously when a game starts and when it ends, and
+    only the records in between are written in the background.
+    
+    Attributes:
+        _db: The DBConnector object used to write to the database.
+        _db_path: The path to the database, or None to use the default database.
+        _batch_size: The number of queries waiting that starts a write.
+        _flush_interval: The longest time in seconds a query waits before it is written.
+        _pending: A list of the queries waiting to be written, as tuples of the query and its parameters.
+        _condition: A condition used to add to the list of queries waiting and to wake the background thread.
+        _write_lock: A lock that keeps the queries written in the order they were added.
+        _error: The error from the last failed write from the background thread, or None.
+        _closed: Whether the close method has been called.
+        _thread: The background thread.
+    """
+    
+    def __init__(self, db, db_path=None, batch_size=32, flush_interval=0.5):
+        self._db = db
+        self._db_path = db_path
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._pending = []
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._error = None
+        self._closed = False
+        
+        self._thread = threading.Thread(target=self._run, name="WriteBehindWriter", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+    
+    def add(self, query, parameters=None):
+        """This method adds a query to the list of queries waiting to be written.  The parameters are copied, so
+        they can be changed after the query is added."""
+        
+        parameters = dict(parameters) if parameters else ()
+        with self._condition:
+            self._pending.append((query, parameters))
+            if len(self._pending) >= self._batch_size:
+                self._condition.notify()
+    
+    def flush(self):
+        """This method writes every query waiting to the database on the calling thread."""
+        
+        with self._write_lock:
+            with self._condition:
+                pending, self._pending = self._pending, []
+            error, self._error = self._error, None
+            self._write(pending)
+        
+        if error:
+            raise error
+    
+    def insert(self, query, parameters=None):
+        """This method writes every query waiting and then runs an insert query, both synchronously on the calling
+        thread.  It is used for the game and outcome records, so it is where the writer flushes at the start and end
+        of each game.  It returns the id of the new row."""
+        
+        self.flush()
+        with self._write_lock:
+            return self._db.run_insert(query, parameters, _db_path=self._db_path)
+    
+    def get_pending_count(self):
+        with self._condition:
+            return len(self._pending)
+    
+    def close(self):
+        """This method stops the background thread and writes every query still waiting.  It can be called more
+        than once."""
+        
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        
+        self._thread.join()
+        atexit.unregister(self.close)
+        self.flush()
+    
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._closed or len(self._pending) >= self._batch_size,
+                                         timeout=self._flush_interval)
+                if self._closed:
+                    return
+            
+            with self._write_lock:
+                with self._condition:
+                    pending, self._pending = self._pending, []
+                try:
+                    self._write(pending)
+                except Exception as error:
+                    self._error = error
+    
+    def _write(self, pending):
+        """This method groups the queries waiting by query, keeping their order, and writes all of the groups in a
+        single transaction."""
+        
+        if not pending:
+            return
+        
+        batches = [(query, [parameters for _, parameters in group])
+                   for query, group in itertools.groupby(pending, key=lambda entry: entry[0])]
+        self._db.run_batch(batches, _db_path=self._db_path)
\ No newline at end of file
@@ -17,7 +17,8 @@ from app_data.data_storers.data_storer_components import DataStorer, ErrorStorer
 class GameDataStorer(DataStorer):
     """
     The GameDataStorer class inherits from DataStorer.  It is for entries into the game table in the database.
-    It does not add any new functionality; it is there for organizational purposes.
+    It does not add any new functionality; it is there for organizational purposes.  The game records are inserted
+    right away, since the game_id is needed for the rest of the game.
     """
     
     def update_db_table(self):
@@ -35,9 +36,9 @@ class GameEntry(GameDataStorer):
     """
     
     _update_query = """
-        INSERT INTO game(session_id, level_of_difficulty_type_id, range_low, range_high, winning_number, time, error) 
+        INSERT INTO game(session_id, level_of_difficulty_type_id, range_low, range_high, winning_number, time, error, seed) 
         VALUES (:session_id, :level_of_difficulty_type_id, :range_low, :range_high, :winning_number, 
-                datetime('now', 'localtime'), :error);
+                datetime('now', 'localtime'), :error, :seed);
         """
     
     def __init__(self, session, settings):
@@ -46,10 +47,11 @@ class GameEntry(GameDataStorer):
         self._level_id = self._settings.get_setting("level of difficulty id")
         self._range_low, self._range_high = self._settings.get_setting("number range")
         self._winning_number = self._settings.get_setting("winning number")
+        self._seed = self._settings.get_setting("seed")
     
     def update_db_table(self):
         self._set_parameters()
-        self._db.run_query(GameEntry._update_query, self._parameters, _db_path=self._session._db_path)
+        self._insert(GameEntry._update_query, self._parameters)
     
     def _set_parameters(self):
         self._parameters.update({
@@ -57,7 +59,8 @@ class GameEntry(GameDataStorer):
             "range_low": int(self._range_low),
             "range_high": int(self._range_high),
             "winning_number": int(self._winning_number),
-            "error": 0
+            "error": 0,
+            "seed": int(self._seed)
         })
 
 
@@ -80,13 +83,14 @@ class GameErrorEntry(GameDataStorer, ErrorStorer):
     def update_db_table(self):
         self._set_parameters()
         self._parameters = self.add_error_info(self._parameters, self._error_type)
-        self._db.run_query(GameErrorEntry._update_query, self._parameters, _db_path=self._session._db_path)
+        self._insert(GameErrorEntry._update_query, self._parameters)
 
 
 
 class GameStorageManager(StorageManager):
     """
-    The GameStorageManager class is the manager class for database updates when a game is initiated.  It
+    The GameStorageManager class is the manager class for database updates when a game is initiated.  The game_id
+    of the new record is kept on the session as the current game, and the outcome_id of the last game is cleared.  It
     inherits from StorageManager.
     """
     
@@ -100,4 +104,6 @@ class GameStorageManager(StorageManager):
         else:
             game_entry_obj = GameEntry(self._session, db_update_params["settings"])
         
-        self._process_update(game_entry_obj)
\ No newline at end of file
+        self._session.current_game_id = self._process_update(game_entry_obj)
+        self._session.current_outcome_id = None
+        self._session.current_hint_count = 0
\ No newline at end of file
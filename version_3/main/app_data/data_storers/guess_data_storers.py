@@ -13,6 +13,7 @@ Classes:
 
 
 from app_data.data_storers.data_storer_components import GameComponentStorer, ErrorStorer, StorageManager
+from concepts.hints import HintRecord
 
 
 
@@ -62,7 +63,9 @@ class GuessEntry(GuessDataStorer):
 class GuessHintEntry(GuessEntry):
     """
     The GuessHintEntry class inherits from GuessEntry.  It implements the updates for new guesses entered
-    with a hint.
+    with a hint.  The hint type id is read from the HintRecord object, and the hint is rendered as text to be stored.
+    The hint type of a hint passed in as text is looked up from the text.  The hint number follows the count of hints
+    given in the game so far, which the session keeps in memory.
     """
     
     _update_query = """
@@ -78,16 +81,19 @@ class GuessHintEntry(GuessEntry):
         
     def update_db_table(self):
         self._set_parameters()
-        self._db.run_query(GuessHintEntry._update_query, self._parameters, _db_path=self._session._db_path)
+        self._write(GuessHintEntry._update_query, self._parameters)
+        self._session.current_hint_count = self._parameters['hint_number']
     
     def _set_parameters(self):
-        hint_number = self._session.get_total_hints_given()
-        hint_number = 1 if not hint_number else hint_number[0] + 1
+        hint_number = self._session.current_hint_count + 1
         
-        hint_obj = self._hint_types_obj.get_hint_obj_from_hint(self._hint)
-        hint_type_id = hint_obj.get_id()
+        if isinstance(self._hint, HintRecord):
+            hint_type_id = self._hint.type_id
+        else:
+            hint_obj = self._hint_types_obj.get_hint_obj_from_hint(self._hint)
+            hint_type_id = hint_obj.get_id()
         
-        hint = self._hint if self._hint else None
+        hint = str(self._hint) if self._hint else None
         
         self._parameters.update({
             'hint_type_id': int(hint_type_id),
@@ -112,7 +118,7 @@ class GuessNoHintEntry(GuessEntry):
         super().__init__(session, guess, feedback)
     
     def update_db_table(self):
-        self._db.run_query(GuessNoHintEntry._update_query, self._parameters, _db_path=self._session._db_path)
+        self._write(GuessNoHintEntry._update_query, self._parameters)
 
 
 
@@ -134,7 +140,7 @@ class GuessErrorEntry(GuessDataStorer, ErrorStorer):
     def update_db_table(self):
         self._set_parameters()
         self._parameters = self.add_error_info(self._parameters, self._error_type)
-        self._db.run_query(GuessErrorEntry._update_query, self._parameters, _db_path=self._session._db_path)
+        self._write(GuessErrorEntry._update_query, self._parameters)
 
 
 
@@ -33,7 +33,7 @@ class OutcomeDataStorer(GameComponentStorer):
 class OutcomeEntry(OutcomeDataStorer):
     """
     The OutcomeEntry class inherits from OutcomeDataStorer.  It implements the updates for the conclusion of
-    a game.
+    a game.  The outcome record is inserted right away, so its outcome_id can be kept for the updates that follow.
     """
     
     _update_query = """
@@ -53,9 +53,9 @@ class OutcomeEntry(OutcomeDataStorer):
     def update_db_table(self):
         self._set_parameters()
         if self._outcome_obj.get_name() == "win":
-            self._db.run_query(OutcomeEntry._update_query, self._parameters, _db_path=self._session._db_path)
+            self._insert(OutcomeEntry._update_query, self._parameters)
         else:
-            self._db.run_query(OutcomeEntry._update_query_no_score, self._parameters, _db_path=self._session._db_path)
+            self._insert(OutcomeEntry._update_query_no_score, self._parameters)
     
     def _set_parameters(self):
         self._parameters.update({
@@ -71,14 +71,13 @@ class OutcomeEntry(OutcomeDataStorer):
 class OutcomeUpdater(OutcomeDataStorer):
     """
     The OutcomeUpdater class inherits from OutcomeDataStorer.  It is for new updates to the outcome table
-    in the database after the original outcome record was inserted.
+    in the database after the original outcome record was inserted.  The outcome_id of that record is taken from
+    the session, so it is not read back from the database.
     """
     
     def __init__(self, session):
         super().__init__(session)
-        
-        outcome_id_query = self._session.build_query("outcome_id", "outcome", "game_id", str(self._game_id))
-        self._outcome_id = self._db.run_query(outcome_id_query, fetch='one', _db_path=self._session._db_path)[0]
+        self._outcome_id = self._session.current_outcome_id
     
     def update_db_table(self):
         pass
@@ -98,7 +97,7 @@ class PlayAgainUpdate(OutcomeUpdater):
     
     def update_db_table(self):
         update_query = PlayAgainUpdate._update_query.format(self._outcome_id)
-        self._db.run_query(update_query, _db_path=self._session._db_path)
+        self._write(update_query)
 
 
 
@@ -120,7 +119,7 @@ class FeedbackUpdate(OutcomeUpdater):
         update_col, update_val = self._set_parameters()
         
         update_query = FeedbackUpdate._update_query.format(self._feedback_type, update_col, update_val, self._outcome_id)
-        self._db.run_query(update_query, _db_path=self._session._db_path)
+        self._write(update_query)
     
     def _set_parameters(self):
         if self._improvement_area_id:
@@ -153,10 +152,12 @@ class OutcomeStorageManager(StorageManager):
             self._update_outcome_record_in_db(db_update_params)
     
     def _add_outcome_record_to_db(self, db_update_params):
-        """This method adds a record to the outcome table in the database when a game is concluded."""
+        """This method adds a record to the outcome table in the database when a game is concluded.  The record is
+        inserted right away, after every record still waiting to be written, so the whole game is written when it
+        ends.  The outcome_id of the new record is kept on the session for the updates that follow."""
         
         outcome_entry_obj = OutcomeEntry(self._session, db_update_params["outcome_obj"])
-        self._process_update(outcome_entry_obj)
+        self._session.current_outcome_id = self._process_update(outcome_entry_obj)
     
     def _update_outcome_record_in_db(self, db_update_params):
         """This method takes the outcome record for the most recent game and updates play_again to 1 when 
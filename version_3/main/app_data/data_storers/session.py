@@ -11,6 +11,7 @@ Classes:
 from app_data.data_storers.game_data_storers import GameStorageManager
 from app_data.data_storers.guess_data_storers import GuessStorageManager
 from app_data.data_storers.outcome_data_storers import OutcomeStorageManager
+from app_data.data_storers.db_writer import WriteBehindWriter
 from resources.infrastructure.log_entries import NewSessionLogEntry
 from resources.infrastructure.iterable_log_entries import DBRecordLogEntry
 
@@ -20,30 +21,37 @@ class Session:
     """
     The Session class captures information about a live session of a user, including information about the 
     games played, guesses, hints, and outcome.  It also contains helper methods to query the database for
-    specific information as needed.
+    specific information as needed.  The records for guesses and the updates to outcomes are written in the
+    background by a WriteBehindWriter object.  The queries that read back the current game write any records still
+    waiting first.  The session, game, and outcome records are inserted right away instead, and their ids, returned by
+    the inserts, are kept in memory, so they are never read back from the database.  The number of hints given in the
+    current game is kept in memory as well, so storing a guess with a hint does not wait for the writes.
     """
     
-    def __init__(self, objects, _db_path=None):
+    def __init__(self, objects, _db_path=None, _write_behind=True):
         """The constructor method for this class takes in a game object and saves it as an attribute.  It 
-        also creates a session, adds it to the session table in the database, saves the session_id as an 
-        attribute and instantiates an AppData object."""
+        also creates a session, adds it to the session table in the database, saves the session_id returned by
+        the insert as an attribute and instantiates an AppData object.  If _write_behind is False, records are
+        written right away instead of in the background."""
         
         self._objects = objects
         self._db_manager = self._objects.get_object("db_manager")
         self._db = self.get_database()
         self._logs = self._objects.get_object("logs")
         self._db_path = _db_path
+        self._writer = WriteBehindWriter(self._db, self._db_path) if _write_behind else None
         self._data_storers = {
             "Game": GameStorageManager(self, self._objects),
             "Guess": GuessStorageManager(self, self._objects),
             "Outcome": OutcomeStorageManager(self, self._objects)
             }
         
-        self.add_session_record_to_db()
-        self.session_id = self._get_session_id()
+        self.session_id = self.add_session_record_to_db()
         
         self._game_ids = []
         self._current_game_id = None
+        self._current_outcome_id = None
+        self._current_hint_count = 0
     
     @property
     def current_game_id(self):
@@ -53,33 +61,75 @@ class Session:
     def current_game_id(self, new_value):
         self._current_game_id = new_value
     
+    @property
+    def current_outcome_id(self):
+        return self._current_outcome_id
+    
+    @current_outcome_id.setter
+    def current_outcome_id(self, new_value):
+        self._current_outcome_id = new_value
+    
+    @property
+    def current_hint_count(self):
+        return self._current_hint_count
+    
+    @current_hint_count.setter
+    def current_hint_count(self, new_value):
+        self._current_hint_count = new_value
+    
     def add_session_record_to_db(self):
-        """This method adds a new record to the session table in the database when the app is opened."""
+        """This method adds a new record to the session table in the database when the app is opened.  It
+        returns the session_id of the new record."""
         
         query = "INSERT INTO session(time) VALUES (datetime('now', 'localtime'))"
-        self._db.run_query(query, _db_path=self._db_path)
+        session_id = self._db.run_insert(query, _db_path=self._db_path)
+        
+        if self._logs:
+            session_log_entry = NewSessionLogEntry(self._logs, session_id)
+            session_log_entry.add_log_entry("database")
+        
+        return session_id
     
     def update_database(self, update_type, update_db_params):
         """This method delegates database updates to the appropriate data storers based on the type of
-        update: a new game initiated, a new guess entered, or a game concluding."""
+        update: a new game initiated, a new guess entered, or a game concluding.  The data storers keep the ids of
+        the new game and outcome records on the session."""
         
         data_storer = self._data_storers[update_type.title()]
         data_storer.update_database(update_db_params)
         
         if update_type == "game":
-            self.current_game_id = self._get_game_id()
+            self._game_ids.append(self.current_game_id)
     
     def get_database(self):
         return self._db_manager.get_database()
     
+    def get_writer(self):
+        return self._writer
+    
+    def flush_writes(self):
+        """This method writes every record still waiting to the database."""
+        
+        if self._writer:
+            self._writer.flush()
+    
+    def close(self):
+        """This method writes every record still waiting to the database and stops the background writer.  It is
+        called when the app is closed."""
+        
+        if self._writer:
+            self._writer.close()
+    
     def get_total_hints_given(self):
-        """This method returns the number of hints that were given for the most recent game of a session."""
+        """This method returns the number of hints that were given for the most recent game of a session, as stored in
+        the database.  The app itself uses the count kept in current_hint_count, which needs no flush."""
         
         query = """SELECT COUNT(hint) 
                    FROM guess 
                    WHERE game_id = """ + str(self.current_game_id) + """ 
                        AND hint IS NOT NULL"""
         
+        self.flush_writes()
         total_hints_given = self._db.run_query(query, fetch='one', _db_path=self._db_path)
         
         return total_hints_given
@@ -94,6 +144,7 @@ class Session:
                    WHERE g.game_id = """ + str(self.current_game_id) + """ 
                    ORDER BY g.guess_id DESC LIMIT 1"""
         
+        self.flush_writes()
         hint_type, hint = self._db.run_query(query, fetch='one', _db_path=self._db_path)
         
         return hint_type, hint
@@ -106,26 +157,6 @@ class Session:
         
         return int(session_count)
     
-    def _get_session_id(self):
-        """This method returns the most recent session_id from the session table."""
-        
-        query = "SELECT id FROM session ORDER BY time DESC LIMIT 1"
-        session_id = self._db.run_query(query, fetch='one', _db_path=self._db_path)[0]
-        
-        if self._logs:
-            session_log_entry = NewSessionLogEntry(self._logs, session_id)
-            session_log_entry.add_log_entry("database")
-        
-        return session_id
-    
-    def _get_game_id(self):
-        game_id_query = """SELECT game_id FROM game WHERE session_id = """ + str(self.session_id) + """ 
-                           ORDER BY time DESC LIMIT 1"""
-        game_id = self._db.run_query(game_id_query, fetch='one', _db_path=self._db_path)[0]
-        self._game_ids.append(game_id)
-        
-        return game_id
-    
     @staticmethod
     def build_query(target_col, table, filter_col=None, filter_val=None):
         query = "SELECT " + target_col + " FROM " + table
@@ -1,8 +1,11 @@
 """
-The db.py module is part of the app_data package.  It consists of 2 sets of classes: 1 for establishing a
-database connection and 1 for building the database for the app.
+The db.py module is part of the app_data package.  It consists of 3 sets of classes: 1 for establishing a
+database connection, 1 for building the database for the app and 1 for migrating the schema of an existing
+database.
 
 Classes:
+    SqliteConnectionManager
+    
     DBConnector
     SqliteDBConnector
     PostgreSqlDBConnector
@@ -12,23 +15,99 @@ Classes:
     PopulateTypesDBScriptor
     PopulateHintsDBScriptor
     
+    MigrationDBScriptor
+    ColumnsMigrationDBScriptor
+    ImplicationColumnsMigrationDBScriptor
+    IndexesMigrationDBScriptor
+    ExpertLevelMigrationDBScriptor
+    GameSeedColumnMigrationDBScriptor
+    UnusedIndexesMigrationDBScriptor
+    MigrateDBScriptor
+    
     DBManager
 """
 
 
 import os.path
+import time
+import itertools
+import threading
+import weakref
+import multiprocessing
 import pandas as pd
 
-from resources.infrastructure.log_entries import DBConnectorLogEntry, DBScriptorLogEntry, DBTableLogEntry, HintsPopulatedLogEntry
+from resources.infrastructure.log_entries import DBConnectorLogEntry, DBScriptorLogEntry, DBTableLogEntry, HintsPopulatedLogEntry, \
+    HintImplicationsStoredLogEntry, MigrationAppliedLogEntry
 from resources.infrastructure.iterable_log_entries import DBCreatedLogEntry, DBQueryLogEntry
-from resources.variables.create_db_queries import create_table_queries
-from concepts.concept_manager import ConceptManager
+from resources.variables.create_db_queries import create_table_queries, create_index_queries, create_schema_version_table
+from concepts.concept_registry import ConceptRegistry
 
 import sqlite3
 # import psycopg2   # PostgreSQL
 
 
 
+class SqliteConnectionManager:
+    """
+    The SqliteConnectionManager class keeps one long-lived connection to each SQLite database per thread, so a query
+    does not have to open and close a connection of its own.  Each connection is opened in WAL journal mode, which lets
+    the database be read while it is being written to, with the synchronous level passed in and a prepared statement
+    cache of the size passed in.  The close_all method closes every connection it has opened, from any thread.  Any
+    connections still open are also closed when the object is garbage collected or the app exits.
+    
+    Attributes:
+        _synchronous: The level of the synchronous pragma set on each connection.
+        _cached_statements: The number of prepared statements each connection keeps in its cache.
+        _connections: A dictionary of the open connections, keyed by thread id and database path.
+        _lock: A lock that keeps 2 threads from changing the dictionary of connections at once.
+    """
+    
+    _synchronous_levels = ("OFF", "NORMAL", "FULL", "EXTRA")
+    
+    def __init__(self, synchronous="NORMAL", cached_statements=256):
+        if synchronous.upper() not in SqliteConnectionManager._synchronous_levels:
+            raise ValueError(f"{synchronous} is not a synchronous level.")
+        
+        self._synchronous = synchronous.upper()
+        self._cached_statements = cached_statements
+        self._connections = {}
+        self._lock = threading.Lock()
+        weakref.finalize(self, SqliteConnectionManager._close_connections, self._connections, self._lock)
+    
+    def get_connection(self, db_path):
+        """This method returns the calling thread's connection to a database, opening it the first time."""
+        
+        key = (threading.get_ident(), db_path)
+        with self._lock:
+            if key not in self._connections:
+                self._connections[key] = self._open_connection(db_path)
+            return self._connections[key]
+    
+    def get_connection_count(self):
+        return len(self._connections)
+    
+    def close_all(self):
+        SqliteConnectionManager._close_connections(self._connections, self._lock)
+    
+    def _open_connection(self, db_path):
+        """This method opens a connection to a database and sets its pragmas.  The connection is not tied to the thread
+        that opened it, so the close_all method can close it from another thread, but only that thread is given it."""
+        
+        conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=self._cached_statements)
+        conn.execute("PRAGMA journal_mode = WAL;")
+        conn.execute(f"PRAGMA synchronous = {self._synchronous};")
+        
+        return conn
+    
+    @staticmethod
+    def _close_connections(connections, lock):
+        with lock:
+            for conn in connections.values():
+                conn.close()
+            connections.clear()
+
+
+
 class DBConnector:
     """
     The DBConnector class is a base class for establishing a connection to a database and executing queries.
@@ -43,53 +122,123 @@ class DBConnector:
     
     def run_query(self):
         pass
+    
+    def run_insert(self):
+        pass
+    
+    def run_many(self):
+        pass
+    
+    def run_batch(self):
+        pass
+    
+    def close(self):
+        pass
 
 
 
 class SqliteDBConnector(DBConnector):
     """
-    The SqliteDBConnector class implements the connection to a SQLite database.  It inherits from DBConnector.
+    The SqliteDBConnector class implements the connection to a SQLite database.  Its queries run on long-lived
+    connections, one per thread, held by a SqliteConnectionManager object.  It inherits from DBConnector.
     """
     
     _name = 'Sqlite'
     _db_name = 'sqlite_guess_that_number.db'
     _db_absolute_path = os.path.join(DBConnector._main_directory, _db_name)
     
+    def __init__(self, synchronous="NORMAL", cached_statements=256):
+        self._connections = SqliteConnectionManager(synchronous, cached_statements)
+    
     def run_query(self, query, parameters=None, fetch=None, include_cols=False, _db_path=None):
-        """This method creates a database connection and runs a query.  If fetch_result is true, it
-        returns the result."""
+        """This method runs a query on the calling thread's connection to the database and commits it.  If fetch is
+        'all' or 'one', it returns the result.  If the query fails, it is rolled back."""
         
         db_path = _db_path if _db_path else SqliteDBConnector._db_absolute_path
         
-        conn = sqlite3.connect(db_path)
+        conn = self._connections.get_connection(db_path)
         c = conn.cursor()
         
-        if parameters:
-            if fetch == 'all':
-                result = c.execute(query, parameters).fetchall()
-            elif fetch == 'one':
-                result = c.execute(query, parameters).fetchone()
-            else:
+        try:
+            if parameters:
                 c.execute(query, parameters)
-                result = None
-        else:
+            else:
+                c.execute(query)
+            
             if fetch == 'all':
-                result = c.execute(query).fetchall()
+                result = c.fetchall()
             elif fetch == 'one':
-                result = c.execute(query).fetchone()
+                result = c.fetchone()
             else:
-                c.execute(query)
                 result = None
-        
-        if include_cols:
-            cols = tuple([x[0] for x in c.description])
-        
-        conn.commit()
-        conn.close()
+            
+            if include_cols:
+                cols = tuple([x[0] for x in c.description])
+            
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            c.close()
         
         if include_cols:
             return result, cols
         return result
+    
+    def run_insert(self, query, parameters=None, _db_path=None):
+        """This method runs an insert query on the calling thread's connection to the database and commits it.  It
+        returns the id of the new row from the cursor's lastrowid, so the row does not need to be read back.  If the
+        query fails, it is rolled back."""
+        
+        db_path = _db_path if _db_path else SqliteDBConnector._db_absolute_path
+        
+        conn = self._connections.get_connection(db_path)
+        c = conn.cursor()
+        
+        try:
+            if parameters:
+                c.execute(query, parameters)
+            else:
+                c.execute(query)
+            
+            row_id = c.lastrowid
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            c.close()
+        
+        return row_id
+    
+    def run_many(self, query, parameters_list, _db_path=None):
+        """This method runs a query once for each set of parameters in a list with executemany.  All of the rows are
+        written in a single transaction, which is rolled back if any of them fail."""
+        
+        db_path = _db_path if _db_path else SqliteDBConnector._db_absolute_path
+        
+        conn = self._connections.get_connection(db_path)
+        with conn:
+            conn.executemany(query, parameters_list)
+    
+    def run_batch(self, batches, _db_path=None):
+        """This method runs a list of queries, each with a list of sets of parameters, with executemany.  Every query
+        in the list is run in a single transaction, which is rolled back if any of them fail.  The transaction is
+        begun explicitly, so it also covers queries that change the schema."""
+        
+        db_path = _db_path if _db_path else SqliteDBConnector._db_absolute_path
+        
+        conn = self._connections.get_connection(db_path)
+        with conn:
+            conn.execute("BEGIN;")
+            for query, parameters_list in batches:
+                conn.executemany(query, parameters_list)
+    
+    def close(self):
+        """This method closes every connection to the database.  Queries run after it open new connections."""
+        
+        self._connections.close_all()
 
 
 
@@ -105,6 +254,18 @@ class PostgreSqlDBConnector(DBConnector):
     
     def run_query(self):
         pass
+    
+    def run_insert(self):
+        pass
+    
+    def run_many(self):
+        pass
+    
+    def run_batch(self):
+        pass
+    
+    def close(self):
+        pass
 
 
 
@@ -122,11 +283,11 @@ class DBScriptor:
         self._db = self._db_manager.get_database()
         self._logs = logs
     
-    def execute_script(self):
+    def execute_script(self, _db_path=None):
         pass
     
-    def log_result(self, query, result_name):
-        results, cols = self._db.run_query(query, fetch="all", include_cols=True)
+    def log_result(self, query, result_name, _db_path=None):
+        results, cols = self._db.run_query(query, fetch="all", include_cols=True, _db_path=_db_path)
         results_df = pd.DataFrame(results, columns=cols)
         db_query_log_entry = DBQueryLogEntry(self._logs, result_name, results_df)
         db_query_log_entry.add_log_entry("database")
@@ -135,22 +296,33 @@ class DBScriptor:
 
 class CreateDBScriptor(DBScriptor):
     """
-    The CreateDBScriptor class implements the script to create the database and all of its tables.
-    It inherits from DBScriptor.
+    The CreateDBScriptor class implements the script to create the database and all of its tables and
+    indexes.  The indexes can also be added to an existing database with the create_indexes method.  It
+    inherits from DBScriptor.
     """
     
     _name = "Create Database Scriptor"
     
-    def execute_script(self):
+    def execute_script(self, _db_path=None):
         for table, query in create_table_queries:
-            self._db.run_query(query)
+            self._db.run_query(query, _db_path=_db_path)
             if self._logs:
                 self._db_manager.log_update(DBTableLogEntry, table, "created")
+        self.create_indexes(_db_path=_db_path)
         if self._logs:
-            self.log_result()
+            self.log_result(_db_path=_db_path)
+    
+    def create_indexes(self, _db_path=None):
+        """This method creates the indexes for the queries the app runs as it is played, skipping any that
+        already exist."""
+        
+        for table, query in create_index_queries:
+            self._db.run_query(query, _db_path=_db_path)
+            if self._logs:
+                self._db_manager.log_update(DBTableLogEntry, table, "indexed")
     
-    def log_result(self):
-        tables = self._db.run_query("SELECT * FROM sqlite_master WHERE type = 'table';", fetch="all")
+    def log_result(self, _db_path=None):
+        tables = self._db.run_query("SELECT * FROM sqlite_master WHERE type = 'table';", fetch="all", _db_path=_db_path)
         db_query_log_entry = DBCreatedLogEntry(self._logs, tables)
         db_query_log_entry.add_log_entry("database")
 
@@ -168,7 +340,7 @@ class PopulateTypesDBScriptor(DBScriptor):
         super().__init__(db_manager, log_manager)
         self._data = data_obj
     
-    def execute_script(self):
+    def execute_script(self, _db_path=None):
         levels_of_difficulty = self._data.get_type_list("levels")
         hint_types = self._data.get_type_list("hints")
         outcomes = self._data.get_type_list("outcomes")
@@ -180,100 +352,409 @@ class PopulateTypesDBScriptor(DBScriptor):
             for index, value in values_list:
                 query = f"INSERT INTO {table_name}_type VALUES (:id, :code, :description);"
                 parameters = {"id": index, "code": value, "description": value}
-                self._db.run_query(query, parameters)
+                self._db.run_query(query, parameters, _db_path=_db_path)
             if self._logs:
                 self._db_manager.log_update(DBTableLogEntry, table_name, "populated")
-                self.log_result(f"SELECT * FROM {table_name}_type;", f"{table_name.replace('_', ' ').title()} Types")
+                self.log_result(f"SELECT * FROM {table_name}_type;", f"{table_name.replace('_', ' ').title()} Types", _db_path=_db_path)
         
         for index, value, description in hint_types:
             query = f"INSERT INTO hint_type VALUES (:id, :code, :description);"
             parameters = {"id": index, "code": value, "description": description}
-            self._db.run_query(query, parameters)
+            self._db.run_query(query, parameters, _db_path=_db_path)
         if self._logs:
             self._db_manager.log_update(DBTableLogEntry, "hint", "populated")
-            self.log_result("SELECT * FROM hint_type;", "Hint Types")
+            self.log_result("SELECT * FROM hint_type;", "Hint Types", _db_path=_db_path)
         
         for index, category, value in error_types:
             query = "INSERT INTO error_type VALUES (:id, :category, :code, :description);"
             parameters = {"id": index, "category": category, "code": value, "description": value}
-            self._db.run_query(query, parameters)
+            self._db.run_query(query, parameters, _db_path=_db_path)
         if self._logs:
             self._db_manager.log_update(DBTableLogEntry, "error_type", "populated")
-            self.log_result("SELECT * FROM error_type;", "Error Types")
+            self.log_result("SELECT * FROM error_type;", "Error Types", _db_path=_db_path)
 
 
 
 class PopulateHintsDBScriptor(DBScriptor):
     """
     The PopulateHintsDBScriptor class implements the script to populate the hint table in the database
-    with a set of hints for the numbers 1 up to the value of the _hints_stored attribute.  This improves
-    the app's performance by not requiring it to generate hints every game for the most common numbers.
-    It inherits from DBScriptor.
+    with a set of hints for the numbers 1 up to the value of the _hints_stored attribute, which covers the
+    range of every standard level short of expert.  This improves the app's performance by not requiring it
+    to generate hints every game.  Any range can be populated with the populate_hints method.  Only the
+    numbers in the range without hints yet are generated, so the table can be topped up incrementally.  The
+    hints are generated in chunks across a multiprocessing pool and written with a single executemany call.  When
+    the app starts, the hints are generated in its own process instead, since spawning the workers takes longer than
+    generating the hints for the standard levels.
+    
+    Each number's hints are also checked for hints implied by the others, with the store_implied_hints method.  The
+    redundant column of a hint row marks whether the hint is implied, and the implied_by column lists the ids of the
+    hints that imply it, so the rows hold the implication graph for each number.  Rows that have not been checked yet
+    have no value in the redundant column.  It inherits from DBScriptor.
     """
     
     _name = "Populate Hints Database Scriptor"
-    _hints_stored = 100
+    _hints_stored = 1000
+    _chunk_size = 2000
+    _insert_query = "INSERT INTO hint(hint_type_id, number, hint) VALUES (?, ?, ?);"
+    _update_query = "UPDATE hint SET redundant = ?, implied_by = ? WHERE hint_id = ?;"
+    _worker_objects = None
     
     def __init__(self, db_manager, log_manager, data_obj, numbers):
         super().__init__(db_manager, log_manager)
         self._data = data_obj
         self._numbers = numbers
     
-    def execute_script(self):
-        self._populate_hints()
+    def execute_script(self, _db_path=None):
+        self.populate_hints(processes=1, _db_path=_db_path)
+        self.store_implied_hints(_db_path=_db_path)
         if self._logs:
-            self._db_manager.log_update(HintsPopulatedLogEntry, PopulateHintsDBScriptor._hints_stored)
-            self.log_result("SELECT * FROM hint WHERE number IN (1,2,3,4,5) ORDER BY number;", "Hints")
+            self.log_result("SELECT * FROM hint WHERE number IN (1,2,3,4,5) ORDER BY number;", "Hints", _db_path=_db_path)
+    
+    def populate_hints(self, num_range=None, processes=None, _db_path=None):
+        """This method stores hints for every number in a range that does not have any in the hint table yet.  The
+        range defaults to 1 up to the value of _hints_stored.  It returns the number of rows written and the seconds
+        it took."""
+        
+        num_range = num_range if num_range else (1, PopulateHintsDBScriptor._hints_stored)
+        start_time = time.perf_counter()
+        
+        missing_numbers = self._get_missing_numbers(num_range, _db_path=_db_path)
+        rows = self._generate_hint_rows(missing_numbers, processes)
+        if rows:
+            self._db.run_many(PopulateHintsDBScriptor._insert_query, rows, _db_path=_db_path)
+        
+        seconds = time.perf_counter() - start_time
+        if self._logs and rows:
+            self._db_manager.log_update(HintsPopulatedLogEntry, num_range, len(rows), seconds)
+        
+        return len(rows), seconds
+    
+    def store_implied_hints(self, num_range=None, _db_path=None):
+        """This method stores which hints are implied by the other hints for the same number, for every number in a
+        range with hint rows that have not been checked yet.  The range defaults to 1 up to the value of _hints_stored.
+        The implications hold over the implication range of the ConceptRegistry class, whatever range is checked.  It
+        returns the number of rows checked and the seconds it took."""
+        
+        num_range = num_range if num_range else (1, PopulateHintsDBScriptor._hints_stored)
+        start_time = time.perf_counter()
+        
+        rows = self._get_unchecked_rows(num_range, _db_path=_db_path)
+        concepts = ConceptRegistry.get_registry(self._numbers, self._data)
+        
+        updates = []
+        for number, number_rows in itertools.groupby(rows, key=lambda row: row[1]):
+            number_rows = list(number_rows)
+            hints = [concepts.parse_hint(row[2], row[3]) for row in number_rows]
+            implied_hints = concepts.find_implied_hints(hints)
+            for index, row in enumerate(number_rows):
+                if index in implied_hints:
+                    implied_by = ",".join(str(number_rows[i][0]) for i in implied_hints[index])
+                    updates.append((1, implied_by, row[0]))
+                else:
+                    updates.append((0, None, row[0]))
+        
+        if updates:
+            self._db.run_many(PopulateHintsDBScriptor._update_query, updates, _db_path=_db_path)
+        
+        seconds = time.perf_counter() - start_time
+        if self._logs and updates:
+            implied_count = len([update for update in updates if update[0]])
+            self._db_manager.log_update(HintImplicationsStoredLogEntry, num_range, len(updates), implied_count, seconds)
+        
+        return len(updates), seconds
+    
+    def _get_unchecked_rows(self, num_range, _db_path=None):
+        low, high = num_range
+        query = """SELECT h.hint_id, h.number, t.code, h.hint
+                   FROM hint h
+                       JOIN hint_type t ON h.hint_type_id = t.id
+                   WHERE h.number BETWEEN :low AND :high
+                       AND h.redundant IS NULL
+                   ORDER BY h.number, h.hint_id;"""
+        rows = self._db.run_query(query, {"low": low, "high": high}, fetch="all", _db_path=_db_path)
+        
+        return rows if rows else []
     
-    def _populate_hints(self):
-        for i in range(1, PopulateHintsDBScriptor._hints_stored + 1):
-            concept_manager = ConceptManager(i, self._numbers, self._db, self._data)
-            hints = concept_manager.generate_hints(check_db=False, filter_results=False)
-            for hint in hints:
-                hint_obj = self._data.get_hint_obj_from_hint(hint)
-                hint_type_id = hint_obj.get_id()
-                populate_hints_query = "INSERT INTO hint(hint_type_id, number, hint) VALUES (:hint_type_id, :number, :hint);"
-                parameters = {'hint_type_id': int(hint_type_id), 'number': int(i), 'hint': hint}
-                self._db.run_query(populate_hints_query, parameters)
+    def _get_missing_numbers(self, num_range, _db_path=None):
+        low, high = num_range
+        query = "SELECT DISTINCT number FROM hint WHERE number BETWEEN :low AND :high;"
+        stored_numbers = self._db.run_query(query, {"low": low, "high": high}, fetch="all", _db_path=_db_path)
+        stored_numbers = {row[0] for row in stored_numbers} if stored_numbers else set()
+        
+        return [number for number in range(low, high + 1) if number not in stored_numbers]
+    
+    def _generate_hint_rows(self, numbers, processes=None):
+        """This method generates the hint rows for a list of numbers.  The numbers are split into chunks, which are
+        spread across a pool of processes when there is more than one chunk and more than one process to use.  The
+        workers are spawned rather than forked, as on Windows, so they do not inherit the state of the app's UI
+        threads.  Spawned workers import the app's main module, so guess_that_number.py keeps its window and layout
+        out of module level.  The rows come back in the order of the numbers either way."""
+        
+        size = PopulateHintsDBScriptor._chunk_size
+        chunks = [numbers[i:i + size] for i in range(0, len(numbers), size)]
+        processes = min(processes if processes else os.cpu_count() or 1, len(chunks))
+        
+        if processes > 1:
+            context = multiprocessing.get_context("spawn")
+            with context.Pool(processes, PopulateHintsDBScriptor._init_worker, (self._numbers, self._data)) as pool:
+                chunk_rows = pool.map(PopulateHintsDBScriptor._generate_chunk_rows, chunks)
+        else:
+            PopulateHintsDBScriptor._init_worker(self._numbers, self._data)
+            chunk_rows = [PopulateHintsDBScriptor._generate_chunk_rows(chunk) for chunk in chunks]
+        
+        return [row for rows in chunk_rows for row in rows]
+    
+    @staticmethod
+    def _init_worker(numbers, data_obj):
+        PopulateHintsDBScriptor._worker_objects = (numbers, data_obj)
+    
+    @staticmethod
+    def _generate_chunk_rows(numbers):
+        """This static method generates the hint rows for a chunk of numbers.  It runs in the worker processes, so it
+        uses the objects set for the process by _init_worker."""
+        
+        concepts = ConceptRegistry.get_registry(*PopulateHintsDBScriptor._worker_objects)
+        rows = []
+        for number in numbers:
+            for hint in concepts.generate_hints(number, filter_results=False):
+                rows.append((int(hint.type_id), int(number), hint.render()))
+        
+        return rows
+
+
+
+class MigrationDBScriptor(DBScriptor):
+    """
+    The MigrationDBScriptor class is the base class for the steps that migrate the schema of an existing database.
+    Each step has a version number, and the steps are applied in order of version by the MigrateDBScriptor class.
+    The queries from the _get_queries method are run in a single transaction, along with the query that records the
+    version in the schema_version table, so a step is either applied and recorded in full or not at all.
+    
+    Steps that change the rows of a large table do so in batches, from the _get_batch method, so that no single
+    transaction holds the database for long.  Each batch is run in a transaction of its own, before the queries from
+    _get_queries, until _get_batch returns an empty list.  Each batch must migrate the rows it covers, so the next
+    batch moves on to the next rows, and a step interrupted part way through picks up where it left off.  It inherits
+    from DBScriptor.  It is not meant to be instantiated directly.
+    """
+    
+    _name = ""
+    _version = 0
+    _batch_size = 5000
+    _version_query = "INSERT INTO schema_version(version, name, time) VALUES (?, ?, datetime('now', 'localtime'));"
+    
+    def execute_script(self, _db_path=None):
+        """This method applies the step and records its version.  It returns the number of batches run and the
+        seconds it took."""
+        
+        start_time = time.perf_counter()
+        
+        batch_count = 0
+        batch = self._get_batch(_db_path=_db_path)
+        while batch:
+            self._db.run_batch(batch, _db_path=_db_path)
+            batch_count += 1
+            batch = self._get_batch(_db_path=_db_path)
+        
+        queries = [(query, [()]) for query in self._get_queries(_db_path=_db_path)]
+        queries.append((MigrationDBScriptor._version_query, [(self._version, self._name)]))
+        self._db.run_batch(queries, _db_path=_db_path)
+        
+        seconds = time.perf_counter() - start_time
+        if self._logs:
+            self._db_manager.log_update(MigrationAppliedLogEntry, self._version, self._name, batch_count, seconds)
+        
+        return batch_count, seconds
+    
+    def get_version(self):
+        return self._version
+    
+    def _get_queries(self, _db_path=None):
+        return []
+    
+    def _get_batch(self, _db_path=None):
+        return []
+
+
+
+class ColumnsMigrationDBScriptor(MigrationDBScriptor):
+    """
+    The ColumnsMigrationDBScriptor class is the base class for the steps that add columns to a table.  Only the columns
+    the table does not have yet are added, so the step also runs on a table that was created with them.  It inherits
+    from MigrationDBScriptor.  It is not meant to be instantiated directly.
+    """
+    
+    _table = ""
+    _columns = []
+    
+    def _get_queries(self, _db_path=None):
+        columns = self._db.run_query(f"PRAGMA table_info({self._table});", fetch="all", _db_path=_db_path)
+        column_names = [column[1] for column in columns]
+        
+        return [f"ALTER TABLE {self._table} ADD COLUMN {column_name} {column_type};"
+                for column_name, column_type in self._columns if column_name not in column_names]
+
+
+
+class ImplicationColumnsMigrationDBScriptor(ColumnsMigrationDBScriptor):
+    """
+    The ImplicationColumnsMigrationDBScriptor class adds the redundant and implied_by columns to hint tables created
+    without them.  It inherits from ColumnsMigrationDBScriptor.
+    """
+    
+    _name = "Add hint implication columns"
+    _version = 1
+    _table = "hint"
+    _columns = [("redundant", "INTEGER"), ("implied_by", "TEXT")]
+
+
+
+class IndexesMigrationDBScriptor(MigrationDBScriptor):
+    """
+    The IndexesMigrationDBScriptor class adds the indexes for the queries the app runs as it is played to databases
+    created without them.  It inherits from MigrationDBScriptor.
+    """
+    
+    _name = "Add indexes"
+    _version = 2
+    
+    def _get_queries(self, _db_path=None):
+        return [query for table, query in create_index_queries]
+
+
+
+class ExpertLevelMigrationDBScriptor(MigrationDBScriptor):
+    """
+    The ExpertLevelMigrationDBScriptor class adds the expert level to level_of_difficulty_type tables populated before
+    it existed.  The type tables are only populated when the database is built, so without this step, games at the
+    expert level would refer to a level that is not in the table.  It inherits from MigrationDBScriptor.
+    """
+    
+    _name = "Add expert level"
+    _version = 3
+    
+    def _get_queries(self, _db_path=None):
+        return ["INSERT OR IGNORE INTO level_of_difficulty_type VALUES (5, 'expert', 'expert');"]
+
+
+
+class GameSeedColumnMigrationDBScriptor(ColumnsMigrationDBScriptor):
+    """
+    The GameSeedColumnMigrationDBScriptor class adds the seed column, which records the seed each game's numbers were
+    drawn from, to game tables created without it.  It inherits from ColumnsMigrationDBScriptor.
+    """
+    
+    _name = "Add game seed column"
+    _version = 4
+    _table = "game"
+    _columns = [("seed", "INTEGER")]
+
+
+
+class UnusedIndexesMigrationDBScriptor(MigrationDBScriptor):
+    """
+    The UnusedIndexesMigrationDBScriptor class drops the session time and game session indexes from databases that
+    were given them by the indexes step.  No query the app runs looks sessions or games up by time, so they only added
+    work to every insert.  It inherits from MigrationDBScriptor.
+    """
+    
+    _name = "Drop unused indexes"
+    _version = 5
+    
+    def _get_queries(self, _db_path=None):
+        return ["DROP INDEX IF EXISTS session_time_index;", "DROP INDEX IF EXISTS game_session_index;"]
+
+
+
+class MigrateDBScriptor(DBScriptor):
+    """
+    The MigrateDBScriptor class implements the script to bring the schema of the database up to date.  It creates the
+    schema_version table if it does not exist, reads the latest version recorded in it and applies every migration
+    step with a later version, in order.  A database with no versions recorded is at version 0, the schema from
+    before the first migration.  The steps also run on a database that was just created, where they find nothing
+    left to change and only record their versions.  It inherits from DBScriptor.
+    """
+    
+    _name = "Migrate Database Scriptor"
+    _current_version_query = "SELECT COALESCE(MAX(version), 0) FROM schema_version;"
+    
+    def __init__(self, db_manager, logs):
+        super().__init__(db_manager, logs)
+        self._migrations = [
+            ImplicationColumnsMigrationDBScriptor(db_manager, logs),
+            IndexesMigrationDBScriptor(db_manager, logs),
+            ExpertLevelMigrationDBScriptor(db_manager, logs),
+            GameSeedColumnMigrationDBScriptor(db_manager, logs),
+            UnusedIndexesMigrationDBScriptor(db_manager, logs)
+            ]
+    
+    def execute_script(self, _db_path=None):
+        """This method applies every migration step newer than the database and returns the versions applied."""
+        
+        self._db.run_query(create_schema_version_table, _db_path=_db_path)
+        current_version = self.get_current_version(_db_path=_db_path)
+        
+        applied_versions = []
+        for migration in sorted(self._migrations, key=lambda migration: migration.get_version()):
+            if migration.get_version() > current_version:
+                migration.execute_script(_db_path=_db_path)
+                applied_versions.append(migration.get_version())
+        
+        return applied_versions
+    
+    def get_current_version(self, _db_path=None):
+        return self._db.run_query(MigrateDBScriptor._current_version_query, fetch="one", _db_path=_db_path)[0]
 
 
 
 class DBManager:
     """
     The DBManager class manages the database.  It determines which connector to use and instantiates that object, which it
-    then uses to instantiate each DBScriptor subclass and execute their scripts to create and load the database.
+    then uses to instantiate each DBScriptor subclass and execute their scripts to create and load the database.  If the
+    database already exists, it applies any schema migrations it is missing, tops up the hint table with any numbers in
+    its coverage that are missing and checks any hints that have not been checked for implications yet.  The synchronous
+    level and prepared statement cache size are passed on to the SQLite connector.  If _db_path is given, the database
+    at that path is built or brought up to date instead of the app's.
     """
     
-    def __init__(self, numbers, data_obj, logs=None):
+    def __init__(self, numbers, data_obj, logs=None, synchronous="NORMAL", cached_statements=256, _db_path=None):
         self._logs = logs
+        self._db_path = _db_path
         
         if os.path.exists(PostgreSqlDBConnector._db_name):
             self._db = self._get_db_connector(PostgreSqlDBConnector)
         else:
-            self._db = self._get_db_connector(SqliteDBConnector)
+            self._db = self._get_db_connector(SqliteDBConnector, synchronous, cached_statements)
         
         self._numbers = numbers
         self._data = data_obj
         
         self._create_db = CreateDBScriptor(self, self._logs)
+        self._migrate_db = MigrateDBScriptor(self, self._logs)
         self._populate_db = PopulateTypesDBScriptor(self, self._logs, self._data)
         self._populate_hints = PopulateHintsDBScriptor(self, self._logs, self._data, self._numbers)
         
-        if not os.path.exists(self._db._db_name):
+        if not os.path.exists(self._db_path if self._db_path else self._db._db_name):
             self._build_db()
+        else:
+            self._migrate_db.execute_script(_db_path=self._db_path)
+            self._populate_hints.populate_hints(processes=1, _db_path=self._db_path)
+            self._populate_hints.store_implied_hints(_db_path=self._db_path)
     
     def get_database(self):
         return self._db
     
-    def _get_db_connector(self, connector_class):
-        db_connector = connector_class()
+    def close(self):
+        self._db.close()
+    
+    def _get_db_connector(self, connector_class, *args):
+        db_connector = connector_class(*args)
         if self._logs:
             self.log_update(DBConnectorLogEntry, connector_class._name)
         return db_connector
     
     def _build_db(self):
-        for scriptor in [self._create_db, self._populate_db, self._populate_hints]:
-            scriptor.execute_script()
+        for scriptor in [self._create_db, self._populate_db, self._migrate_db, self._populate_hints]:
+            scriptor.execute_script(_db_path=self._db_path)
             if self._logs:
                 self.log_update(DBScriptorLogEntry, scriptor._name)
     
@@ -282,4 +763,4 @@ class DBManager:
         log_entry.add_log_entry("database")
     
     def log_query_result(self, query, result_name):
-        self._populate_hints.log_result(query, result_name)
\ No newline at end of file
+        self._populate_hints.log_result(query, result_name, _db_path=self._db_path)
\ No newline at end of file
@@ -18,6 +18,7 @@ Description: The concepts package contains all the modules relating to generatin
 
 Modules:
     concept_manager.py
+    concept_registry.py
     factor.py
     multiple.py
     prime.py
@@ -1,31 +1,23 @@
 """
 The concept_manager.py module is part of the concepts package.  It is for aggregating all of the hints generated
 for each of the concepts and delegating the evaluation of guesses to the appropriate concept's subclass of
-MathConcept, the base class for concepts.
+MathConcept, the base class for concepts.  The concepts themselves are shared through the ConceptRegistry class.
 
 Classes:
     ConceptManager
 """
 
 
-from resources.infrastructure.subsystem import Manager
-from concepts.math_concept import MathConcept
-from concepts.hints import MainHint, DigitHint, FactorHint
+from concepts.concept_registry import ConceptRegistry
 
-from concepts.factor import Factor
-from concepts.multiple import Multiple
-from concepts.prime import PrimeNumber
-from concepts.even_odd import EvenOdd
-from concepts.perfect_exponents import PerfectSquare, PerfectCube
-from concepts.digit_concepts import DigitSum, DigitLength
 
 
-
-class ConceptManager(Manager):
+class ConceptManager:
     """
     The ConceptManager class serves as a centralized location for generating hints and evaluating guesses for each math
-    concept included in the app.  It is composed of objects of each of the subclasses of MathConcept, as well as some
-    helper objects.
+    concept included in the app, for a particular number.  It does not create any concepts of its own.  It uses the
+    shared objects of each of the subclasses of MathConcept held by the ConceptRegistry class, so creating one for
+    every guess only costs a profile of the number, which is usually cached.
     """
     
     def __init__(self, number, numbers_obj, db, data):
@@ -33,62 +25,97 @@ class ConceptManager(Manager):
         self._numbers_obj = numbers_obj
         self._db = db
         self._data = data
-        
-        self._factor = Factor(self._number, self._numbers_obj, self._data.get_sub_data_object("hints", "factor"))
-        self._multiple = Multiple(self._number, self._numbers_obj, self._data.get_sub_data_object("hints", "multiple"))
-        self._prime = PrimeNumber(self._number, self._numbers_obj, self._data.get_sub_data_object("hints", "prime"))
-        self._even_odd = EvenOdd(self._number, self._numbers_obj, self._data.get_sub_data_object("hints", "even_odd"))
-        self._perfect_square = PerfectSquare(self._number, self._numbers_obj, self._data.get_sub_data_object("hints", "perfect_square"))
-        self._perfect_cube = PerfectCube(self._number, self._numbers_obj, self._data.get_sub_data_object("hints", "perfect_cube"))
-        self._digit_sum = DigitSum(self._number, self._numbers_obj, self._data.get_sub_data_object("hints", "digit_sum"))
-        self._digit_length = DigitLength(self._number, self._numbers_obj, self._data.get_sub_data_object("hints", "digit_length"))
-        super().__init__(MathConcept)
-        
-        self._game_concepts = self._subclass_list
-        self._main_concepts = self.get_class_instances(MainHint)
-        self._digit_concepts = self.get_class_instances(DigitHint)
-        self._factor_concepts = self.get_class_instances(FactorHint)
+        self._profile = self._numbers_obj.get_number_profile(self._number)
+        self._registry = ConceptRegistry.get_registry(self._numbers_obj, self._data)
+    
+    def get_number(self):
+        return self._number
     
     def generate_hints(self, check_db=True, filter_results=True, _db_path=None):
         """This is the main method for generating hints.  It checks the database for hints first to avoid extra
         processing.  If a set of hints does not exist, it uses the MathConcept subclasses to generate new hints and
-        aggregates them."""
-        
-        game_concepts = self._create_hint_concept_list()
+        aggregates them.  Either way, the hints are returned as HintRecord objects."""
         
         if check_db:
-            hint_types = [concept.get_name() for concept in game_concepts]
+            hint_types = [concept.get_name() for concept in self._create_hint_concept_list()]
             hints = self._get_hints_from_db(hint_types, _db_path=_db_path)
         else:
             hints = []
         
         if not hints:
-            for concept in game_concepts:
-                if concept.get_name() == "multiple":
-                    concept_hints = concept.generate_hints(filter_results)
-                else:
-                    concept_hints = concept.generate_hints()
-                
-                hints = hints + concept_hints
+            hints = self._registry.generate_hints(self._number, filter_results)
         
         return hints
     
+    def iter_hints(self, check_db=True, filter_results=True, _db_path=None):
+        """This method is the lazy counterpart of generate_hints.  Hints found in the database are yielded one type at
+        a time in turn, the same way the ConceptRegistry class interleaves the hints it generates.  Otherwise, the
+        hints are generated as they are requested."""
+        
+        hints = []
+        if check_db:
+            hint_types = [concept.get_name() for concept in self._create_hint_concept_list()]
+            hints = self._get_hints_from_db(hint_types, _db_path=_db_path)
+        
+        if hints:
+            yield from self._registry.interleave_hints(self._group_hints_by_type(hints))
+        else:
+            yield from self._registry.iter_hints(self._number, filter_results)
+    
     def evaluate_guess(self, hint_type, guess, hint):
-        feedback = self.run_subclass_method(hint_type, guess, hint)
+        feedback = self._registry.evaluate_guess(hint_type, guess, hint)
         
         return feedback
     
-    @staticmethod
-    def check_greater_or_less(guess, number):
+    def evaluate_guesses(self, hint, guesses, number_info=None):
+        """This method evaluates an array of guesses against a hint at once.  It returns a boolean array marking the
+        guesses that were good, so past feedback can be recomputed and simulated games can be played without
+        evaluating each guess separately."""
+        
+        good_guesses = self._registry.evaluate_guesses(hint, guesses, number_info)
+        return good_guesses
+    
+    def get_hint_mask(self, hint, numbers, number_info):
+        """This method returns a boolean array marking which of an array of numbers are consistent with a hint.  The
+        BatchNumberInfo columns for the numbers are passed in, so they are computed once for every hint checked."""
+        
+        mask = self._registry.get_hint_mask(hint, numbers, number_info)
+        return mask
+    
+    def get_implication_graph(self, num_range, _db_path=None):
+        """This method returns the implication graph stored with the hints for the number in the database, as a
+        dictionary mapping each hint implied by the others to the list of hints that imply it.  The implications only
+        hold over the implication range, so the graph is empty for number ranges that are not within it."""
+        
+        low, high = num_range
+        implication_low, implication_high = self._registry.get_implication_range()
+        if not self._db or low < implication_low or high > implication_high:
+            return {}
+        
+        query = """SELECT h.hint_id, t.code, h.hint, h.redundant, h.implied_by
+                   FROM hint h
+                       JOIN hint_type t ON h.hint_type_id = t.id
+                   WHERE h.number = :number
+                       AND h.redundant IS NOT NULL"""
+        rows = self._db.run_query(query, {"number": self._number}, fetch='all', _db_path=_db_path)
+        
+        hints = {row[0]: self._registry.parse_hint(row[1], row[2]) for row in rows}
+        implication_graph = {}
+        for hint_id, hint_type, hint, redundant, implied_by in rows:
+            if redundant:
+                implying_ids = [int(implying_id) for implying_id in implied_by.split(",") if implying_id]
+                implication_graph[hints[hint_id]] = [hints[implying_id] for implying_id in implying_ids]
+        
+        return implication_graph
+    
+    def check_greater_or_less(self, guess, number):
         """This method is used after all possible hints specific to the number have been used."""
         
-        tag = "Higher" if guess < number else "Lower"
-        hint = f"Nice try!  {tag}."
+        hint = self._registry.check_greater_or_less(guess, number)
         return hint
     
     def _create_hint_concept_list(self, concepts=None):
-        concepts = concepts if concepts else self._game_concepts
-        game_concepts = [concept for concept in concepts if concept.include_concept()]
+        game_concepts = self._registry.get_concepts(self._profile, concepts=concepts)
         return game_concepts
     
     def _get_hints_from_db(self, hint_types, _db_path=None):
@@ -102,7 +129,7 @@ class ConceptManager(Manager):
                 indexes = self._numbers_obj.get_random_numbers((0, len(multiple_hints)), n=2)
                 hints = [multiple_hints[index] for index in indexes] + other_hints
             
-            hints = [hint[1] for hint in hints]
+            hints = [self._registry.parse_hint(hint_type, hint) for hint_type, hint in hints]
         
         return hints
     
@@ -119,6 +146,14 @@ class ConceptManager(Manager):
         
         return hints
     
+    @staticmethod
+    def _group_hints_by_type(hints):
+        hint_groups = {}
+        for hint in hints:
+            hint_groups.setdefault(hint.get_type(), []).append(hint)
+        
+        return [iter(hint_group) for hint_group in hint_groups.values()]
+    
     @staticmethod
     def _format_hint_types(hint_types):
         hint_types_string = ""
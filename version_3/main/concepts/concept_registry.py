@@ -0,0 +1,223 @@
+"""
+The concept_registry.py module is part of the concepts package.  It holds the set of MathConcept objects shared
+across the app.  The concepts hold no state about a particular number, so each one is created once per process
+and the number is passed in to every call, instead of a new set of concepts being created for every guess.
+
+Classes:
+    ConceptRegistry
+"""
+
+
+import threading
+import numpy as np
+from resources.infrastructure.subsystem import Manager
+from concepts.math_concept import MathConcept
+from concepts.hints import HintRecord, MainHint, DigitHint, FactorHint, GreaterLessHint
+
+from concepts.factor import Factor
+from concepts.multiple import Multiple
+from concepts.prime import PrimeNumber
+from concepts.even_odd import EvenOdd
+from concepts.perfect_exponents import PerfectSquare, PerfectCube
+from concepts.digit_concepts import DigitSum, DigitLength
+
+
+
+class ConceptRegistry(Manager):
+    """
+    The ConceptRegistry class is composed of one object of each of the subclasses of MathConcept.  The objects are
+    flyweights: they are shared by every game and session in the process, and the number they generate hints for
+    is passed in to each method.  Registries are accessed through the get_registry class method, which creates a
+    registry the first time it is called for a pair of Number and DataManager objects and returns the same one
+    from then on.  It also holds the GreaterLessHint object used once there are no hints left.  It inherits from
+    Manager.
+    
+    Attributes:
+        _registries: A dictionary of the registries created so far, keyed by their Number and DataManager objects.
+        _lock: A lock that keeps 2 threads from creating a registry for the same objects at once.
+        _parsed_hints: A dictionary of the hint records parsed from text so far, keyed by hint type and text.
+        _implication_info: A dictionary of BatchNumberInfo columns for the implication range, or None until needed.
+        _implication_masks: A dictionary of the masks over the implication range computed so far, keyed by hint.
+    """
+    
+    _registries = {}
+    _lock = threading.Lock()
+    _implication_range = (1, 1000)
+    
+    def __init__(self, numbers_obj, data):
+        self._numbers_obj = numbers_obj
+        self._data = data
+        
+        self._factor = Factor(self._numbers_obj, self._data.get_sub_data_object("hints", "factor"))
+        self._multiple = Multiple(self._numbers_obj, self._data.get_sub_data_object("hints", "multiple"))
+        self._prime = PrimeNumber(self._numbers_obj, self._data.get_sub_data_object("hints", "prime"))
+        self._even_odd = EvenOdd(self._numbers_obj, self._data.get_sub_data_object("hints", "even_odd"))
+        self._perfect_square = PerfectSquare(self._numbers_obj, self._data.get_sub_data_object("hints", "perfect_square"))
+        self._perfect_cube = PerfectCube(self._numbers_obj, self._data.get_sub_data_object("hints", "perfect_cube"))
+        self._digit_sum = DigitSum(self._numbers_obj, self._data.get_sub_data_object("hints", "digit_sum"))
+        self._digit_length = DigitLength(self._numbers_obj, self._data.get_sub_data_object("hints", "digit_length"))
+        super().__init__(MathConcept)
+        
+        self._greater_less = GreaterLessHint(self._data.get_sub_data_object("hints", "greater_less"))
+        self._parsed_hints = {}
+        self._implication_info = None
+        self._implication_masks = {}
+        
+        self._game_concepts = self._subclass_list
+        self._main_concepts = self.get_class_instances(MainHint)
+        self._digit_concepts = self.get_class_instances(DigitHint)
+        self._factor_concepts = self.get_class_instances(FactorHint)
+    
+    @classmethod
+    def get_registry(cls, numbers_obj, data):
+        key = (id(numbers_obj), id(data))
+        with cls._lock:
+            if key not in cls._registries:
+                cls._registries[key] = cls(numbers_obj, data)
+            return cls._registries[key]
+    
+    def generate_hints(self, number, filter_results=True):
+        """This method aggregates the hints for a number from each of the concepts included for it.  The number is
+        profiled once and the profile is passed to every concept."""
+        
+        profile = self._numbers_obj.get_number_profile(number)
+        
+        hints = []
+        for concept in self.get_concepts(profile):
+            if concept.get_name() == "multiple":
+                concept_hints = concept.generate_hints(profile, filter_results)
+            else:
+                concept_hints = concept.generate_hints(profile)
+            
+            hints = hints + concept_hints
+        
+        return hints
+    
+    def iter_hints(self, number, filter_results=True):
+        """This method is the lazy counterpart of generate_hints.  It yields the hints for a number one at a time, taking
+        one hint from each concept in turn, so the first few hints cover as many concepts as possible.  No hint is
+        created before it is requested."""
+        
+        profile = self._numbers_obj.get_number_profile(number)
+        
+        hint_streams = []
+        for concept in self.get_concepts(profile):
+            if concept.get_name() == "multiple":
+                hint_streams.append(iter(concept.generate_hints(profile, filter_results)))
+            else:
+                hint_streams.append(concept.iter_hints(profile))
+        
+        yield from self.interleave_hints(hint_streams)
+    
+    @staticmethod
+    def interleave_hints(hint_streams):
+        """This static method takes in a list of iterators of hints and yields one hint from each of them in turn until
+        they have all run out."""
+        
+        hint_streams = list(hint_streams)
+        while hint_streams:
+            for hint_stream in list(hint_streams):
+                hint = next(hint_stream, None)
+                if hint is None:
+                    hint_streams.remove(hint_stream)
+                else:
+                    yield hint
+    
+    def evaluate_guess(self, hint_type, guess, hint):
+        """This method looks up the concept for a hint type directly in the dictionary of concepts, rather than
+        searching the list of them, and delegates the evaluation of the guess to it."""
+        
+        concept = self._subclass_dict[hint_type]
+        feedback = concept.evaluate_guess(guess, hint)
+        
+        return feedback
+    
+    def evaluate_guesses(self, hint, guesses, number_info=None):
+        """This method is the vectorized counterpart of evaluate_guess.  It takes in a hint and an array of guesses and
+        returns a boolean array marking the guesses that were good.  The hint can be a hint record or the text of a
+        hint, whose type is read from the text.  The BatchNumberInfo columns for the guesses are computed if they are
+        not passed in.  Concepts without a vectorized version evaluate the guesses one at a time."""
+        
+        hint_type = hint.get_type() if isinstance(hint, HintRecord) else self._data.get_hint_obj_from_hint(hint).get_name()
+        guesses = np.asarray(guesses, dtype=np.int64)
+        if number_info is None:
+            number_info = self._numbers_obj.get_batch_number_info(guesses)
+        
+        concept = self._subclass_dict[hint_type]
+        return concept.get_hint_mask(hint, guesses, number_info)
+    
+    def get_hint_mask(self, hint, numbers, number_info):
+        concept = self._subclass_dict[hint.get_type()]
+        return concept.get_hint_mask(hint, numbers, number_info)
+    
+    def check_greater_or_less(self, guess, number):
+        return self._greater_less.generate_hint(guess, number)
+    
+    def parse_hint(self, hint_type, hint):
+        """This method parses the text of a hint of a given type, such as a hint stored in the database, into a hint
+        record.  Each distinct hint is only parsed once.  After that, its record is looked up."""
+        
+        key = (hint_type, hint)
+        if key not in self._parsed_hints:
+            self._parsed_hints[key] = self._subclass_dict[hint_type].parse_hint(hint)
+        
+        return self._parsed_hints[key]
+    
+    def find_implied_hints(self, hints):
+        """This method finds the hints in a list that are implied by the others, over the numbers in the implication
+        range.  A hint is implied if every number it rules out is ruled out by one of the other hints.  The hints are
+        checked from the one that rules out the most numbers to the one that rules out the fewest, and each hint found
+        to be implied is set aside, so the hints left are the least revealing ones that still rule out the same numbers
+        as the whole list.  It returns a dictionary mapping the index of each implied hint to the indexes of the hints
+        left that imply it."""
+        
+        if not hints:
+            return {}
+        
+        masks = np.stack([self._get_implication_mask(hint) for hint in hints])
+        kept = np.ones(len(hints), dtype=bool)
+        for index in np.argsort(np.count_nonzero(masks, axis=1), kind="stable"):
+            kept[index] = False
+            if np.any(~masks[index] & np.all(masks[kept], axis=0)):
+                kept[index] = True
+        
+        return {int(index): self._get_implying_hints(masks, kept, ~masks[index]) for index in np.flatnonzero(~kept)}
+    
+    def get_implication_range(self):
+        return ConceptRegistry._implication_range
+    
+    def get_concepts(self, number, concepts=None):
+        """This method returns the concepts included in the hints for a number.  If a list of concepts is passed in,
+        only those concepts are checked."""
+        
+        concepts = concepts if concepts else self._game_concepts
+        game_concepts = [concept for concept in concepts if concept.include_concept(number)]
+        return game_concepts
+    
+    def get_concept(self, hint_type):
+        return self._subclass_dict.get(hint_type)
+    
+    def _get_implication_mask(self, hint):
+        if hint not in self._implication_masks:
+            low, high = ConceptRegistry._implication_range
+            numbers = np.arange(low, high + 1, dtype=np.int64)
+            if self._implication_info is None:
+                self._implication_info = self._numbers_obj.get_batch_number_info(numbers)
+            self._implication_masks[hint] = self.evaluate_guesses(hint, numbers, self._implication_info)
+        
+        return self._implication_masks[hint]
+    
+    @staticmethod
+    def _get_implying_hints(masks, kept, ruled_out):
+        """This static method picks the hints among the ones left that together rule out the numbers a hint rules out.
+        It is a greedy set cover: the hint that rules out the most numbers not ruled out yet is picked each time."""
+        
+        indexes = np.flatnonzero(kept)
+        implying_hints = []
+        while np.any(ruled_out):
+            counts = np.count_nonzero(~masks[indexes] & ruled_out, axis=1)
+            best_index = int(indexes[counts.argmax()])
+            implying_hints.append(best_index)
+            ruled_out = ruled_out & masks[best_index]
+        
+        return sorted(implying_hints)
\ No newline at end of file
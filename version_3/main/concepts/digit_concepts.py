@@ -19,9 +19,10 @@ class DigitSum(DigitConcept):
     
     _name = "digit sum"
     
-    def __init__(self, number, numbers_obj, digit_sum_data_obj):
-        super().__init__(number, numbers_obj, digit_sum_data_obj)
+    def __init__(self, numbers_obj, digit_sum_data_obj):
+        super().__init__(numbers_obj, digit_sum_data_obj)
         self._formula = sum
+        self._info_column = "digit sum"
         self._min_number_to_include = 10
 
 
@@ -33,7 +34,8 @@ class DigitLength(DigitConcept):
     
     _name = "digit length"
     
-    def __init__(self, number, numbers_obj, digit_length_data_obj):
-        super().__init__(number, numbers_obj, digit_length_data_obj)
+    def __init__(self, numbers_obj, digit_length_data_obj):
+        super().__init__(numbers_obj, digit_length_data_obj)
         self._formula = len
+        self._info_column = "digit length"
         self._min_number_to_include = 100
\ No newline at end of file
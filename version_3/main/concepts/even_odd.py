@@ -8,6 +8,7 @@ Classes:
 
 
 from concepts.math_concept import StandardConcept
+from concepts.hints import HintRecord
 
 
 
@@ -18,51 +19,43 @@ class EvenOdd(StandardConcept):
     
     _name = "even/odd"
     
-    def __init__(self, number, numbers_obj, even_odd_data_obj):
-        super().__init__(number, numbers_obj, even_odd_data_obj)
+    def __init__(self, numbers_obj, even_odd_data_obj):
+        super().__init__(numbers_obj, even_odd_data_obj)
         self._digit_hint_display_name = "even number"
     
-    def _generate_main_hints(self):
+    def _generate_main_hints(self, number):
         hints = []
         
-        tag = "even" if self._satisfies_condition() else "odd"
-        main_hint = self._get_main_hint()
-        main_hint = main_hint.format(tag)
+        tag = "even" if self._satisfies_condition(number) else "odd"
+        main_hint = self._create_hint(HintRecord.MAIN, tag)
         hints.append(main_hint)
         
         return hints
     
-    def _generate_digit_hints(self, digits):
-        digit_hints = super()._generate_digit_hints(digits)
-        for index, hint in enumerate(digit_hints):
-            if hint == "Nice try!  Hint: 1 of its digits is a even number.":
-                digit_hints[index] = hint.replace("a ", "an ")
+    def _render_digit_hint(self, hint):
+        hint_text = super()._render_digit_hint(hint)
+        if hint.template_id == HintRecord.DIGITS_ONE:
+            hint_text = hint_text.replace("a ", "an ")
         
-        return digit_hints
+        return hint_text
     
-    def include_concept(self):
-        return abs(self._number) < 100
+    def include_concept(self, number):
+        return abs(self._get_number(number)) < 100
     
-    def evaluate_guess(self, guess, hint):
-        number = self._extract_number_from_hint(hint)
-        
-        digit_hint = self._pattern_match("digits", hint)
-        if not digit_hint:
-            feedback = self._get_non_digit_hint_feedback(hint, guess)
-        else:
-            feedback = self._get_digit_hint_feedback(hint, number, guess)
-        
-        return feedback
+    def _parse_non_digit_hint(self, hint, params):
+        tag = "even" if self._pattern_match("even", hint) else "odd"
+        return self._create_hint(HintRecord.MAIN, tag)
     
     def _get_non_digit_hint_feedback(self, hint, guess):
-        winning_number_tag = "even" if self._pattern_match("even", hint) else "odd"
+        winning_number_tag = hint.params[0]
         guess_tag = "even" if self._satisfies_condition(guess) else "odd"
         feedback = "good" if winning_number_tag == guess_tag else "bad"
         
         return feedback
     
-    def _satisfies_condition(self, x=None):
-        if not x and x != 0:
-            return self._numbers_obj.get_number_info("is factor", self._number, 2)
-        else:
-            return self._numbers_obj.get_number_info("is factor", x, 2)
\ No newline at end of file
+    def _get_non_digit_hint_mask(self, hint, numbers, number_info):
+        is_even = numbers % 2 == 0
+        return is_even if hint.params[0] == "even" else ~is_even
+    
+    def _satisfies_condition(self, x):
+        return self._numbers_obj.get_number_info("is factor", self._get_number(x), 2)
\ No newline at end of file
@@ -8,7 +8,7 @@ Classes:
 
 
 from concepts.math_concept import MathConcept
-from concepts.hints import MainHint, FactorHint, DigitHint
+from concepts.hints import HintRecord, MainHint, FactorHint, DigitHint
 
 
 
@@ -21,86 +21,104 @@ class Factor(MathConcept, MainHint, FactorHint, DigitHint):
     
     _name = "factor"
     
-    def __init__(self, number, numbers_obj, factor_data_obj):
-        super().__init__(number, numbers_obj, factor_data_obj)
+    def __init__(self, numbers_obj, factor_data_obj):
+        super().__init__(numbers_obj, factor_data_obj)
+        self._digit_hint_display_name = Factor._name
     
-    def generate_hints(self):
+    def generate_hints(self, number):
         """This method checks what factors the winning number has and adds a separate hint for each factor, along with one
         for the number of factors.  It also adds a hint for the number of its digits that are factors."""
         
-        hints = []
-        factors = self._numbers_obj.get_number_info("factors", self._number)
-        digits = self._numbers_obj.get_number_info("digits", self._number)
+        hints = list(self.iter_hints(number))
         
-        if len(factors) > 2 or self._number == 1:
-            main_hints = self._generate_main_hints(factors)
-            hints = hints + main_hints
-            
-            factor_hints = self._generate_factor_hints(factors)
-            hints = hints + factor_hints
+        return hints
+    
+    def iter_hints(self, number):
+        """This method yields the same hints as generate_hints, in the same order, creating each one as it is requested.
+        A highly composite number can have thousands of factors, so a caller that stops early skips creating the hints
+        for the rest of them."""
+        
+        profile = self._get_profile(number)
+        factors = profile.factors
+        digits = profile.digits
+        
+        if len(factors) > 2 or profile.number == 1:
+            yield from self._iter_main_hints(factors)
+            yield from self._generate_factor_hints(factors)
             
             if len(digits) > 1:
-                digit_hints = self._generate_digit_hints(factors, digits)
-                hints = hints + digit_hints
-        
-        return hints
+                yield from self._generate_digit_hints(profile)
     
     def _generate_main_hints(self, factors):
-        hints = []
+        hints = list(self._iter_main_hints(factors))
         
+        return hints
+    
+    def _iter_main_hints(self, factors):
         # Add hints for specific factors, not including the number itself or 1.
         for factor in factors[1:-1]:
-            ind_factor_hint = self._get_main_hint()
-            ind_factor_hint = ind_factor_hint.format(factor)
-            hints.append(ind_factor_hint)
-        
-        return hints
+            yield self._create_hint(HintRecord.MAIN, factor)
     
     def _generate_factor_hints(self, factors):
         hints = []
         
-        factors_hint = self._get_factor_hint()
-        factors_hint = factors_hint.format(len(factors))
+        factors_hint = self._create_hint(HintRecord.FACTOR, len(factors))
         hints.append(factors_hint)
         
         return hints
     
-    def _generate_digit_hints(self, factors, digits):
+    def _generate_digit_hints(self, number):
         hints = []
+        profile = self._get_profile(number)
         
         # If the number has at least 2 digits and is not prime, add a hint for number of digits that are also factors.
-        digit_factors = self._get_count_satisfying_condition(digits)
-        
-        digits_hint = self._get_count_based_hint(len(digits), digit_factors)
-        digits_hint = digits_hint.format(Factor._name)
+        digits_hint = self._create_digit_hint(len(profile.digits), profile.digit_factor_count)
         hints.append(digits_hint)
         
         return hints
     
-    def include_concept(self):
-        return self._number != 0
+    def include_concept(self, number):
+        return self._get_number(number) != 0
     
     def evaluate_guess(self, guess, hint):
-        number = self._extract_number_from_hint(hint)
+        hint = self._get_hint_record(hint)
         
-        digit_hint = self._pattern_match("digits", hint)
-        if not digit_hint:
-            individual_factor_hint = self._pattern_match("divisible", hint)
-            if individual_factor_hint:
+        if not hint.is_digit_hint():
+            number = hint.params[0]
+            if hint.template_id == HintRecord.MAIN:
                 feedback = "good" if self._numbers_obj.get_number_info("is factor", guess, number) else "bad"
             else:
-                factors = self._numbers_obj.get_number_info("factors", guess)
+                factors = self._get_profile(guess).factors
                 feedback = "good" if len(factors) == number else "bad"
-        
         else:
-            number_count = self._get_number_count(hint, number)
-            digits = self._numbers_obj.get_number_info("digits", guess)
-            digit_count = self._numbers_obj.get_number_info("digit factors", guess)
+            number_count = self._get_number_count(hint)
+            guess_profile = self._get_profile(guess)
+            digits = guess_profile.digits
+            digit_count = guess_profile.digit_factor_count
             guess_digit_count = self._get_guess_digit_count(digit_count, len(digits))
             
             feedback = "good" if number_count == guess_digit_count else "bad"
         
         return feedback
     
-    def _satisfies_condition(self, x):
-        return self._numbers_obj.get_number_info("is factor", self._number, x)
\ No newline at end of file
+    def get_hint_mask(self, hint, numbers, number_info):
+        hint = self._get_hint_record(hint)
+        
+        if hint.template_id == HintRecord.MAIN:
+            mask = numbers % hint.params[0] == 0
+        elif hint.template_id == HintRecord.FACTOR:
+            mask = number_info["factor count"] == hint.params[0]
+        else:
+            mask = self._get_digit_hint_mask(hint, number_info["digit factors"], number_info["digit length"])
+        
+        return mask
+    
+    def parse_hint(self, hint):
+        if self._pattern_match("digits", hint):
+            return self._parse_digit_hint(hint)
+        
+        template_id = HintRecord.MAIN if self._pattern_match("divisible", hint) else HintRecord.FACTOR
+        return self._create_hint(template_id, self._extract_number_from_hint(hint))
+    
+    def _satisfies_condition(self, x, number):
+        return self._numbers_obj.get_number_info("is factor", self._get_number(number), x)
\ No newline at end of file
@@ -4,11 +4,13 @@ components of the concrete concept classes used for hint generation and guess ev
 classes in this module are meant to be instantiated directly.
 
 Classes:
+    HintRecord
     Hint
     MainHint
     HintAddOn
     FactorHint
     DigitHint
+    GreaterLessHint
     HintGenerator
     Evaluator
 """
@@ -19,6 +21,76 @@ import re
 
 
 
+class HintRecord:
+    """
+    The HintRecord class is the structured form of a hint.  Hints are created as records by the concepts and passed
+    between the parts of the app in this form.  They are only rendered as text where they are shown to the user,
+    stored in the database, or logged.  Records are compared and hashed by a key made up of their type id, template
+    id, and parameters, so no text has to be built or parsed to evaluate a guess against a hint or to tell 2 hints
+    apart.  It uses __slots__ since a game holds many of them at once.
+    
+    The parameters of a record are exactly the values shown in its text, so 2 records are equal if and only if their
+    text is the same.
+    
+    Attributes:
+        type_id: The id of the hint type, matching the hint_type table.
+        template_id: The id of the template the hint is rendered with, one of the template ids defined below.
+        params: A tuple of the values filled in to the template.
+        _renderer: The object that created the hint and renders it as text.
+        _key: A tuple of the type id, template id, and parameters.
+    """
+    
+    __slots__ = ("type_id", "template_id", "params", "_renderer", "_key")
+    
+    MAIN = 1
+    FACTOR = 2
+    DIGITS_NONE = 3
+    DIGITS_ONE = 4
+    DIGITS_SOME = 5
+    DIGITS_ALL = 6
+    HIGHER = 7
+    LOWER = 8
+    
+    _digit_templates = (DIGITS_NONE, DIGITS_ONE, DIGITS_SOME, DIGITS_ALL)
+    
+    def __init__(self, type_id, template_id, params, renderer):
+        self.type_id = type_id
+        self.template_id = template_id
+        self.params = tuple(params)
+        self._renderer = renderer
+        self._key = (type_id, template_id, self.params)
+    
+    def get_key(self):
+        return self._key
+    
+    def get_type(self):
+        return self._renderer.get_name()
+    
+    def is_digit_hint(self):
+        return self.template_id in HintRecord._digit_templates
+    
+    def render(self):
+        return self._renderer.render_hint(self)
+    
+    def __str__(self):
+        return self.render()
+    
+    def __repr__(self):
+        return f"HintRecord{self._key}"
+    
+    def __eq__(self, other):
+        if not isinstance(other, HintRecord):
+            return NotImplemented
+        return self._key == other._key
+    
+    def __lt__(self, other):
+        return self._key < other._key
+    
+    def __hash__(self):
+        return hash(self._key)
+
+
+
 class Hint:
     """
     The Hint class is the base class for all hints.  It defines the text at the beginning of every hint.  Its
@@ -44,6 +116,9 @@ class MainHint(ABC, Hint):
     @abstractmethod
     def _generate_main_hints(self):
         pass
+    
+    def _render_main_hint(self, hint):
+        return self._get_main_hint().format(*hint.params)
 
 
 
@@ -78,6 +153,9 @@ class FactorHint(HintAddOn):
     
     def _get_factor_hint(self):
         return FactorHint._factor_hint
+    
+    def _render_factor_hint(self, hint):
+        return self._get_factor_hint().format(*hint.params)
 
 
 
@@ -87,10 +165,10 @@ class DigitHint(HintAddOn):
     """
     
     _digit_hints = {
-        "digits_none": "None of its digits are ",
-        "digits_one": "1 of its digits is a ",
-        "digits_some": "{} of its digits are ",
-        "digits_all": "All of its digits are "
+        HintRecord.DIGITS_NONE: "None of its digits are ",
+        HintRecord.DIGITS_ONE: "1 of its digits is a ",
+        HintRecord.DIGITS_SOME: "{} of its digits are ",
+        HintRecord.DIGITS_ALL: "All of its digits are "
     }
     
     def _generate_digit_hints(self):
@@ -99,23 +177,44 @@ class DigitHint(HintAddOn):
     def _get_count_based_hint(self, digit_count, match_count):
         """This method looks up hints based on the number of digits that meet a certain criteria."""
         
+        template_id = self._get_count_based_template(digit_count, match_count)
+        if not template_id:
+            return
+        
+        return self._get_digit_hint_text(template_id, (match_count,))
+    
+    def _get_count_based_template(self, digit_count, match_count):
+        """This method returns the id of the template for a digit hint, based on the number of digits that meet a
+        certain criteria."""
+        
         if match_count < 0 or type(match_count) != int:
             return
         
         if match_count == 0:
-            keyword = "digits_none"
+            template_id = HintRecord.DIGITS_NONE
         elif match_count == 1:
-            keyword = "digits_one"
+            template_id = HintRecord.DIGITS_ONE
         elif match_count == digit_count:
-            keyword = "digits_all"
+            template_id = HintRecord.DIGITS_ALL
         elif match_count < digit_count:
-            keyword = "digits_some"
+            template_id = HintRecord.DIGITS_SOME
         else:
             return
         
-        hint = Hint.get_hint_template() + DigitHint._digit_hints[keyword]
+        return template_id
+    
+    def _create_digit_hint(self, digit_count, match_count):
+        """This method creates a digit hint record.  Only hints for some of the digits show the count in their text,
+        so only those hints hold it as a parameter."""
+        
+        template_id = self._get_count_based_template(digit_count, match_count)
+        params = (match_count,) if template_id == HintRecord.DIGITS_SOME else ()
+        return self._create_hint(template_id, *params)
+    
+    def _get_digit_hint_text(self, template_id, params):
+        hint = Hint.get_hint_template() + DigitHint._digit_hints[template_id]
         if "{}" in hint:
-            hint = hint.format(match_count)
+            hint = hint.format(*params)
         
         if "1" in hint:
             hint = hint + "{}."
@@ -123,6 +222,37 @@ class DigitHint(HintAddOn):
             hint = hint + "{}s."
         
         return hint
+    
+    def _render_digit_hint(self, hint):
+        hint_text = self._get_digit_hint_text(hint.template_id, hint.params)
+        return hint_text.format(self._digit_hint_display_name)
+
+
+
+class GreaterLessHint(Hint):
+    """
+    The GreaterLessHint class is for the hints given after all of the hints specific to the winning number have been
+    used, which tell the user whether the winning number is higher or lower than their guess.  It creates and renders
+    the records for these hints.  It inherits from Hint.
+    """
+    
+    _greater_less_hints = {
+        HintRecord.HIGHER: "Nice try!  Higher.",
+        HintRecord.LOWER: "Nice try!  Lower."
+    }
+    
+    def __init__(self, data_obj):
+        self._data_obj = data_obj
+    
+    def generate_hint(self, guess, number):
+        template_id = HintRecord.HIGHER if guess < number else HintRecord.LOWER
+        return HintRecord(self._data_obj.get_id(), template_id, (), self)
+    
+    def render_hint(self, hint):
+        return GreaterLessHint._greater_less_hints[hint.template_id]
+    
+    def get_name(self):
+        return self._data_obj.get_name()
 
 
 
@@ -130,14 +260,15 @@ class HintGenerator(ABC):
     """
     The HintGenerator class is an interface that defines an abstract method for generating hints, as well as one that
     defines the condition in which the hints for a particular math concept should be included in an aggregate hint list.
+    Both take in the number the hints are for.
     """
     
     @abstractmethod
-    def generate_hints(self):
+    def generate_hints(self, number):
         pass
     
     @abstractmethod
-    def include_concept(self):
+    def include_concept(self, number):
         pass
 
 
@@ -145,22 +276,63 @@ class HintGenerator(ABC):
 class Evaluator(ABC):
     """
     The Evaluator class is an interface that defines an abstract method for evaluating whether a guess matches a hint,
-    based on the specific math concept that generated the hint.
+    based on the specific math concept that generated the hint.  Guesses are evaluated against hint records.  Hints
+    that come in as text, such as hints read from the database, are parsed into a record once with the parse_hint
+    method.
     """
     
+    _number_counts = {
+        HintRecord.DIGITS_NONE: "none",
+        HintRecord.DIGITS_ONE: "1",
+        HintRecord.DIGITS_ALL: "all"
+    }
+    
     @abstractmethod
     def evaluate_guess(self):
         pass
     
-    def _get_number_count(self, hint, number=None):
-        if number:
-            number_count = str(number)
-        elif self._pattern_match("None", hint):
-            number_count = "none"
+    @abstractmethod
+    def parse_hint(self):
+        pass
+    
+    def _get_hint_record(self, hint):
+        return hint if isinstance(hint, HintRecord) else self.parse_hint(hint)
+    
+    def _get_number_count(self, hint):
+        if hint.template_id == HintRecord.DIGITS_SOME:
+            return str(hint.params[0])
+        return Evaluator._number_counts[hint.template_id]
+    
+    def _parse_digit_hint(self, hint):
+        """This method parses the text of a digit hint into a hint record.  Only hints for some of the digits have
+        the count as a parameter."""
+        
+        number = self._extract_number_from_hint(hint)
+        if self._pattern_match("None", hint):
+            template_id = HintRecord.DIGITS_NONE
+        elif self._pattern_match("All", hint):
+            template_id = HintRecord.DIGITS_ALL
+        elif number == 1:
+            template_id = HintRecord.DIGITS_ONE
         else:
-            number_count = "all"
+            template_id = HintRecord.DIGITS_SOME
+        
+        params = (number,) if template_id == HintRecord.DIGITS_SOME else ()
+        return self._create_hint(template_id, *params)
+    
+    @staticmethod
+    def _get_digit_hint_mask(hint, digit_counts, digit_lengths):
+        """This static method is the array form of comparing a digit hint to the digit count of a guess.  It takes
+        in an array of the number of digits that meet a certain criteria and an array of the number of digits, and
+        returns a boolean array marking the numbers the digit hint holds for."""
+        
+        if hint.template_id == HintRecord.DIGITS_NONE:
+            return digit_counts == 0
+        if hint.template_id == HintRecord.DIGITS_ALL:
+            return (digit_counts == digit_lengths) & (digit_counts != 0)
         
-        return number_count
+        match_count = hint.params[0] if hint.template_id == HintRecord.DIGITS_SOME else 1
+        return (digit_counts == match_count) & (digit_counts != digit_lengths)
     
     def _get_guess_digit_count(self, digit_count, number):
         if digit_count == 0:
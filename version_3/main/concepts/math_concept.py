@@ -12,8 +12,10 @@ Classes:
 """
 
 
+import numpy as np
 from resources.infrastructure.subsystem import BaseClass
-from concepts.hints import HintGenerator, Evaluator, Hint, MainHint, FactorHint, DigitHint
+from resources.infrastructure.number_profile import NumberProfile
+from concepts.hints import HintRecord, HintGenerator, Evaluator, Hint, MainHint, FactorHint, DigitHint
 
 
 
@@ -23,34 +25,85 @@ class MathConcept(HintGenerator, Evaluator, BaseClass):
     the HintGenerator and Evaluator interfaces, deferring its abstract methods to its subclasses.  It also includes
     an object of the Number class which it uses to generate hints and evaluate guesses for each subclass's
     particular math concept.
+    
+    Concepts hold no state about a particular number.  Each one is created once and shared as a flyweight, and
+    the number it generates hints for is passed in to its methods, either as an integer or as a NumberProfile
+    object, so every characteristic of the number is computed once and shared by all of the concepts.
+    
+    Hints are generated as HintRecord objects, and each concept renders the records it created as text.  Each
+    concept can also mark which of an array of numbers are consistent with a hint in one vectorized pass, using the
+    columns of a BatchNumberInfo object computed for those numbers.
     """
     
     _name = ""
     
-    def __init__(self, number, numbers_obj, data_obj):
+    def __init__(self, numbers_obj, data_obj):
         super().__init__()
         
-        self._number = number
         self._numbers_obj = numbers_obj
         self._data_obj = data_obj
         
         self._obj_id_method = self.get_name
         self._standardized_method = self.evaluate_guess
     
-    def generate_hints(self):
+    def generate_hints(self, number):
+        pass
+    
+    def iter_hints(self, number):
+        """This method yields the hints for a number one at a time, so a caller that only needs a few of them does not
+        have to wait for the rest.  This version yields the hints from generate_hints, for concepts that only ever have
+        a few hints.  Concepts that can have many hints override it to create each hint as it is requested."""
+        
+        yield from self.generate_hints(number)
+    
+    def include_concept(self, number):
         pass
     
-    def include_concept(self):
+    def evaluate_guess(self, guess, hint):
         pass
     
-    def evaluate_guess(self):
+    def parse_hint(self, hint):
         pass
     
+    def get_hint_mask(self, hint, numbers, number_info):
+        """This method takes in a hint and an array of numbers, along with the BatchNumberInfo columns for them, and
+        returns a boolean array marking the numbers that are consistent with the hint.  This version evaluates the
+        numbers one at a time, for concepts that do not have a vectorized version."""
+        
+        hint = self._get_hint_record(hint)
+        return np.array([self.evaluate_guess(int(x), hint) == "good" for x in numbers], dtype=bool)
+    
+    def render_hint(self, hint):
+        """This method renders a hint record created by the concept as text, using the method for its template."""
+        
+        if hint.template_id == HintRecord.MAIN:
+            hint_text = self._render_main_hint(hint)
+        elif hint.template_id == HintRecord.FACTOR:
+            hint_text = self._render_factor_hint(hint)
+        else:
+            hint_text = self._render_digit_hint(hint)
+        
+        return hint_text
+    
     def get_name(self):
         return self._data_obj.get_name()
     
+    def _create_hint(self, template_id, *params):
+        return HintRecord(self._data_obj.get_id(), template_id, params, self)
+    
     def _get_main_hint(self):
         return Hint.get_hint_template() + self._data_obj.get_main_hint()
+    
+    def _get_profile(self, x):
+        """This method returns the profile of a number.  If a NumberProfile object is passed in, it is returned as is."""
+        
+        if isinstance(x, NumberProfile):
+            return x
+        return self._numbers_obj.get_number_profile(x)
+    
+    @staticmethod
+    def _get_number(x):
+        return x.number if isinstance(x, NumberProfile) else x
 
 
 
@@ -60,35 +113,41 @@ class DigitConcept(MathConcept, MainHint):
     It inherits from MathConcept and MainHint.
     """
     
-    def __init__(self, number, numbers_obj, data_obj):
-        super().__init__(number, numbers_obj, data_obj)
+    def __init__(self, numbers_obj, data_obj):
+        super().__init__(numbers_obj, data_obj)
         self._formula = None
+        self._info_column = None
         self._min_number_to_include = 0
     
-    def generate_hints(self):
-        hints = self._generate_main_hints()
+    def generate_hints(self, number):
+        hints = self._generate_main_hints(self._get_profile(number))
         return hints
     
-    def _generate_main_hints(self):
+    def _generate_main_hints(self, number):
         hints = []
-        digits = self._numbers_obj.get_number_info("digits", self._number)
+        digits = self._get_profile(number).digits
         
-        hint = self._get_main_hint()
-        hint = hint.format(self._formula(digits))
+        hint = self._create_hint(HintRecord.MAIN, self._formula(digits))
         hints.append(hint)
         
         return hints
     
-    def include_concept(self):
-        return abs(self._number) > self._min_number_to_include
+    def include_concept(self, number):
+        return abs(self._get_number(number)) > self._min_number_to_include
     
     def evaluate_guess(self, guess, hint):
-        number = self._extract_number_from_hint(hint)
-        digits = self._numbers_obj.get_number_info("digits", guess)
+        number = self._get_hint_record(hint).params[0]
+        digits = self._get_profile(guess).digits
         
         feedback = "good" if self._formula(digits) == number else "bad"
         
         return feedback
+    
+    def parse_hint(self, hint):
+        return self._create_hint(HintRecord.MAIN, self._extract_number_from_hint(hint))
+    
+    def get_hint_mask(self, hint, numbers, number_info):
+        return number_info[self._info_column] == self._get_hint_record(hint).params[0]
 
 
 
@@ -99,15 +158,16 @@ class StandardConcept(MathConcept, MainHint, DigitHint):
     DigitHint.
     """
     
-    def __init__(self, number, numbers_obj, data_obj):
-        super().__init__(number, numbers_obj, data_obj)
+    def __init__(self, numbers_obj, data_obj):
+        super().__init__(numbers_obj, data_obj)
         self._digit_hint_display_name = ""
     
-    def generate_hints(self):
+    def generate_hints(self, number):
         hints = []
-        digits = self._numbers_obj.get_number_info("digits", self._number)
+        profile = self._get_profile(number)
+        digits = profile.digits
         
-        main_hints = self._generate_main_hints()
+        main_hints = self._generate_main_hints(profile)
         hints = hints + main_hints
         
         if len(digits) > 1:
@@ -122,16 +182,59 @@ class StandardConcept(MathConcept, MainHint, DigitHint):
         # If it is at least a 2-digit number, add a hint for the number of digits that are perfect squares.
         digit_count = self._get_count_satisfying_condition(digits)
         
-        digits_hint = self._get_count_based_hint(len(digits), digit_count)
-        digits_hint = digits_hint.format(self._digit_hint_display_name)
+        digits_hint = self._create_digit_hint(len(digits), digit_count)
         hints.append(digits_hint)
         
         return hints
     
-    def _get_digit_hint_feedback(self, hint, number, guess):
-        number_count = self._get_number_count(hint, number)
+    def evaluate_guess(self, guess, hint):
+        hint = self._get_hint_record(hint)
+        
+        if not hint.is_digit_hint():
+            feedback = self._get_non_digit_hint_feedback(hint, guess)
+        else:
+            feedback = self._get_digit_hint_feedback(hint, guess)
+        
+        return feedback
+    
+    def parse_hint(self, hint):
+        """This method parses the text of a hint into a hint record.  Digit hints are recognized by the word "digits",
+        and any number in the text of the other hints is a parameter of them."""
+        
+        if self._pattern_match("digits", hint):
+            return self._parse_digit_hint(hint)
+        
+        number = self._extract_number_from_hint(hint)
+        params = (number,) if number else ()
+        return self._parse_non_digit_hint(hint, params)
+    
+    def get_hint_mask(self, hint, numbers, number_info):
+        """This method marks the numbers consistent with a hint.  Digit hints are checked against the column of counts
+        of digits that satisfy the concept's condition."""
+        
+        hint = self._get_hint_record(hint)
+        
+        if not hint.is_digit_hint():
+            mask = self._get_non_digit_hint_mask(hint, numbers, number_info)
+        else:
+            digit_counts = number_info[f"{self._digit_hint_display_name} digits"]
+            mask = self._get_digit_hint_mask(hint, digit_counts, number_info["digit length"])
+        
+        return mask
+    
+    def _parse_non_digit_hint(self, hint, params):
+        return self._create_hint(HintRecord.MAIN, *params)
+    
+    def _get_non_digit_hint_mask(self, hint, numbers, number_info):
+        return MathConcept.get_hint_mask(self, hint, numbers, number_info)
+    
+    def _get_non_digit_hint_feedback(self, hint, guess):
+        pass
+    
+    def _get_digit_hint_feedback(self, hint, guess):
+        number_count = self._get_number_count(hint)
         
-        digits = self._numbers_obj.get_number_info("digits", guess)
+        digits = self._get_profile(guess).digits
         digit_count = self._get_count_satisfying_condition(digits)
         guess_digit_count = self._get_guess_digit_count(digit_count, len(digits))
         
@@ -147,31 +250,20 @@ class PerfectExponentConcept(StandardConcept):
     It inherits from StandardConcept.  Its subclasses are defined in the perfect_exponents.py module.
     """
     
-    def _generate_main_hints(self):
+    def _generate_main_hints(self, number):
         hints = []
         
-        if self._satisfies_condition():
-            main_hint = self._get_main_hint()
+        if self._satisfies_condition(number):
+            main_hint = self._create_hint(HintRecord.MAIN)
             hints.append(main_hint)
         
         return hints
     
-    def evaluate_guess(self, guess, hint):
-        number = self._extract_number_from_hint(hint)
-        
-        digit_hint = self._pattern_match("digits", hint)
-        if not digit_hint:
-            feedback = self._get_non_digit_hint_feedback(guess)
-        else:
-            feedback = self._get_digit_hint_feedback(hint, number, guess)
-        
-        return feedback
-    
-    def _get_non_digit_hint_feedback(self, guess):
+    def _get_non_digit_hint_feedback(self, hint, guess):
         return "good" if self._satisfies_condition(guess) else "bad"
     
-    def _satisfies_condition(self, x=None):
-        if not x and x != 0:
-            return self._numbers_obj.get_number_info(f"is {self._digit_hint_display_name}", self._number)
-        else:
-            return self._numbers_obj.get_number_info(f"is {self._digit_hint_display_name}", x)
\ No newline at end of file
+    def _get_non_digit_hint_mask(self, hint, numbers, number_info):
+        return number_info[f"is {self._digit_hint_display_name}"]
+    
+    def _satisfies_condition(self, x):
+        return self._get_profile(x).get_info(f"is {self._digit_hint_display_name}")
\ No newline at end of file
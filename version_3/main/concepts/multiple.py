@@ -7,8 +7,9 @@ Classes:
 """
 
 
+import numpy as np
 from concepts.math_concept import MathConcept
-from concepts.hints import MainHint
+from concepts.hints import HintRecord, MainHint
 
 
 
@@ -20,20 +21,21 @@ class Multiple(MathConcept, MainHint):
     
     _name = "multiple"
     
-    def __init__(self, number, numbers_obj, multiple_data_obj):
-        super().__init__(number, numbers_obj, multiple_data_obj)
+    def __init__(self, numbers_obj, multiple_data_obj):
+        super().__init__(numbers_obj, multiple_data_obj)
     
-    def generate_hints(self, filter_results=True):
+    def generate_hints(self, number, filter_results=True):
         """This method generates a few multiples of the winning number, picks 2 of them at random, and adds a hint for each
         of those 2.  If filter_results is False, it returns all of the hints instead of picking 2 of them."""
         
-        hints = self._generate_main_hints(filter_results)
+        hints = self._generate_main_hints(number, filter_results)
         
         return hints
     
-    def _generate_main_hints(self, filter_results=True):
+    def _generate_main_hints(self, number, filter_results=True):
         hints = []
-        multiples = [self._number * i for i in range(1,6)]
+        number = self._get_number(number)
+        multiples = [number * i for i in range(1,6)]
         
         if filter_results:
             hint_indexes = self._numbers_obj.get_random_numbers((0, len(multiples)), n=2)
@@ -46,20 +48,30 @@ class Multiple(MathConcept, MainHint):
         return hints
     
     def _add_multiple_hint_to_list(self, hints, multiple):
-        hint = self._get_main_hint()
-        hint = hint.format(multiple)
+        hint = self._create_hint(HintRecord.MAIN, multiple)
         if hint not in hints:
             hints.append(hint)
     
-    def include_concept(self):
-        return self._number not in (0, 1)
+    def include_concept(self, number):
+        return self._get_number(number) not in (0, 1)
     
     def evaluate_guess(self, guess, hint):
-        number = self._extract_number_from_hint(hint)
+        number = self._get_hint_record(hint).params[0]
         
         if guess != 0:
             feedback = "good" if self._numbers_obj.get_number_info("is factor", number, guess) else "bad"
         else:
             feedback = "good" if number == guess else "bad"
         
-        return feedback
\ No newline at end of file
+        return feedback
+    
+    def get_hint_mask(self, hint, numbers, number_info):
+        """This method marks the numbers that are factors of the multiple in a hint.  Zero is only consistent with a
+        hint for the multiple 0."""
+        
+        multiple = self._get_hint_record(hint).params[0]
+        nonzero_numbers = np.where(numbers == 0, 1, numbers)
+        return np.where(numbers != 0, multiple % nonzero_numbers == 0, multiple == 0)
+    
+    def parse_hint(self, hint):
+        return self._create_hint(HintRecord.MAIN, self._extract_number_from_hint(hint))
\ No newline at end of file
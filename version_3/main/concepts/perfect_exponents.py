@@ -19,12 +19,12 @@ class PerfectSquare(PerfectExponentConcept):
     
     _name = "perfect square"
     
-    def __init__(self, number, numbers_obj, perfect_square_data_obj):
-        super().__init__(number, numbers_obj, perfect_square_data_obj)
+    def __init__(self, numbers_obj, perfect_square_data_obj):
+        super().__init__(numbers_obj, perfect_square_data_obj)
         self._digit_hint_display_name = PerfectSquare._name
     
-    def include_concept(self):
-        return self._number >= 0
+    def include_concept(self, number):
+        return self._get_number(number) >= 0
 
 
 
@@ -35,9 +35,9 @@ class PerfectCube(PerfectExponentConcept):
     
     _name = "perfect cube"
     
-    def __init__(self, number, numbers_obj, perfect_cube_data_obj):
-        super().__init__(number, numbers_obj, perfect_cube_data_obj)
+    def __init__(self, numbers_obj, perfect_cube_data_obj):
+        super().__init__(numbers_obj, perfect_cube_data_obj)
         self._digit_hint_display_name = PerfectCube._name
     
-    def include_concept(self):
+    def include_concept(self, number):
         return True
\ No newline at end of file
@@ -8,7 +8,7 @@ Classes:
 
 
 from concepts.math_concept import StandardConcept
-from concepts.hints import FactorHint
+from concepts.hints import HintRecord, FactorHint
 
 
 
@@ -19,26 +19,29 @@ class PrimeNumber(StandardConcept, FactorHint):
     
     _name = "prime number"
     
-    def __init__(self, number, numbers_obj, prime_data_obj):
-        super().__init__(number, numbers_obj, prime_data_obj)
+    def __init__(self, numbers_obj, prime_data_obj):
+        super().__init__(numbers_obj, prime_data_obj)
         self._digit_hint_display_name = PrimeNumber._name
     
-    def generate_hints(self):
-        hints = super().generate_hints()
+    def generate_hints(self, number):
+        profile = self._get_profile(number)
+        hints = super().generate_hints(profile)
         
-        factors = self._numbers_obj.get_number_info("factors", self._number)
+        factors = profile.factors
         if len(factors) > 2:
-            factor_hints = self._generate_factor_hints(factors)
+            # Only the prime factors can satisfy the condition, so they are all that need to be checked, rather than
+            # every factor of the number.
+            factor_hints = self._generate_factor_hints(profile.prime_factors)
             hints = hints + factor_hints
         
         return hints
     
-    def _generate_main_hints(self):
+    def _generate_main_hints(self, number):
         hints = []
         
         # Add a hint if the number is prime (has exactly 2 factors).
-        if self._satisfies_condition():
-            main_hint = self._get_main_hint()
+        if self._satisfies_condition(number):
+            main_hint = self._create_hint(HintRecord.MAIN)
             hints.append(main_hint)
         
         return hints
@@ -48,37 +51,34 @@ class PrimeNumber(StandardConcept, FactorHint):
         
         prime_factors_count = self._get_count_satisfying_condition(factors)
         
-        prime_factors_hint = self._get_factor_hint()
-        prime_factors_hint = prime_factors_hint.format(str(prime_factors_count) + " prime")
+        prime_factors_hint = self._create_hint(HintRecord.FACTOR, prime_factors_count)
         hints.append(prime_factors_hint)
         
         return hints
     
-    def include_concept(self):
-        return self._number >= 0
+    def include_concept(self, number):
+        return self._get_number(number) >= 0
     
-    def evaluate_guess(self, guess, hint):
-        number = self._extract_number_from_hint(hint)
-        
-        digit_hint = self._pattern_match("digits", hint)
-        if not digit_hint:
-            feedback = self._get_non_digit_hint_feedback(number, guess)
-        else:
-            feedback = self._get_digit_hint_feedback(hint, number, guess)
-        
-        return feedback
+    def _render_factor_hint(self, hint):
+        return self._get_factor_hint().format(str(hint.params[0]) + " prime")
     
-    def _get_non_digit_hint_feedback(self, number, guess):
-        if not number:
+    def _parse_non_digit_hint(self, hint, params):
+        template_id = HintRecord.FACTOR if params else HintRecord.MAIN
+        return self._create_hint(template_id, *params)
+    
+    def _get_non_digit_hint_feedback(self, hint, guess):
+        if hint.template_id == HintRecord.MAIN:
             feedback = "good" if self._satisfies_condition(guess) else "bad"
         else:
-            prime_factors = self._numbers_obj.get_number_info("prime factors", guess)
-            feedback = "good" if len(prime_factors) == number else "bad"
+            prime_factors = self._get_profile(guess).prime_factors
+            feedback = "good" if len(prime_factors) == hint.params[0] else "bad"
         
         return feedback
     
-    def _satisfies_condition(self, x=None):
-        if not x and x != 0:
-            return self._numbers_obj.get_number_info("is prime", self._number)
-        else:
-            return self._numbers_obj.get_number_info("is prime", x)
\ No newline at end of file
+    def _get_non_digit_hint_mask(self, hint, numbers, number_info):
+        if hint.template_id == HintRecord.MAIN:
+            return number_info["is prime"]
+        return number_info["prime factor count"] == hint.params[0]
+    
+    def _satisfies_condition(self, x):
+        return self._get_profile(x).is_prime
\ No newline at end of file
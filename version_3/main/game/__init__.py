@@ -14,6 +14,8 @@ Modules:
     guess_manager.py
     guess.py
     hint_manager.py
+    candidates.py
+    hint_policies.py
     game_summarizers.py
     feedback.py
     improvement.py
@@ -0,0 +1,209 @@
+"""
+The candidates.py module is part of the game package.  It is for keeping track of the numbers that could still be
+the winning number, given the guesses and hints in a game so far.  The HintManager uses it to tell which hints
+would give the user new information.
+
+Classes:
+    CandidateSet
+"""
+
+
+import numpy as np
+from concepts.hints import HintRecord
+
+
+
+class CandidateSet:
+    """
+    The CandidateSet class holds the numbers in the range of a game that are consistent with every hint given and
+    are not among the guesses made.  The set is a NumPy boolean mask over the range, so narrowing it with a hint or
+    checking whether a hint would narrow it is a single vectorized pass over the mask.  The mask for each hint is
+    computed once per game, the first time it is needed, from BatchNumberInfo columns that are each computed once
+    for the whole range, the first time a mask needs them.
+    
+    Ranges with more numbers than the value of the _max_size attribute, such as the expert level's, are too large to
+    hold in a mask.  So are ranges with more numbers beyond the factorization sieve than the value of the
+    _sample_size attribute, since each of those is factorized on its own.  For those, the set is tracked over a
+    random sample of the range that always holds the winning number, and a hint is only known to narrow the set if it
+    rules out one of the numbers in the sample.  The counts are estimates for the whole range: the winning number, plus
+    the share of the rest of the sample still left scaled up to the rest of the range.  The numbers in a sample are
+    mostly beyond the sieve, so their factor columns are prefetched in a background thread as soon as the set is
+    created, and only a mask that needs them waits for them.
+    
+    A few true hints rule out most of a sample, after which the sample holds no candidates other than the winning
+    number and can no longer tell the hints apart.  From then on, a hint narrows the set if it rules out any of the rest
+    of the sample, unless it was applied already or one of the hints applied that keeps some of the rest of the sample
+    already rules out every number there that it does.  Each hint is assumed to rule out the same share of the
+    candidates left as it does of the rest of the sample, so the estimated count keeps shrinking with every hint.
+    
+    Attributes:
+        _concepts: The ConceptManager object used to mark the numbers consistent with a hint.
+        _numbers: A sorted array of every number in the range, or of a random sample of it for large ranges.
+        _mask: A boolean array marking the numbers that are still candidates.
+        _winning_mask: A boolean array marking the winning number in a sample, or None if the range is not sampled.
+        _scale: The number of numbers in the rest of the range each of the rest of the sample stands for, or None if
+            the range is not sampled.
+        _spent_count: The estimated count once the sample has no candidates left other than the winning number, or
+            None until then.
+        _applied_masks: A list of the masks of the hints applied so far.
+        _number_info: A LazyNumberInfo object with the BatchNumberInfo columns for the range.
+        _hint_masks: A dictionary of the masks computed so far, keyed by hint.
+    """
+    
+    _max_size = 10**5
+    _sample_size = 1024
+    
+    def __init__(self, num_range, numbers_obj, concepts):
+        low, high = num_range
+        self._numbers_obj = numbers_obj
+        self._concepts = concepts
+        
+        self._winning_mask = None
+        self._scale = None
+        self._spent_count = None
+        self._applied_masks = []
+        
+        if not self._fits_mask(low, high):
+            self._numbers = self._get_sample(low, high)
+        else:
+            self._numbers = np.arange(low, high + 1, dtype=np.int64)
+        self._mask = np.ones(len(self._numbers), dtype=bool)
+        self._number_info = self._numbers_obj.get_lazy_batch_number_info(self._numbers)
+        self._hint_masks = {}
+        
+        if self._winning_mask is not None:
+            self._number_info.prefetch("factor count")
+    
+    def _get_sample(self, low, high):
+        """This method draws the sample for a range too large for a mask, adding the winning number to it if it is in
+        the range, and sets the attributes used to estimate counts from it."""
+        
+        sample = self._numbers_obj.get_random_numbers((low, high + 1), n=CandidateSet._sample_size - 1)
+        winning_number = self._concepts.get_number()
+        if low <= winning_number <= high:
+            sample.append(winning_number)
+        numbers = np.unique(np.array(sample, dtype=np.int64))
+        
+        self._winning_mask = numbers == winning_number
+        winning_count = int(np.count_nonzero(self._winning_mask))
+        self._scale = (high - low + 1 - winning_count) / (len(numbers) - winning_count)
+        
+        return numbers
+    
+    def _fits_mask(self, low, high):
+        beyond_sieve_count = high - max(low - 1, self._numbers_obj.get_max_sieve_limit())
+        return high - low + 1 <= CandidateSet._max_size and beyond_sieve_count <= CandidateSet._sample_size
+    
+    def get_count(self):
+        """This method returns the number of candidates left, which is an estimate for ranges that are sampled."""
+        
+        if self._spent_count is not None:
+            return self._spent_count
+        return int(self._get_estimated_counts(self._mask))
+    
+    def get_candidates(self):
+        """This method returns the candidates left, which are only the candidates in the sample for ranges that are
+        sampled."""
+        
+        return self._numbers[self._mask].tolist()
+    
+    def exclude(self, guess):
+        """This method removes a guess from the candidates.  Guesses outside of the range are ignored."""
+        
+        index = int(np.searchsorted(self._numbers, guess))
+        if index < len(self._numbers) and self._numbers[index] == guess:
+            self._mask[index] = False
+    
+    def apply_hint(self, hint, guess=None):
+        """This method narrows the candidates to the numbers consistent with a hint.  Hints for whether the number is
+        higher or lower are applied relative to the guess they were given for."""
+        
+        if hint.template_id == HintRecord.HIGHER:
+            hint_mask = self._numbers > guess
+        elif hint.template_id == HintRecord.LOWER:
+            hint_mask = self._numbers < guess
+        else:
+            hint_mask = self._get_hint_mask(hint)
+        
+        if self._spent_count is None and self._is_spent(self._mask & hint_mask):
+            self._spent_count = self.get_count()
+        if self._spent_count is not None:
+            self._spent_count = int(self._get_spent_counts(hint_mask[np.newaxis])[0])
+        self._mask &= hint_mask
+        self._applied_masks.append(hint_mask)
+    
+    def narrows(self, hint):
+        """This method checks whether a hint would rule out any of the candidates left.  It is the measure of whether
+        a hint is relevant.  Once a sample has no candidates left other than the winning number, it checks the hint
+        against the rest of the sample instead."""
+        
+        if self._spent_count is not None:
+            return self._narrows_spent(self._get_hint_mask(hint))
+        return bool(np.any(self._mask & ~self._get_hint_mask(hint)))
+    
+    def split_hints(self, hints):
+        """This method splits a list of hints into the ones that would narrow the candidates and the ones that would
+        not, keeping the order of each."""
+        
+        relevant_hints = []
+        redundant_hints = []
+        for hint in hints:
+            if self.narrows(hint):
+                relevant_hints.append(hint)
+            else:
+                redundant_hints.append(hint)
+        
+        return relevant_hints, redundant_hints
+    
+    def get_remaining_counts(self, hints):
+        """This method returns an array with the number of candidates that would be left after each of a list of
+        hints.  The masks of the hints are stacked into one array, so all of the counts take one vectorized pass."""
+        
+        hint_masks = np.stack([self._get_hint_mask(hint) for hint in hints])
+        if self._spent_count is not None:
+            return self._get_spent_counts(hint_masks)
+        return self._get_estimated_counts(hint_masks & self._mask)
+    
+    def _get_estimated_counts(self, masks):
+        """This method counts the numbers marked in the last axis of an array of masks.  For a sample, the winning
+        number counts as one and each of the rest of the sample counts for its share of the rest of the range."""
+        
+        counts = np.count_nonzero(masks, axis=-1)
+        if self._winning_mask is None:
+            return counts
+        
+        winning_counts = np.count_nonzero(masks & self._winning_mask, axis=-1)
+        return winning_counts + np.rint((counts - winning_counts) * self._scale).astype(np.int64)
+    
+    def _get_spent_counts(self, hint_masks):
+        """This method estimates the candidates that would be left after each of an array of hint masks, once the
+        sample has no candidates left other than the winning number, from the share of the rest of the sample each
+        hint keeps.  At least the winning number is always left."""
+        
+        others = ~self._winning_mask
+        shares = np.count_nonzero(hint_masks & others, axis=-1) / max(np.count_nonzero(others), 1)
+        return np.maximum(np.rint(self._spent_count * shares), 1).astype(np.int64)
+    
+    def _narrows_spent(self, hint_mask):
+        """This method checks whether a hint mask rules out any of the rest of the sample that is not ruled out by a
+        hint applied already.  Applied hints that keep none of the rest of the sample say nothing about the hint."""
+        
+        applied_masks = np.stack(self._applied_masks)
+        if np.any(np.all(applied_masks == hint_mask, axis=1)):
+            return False
+        
+        applied_masks = applied_masks & ~self._winning_mask
+        applied_masks = applied_masks[np.any(applied_masks, axis=1)]
+        if not len(applied_masks):
+            applied_masks = ~self._winning_mask[np.newaxis]
+        
+        return bool(np.all(np.any(applied_masks & ~hint_mask, axis=1)))
+    
+    def _is_spent(self, mask):
+        return self._winning_mask is not None and not np.any(mask & ~self._winning_mask)
+    
+    def _get_hint_mask(self, hint):
+        if hint not in self._hint_masks:
+            self._hint_masks[hint] = self._concepts.evaluate_guesses(hint, self._numbers, self._number_info)
+        
+        return self._hint_masks[hint]
\ No newline at end of file
@@ -37,15 +37,24 @@ class Feedback:
 class GuessFeedback(Feedback):
     """
     The GuessFeedback class is for feedback after a guess, based on whether the guess is in line with
-    the hint provided.  It inherits from Feedback.
+    the hint provided.  The last hint is taken from the HintManager as a HintRecord object when it has one, so the
+    guess is evaluated without parsing any text.  Otherwise, it is read from the database.  It inherits from Feedback.
     """
     
     def __init__(self, objects, feedback, guess):
         super().__init__(objects, feedback)
         self._guess = guess
-        self._last_hint_type, self._last_hint = self._session.get_last_hint()
+        self._last_hint_type, self._last_hint = self._get_last_hint()
         self._logs = self._objects.get_object("logs")
     
+    def _get_last_hint(self):
+        hints = self._objects.get_object("hints")
+        last_hint = hints.get_last_hint() if hints else None
+        
+        if last_hint:
+            return last_hint.get_type(), last_hint
+        return self._session.get_last_hint()
+    
     def get_feedback(self, guess_concepts):
         feedback_number, feedback_ind = self._generate_guess_feedback(guess_concepts)
         self._record_guess_feedback(feedback_number, feedback_ind)
@@ -127,7 +136,7 @@ class FeedbackManager:
         self._feedback = pd.DataFrame(columns=["hint_type", "hint", "guess", "feedback_ind"])
     
     def get_guess_feedback(self, guess, guess_concepts):
-        if self._session.get_total_hints_given()[0]:
+        if self._session.current_hint_count:
             guess_feedback = GuessFeedback(self._objects, self._feedback, guess)
             feedback_ind = guess_feedback.get_feedback(guess_concepts)
             return feedback_ind
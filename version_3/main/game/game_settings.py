@@ -1,6 +1,7 @@
 """
 The game_settings.py module is part of the game package.  It is for setting the parameters for the
-game, including the winning number, the level of difficulty, the number range, and the penalty.
+game, including the winning number, the level of difficulty, the number range, the penalty, and the seed
+for the random numbers drawn during the game.
 
 Classes:
     GameSettings
@@ -59,6 +60,8 @@ class GameSettings:
     
     def _set_winning_number(self):
         low_num, high_num = self._level_obj.get_number_range()
+        self._numbers.set_number_range((low_num, high_num))
+        self._settings["seed"] = self._numbers.new_random_seed()
         self._winning_number = self._numbers.get_random_numbers((low_num, high_num + 1), n=1)
         self._settings["winning number"] = self._winning_number
     
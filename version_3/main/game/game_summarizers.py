@@ -33,6 +33,8 @@ class GameSummarizer:
     def run_game_summary(self):
         self._update_database()
         self._get_game_feedback()
+        # The feedback given is recorded in the background, so it is written before the game's records are read.
+        self._session.flush_writes()
         self._get_end_game_message()
         self._update_user_metrics()
         if self._logs:
@@ -62,7 +64,7 @@ class GameSummarizer:
         FROM game gm
             LEFT JOIN guess gs ON gm.game_id = gs.game_id
             LEFT JOIN outcome o ON gm.game_id = o.game_id
-        WHERE gm.game_id = (SELECT MAX(game_id) FROM game WHERE session_id = {self._session.session_id})
+        WHERE gm.game_id = {self._session.current_game_id}
         ORDER BY gm.game_id, gs.guess_id
         ;"""
         db_manager = self._objects.get_object("db_manager")
@@ -13,7 +13,7 @@ Classes:
 """
 
 
-from resources.infrastructure.log_entries import NewGuessLogEntry
+from resources.infrastructure.log_entries import NewGuessLogEntry, HintSelectionLogEntry
 from resources.infrastructure.iterable_log_entries import RemainingHintsLogEntry
 
 
@@ -42,7 +42,7 @@ class Guess:
         self._update_screen_text(message)
     
     def _update_screen_text(self, message):
-        self._text_display.display_text("dynamic", "hint_text", message)
+        self._text_display.display_text("dynamic", "hint_text", str(message))
         self._update_status()
     
     def _update_db(self, message, feedback=None, error=False, error_type=None):
@@ -120,8 +120,8 @@ class IncorrectGuess(ValidGuess):
         guess_concepts = self._hints.get_concepts(self._guess)
         if self._hints.get_hint_count("pool") > 0 and self._stats.get_value("guesses remaining") > 1:
             self._update_metrics()
-            hint = self._hints.get_new_hint(guess_concepts, self._guess)
             feedback_ind = self._feedback.get_guess_feedback(self._guess, guess_concepts)
+            hint = self._hints.get_new_hint(guess_concepts, self._guess)
             self._update_game_state(hint, feedback_ind)
         elif self._stats.get_value("guesses remaining") > 1:
             self._update_metrics()
@@ -189,4 +189,9 @@ class GuessManager:
         
         remaining_hints_log_entry = RemainingHintsLogEntry(self._logs, new_guess_log_entry, self._hints.get_hints("relevant"),
                                                            self._hints.get_hints("redundant"), self._hints.get_hints("pool"))
-        remaining_hints_log_entry.add_log_entry("hints")
\ No newline at end of file
+        remaining_hints_log_entry.add_log_entry("hints")
+        
+        selection_stats = self._hints.get_selection_stats()
+        if message_type == "hint" and selection_stats:
+            hint_selection_log_entry = HintSelectionLogEntry(self._logs, *selection_stats)
+            hint_selection_log_entry.add_log_entry("hints")
\ No newline at end of file
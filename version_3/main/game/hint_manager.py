@@ -8,21 +8,58 @@ Classes:
 """
 
 
+import time
 from concepts.concept_manager import ConceptManager
+from game.candidates import CandidateSet
+from game.hint_policies import HintPolicyManager
 
 
 
 class HintManager:
     """
-    The HintManager class manages and controls access to the hints for a game.
+    The HintManager class manages and controls access to the hints for a game.  Hints are kept as HintRecord
+    objects, which are compared by their type id, template id, and parameters rather than by their text.
+    
+    A hint is relevant if it would rule out at least one of the numbers that could still be the winning number,
+    given every guess and hint so far.  Those numbers are tracked by a CandidateSet object, so no hints have to be
+    generated for the guesses to tell which hints are relevant.
+    
+    Each hint is in one of 3 states: relevant, redundant, or given.  The hints in each state are kept in a dictionary
+    used as an ordered set, along with one for the hint pool (the hints not given yet) and one mapping each hint to
+    its state.  Moving a hint from one state to another and counting the hints in a state both take constant time.
+    
+    The hints are not all generated at the start of a game.  They are pulled one at a time from a stream of hints
+    for the winning number, only until there are a few relevant hints to select from, so the work done at the start of
+    a game does not depend on how many hints the winning number has.  The stream is topped up before every hint.
+    
+    The hints implied by the winning number's other hints are known before the game starts, from the implication graph
+    stored with the hints in the database.  An implied hint is set aside as redundant, without checking it against the
+    candidates, as soon as it and every hint that implies it have been pulled.
+    
+    Hints are selected with a hint selection policy.  The default policy picks hints at random, and the time each
+    selection takes is kept so it can be logged.
     
     Attributes:
-        _hint_pool: A list of all possible hints for a game, based on the winning number.
-        _relevant_hints: A subset of the hint_pool list that provides new information about the winning number.
-        _redundant_hints: A subset of the hint_pool list that does not provide new information about the winning number.
-        _hints_given: A list of hints that have been shown to the user during a game.
+        _hint_pool: The hints pulled for a game, based on the winning number, that have not been shown to the user yet.
+        _relevant_hints: The hints in the hint pool that provide new information about the winning number.
+        _redundant_hints: The hints in the hint pool that do not provide new information about the winning number.
+        _hints_given: The hints that have been shown to the user during a game.
+        _hint_states: A dictionary mapping each hint to its state.
+        _hint_lists: A dictionary of the 4 dictionaries of hints above, keyed by the name of the list.
+        _hint_stream: An iterator of the hints not pulled yet, or None once it has run out.
+        _relevant_hint_total: The number of hints that have been relevant at some point during a game.
+        _implication_graph: A dictionary mapping each hint implied by the other hints to the hints that imply it.
+        _implied_hints: A dictionary mapping each hint that implies other hints in the implication graph to those hints.
+        _last_hint: The last hint shown to the user, including hints for whether the number is higher or lower.
+        _candidates: A CandidateSet object holding the numbers that could still be the winning number.
+        _policies: A HintPolicyManager object holding the hint selection policies.
+        _policy_name: The name of the policy used to select hints.
+        _selection_time: The number of seconds the last hint selection took, or None if no hint has been selected.
     """
     
+    _default_policy_name = "random"
+    _lookahead = 8
+    
     def __init__(self, objects):
         self._objects = objects
         self._numbers = self._objects.get_object("numbers")
@@ -30,15 +67,32 @@ class HintManager:
         self._data = self._objects.get_object("data")
         self._settings = self._objects.get_object("settings")
         
-        self._hint_pool = []
-        self._relevant_hints = []
-        self._redundant_hints = []
-        self._hints_given = []
+        self._hint_pool = {}
+        self._relevant_hints = {}
+        self._redundant_hints = {}
+        self._hints_given = {}
+        self._hint_states = {}
+        self._hint_lists = {"pool": self._hint_pool, "relevant": self._relevant_hints, "redundant": self._redundant_hints,
+                            "given": self._hints_given}
+        self._hint_stream = None
+        self._relevant_hint_total = 0
+        self._implication_graph = {}
+        self._implied_hints = {}
+        self._last_hint = None
+        self._candidates = None
+        
+        self._policies = HintPolicyManager(self._numbers)
+        self._policy_name = HintManager._default_policy_name
+        self._selection_time = None
     
     def get_hint_list(self, _db=True):
         game_concepts = self.get_concepts(self._settings.get_setting("winning number"), store_object=True, _db=_db)
-        self._hint_pool = game_concepts.generate_hints(check_db=_db, _db_path=self._session._db_path)
-        self._relevant_hints = list(self._hint_pool)
+        num_range = self._settings.get_setting("number range")
+        self._load_hints([])
+        self._hint_stream = game_concepts.iter_hints(check_db=_db, _db_path=self._session._db_path)
+        self._set_implication_graph(game_concepts.get_implication_graph(num_range, _db_path=self._session._db_path))
+        self._candidates = CandidateSet(num_range, self._numbers, game_concepts)
+        self._pull_hints()
     
     def get_concepts(self, number, store_object=False, _db=True):
         db = self._session.get_database() if _db else None
@@ -51,50 +105,166 @@ class HintManager:
         
         return concepts
     
-    def get_new_hint(self, guess_concepts, guess, _check_db=True):
+    def get_new_hint(self, guess_concepts, guess):
+        candidates = self._get_candidates()
+        candidates.exclude(guess)
+        self._selection_time = None
+        
+        self._get_relevant_hints()
+        self._pull_hints()
         if self.get_hint_count("pool") > 0:
-            self._get_relevant_hints(guess_concepts, _check_db=_check_db)
             hint = self._select_hint()
-            self._hints_given.append(hint)
         else:
             hint = guess_concepts.check_greater_or_less(guess, self._settings.get_setting("winning number"))
         
+        candidates.apply_hint(hint, guess)
+        self._last_hint = hint
         return hint
     
+    def get_last_hint(self):
+        return self._last_hint
+    
+    def get_candidate_count(self):
+        """This method returns the number of numbers that could still be the winning number, given every guess and
+        hint so far."""
+        
+        return self._get_candidates().get_count()
+    
+    def set_hint_policy(self, policy_name):
+        if policy_name not in self._policies.get_policy_names():
+            raise ValueError(f"{policy_name} is not a hint selection policy.")
+        self._policy_name = policy_name
+    
+    def get_hint_policy(self):
+        return self._policy_name
+    
+    def get_selection_stats(self):
+        """This method returns the name of the hint selection policy and the number of seconds the last hint selection
+        took, or None if no hint has been selected yet."""
+        
+        if self._selection_time is None:
+            return
+        return self._policy_name, self._selection_time
+    
+    def get_relevant_hint_total(self):
+        """This method returns the number of hints that have been relevant at some point during the game, which is the
+        number of relevant hints left plus the number that have since been given or become redundant."""
+        
+        return self._relevant_hint_total
+    
     def get_hint_count(self, hint_list_name):
         hint_list = self.get_hints(hint_list_name)
         return len(hint_list)
     
     def get_hints(self, hint_list_name):
-        hint_lists = {
-            "pool": self._hint_pool,
-            "relevant": self._relevant_hints,
-            "redundant": self._redundant_hints,
-            "given": self._hints_given
-            }
+        """This method returns a read-only view of the hints in a list, in the order they were added to it.  The view
+        is not a copy, so it reflects any later changes to the list."""
         
-        if hint_list_name in hint_lists:
-            return hint_lists[hint_list_name].copy()
+        if hint_list_name in self._hint_lists:
+            return self._hint_lists[hint_list_name].keys()
     
-    def _get_relevant_hints(self, guess_concepts, _check_db=True):
-        guess_hints = guess_concepts.generate_hints(check_db=_check_db, filter_results=False, _db_path=self._session._db_path)
-        self._redundant_hints = self._redundant_hints + list(set(self._hint_pool).intersection(set(guess_hints)))
-        self._relevant_hints = [hint for hint in self._relevant_hints if hint not in self._redundant_hints]
+    def get_hint_state(self, hint):
+        return self._hint_states.get(hint)
     
-    def _select_hint(self):
-        try:
-            hint = self._get_hint_from_list(self._relevant_hints)
-        except ValueError:
-            hint = self._get_hint_from_list(self._redundant_hints)
+    def _get_candidates(self):
+        """This method returns the CandidateSet object for the game, creating it over the number range first if the
+        hint list has not been created yet."""
+        
+        if self._candidates is None:
+            concepts = self.get_concepts(self._settings.get_setting("winning number"), _db=False)
+            self._candidates = CandidateSet(self._settings.get_setting("number range"), self._numbers, concepts)
+        
+        return self._candidates
+    
+    def _get_relevant_hints(self):
+        """This method moves the relevant hints that would no longer rule out any candidates to the redundant hints.
+        The candidates only ever shrink, so a redundant hint never becomes relevant again."""
+        
+        relevant_hints, redundant_hints = self._get_candidates().split_hints(self._relevant_hints)
+        for hint in redundant_hints:
+            self._set_hint_state(hint, "redundant")
+    
+    def _pull_hints(self):
+        """This method pulls hints from the stream until there are enough relevant hints to select from or the stream
+        runs out.  Each hint is checked as it is pulled.  A relevant hint is set aside once the last of the hints that
+        imply it is pulled."""
+        
+        while self._hint_stream is not None and len(self._relevant_hints) < HintManager._lookahead:
+            hint = next(self._hint_stream, None)
+            if hint is None:
+                self._hint_stream = None
+            elif hint not in self._hint_states:
+                self._set_hint_state(hint, "relevant" if self._is_relevant(hint) else "redundant")
+                for implied_hint in self._implied_hints.get(hint, ()):
+                    if self._hint_states.get(implied_hint) == "relevant" and self._is_implied(implied_hint):
+                        self._set_hint_state(implied_hint, "redundant")
+    
+    def _is_relevant(self, hint):
+        """This method checks whether a hint would give the user new information.  Implied hints are not relevant.
+        Otherwise, the hint is checked against the candidates."""
         
-        self._update_hint_pool()
+        return not self._is_implied(hint) and self._get_candidates().narrows(hint)
+    
+    def _is_implied(self, hint):
+        """This method checks whether a hint is in the implication graph and every hint that implies it has been
+        pulled."""
+        
+        implying_hints = self._implication_graph.get(hint)
+        return implying_hints is not None and all(implying_hint in self._hint_states for implying_hint in implying_hints)
+    
+    def _set_implication_graph(self, implication_graph):
+        self._implication_graph = implication_graph
+        self._implied_hints = {}
+        for hint, implying_hints in implication_graph.items():
+            for implying_hint in implying_hints:
+                self._implied_hints.setdefault(implying_hint, []).append(hint)
+    
+    def _select_hint(self):
+        hint_list = self._relevant_hints if self._relevant_hints else self._redundant_hints
+        hint = self._get_hint_from_list(hint_list)
+        self._set_hint_state(hint, "given")
         
         return hint
     
     def _get_hint_from_list(self, hint_list):
-        hint_index = self._numbers.get_random_numbers((0, len(hint_list)), n=1)
-        hint = hint_list.pop(hint_index)
-        return hint
+        hint_list = list(hint_list)
+        
+        start_time = time.perf_counter()
+        hint_index = self._policies.select_hint(self._policy_name, hint_list, self._get_candidates())
+        self._selection_time = time.perf_counter() - start_time
+        
+        return hint_list[hint_index]
+    
+    def _load_hints(self, relevant_hints, redundant_hints=()):
+        """This method replaces all of the hints with new lists of relevant and redundant hints and drops the stream of
+        hints and the implication graph.  Any repeated hints are only added once."""
+        
+        for hint_list in self._hint_lists.values():
+            hint_list.clear()
+        self._hint_states.clear()
+        self._hint_stream = None
+        self._relevant_hint_total = 0
+        self._set_implication_graph({})
+        
+        for hint in relevant_hints:
+            self._set_hint_state(hint, "relevant")
+        for hint in redundant_hints:
+            self._set_hint_state(hint, "redundant")
     
-    def _update_hint_pool(self):
-        self._hint_pool = self._relevant_hints + self._redundant_hints
\ No newline at end of file
+    def _set_hint_state(self, hint, state):
+        """This method moves a hint from its current state, if it has one, to a new state.  Each step is a dictionary
+        lookup, insert, or delete, so it takes constant time."""
+        
+        current_state = self._hint_states.get(hint)
+        if current_state:
+            del self._hint_lists[current_state][hint]
+        elif state == "relevant":
+            self._relevant_hint_total += 1
+        
+        self._hint_lists[state][hint] = None
+        self._hint_states[hint] = state
+        
+        if state == "given":
+            self._hint_pool.pop(hint, None)
+        else:
+            self._hint_pool[hint] = None
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""
+The hint_policies.py module is part of the game package.  It is for choosing which hint to show the user next from
+a list of hints.  Each way of choosing is a policy, and the HintManager selects hints with the policy set for the
+game.
+
+Classes:
+    HintPolicy
+    RandomHintPolicy
+    InformationGainHintPolicy
+    HintPolicyManager
+"""
+
+
+import numpy as np
+from resources.infrastructure.subsystem import BaseClass, Manager
+
+
+
+class HintPolicy(BaseClass):
+    """
+    The HintPolicy class is the base class for the hint selection policies.  Its main method, select_hint, takes in a
+    list of hints and the CandidateSet object for the game and returns the index of the hint to show.  It inherits from
+    BaseClass.  It is not meant to be instantiated directly.
+    """
+    
+    _name = ""
+    
+    def __init__(self, numbers):
+        super().__init__()
+        self._numbers = numbers
+        
+        self._obj_id_method = self.get_name
+        self._standardized_method = self.select_hint
+    
+    def select_hint(self, hints, candidates):
+        pass
+    
+    def get_name(self):
+        return self._name
+
+
+
+class RandomHintPolicy(HintPolicy):
+    """
+    The RandomHintPolicy class picks a hint at random.  It is the default policy.  It inherits from HintPolicy.
+    """
+    
+    _name = "random"
+    
+    def select_hint(self, hints, candidates):
+        return self._numbers.get_random_numbers((0, len(hints)), n=1)
+
+
+
+class InformationGainHintPolicy(HintPolicy):
+    """
+    The InformationGainHintPolicy class picks the hint that would rule out the most candidates.  Every hint is true of
+    the winning number, so the information a hint gives is log2 of the number of candidates left before it over the
+    number left after it.  The counts for all of the hints are computed in one vectorized pass over their masks.  Ties
+    are broken at random.  It inherits from HintPolicy.
+    """
+    
+    _name = "information gain"
+    
+    def select_hint(self, hints, candidates):
+        if not hints:
+            raise ValueError("There are no hints to select from.")
+        
+        information_gains = self.get_information_gains(hints, candidates)
+        best_indexes = np.flatnonzero(information_gains == information_gains.max())
+        best_index = self._numbers.get_random_numbers((0, len(best_indexes)), n=1)
+        
+        return int(best_indexes[best_index])
+    
+    @staticmethod
+    def get_information_gains(hints, candidates):
+        """This static method returns an array with the information gain of each hint, in bits."""
+        
+        remaining_counts = np.maximum(candidates.get_remaining_counts(hints), 1)
+        return np.log2(max(candidates.get_count(), 1) / remaining_counts)
+
+
+
+class HintPolicyManager(Manager):
+    """
+    The HintPolicyManager class is composed of one object of each of the subclasses of HintPolicy.  It runs the
+    select_hint method of the policy with a given name.  It inherits from Manager.
+    """
+    
+    def __init__(self, numbers):
+        self._random = RandomHintPolicy(numbers)
+        self._information_gain = InformationGainHintPolicy(numbers)
+        super().__init__(HintPolicy)
+    
+    def select_hint(self, policy_name, hints, candidates):
+        policy = self._subclass_dict[policy_name]
+        return policy.select_hint(hints, candidates)
+    
+    def get_policy_names(self):
+        return list(self._subclass_dict)
\ No newline at end of file
@@ -18,6 +18,10 @@ class Recommendation:
     of difficulty.
     """
     
+    # The ids of the levels of difficulty, mapped to the ids of the levels recommended after them.  The standard levels
+    # go from easy to medium, hard, and then expert, which is the highest, while custom games stay custom.
+    _next_level_ids = {1: 2, 2: 3, 3: 5, 4: 4, 5: 5}
+    
     def __init__(self, objects, score):
         self._objects = objects
         self._games = self._objects.get_object("games")
@@ -90,12 +94,12 @@ class Recommendation:
         game.  If the most recent level is the highest, it returns that same level."""
         
         level_id_query = self._session.build_query("level_of_difficulty_type_id", "game", "game_id", str(self._current_game_id))
-        level_id = self._db.run_query(level_id_query, fetch='one')[0]
+        level_id = self._db.run_query(level_id_query, fetch='one', _db_path=self._session._db_path)[0]
         
-        next_level_id = int(level_id) + 1 if level_id < 4 else 4
+        next_level_id = Recommendation._next_level_ids[int(level_id)]
         
         next_level_query = self._session.build_query("code", "level_of_difficulty_type", "id", str(next_level_id))
-        next_level = self._db.run_query(next_level_query, fetch='one')[0]
+        next_level = self._db.run_query(next_level_query, fetch='one', _db_path=self._session._db_path)[0]
         
         return next_level
     
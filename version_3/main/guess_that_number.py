@@ -8,7 +8,6 @@ the user interface.
 # Import modules.
 
 from kivy.app import App
-from kivy.core.window import Window
 from kivy.uix.screenmanager import ScreenManager, Screen
 from kivy.lang import Builder
 from kivy.properties import ObjectProperty
@@ -55,7 +54,7 @@ class WelcomePage(Screen):
             self.manager.transition.direction = "left"
     
     def set_level_of_difficulty(self, instance, app, value, level="easy"):
-        """This method determines a level of difficulty (easy, medium, or hard) based on the user's 
+        """This method determines a level of difficulty (easy, medium, hard, or expert) based on the user's 
         selection on the app and sets the number range and penalty attributes based on that level."""
         
         objects = app.get_objects()
@@ -173,10 +172,6 @@ class PageManager(ScreenManager):
 
 
 
-display = Builder.load_file("guess_that_number_design.kv")
-
-
-
 class GuessThatNumberGame(App):
     """
     The GuessThatNumberGame class is the main class for the application.  It inherits from Kivy's App class.  
@@ -218,9 +213,17 @@ class GuessThatNumberGame(App):
         self.level_obj = level_obj
     
     def build(self):
+        # The window is only imported, and the layout only loaded, once the app is built.  The processes that top up
+        # the hint table are spawned, so each one imports this module, and they should not open windows of their own.
+        from kivy.core.window import Window
         Window.clearcolor = (.45,.9,0,0)
+        display = Builder.load_file("guess_that_number_design.kv")
         
         return display
+    
+    def on_stop(self):
+        self._objects.get_object("session").close()
+        self._objects.get_object("db_manager").close()
 
 
 
@@ -15,4 +15,10 @@ Modules:
     text_displayers.py
     data.py
     number.py
+    factorization.py
+    perfect_powers.py
+    number_profile.py
+    cache.py
+    number_atlas.py
+    digits.py
 """
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""
+The cache.py module is part of the infrastructure package.  It contains a bounded cache that keeps the most
+recently used results and evicts the least recently used ones once it is full.  It is used to reuse results
+computed for the same numbers across guesses and games in a session.
+
+Classes:
+    LRUCache
+"""
+
+
+from collections import OrderedDict
+
+
+
+class LRUCache:
+    """
+    The LRUCache class is a bounded least-recently-used cache.  It counts hits, misses, and evictions so that
+    its effectiveness can be checked while the app is running.
+    
+    Attributes:
+        _max_size: The largest number of results the cache holds before it starts evicting.
+        _results: An ordered dictionary of cached results, from least to most recently used.
+        _stats: A dictionary with the hit, miss, and eviction counts.
+    """
+    
+    def __init__(self, max_size=256):
+        if max_size < 1:
+            raise ValueError("The maximum size of the cache must be at least 1.")
+        
+        self._max_size = max_size
+        self._results = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+    
+    def get(self, key, function, *args):
+        """This method returns the cached result for a key.  If there is none, it calls the function with the
+        arguments passed in, caches the result, and evicts the least recently used result if the cache is full."""
+        
+        if key in self._results:
+            self._results.move_to_end(key)
+            self._stats["hits"] += 1
+            return self._results[key]
+        
+        self._stats["misses"] += 1
+        result = function(*args)
+        self._results[key] = result
+        
+        if len(self._results) > self._max_size:
+            self._results.popitem(last=False)
+            self._stats["evictions"] += 1
+        
+        return result
+    
+    def get_stats(self):
+        stats = dict(self._stats)
+        stats.update({"size": len(self._results), "max size": self._max_size})
+        return stats
+    
+    def get_max_size(self):
+        return self._max_size
+    
+    def clear(self):
+        self._results.clear()
+        for stat in self._stats:
+            self._stats[stat] = 0
+    
+    def __len__(self):
+        return len(self._results)
+    
+    def __contains__(self, key):
+        return key in self._results
\ No newline at end of file
@@ -112,6 +112,7 @@ class LevelOfDifficultyTypes(Manager):
         self._medium = StandardLevel("medium", 2, num_range=(1,100), penalty=20)
         self._hard = StandardLevel("hard", 3, num_range=(1,1000), penalty=25)
         self._custom = CustomLevel()
+        self._expert = StandardLevel("expert", 5, num_range=(1,10**12), penalty=30)
         super().__init__(Level)
     
     def get_level_obj(self, level):
@@ -261,10 +262,13 @@ class NoFeedbackHintType(HintType):
 class HintTypes(Manager):
     """
     The HintTypes class is composed of objects of the subclasses of HintType that represent all of the
-    possible values for hint types.
+    possible values for hint types.  It also compiles one pattern, when it is created, that finds the hint
+    type of the text of a hint in a single match.
     """
     
     _category = "hints"
+    _match_order = ["multiple", "prime", "factor", "perfect_square", "perfect_cube", "even_odd", "greater_less",
+                    "digit_sum", "digit_length"]
     
     def __init__(self, text_obj):
         self._text = text_obj
@@ -279,17 +283,20 @@ class HintTypes(Manager):
         self._digit_length = self._create_hint_obj(FeedbackHintType, "digit_length", 8, "-digit number", "n-digit numbers")
         self._greater_less = self._create_hint_obj(NoFeedbackHintType, "greater_less", 9, "Higher|Lower")
         super().__init__(HintType)
+        
+        self._hint_pattern = self._compile_hint_pattern()
     
     def get_hint_obj_from_hint_type(self, hint_type):
         hint_obj = self.get_subclass_obj(hint_type)
         return hint_obj
     
     def get_hint_obj_from_hint(self, hint):
-        hint_objs = [self._subclass_list[i] for i in [1, 2, 0, 4, 5, 3, 8, 6, 7]]
-        for hint_obj in hint_objs:
-            match = re.findall(re.compile(hint_obj.get_hint_display_name()), hint)
-            if match:
-                return hint_obj
+        """This method returns the hint type of the text of a hint.  The name of the group that matched is the name of
+        the hint type."""
+        
+        match = self._hint_pattern.match(hint)
+        if match:
+            return self._subclass_dict[match.lastgroup]
     
     def get_feedback_display_name(self, hint_type):
         feedback_display_names = {
@@ -318,6 +325,19 @@ class HintTypes(Manager):
         
         return hint_obj
     
+    def _compile_hint_pattern(self):
+        """This method compiles the pattern used to find the hint type of a hint.  Each hint type is a named group in a
+        lookahead that searches the whole hint for its display name.  The lookaheads are tried in the order of the
+        _match_order attribute from the start of the hint, so when more than one hint type appears in a hint, the one
+        earlier in the order is chosen."""
+        
+        lookaheads = []
+        for hint_type in HintTypes._match_order:
+            hint_display_name = self._subclass_dict[hint_type].get_hint_display_name()
+            lookaheads.append(f"(?=.*?(?P<{hint_type}>{hint_display_name}))")
+        
+        return re.compile("(?:" + "|".join(lookaheads) + ")", re.DOTALL)
+    
     @classmethod
     def get_category(cls):
         return HintTypes._category
@@ -0,0 +1,157 @@
+"""
+The digits.py module is part of the infrastructure package.  It contains a class that breaks numbers down into
+their digits arithmetically, rather than converting them to strings.  Numbers are split into blocks of 4 digits,
+and the digit characteristics of each block are read from tables precomputed for every block from 0 to 9999.
+
+Classes:
+    DigitAnalyzer
+"""
+
+
+import numpy as np
+
+
+
+class DigitAnalyzer:
+    """
+    The DigitAnalyzer class computes the digits of numbers, along with digit sums, digit lengths, and counts of
+    digits with a given property (prime, even, perfect square, or perfect cube).  It has a scalar form of each
+    method for single numbers and an array form for NumPy arrays of numbers.  All of its methods are class methods,
+    and its tables are built the first time they are needed and shared from then on.
+    
+    The leading block of a number has no leading zeros, while every other block is padded to 4 digits, so there
+    are 2 versions of each table: one for leading blocks and one for padded blocks.
+    """
+    
+    _block_size = 10**4
+    _block_digits = 4
+    _digit_properties = {
+        "prime number": (2, 3, 5, 7),
+        "even number": (0, 2, 4, 6, 8),
+        "perfect square": (0, 1, 4, 9),
+        "perfect cube": (0, 1, 8)
+        }
+    
+    _digits = None
+    _tables = None
+    _arrays = None
+    
+    @classmethod
+    def get_digits(cls, x):
+        """This class method returns the list of digits of a number, ignoring its sign.  The digits of 0 are [0]."""
+        
+        cls._build_tables()
+        leading_block, blocks = cls._split(x)
+        
+        digits = list(cls._digits["leading"][leading_block])
+        for block in blocks:
+            digits.extend(cls._digits["padded"][block])
+        
+        return digits
+    
+    @classmethod
+    def get_digit_sum(cls, x):
+        return cls._combine("sum", x)
+    
+    @classmethod
+    def get_digit_length(cls, x):
+        return cls._combine("length", x)
+    
+    @classmethod
+    def get_digit_count(cls, x, digit_property):
+        """This class method returns the number of digits of a number that have a property, such as "prime number"."""
+        
+        return cls._combine(digit_property, x)
+    
+    @classmethod
+    def get_digit_sums(cls, numbers):
+        return cls._combine_array("sum", numbers)
+    
+    @classmethod
+    def get_digit_lengths(cls, numbers):
+        return cls._combine_array("length", numbers)
+    
+    @classmethod
+    def get_digit_counts(cls, numbers, digit_property):
+        """This class method is the array form of get_digit_count.  It takes one pass per block of 4 digits over the
+        whole array instead of one pass per digit of each number."""
+        
+        return cls._combine_array(digit_property, numbers)
+    
+    @classmethod
+    def get_digit_properties(cls):
+        return list(cls._digit_properties)
+    
+    @classmethod
+    def _split(cls, x):
+        """This class method splits the absolute value of a number into its leading block and a list of the rest of
+        its blocks, from most to least significant."""
+        
+        x = abs(int(x))
+        blocks = []
+        while x >= cls._block_size:
+            x, block = divmod(x, cls._block_size)
+            blocks.append(block)
+        
+        blocks.reverse()
+        return x, blocks
+    
+    @classmethod
+    def _combine(cls, table_name, x):
+        cls._build_tables()
+        leading_block, blocks = cls._split(x)
+        
+        tables = cls._tables[table_name]
+        total = tables["leading"][leading_block]
+        for block in blocks:
+            total += tables["padded"][block]
+        
+        return total
+    
+    @classmethod
+    def _combine_array(cls, table_name, numbers):
+        cls._build_tables()
+        remainders = np.abs(np.asarray(numbers, dtype=np.int64))
+        arrays = cls._arrays[table_name]
+        
+        totals = np.zeros(len(remainders), dtype=np.int64)
+        active = np.ones(len(remainders), dtype=bool)
+        while True:
+            remainders, blocks = np.divmod(remainders, cls._block_size)
+            leading = remainders == 0
+            block_totals = np.where(leading, arrays["leading"][blocks], arrays["padded"][blocks])
+            totals += np.where(active, block_totals, 0)
+            
+            # Numbers whose leading block has been counted are done.
+            active &= ~leading
+            if not active.any():
+                return totals
+    
+    @classmethod
+    def _build_tables(cls):
+        """This class method builds the digits of every block from 0 to 9999, in leading and padded form, and then the
+        tables of digit sums, digit lengths, and digit property counts from them.  Each table is kept both as a list,
+        for fast scalar lookups, and as a NumPy array, for array lookups."""
+        
+        if cls._tables is not None:
+            return
+        
+        padded_digits = [tuple(int(d) for d in str(block).zfill(cls._block_digits)) for block in range(cls._block_size)]
+        leading_digits = [digits[next((i for i, d in enumerate(digits) if d != 0), cls._block_digits - 1):]
+                          for digits in padded_digits]
+        digits = {"leading": leading_digits, "padded": padded_digits}
+        
+        formulas = {"sum": sum, "length": len}
+        for digit_property, property_digits in cls._digit_properties.items():
+            formulas[digit_property] = lambda block_digits, property_digits=property_digits: len(
+                [d for d in block_digits if d in property_digits])
+        
+        tables = {}
+        arrays = {}
+        for table_name, formula in formulas.items():
+            tables[table_name] = {form: [formula(block) for block in digits[form]] for form in digits}
+            arrays[table_name] = {form: np.array(tables[table_name][form], dtype=np.int64) for form in digits}
+        
+        cls._digits = digits
+        cls._arrays = arrays
+        cls._tables = tables
\ No newline at end of file
@@ -0,0 +1,330 @@
+"""
+The factorization.py module is part of the infrastructure package.  It contains a set of classes that break
+numbers down into their prime factorizations.  The NumberInfo class derives factors, prime factors, and
+primality from these factorizations instead of scanning every number up to the one being checked.
+
+Classes:
+    Factorizer
+    SieveFactorizer
+    PollardRhoFactorizer
+    AdaptiveFactorizer
+"""
+
+
+import math
+import numpy as np
+
+
+
+class Factorizer:
+    """
+    The Factorizer class is the base class for factorization engines.  It defines one method to get the prime
+    factorization of a number that it defers to its subclasses to implement.  Everything else (factors, prime
+    factors, factor counts, and primality) is derived from that factorization.
+    """
+    
+    def factorize(self, x):
+        pass
+    
+    def get_factors(self, x):
+        """This method builds the full list of factors of a positive number from its prime factorization, which
+        takes time proportional to the number of factors instead of the size of the number."""
+        
+        if x < 1:
+            return []
+        return Factorizer.expand_factors(self.factorize(x))
+    
+    @staticmethod
+    def expand_factors(factorization):
+        """This static method takes in a prime factorization and returns the sorted list of every factor it produces."""
+        
+        factors = [1]
+        for prime, exponent in factorization:
+            factors = [factor * prime**power for factor in factors for power in range(exponent + 1)]
+        
+        return sorted(factors)
+    
+    def get_prime_factors(self, x):
+        if x < 2:
+            return []
+        return [prime for prime, exponent in self.factorize(x)]
+    
+    def get_factor_count(self, x):
+        if x < 1:
+            return 0
+        
+        factor_count = 1
+        for prime, exponent in self.factorize(x):
+            factor_count *= exponent + 1
+        
+        return factor_count
+    
+    def is_prime(self, x):
+        if x < 2:
+            return False
+        return self.factorize(x) == [(x, 1)]
+
+
+
+class SieveFactorizer(Factorizer):
+    """
+    The SieveFactorizer class factorizes numbers using a smallest-prime-factor sieve.  The sieve is built lazily,
+    the first time a number is factorized, up to the upper bound of the active number range.  Numbers within the
+    sieve are factorized in O(log n) steps.  Larger numbers are factorized by trial division using the primes in
+    the sieve.  It inherits from Factorizer.
+    
+    Attributes:
+        _upper_bound: The largest number the sieve should cover, based on the active number range.
+        _limit: The largest number the current sieve covers.
+        _smallest_prime_factors: An array holding the smallest prime factor of every number up to _limit.
+        _primes: An array of all of the primes up to _limit.
+    """
+    
+    _min_limit = 1000
+    _max_limit = 10**6
+    
+    def __init__(self, upper_bound=None):
+        self._upper_bound = upper_bound if upper_bound else SieveFactorizer._min_limit
+        self._limit = 0
+        self._smallest_prime_factors = None
+        self._primes = None
+    
+    def set_upper_bound(self, upper_bound):
+        """This method updates the upper bound of the sieve.  The sieve is only rebuilt, on the next factorization,
+        if the new bound is larger than the range the current sieve already covers."""
+        
+        self._upper_bound = max(abs(int(upper_bound)), SieveFactorizer._min_limit)
+    
+    def get_limit(self):
+        self._build_sieve()
+        return self._limit
+    
+    @classmethod
+    def get_max_limit(cls):
+        return cls._max_limit
+    
+    def get_smallest_prime_factors(self):
+        """This method returns the sieve array, where the value at each index is the smallest prime factor of that
+        index.  It is used to factorize whole arrays of numbers at once."""
+        
+        self._build_sieve()
+        return self._smallest_prime_factors
+    
+    def factorize(self, x):
+        """This method returns the prime factorization of a positive number as an ordered list of (prime, exponent)
+        tuples."""
+        
+        if x < 2:
+            return []
+        
+        self._build_sieve()
+        
+        if x <= self._limit:
+            return self._factorize_with_sieve(x)
+        return self._factorize_with_trial_division(x)
+    
+    def _factorize_with_sieve(self, x):
+        factorization = []
+        while x > 1:
+            prime = int(self._smallest_prime_factors[x])
+            exponent = 0
+            while x % prime == 0:
+                x //= prime
+                exponent += 1
+            factorization.append((prime, exponent))
+        
+        return factorization
+    
+    def _factorize_with_trial_division(self, x):
+        factorization = []
+        
+        for prime in self._primes:
+            prime = int(prime)
+            if prime * prime > x:
+                break
+            if x % prime == 0:
+                exponent = 0
+                while x % prime == 0:
+                    x //= prime
+                    exponent += 1
+                factorization.append((prime, exponent))
+        else:
+            # The sieve primes ran out before reaching the square root, so keep going with odd candidates.
+            candidate = self._limit + 1 if self._limit % 2 == 0 else self._limit + 2
+            while candidate * candidate <= x:
+                if x % candidate == 0:
+                    exponent = 0
+                    while x % candidate == 0:
+                        x //= candidate
+                        exponent += 1
+                    factorization.append((candidate, exponent))
+                candidate += 2
+        
+        if x > 1:
+            factorization.append((x, 1))
+        
+        return factorization
+    
+    def _build_sieve(self):
+        limit = min(self._upper_bound, SieveFactorizer._max_limit)
+        if limit <= self._limit:
+            return
+        
+        smallest_prime_factors = np.zeros(limit + 1, dtype=np.int32)
+        for i in range(2, math.isqrt(limit) + 1):
+            if smallest_prime_factors[i] == 0:
+                multiples = smallest_prime_factors[i*i::i]
+                multiples[multiples == 0] = i
+        
+        unmarked = smallest_prime_factors == 0
+        smallest_prime_factors[unmarked] = np.arange(limit + 1, dtype=np.int32)[unmarked]
+        
+        self._smallest_prime_factors = smallest_prime_factors
+        self._primes = np.flatnonzero(smallest_prime_factors == np.arange(limit + 1))[2:]
+        self._limit = limit
+
+
+
+class PollardRhoFactorizer(Factorizer):
+    """
+    The PollardRhoFactorizer class factorizes large numbers, beyond the reach of a sieve.  It checks primality with
+    the Miller-Rabin test and splits composite numbers with Pollard's rho algorithm (using Brent's cycle detection),
+    after dividing out small primes by trial division.  With its fixed set of bases, the Miller-Rabin test is exact
+    for every number below 3.3 * 10^24, which covers all 64-bit numbers.  It inherits from Factorizer.
+    """
+    
+    _small_primes = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+    _miller_rabin_bases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    
+    def factorize(self, x):
+        """This method returns the prime factorization of a positive number as an ordered list of (prime, exponent)
+        tuples."""
+        
+        if x < 2:
+            return []
+        
+        x = int(x)
+        exponents = {}
+        
+        for prime in PollardRhoFactorizer._small_primes:
+            while x % prime == 0:
+                x //= prime
+                exponents[prime] = exponents.get(prime, 0) + 1
+        
+        remaining = [x] if x > 1 else []
+        while remaining:
+            n = remaining.pop()
+            if self.is_prime(n):
+                exponents[n] = exponents.get(n, 0) + 1
+            else:
+                factor = self._find_factor(n)
+                remaining.extend([factor, n // factor])
+        
+        return sorted(exponents.items())
+    
+    def is_prime(self, x):
+        if x < 2:
+            return False
+        
+        for prime in PollardRhoFactorizer._small_primes:
+            if x % prime == 0:
+                return x == prime
+        
+        return self._miller_rabin(int(x))
+    
+    @staticmethod
+    def _miller_rabin(n):
+        """This static method runs the Miller-Rabin test on an odd number with no small prime factors."""
+        
+        d = n - 1
+        s = 0
+        while d % 2 == 0:
+            d //= 2
+            s += 1
+        
+        for base in PollardRhoFactorizer._miller_rabin_bases:
+            y = pow(base, d, n)
+            if y == 1 or y == n - 1:
+                continue
+            for _ in range(s - 1):
+                y = y * y % n
+                if y == n - 1:
+                    break
+            else:
+                return False
+        
+        return True
+    
+    @staticmethod
+    def _find_factor(n):
+        """This static method finds a nontrivial factor of an odd composite number using Pollard's rho algorithm with
+        Brent's cycle detection.  The gcd is taken over batches of steps, and if a batch overshoots, its steps are
+        retraced one at a time.  If a sequence fails to find a factor, it starts over with a different constant."""
+        
+        if math.isqrt(n)**2 == n:
+            return math.isqrt(n)
+        
+        batch_size = 128
+        for c in range(1, n):
+            y, r, q, factor = 2, 1, 1, 1
+            while factor == 1:
+                x = y
+                for _ in range(r):
+                    y = (y * y + c) % n
+                k = 0
+                while k < r and factor == 1:
+                    saved_y = y
+                    for _ in range(min(batch_size, r - k)):
+                        y = (y * y + c) % n
+                        q = q * abs(x - y) % n
+                    factor = math.gcd(q, n)
+                    k += batch_size
+                r *= 2
+            
+            if factor == n:
+                factor = 1
+                while factor == 1:
+                    saved_y = (saved_y * saved_y + c) % n
+                    factor = math.gcd(abs(x - saved_y), n)
+            
+            if factor != n:
+                return factor
+
+
+
+class AdaptiveFactorizer(Factorizer):
+    """
+    The AdaptiveFactorizer class picks a factorization engine based on the size of the number.  Numbers covered
+    by the sieve are factorized with a SieveFactorizer, and larger numbers with a PollardRhoFactorizer.  It also
+    passes the sieve methods through, so it can be used anywhere a SieveFactorizer is expected.  It inherits from
+    Factorizer.
+    
+    Attributes:
+        _sieve: A SieveFactorizer object for numbers within the sieve.
+        _large: A PollardRhoFactorizer object for numbers beyond the sieve.
+    """
+    
+    def __init__(self, upper_bound=None):
+        self._sieve = SieveFactorizer(upper_bound)
+        self._large = PollardRhoFactorizer()
+    
+    def set_upper_bound(self, upper_bound):
+        self._sieve.set_upper_bound(upper_bound)
+    
+    def get_limit(self):
+        return self._sieve.get_limit()
+    
+    def get_max_limit(self):
+        return self._sieve.get_max_limit()
+    
+    def get_smallest_prime_factors(self):
+        return self._sieve.get_smallest_prime_factors()
+    
+    def factorize(self, x):
+        return self._get_factorizer(x).factorize(x)
+    
+    def is_prime(self, x):
+        return self._get_factorizer(x).is_prime(x)
+    
+    def _get_factorizer(self, x):
+        return self._sieve if x <= self._sieve.get_limit() else self._large
\ No newline at end of file
@@ -76,9 +76,24 @@ class DBTableLogEntry(LogEntry):
 
 
 class HintsPopulatedLogEntry(LogEntry):
-    def __init__(self, logs, max_number):
+    def __init__(self, logs, num_range, row_count, seconds):
         super().__init__(logs)
-        self._log_message = f"hints 1 to {max_number} populated"
+        rows_per_second = row_count / seconds if seconds else 0
+        self._log_message = f"hints {num_range[0]} to {num_range[1]} populated: {row_count} rows in {seconds:.3f} s ({rows_per_second:,.0f} rows/sec)"
+
+
+
+class HintImplicationsStoredLogEntry(LogEntry):
+    def __init__(self, logs, num_range, row_count, implied_count, seconds):
+        super().__init__(logs)
+        self._log_message = f"hint implications {num_range[0]} to {num_range[1]} stored: {implied_count} of {row_count} hints implied ({seconds:.3f} s)"
+
+
+
+class MigrationAppliedLogEntry(LogEntry):
+    def __init__(self, logs, version, name, batch_count, seconds):
+        super().__init__(logs)
+        self._log_message = f"schema migration {version} ({name}) applied: {batch_count} batch(es) in {seconds:.3f} s"
 
 
 
@@ -119,6 +134,13 @@ class NewGuessLogEntry(LogEntry):
 
 
 
+class HintSelectionLogEntry(LogEntry):
+    def __init__(self, logs, policy_name, latency):
+        super().__init__(logs)
+        self._log_message = f"Hint Selection\t\tPolicy: {policy_name.title()}\tLatency: {latency * 1000:.3f} ms"
+
+
+
 class IndividualFeedbackLogEntry(LogEntry):
     def __init__(self, logs, hint_type, hint, guess, feedback_ind):
         super().__init__(logs)
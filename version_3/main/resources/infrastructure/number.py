@@ -5,23 +5,46 @@ inputs expected to be numbers, and generating random numbers.
 
 Classes:
     NumberInfo
+    BatchNumberInfo
+    LazyNumberInfo
     Validator
     RandomNumberGenerator
     Number
 """
 
 
+import operator
+import threading
 import numpy as np
+from resources.infrastructure.factorization import AdaptiveFactorizer
+from resources.infrastructure.perfect_powers import PerfectPowers
+from resources.infrastructure.number_profile import NumberProfile
+from resources.infrastructure.cache import LRUCache
+from resources.infrastructure.number_atlas import NumberAtlas
+from resources.infrastructure.digits import DigitAnalyzer
 
 
 
 class NumberInfo:
     """
     The NumberInfo class provides the logic behind the different math concepts.  It also has some helper methods for those
-    concepts, used when generating hints and evaluating guesses.
+    concepts, used when generating hints and evaluating guesses.  Factors, prime factors, and primality are derived from
+    the prime factorization provided by a Factorizer object.  Perfect powers are checked with exact integer roots.
+    Results of the formulas can optionally be cached for callers of get_number_info.  The math concepts read their
+    characteristics from cached NumberProfile objects instead, so this cache does not sit in front of them.  If a
+    NumberAtlas object is set, the formulas it has a column for are looked up in it before anything is computed.
+    
+    Attributes:
+        _factorizer: A Factorizer object used for factors, prime factors, and primality.
+        _cache: An LRUCache object holding formula results, or None if caching is turned off.
+        _atlas: A loaded NumberAtlas object, or None if there is no atlas.
+        _formulas: A dictionary mapping each formula name to the method that computes it.
     """
     
-    def __init__(self):
+    def __init__(self, factorizer=None, cache_size=None):
+        self._factorizer = factorizer if factorizer else AdaptiveFactorizer()
+        self._cache = LRUCache(cache_size) if cache_size else None
+        self._atlas = None
         self._formulas = {
             "prime factors": self._get_prime_factors,
             "digit factors": self._get_digit_factor_count,
@@ -30,45 +53,94 @@ class NumberInfo:
             "is prime": self._is_prime,
             "is perfect square": self._is_perfect_square,
             "is perfect cube": self._is_perfect_cube,
-            "is factor": self._is_factor
+            "is perfect power": self._is_perfect_power,
+            "is factor": self._is_factor,
+            "factor count": self._get_factor_count,
+            "prime factor count": self._get_prime_factor_count,
+            "digit sum": self._get_digit_sum,
+            "digit length": self._get_digit_length
             }
     
     def get_formula(self, formula_name):
-        return self._formulas[formula_name]
+        formula = self._formulas[formula_name]
+        if self._atlas is not None and formula_name in NumberAtlas.get_columns():
+            computed_formula = formula
+            formula = lambda x: self._get_atlas_result(formula_name, computed_formula, x)
+        if self._cache is None:
+            return formula
+        return lambda *args: self._get_cached_result(formula_name, formula, *args)
+    
+    def enable_cache(self, max_size):
+        self._cache = LRUCache(max_size)
+    
+    def disable_cache(self):
+        self._cache = None
+    
+    def set_atlas(self, atlas):
+        self._atlas = atlas
+    
+    def get_cache_stats(self):
+        if self._cache is None:
+            return
+        return self._cache.get_stats()
+    
+    def _get_cached_result(self, formula_name, formula, *args):
+        """This method returns the result of a formula from the cache, keyed by the formula name and its arguments.
+        Lists are copied on the way out so that callers cannot change the cached result."""
+        
+        result = self._cache.get((formula_name,) + args, formula, *args)
+        return list(result) if isinstance(result, list) else result
+    
+    def _get_atlas_result(self, formula_name, formula, x):
+        value = self._atlas.get_value(formula_name, x)
+        return value if value is not None else formula(x)
     
     def _get_prime_factors(self, x):
-        factors = self._get_factors(x)
-        prime_factors = [factor for factor in factors if self._is_prime(factor)]
+        prime_factors = self._factorizer.get_prime_factors(x)
         return prime_factors
     
+    def _get_factor_count(self, x):
+        return self._factorizer.get_factor_count(x)
+    
+    def _get_prime_factor_count(self, x):
+        return len(self._factorizer.get_prime_factors(x))
+    
+    @staticmethod
+    def _get_digit_sum(x):
+        return DigitAnalyzer.get_digit_sum(x)
+    
+    @staticmethod
+    def _get_digit_length(x):
+        return DigitAnalyzer.get_digit_length(x)
+    
     def _get_digit_factor_count(self, x):
         digits = self._get_digits(x)
         digit_factors = [d for d in digits if self._is_factor(x, d) and d != 0]
         return len(digit_factors)
     
     def _get_factors(self, x):
-        factors = [i for i in range(1, x + 1) if self._is_factor(x, i)]
+        factors = self._factorizer.get_factors(x)
         return factors
     
     @staticmethod
     def _get_digits(x):
-        digits = [int(d) for d in str(x) if d != "-"]
+        digits = DigitAnalyzer.get_digits(x)
         return digits
     
     def _is_prime(self, x):
-        factors = self._get_factors(x)
-        return True if len(factors) == 2 else False
+        return self._factorizer.is_prime(x)
     
     @staticmethod
     def _is_perfect_square(x):
-        result = True if x**.5 in range(0, x + 1) else False
-        return result
+        return PerfectPowers.is_perfect_square(x)
     
     @staticmethod
     def _is_perfect_cube(x):
-        if [i for i in range(-abs(x), abs(x) + 1) if i**3 == x]:
-            return True
-        return False
+        return PerfectPowers.is_perfect_cube(x)
+    
+    @staticmethod
+    def _is_perfect_power(x, k):
+        return PerfectPowers.is_perfect_power(x, k)
     
     @staticmethod
     def _is_factor(x, y):
@@ -78,6 +150,246 @@ class NumberInfo:
 
 
 
+class BatchNumberInfo:
+    """
+    The BatchNumberInfo class is the batch counterpart of the NumberInfo class.  It takes in an array of numbers and
+    computes a column of values for each characteristic in vectorized passes over the whole array, rather than one
+    call per number.  It is meant for computing characteristics for an entire number range at once.  If a loaded
+    NumberAtlas object is set, the columns it has are read from it for the numbers it covers, and only the rest of
+    the numbers are factorized.
+    """
+    
+    _columns = ["factor count", "prime factor count", "is prime", "is perfect square", "is perfect cube", "digit sum",
+                "digit length", "digit factors", "prime number digits", "even number digits", "perfect square digits",
+                "perfect cube digits"]
+    
+    def __init__(self, factorizer):
+        self._factorizer = factorizer
+        self._atlas = None
+        self._column_groups = [
+            (["factor count", "prime factor count", "is prime"], self._get_factor_columns),
+            (["is perfect square", "is perfect cube"], self._get_perfect_exponent_columns),
+            (["digit sum", "digit length", "digit factors"], self._get_digit_columns),
+            ([f"{digit_property} digits" for digit_property in DigitAnalyzer.get_digit_properties()],
+             self._get_digit_property_columns)
+            ]
+    
+    def set_atlas(self, atlas):
+        self._atlas = atlas
+    
+    def get_number_info(self, numbers):
+        """This method takes in an array of integers and returns a dictionary with an array for each characteristic,
+        aligned with the numbers passed in."""
+        
+        numbers = np.asarray(numbers, dtype=np.int64)
+        
+        number_info = {}
+        for columns, get_columns in self._column_groups:
+            number_info.update(self._get_column_group(columns, get_columns, numbers))
+        
+        return number_info
+    
+    def get_lazy_number_info(self, numbers):
+        """This method is the lazy form of get_number_info.  It returns a LazyNumberInfo object that only computes a
+        characteristic, along with the others computed in the same pass, the first time it is looked up."""
+        
+        return LazyNumberInfo(self, np.asarray(numbers, dtype=np.int64))
+    
+    def get_column_group(self, numbers, column):
+        """This method computes the columns that are computed in the same pass as a column and returns them in a
+        dictionary.  It raises a KeyError if there is no such column."""
+        
+        columns, get_columns = self._find_column_group(column)
+        return self._get_column_group(columns, get_columns, numbers)
+    
+    def get_group_columns(self, column):
+        """This method returns the list of columns computed in the same pass as a column.  It raises a KeyError if there
+        is no such column."""
+        
+        return list(self._find_column_group(column)[0])
+    
+    def _find_column_group(self, column):
+        for columns, get_columns in self._column_groups:
+            if column in columns:
+                return columns, get_columns
+        
+        raise KeyError(column)
+    
+    def _get_column_group(self, columns, get_columns, numbers):
+        """This method reads a group of columns from the atlas for the numbers it covers and computes them for the
+        rest.  Groups with a column the atlas does not have are computed for every number."""
+        
+        if self._atlas is None or not self._atlas.is_loaded() or not set(columns) <= set(NumberAtlas.get_columns()):
+            return get_columns(numbers)
+        
+        covered = (numbers >= 1) & (numbers <= self._atlas.get_size())
+        if not covered.any():
+            return get_columns(numbers)
+        
+        computed_columns = get_columns(numbers[~covered]) if not covered.all() else None
+        column_group = {}
+        for column in columns:
+            atlas_values = self._atlas.get_values(column, numbers[covered])
+            values = np.zeros(len(numbers), dtype=bool if atlas_values.dtype == np.bool_ else np.int64)
+            values[covered] = atlas_values
+            if computed_columns is not None:
+                values[~covered] = computed_columns[column]
+            column_group[column] = values
+        
+        return column_group
+    
+    @classmethod
+    def get_columns(cls):
+        return list(cls._columns)
+    
+    def _get_factor_columns(self, numbers):
+        """This method factorizes every number in the array at the same time, dividing each one by its smallest prime
+        factor until it reaches 1.  This takes as many passes as the largest number of prime factors (with repeats)
+        of any number in the array."""
+        
+        if len(numbers):
+            self._factorizer.set_upper_bound(int(np.abs(numbers).max()))
+        smallest_prime_factors = self._factorizer.get_smallest_prime_factors()
+        limit = len(smallest_prime_factors) - 1
+        
+        in_sieve = numbers <= limit
+        remainders = np.where(in_sieve & (numbers > 1), numbers, 1)
+        factor_counts = np.ones(len(numbers), dtype=np.int64)
+        prime_factor_counts = np.zeros(len(numbers), dtype=np.int64)
+        exponents = np.zeros(len(numbers), dtype=np.int64)
+        last_primes = np.zeros(len(numbers), dtype=np.int64)
+        
+        active = remainders > 1
+        while active.any():
+            primes = np.where(active, smallest_prime_factors[remainders], 0)
+            new_prime = active & (primes != last_primes)
+            
+            closed = new_prime & (last_primes > 0)
+            factor_counts[closed] *= exponents[closed] + 1
+            exponents[new_prime] = 0
+            prime_factor_counts += new_prime
+            last_primes = np.where(new_prime, primes, last_primes)
+            
+            exponents[active] += 1
+            remainders[active] //= primes[active]
+            active = remainders > 1
+        
+        closed = last_primes > 0
+        factor_counts[closed] *= exponents[closed] + 1
+        factor_counts[numbers < 1] = 0
+        
+        # Numbers beyond the largest sieve fall back to the factorizer one at a time.
+        for index in np.flatnonzero(~in_sieve):
+            x = int(numbers[index])
+            factor_counts[index] = self._factorizer.get_factor_count(x)
+            prime_factor_counts[index] = len(self._factorizer.get_prime_factors(x))
+        
+        return {
+            "factor count": factor_counts,
+            "prime factor count": prime_factor_counts,
+            "is prime": factor_counts == 2
+            }
+    
+    @staticmethod
+    def _get_perfect_exponent_columns(numbers):
+        """This static method finds the integer square and cube roots of each number and checks them exactly in
+        integer arithmetic, adjusting for any rounding in the floating point roots."""
+        
+        non_negative = np.maximum(numbers, 0)
+        square_roots = np.floor(np.sqrt(non_negative)).astype(np.int64)
+        square_roots = square_roots + ((square_roots + 1)**2 <= non_negative) - (square_roots**2 > non_negative)
+        is_perfect_square = (numbers >= 0) & (square_roots**2 == numbers)
+        
+        cube_roots = np.rint(np.cbrt(numbers)).astype(np.int64)
+        is_perfect_cube = np.zeros(len(numbers), dtype=bool)
+        for offset in (-1, 0, 1):
+            is_perfect_cube |= (cube_roots + offset)**3 == numbers
+        
+        return {"is perfect square": is_perfect_square, "is perfect cube": is_perfect_cube}
+    
+    @staticmethod
+    def _get_digit_columns(numbers):
+        """This static method reads the digit sums and digit lengths from the block tables of the DigitAnalyzer
+        class.  Digit factors depend on the whole number, so it peels off the last digit of every
+        number in the array on each pass for those, taking as many passes as the longest number has digits."""
+        
+        remainders = np.abs(numbers)
+        digit_factor_counts = np.zeros(len(numbers), dtype=np.int64)
+        
+        active = np.ones(len(numbers), dtype=bool)
+        while active.any():
+            digits = remainders % 10
+            is_digit_factor = active & (digits != 0) & (numbers % np.where(digits == 0, 1, digits) == 0)
+            
+            digit_factor_counts += is_digit_factor
+            remainders //= 10
+            active = remainders > 0
+        
+        digit_columns = {
+            "digit sum": DigitAnalyzer.get_digit_sums(numbers),
+            "digit length": DigitAnalyzer.get_digit_lengths(numbers),
+            "digit factors": digit_factor_counts
+            }
+        
+        return digit_columns
+    
+    @staticmethod
+    def _get_digit_property_columns(numbers):
+        """This static method reads the number of digits with each digit property from the block tables of the
+        DigitAnalyzer class."""
+        
+        return {f"{digit_property} digits": DigitAnalyzer.get_digit_counts(numbers, digit_property)
+                for digit_property in DigitAnalyzer.get_digit_properties()}
+
+
+
+class LazyNumberInfo(dict):
+    """
+    The LazyNumberInfo class is a dictionary of BatchNumberInfo columns for an array of numbers that computes its
+    columns as they are looked up.  A column is computed along with the other columns from the same pass, so looking
+    up the factor count also fills in the prime factor count.  Callers that only need a few characteristics, such as
+    the mask for a single hint, skip factorizing the numbers unless they need it.  A column that is slow to compute can
+    be prefetched in a background thread, so that looking it up later only waits for whatever is left of the pass.  It
+    inherits from dict.
+    
+    Attributes:
+        _batch_info: The BatchNumberInfo object that computes the columns.
+        _numbers: The array of numbers the columns are aligned with.
+        _prefetch_thread: The thread computing the prefetched columns, or None if there is none running.
+        _prefetch_columns: The columns the prefetch thread is computing.
+    """
+    
+    def __init__(self, batch_info, numbers):
+        super().__init__()
+        self._batch_info = batch_info
+        self._numbers = numbers
+        self._prefetch_thread = None
+        self._prefetch_columns = []
+    
+    def prefetch(self, column):
+        """This method starts computing a column, along with the others computed in the same pass, in a background
+        thread.  It raises a KeyError if there is no such column."""
+        
+        self._prefetch_columns = self._batch_info.get_group_columns(column)
+        self._prefetch_thread = threading.Thread(target=self._compute_column_group, args=(column,),
+                                                 name="NumberInfoPrefetcher", daemon=True)
+        self._prefetch_thread.start()
+    
+    def __missing__(self, column):
+        if self._prefetch_thread is not None and column in self._prefetch_columns:
+            self._prefetch_thread.join()
+            self._prefetch_thread = None
+            if column in self:
+                return self[column]
+        
+        self._compute_column_group(column)
+        return self[column]
+    
+    def _compute_column_group(self, column):
+        self.update(self._batch_info.get_column_group(self._numbers, column))
+
+
+
 class Validator:
     """
     The Validator class is for validating user inputs.  This includes custom ranges the user enters and guesses entered
@@ -130,54 +442,203 @@ class Validator:
     
     @staticmethod
     def _is_in_range(x, num_range):
-        return int(x) in [i for i in range(num_range[0], num_range[1] + 1)]
+        """This static method checks the number against the bounds of the range directly, so it takes the same time
+        no matter how wide the range is."""
+        
+        low, high = num_range
+        return low <= int(x) <= high
 
 
 
 class RandomNumberGenerator:
     """
     The RandomNumberGenerator class is for generating random numbers, whether it is one number or muliple numbers,
-    within a range.  It it used to select a winning number, and identify which hints to show.
+    within a range.  It it used to select a winning number, and identify which hints to show.  All of the numbers
+    are drawn from a NumPy Generator seeded for each game, so that any game can be replayed from its seed.
+    
+    Attributes:
+        _seed_sequence: A NumPy SeedSequence for the session, which the seed for each game is drawn from.
+        _seed: The seed of the current game.
+        _generator: A NumPy Generator seeded with the seed of the current game.
     """
     
+    def __init__(self, session_seed=None):
+        self._seed_sequence = np.random.SeedSequence(session_seed)
+        self._seed = None
+        self._generator = None
+        self.new_seed()
+    
+    def new_seed(self):
+        """This method draws a new seed from the session's seed sequence and reseeds the generator with it.  It is
+        called at the start of each game, and it returns the seed so that it can be stored with the game."""
+        
+        child_seed_sequence = self._seed_sequence.spawn(1)[0]
+        self.set_seed(int(child_seed_sequence.generate_state(1)[0]))
+        return self._seed
+    
+    def set_seed(self, seed):
+        """This method reseeds the generator with a seed recorded for a previous game, which replays the same random
+        numbers that game was given."""
+        
+        self._seed = int(seed)
+        self._generator = np.random.default_rng(self._seed)
+    
+    def get_seed(self):
+        return self._seed
+    
     def unique_random_numbers(self, num_range, n):
         """This method takes in a number range and generates a specified number of unique random numbers within that 
-        range."""
+        range.  It uses Floyd's algorithm, which draws exactly one number per result instead of retrying on repeats,
+        and then shuffles the result so that its order is random too."""
+        
+        low = num_range[0]
+        high = num_range[1]
+        size = high - low
+        if n > size:
+            raise ValueError(f"Cannot draw {n} unique numbers from a range of {size} numbers.")
+        
+        # For each j, draw a number between 0 and j.  If it was already taken, take j instead, which cannot have been.
+        upper_bounds = np.arange(size - n, size, dtype=np.int64)
+        draws = self._generator.integers(0, upper_bounds + 1).tolist()
         
         numbers = []
-        while len(numbers) < n:
-            number = self.generate_random_number(num_range)
-            if number not in numbers:
-                numbers.append(number)
-        return numbers
+        taken = set()
+        for j, draw in zip(upper_bounds.tolist(), draws):
+            number = draw if draw not in taken else j
+            taken.add(number)
+            numbers.append(number)
+        
+        self._generator.shuffle(numbers)
+        return [number + low for number in numbers]
     
-    @staticmethod
-    def generate_random_number(num_range):
-        """This static method takes in a number range and generates a random number that is within that range."""
+    def generate_random_numbers(self, num_range, n):
+        """This method takes in a number range and generates a specified number of random numbers within that range in
+        a single batch.  Unlike unique_random_numbers, the numbers may repeat."""
         
         low = num_range[0]
         high = num_range[1]
-        number = np.random.randint(low, high, 1)[0]
+        return self._generator.integers(low, high, size=n).tolist()
+    
+    def generate_random_number(self, num_range):
+        """This method takes in a number range and generates a random number that is within that range."""
+        
+        low = num_range[0]
+        high = num_range[1]
+        number = int(self._generator.integers(low, high))
         return number
 
 
 
 class Number:
     """
-    The Number class is composed with objects of the Formula, Validator, and RandomNumberGenerator classes.  It is a
-    one-stop shop for mathematical calculations.  This is the only class in this module that is instantiated and
+    The Number class is composed with objects of the NumberInfo, BatchNumberInfo, Validator, and RandomNumberGenerator
+    classes.  It is a one-stop shop for mathematical calculations.  This is the only class in this module that is instantiated and
     utilized elsewhere in the app.
     """
     
-    def __init__(self):
-        self._info = NumberInfo()
+    _profile_cache_size = 256
+    _formula_cache_size = 1024
+    
+    def __init__(self, seed=None, cache_size=None):
+        self._factorizer = AdaptiveFactorizer()
+        self._atlas = None
+        self._profiles = LRUCache(Number._profile_cache_size)
+        self._info = NumberInfo(self._factorizer, cache_size)
+        self._batch_info = BatchNumberInfo(self._factorizer)
         self._validator = Validator()
-        self._random = RandomNumberGenerator()
+        self._random = RandomNumberGenerator(seed)
     
     def get_number_info(self, info_type, *args):
         formula = self._info.get_formula(info_type)
         return formula(*args)
     
+    def enable_cache(self, max_size=None):
+        """This method turns on caching of the results of get_number_info, holding up to max_size results before the
+        least recently used ones are evicted.  Turning it on again starts a new, empty cache.  It is off by default,
+        since the math concepts go through get_number_profile, which has a cache of its own; it only helps code that
+        calls get_number_info directly with the same arguments many times."""
+        
+        self._info.enable_cache(max_size if max_size else Number._formula_cache_size)
+    
+    def disable_cache(self):
+        self._info.disable_cache()
+    
+    def load_atlas(self, directory, size=None, build=True):
+        """This method opens the number atlas saved in a directory, building it first if it does not exist and build
+        is True, and has get_number_info consult it from then on.  It returns a boolean value indicating whether the
+        atlas was loaded."""
+        
+        atlas = NumberAtlas(directory, size)
+        loaded = atlas.load(self._batch_info if build else None)
+        if loaded:
+            self._set_atlas(atlas)
+        
+        return loaded
+    
+    def load_atlas_in_background(self, directory, size=None):
+        """This method opens the number atlas saved in a directory if it has already been built.  Otherwise it builds
+        the atlas on a background thread, with a factorizer of its own so that the sieve in use is left alone, and
+        has the characteristics consult it once it is ready.  It returns the thread, or None if the atlas was opened
+        right away."""
+        
+        if self.load_atlas(directory, size, build=False):
+            return
+        
+        atlas = NumberAtlas(directory, size)
+        batch_info = BatchNumberInfo(AdaptiveFactorizer())
+        thread = threading.Thread(target=self._build_atlas, args=(atlas, batch_info), name="NumberAtlasBuilder",
+                                  daemon=True)
+        thread.start()
+        
+        return thread
+    
+    def _build_atlas(self, atlas, batch_info):
+        if atlas.load(batch_info):
+            self._set_atlas(atlas)
+    
+    def _set_atlas(self, atlas):
+        self._atlas = atlas
+        self._info.set_atlas(atlas)
+        self._batch_info.set_atlas(atlas)
+    
+    def cache_stats(self):
+        """This method returns a dictionary with the hit, miss, and eviction counts of the get_number_info cache, along
+        with its size and maximum size.  It returns None if caching is turned off."""
+        
+        return self._info.get_cache_stats()
+    
+    def get_number_profile(self, x):
+        """This method returns the profile of a number, with all of its characteristics computed together.  Profiles
+        are kept in a bounded cache, so a number is only profiled again once it has gone unused for a while."""
+        
+        x = operator.index(x)
+        return self._profiles.get(x, NumberProfile, x, self._factorizer, self._atlas)
+    
+    def get_batch_number_info(self, numbers):
+        """This method is the batch counterpart of get_number_info.  It takes in an array of integers and returns a
+        dictionary with an array of values for each characteristic, computed over the whole array at once."""
+        
+        return self._batch_info.get_number_info(numbers)
+    
+    def get_lazy_batch_number_info(self, numbers):
+        """This method is the lazy counterpart of get_batch_number_info.  Each characteristic is only computed the first
+        time it is looked up."""
+        
+        return self._batch_info.get_lazy_number_info(numbers)
+    
+    def get_max_sieve_limit(self):
+        """This method returns the largest number the factorization sieve can cover.  Larger numbers are factorized one
+        at a time, which is much slower."""
+        
+        return self._factorizer.get_max_limit()
+    
+    def set_number_range(self, num_range):
+        """This method sizes the factorization sieve to the number range of the active game.  The sieve itself is
+        only built the next time a number is factorized."""
+        
+        low, high = num_range
+        self._factorizer.set_upper_bound(max(abs(low), abs(high)))
+    
     def validate_user_entry(self, entry_type, *args):
         if entry_type == "guess":
             return self._validator.validate_guess(*args)
@@ -188,4 +649,16 @@ class Number:
         if n == 1:
             return self._random.generate_random_number(num_range)
         elif n > 1:
-            return self._random.unique_random_numbers(num_range, n)
\ No newline at end of file
+            return self._random.unique_random_numbers(num_range, n)
+    
+    def get_random_sample(self, num_range, n):
+        return self._random.generate_random_numbers(num_range, n)
+    
+    def new_random_seed(self):
+        return self._random.new_seed()
+    
+    def set_random_seed(self, seed):
+        self._random.set_seed(seed)
+    
+    def get_random_seed(self):
+        return self._random.get_seed()
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""
+The number_atlas.py module is part of the infrastructure package.  It contains a precomputed, on-disk table of
+number characteristics covering every number from 1 up to a set size.  Each characteristic is stored as its own
+.npy file and opened as a memory-mapped array, so loading the atlas costs nothing up front and the operating
+system only reads in the pages that are used.  Several app processes on one machine also share those pages.
+
+Classes:
+    NumberAtlas
+"""
+
+
+import os
+import numpy as np
+
+
+
+class NumberAtlas:
+    """
+    The NumberAtlas class builds and reads the number atlas.  The columns are computed in one vectorized pass with a
+    BatchNumberInfo object and saved to a directory, one .npy file per column.  The value for a number x is at index
+    x - 1 of each column.
+    
+    Attributes:
+        _directory: The directory holding the .npy files.
+        _size: The largest number the atlas covers.
+        _columns: A dictionary of memory-mapped arrays, one per column, or None until the atlas is loaded.
+    """
+    
+    _default_size = 10**6
+    _column_types = {
+        "factor count": np.uint16,
+        "prime factor count": np.uint8,
+        "is prime": np.bool_,
+        "is perfect square": np.bool_,
+        "is perfect cube": np.bool_,
+        "digit sum": np.uint8,
+        "digit length": np.uint8,
+        "digit factors": np.uint8
+        }
+    
+    def __init__(self, directory, size=None):
+        self._directory = directory
+        self._size = size if size else NumberAtlas._default_size
+        self._columns = None
+    
+    def build(self, batch_info):
+        """This method computes every column for the numbers 1 up to the size of the atlas and saves them.  Each file
+        is written under a temporary name first and then renamed, so a process reading the atlas never sees a file
+        that is only partly written."""
+        
+        os.makedirs(self._directory, exist_ok=True)
+        number_info = batch_info.get_number_info(np.arange(1, self._size + 1, dtype=np.int64))
+        
+        for column, dtype in NumberAtlas._column_types.items():
+            path = self._get_path(column)
+            temp_path = path[:-len(".npy")] + ".tmp.npy"
+            np.save(temp_path, number_info[column].astype(dtype))
+            os.replace(temp_path, path)
+        
+        self._columns = None
+    
+    def load(self, batch_info=None):
+        """This method opens the columns as memory-mapped arrays.  If the atlas has not been built, or it covers fewer
+        numbers than its size, it is built first when a BatchNumberInfo object is passed in.  It returns a boolean
+        value indicating whether the atlas is ready to use."""
+        
+        if not self.exists() and batch_info is None:
+            return False
+        if not self.exists():
+            self.build(batch_info)
+        
+        columns = {column: np.load(self._get_path(column), mmap_mode="r") for column in NumberAtlas._column_types}
+        self._columns = columns
+        return True
+    
+    def exists(self):
+        """This method checks that every column file exists and covers at least the size of the atlas.  The files
+        are only memory-mapped, so just their headers are read."""
+        
+        for column in NumberAtlas._column_types:
+            path = self._get_path(column)
+            if not os.path.exists(path):
+                return False
+            if len(np.load(path, mmap_mode="r")) < self._size:
+                return False
+        
+        return True
+    
+    def is_loaded(self):
+        return self._columns is not None
+    
+    def covers(self, x):
+        return self._columns is not None and 1 <= x <= self._size
+    
+    def get_value(self, column, x):
+        """This method returns the value of a column for a number as a plain Python value, or None if the atlas is not
+        loaded or does not cover the number."""
+        
+        if not self.covers(x):
+            return
+        return self._columns[column][x - 1].item()
+    
+    def get_values(self, column, numbers):
+        """This method is the array form of get_value.  Every number passed in must be covered by the atlas."""
+        
+        numbers = np.asarray(numbers, dtype=np.int64)
+        return np.asarray(self._columns[column][numbers - 1])
+    
+    def get_size(self):
+        return self._size
+    
+    @classmethod
+    def get_columns(cls):
+        return list(cls._column_types)
+    
+    def _get_path(self, column):
+        return os.path.join(self._directory, column.replace(" ", "_") + ".npy")
\ No newline at end of file
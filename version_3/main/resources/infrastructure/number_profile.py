@@ -0,0 +1,80 @@
+"""
+The number_profile.py module is part of the infrastructure package.  It contains a compact object holding every
+characteristic of a number that the math concepts use.  All of the characteristics are computed together, from
+a single prime factorization and a single pass over the digits, instead of being recomputed by each concept.
+
+Classes:
+    NumberProfile
+"""
+
+
+from resources.infrastructure.factorization import Factorizer
+from resources.infrastructure.perfect_powers import PerfectPowers
+from resources.infrastructure.digits import DigitAnalyzer
+
+
+
+class NumberProfile:
+    """
+    The NumberProfile class holds the characteristics of one number.  It uses __slots__ since many profiles are
+    kept in a cache at once.  Its characteristics match the results of the formulas in the NumberInfo class, with
+    sequences stored as tuples since a cached profile is shared by every concept that asks for it.  If a loaded
+    NumberAtlas object covers the number, the characteristics it has a column for are read from it.
+    
+    Attributes:
+        number: The number the profile describes.
+        factorization: The prime factorization of the number, as a tuple of (prime, exponent) tuples.
+        factors: A sorted tuple of the factors of the number.
+        prime_factors: A sorted tuple of the distinct prime factors of the number.
+        digits: A tuple of the digits of the number.
+        digit_sum: The sum of the digits of the number.
+        digit_length: The number of digits of the number.
+        digit_factor_count: The number of digits of the number that are also factors of it.
+        is_prime: A boolean value indicating whether the number is prime.
+        is_perfect_square: A boolean value indicating whether the number is a perfect square.
+        is_perfect_cube: A boolean value indicating whether the number is a perfect cube.
+    """
+    
+    __slots__ = ("number", "factorization", "factors", "prime_factors", "digits", "digit_sum", "digit_length",
+                 "digit_factor_count", "is_prime", "is_perfect_square", "is_perfect_cube")
+    
+    _info_types = {
+        "factors": "factors",
+        "prime factors": "prime_factors",
+        "digits": "digits",
+        "digit factors": "digit_factor_count",
+        "is prime": "is_prime",
+        "is perfect square": "is_perfect_square",
+        "is perfect cube": "is_perfect_cube"
+        }
+    
+    def __init__(self, number, factorizer, atlas=None):
+        number = int(number)
+        self.number = number
+        
+        self.factorization = tuple(factorizer.factorize(number))
+        self.factors = tuple(Factorizer.expand_factors(self.factorization)) if number > 0 else ()
+        self.prime_factors = tuple(prime for prime, exponent in self.factorization)
+        self.is_prime = self.factorization == ((number, 1),)
+        
+        self.digits = tuple(DigitAnalyzer.get_digits(number))
+        self.digit_sum = sum(self.digits)
+        self.digit_length = len(self.digits)
+        
+        if atlas is not None and atlas.covers(number):
+            self.digit_factor_count = atlas.get_value("digit factors", number)
+            self.is_perfect_square = atlas.get_value("is perfect square", number)
+            self.is_perfect_cube = atlas.get_value("is perfect cube", number)
+        else:
+            self.digit_factor_count = len([d for d in self.digits if d != 0 and number % d == 0])
+            self.is_perfect_square = PerfectPowers.is_perfect_square(number)
+            self.is_perfect_cube = PerfectPowers.is_perfect_cube(number)
+    
+    def get_info(self, info_type):
+        """This method takes in the name of a formula from the NumberInfo class and returns the matching
+        characteristic, for concepts that look up a characteristic by name."""
+        
+        return getattr(self, NumberProfile._info_types[info_type])
+    
+    def __repr__(self):
+        return f"NumberProfile({self.number})"
\ No newline at end of file
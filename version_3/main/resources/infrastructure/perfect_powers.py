@@ -0,0 +1,62 @@
+"""
+The perfect_powers.py module is part of the infrastructure package.  It contains a class that checks whether
+numbers are perfect powers (perfect squares, perfect cubes, or any k-th power) using exact integer roots.  The
+roots are found with integer arithmetic only, so the checks stay exact and take O(log x) steps no matter how
+large the number is.
+
+Classes:
+    PerfectPowers
+"""
+
+
+import math
+
+
+
+class PerfectPowers:
+    """
+    The PerfectPowers class finds integer roots of numbers and uses them to check for perfect powers.  All of its
+    methods are static, and they work for negative numbers and arbitrarily large Python integers.
+    """
+    
+    @staticmethod
+    def integer_root(x, k):
+        """This static method takes in an integer and a positive exponent, and returns the integer k-th root of the
+        number, which is the root rounded toward zero.  Negative numbers only have roots for odd exponents.  The root
+        is found with Newton's method, starting from a power of 2 that is known to be at least as large as the root."""
+        
+        x = int(x)
+        k = int(k)
+        
+        if k < 1:
+            raise ValueError("The exponent must be a positive integer.")
+        if x < 0:
+            if k % 2 == 0:
+                raise ValueError("Negative numbers do not have roots for even exponents.")
+            return -PerfectPowers.integer_root(-x, k)
+        if x < 2 or k == 1:
+            return x
+        if k == 2:
+            return math.isqrt(x)
+        
+        root = 1 << -(-x.bit_length() // k)
+        while True:
+            next_root = ((k - 1) * root + x // root**(k - 1)) // k
+            if next_root >= root:
+                return root
+            root = next_root
+    
+    @staticmethod
+    def is_perfect_power(x, k):
+        x = int(x)
+        if x < 0 and k % 2 == 0:
+            return False
+        return PerfectPowers.integer_root(x, k)**k == x
+    
+    @staticmethod
+    def is_perfect_square(x):
+        return PerfectPowers.is_perfect_power(x, 2)
+    
+    @staticmethod
+    def is_perfect_cube(x):
+        return PerfectPowers.is_perfect_power(x, 3)
\ No newline at end of file
@@ -6,7 +6,8 @@ standardized method for all concrete subclasses of that base class.  This allows
 to be updated in one action, using a standardized method.  The modules that use this subsystem include:
     game_stats.py
     user_metrics.py
-    concept_manager.py
+    concept_registry.py
+    hint_policies.py
     math_concept.py
     application_analytics.py
     data.py
@@ -7,6 +7,7 @@ Classes:
 """
 
 
+import os
 from resources.infrastructure.log import LogFactory
 from resources.infrastructure.number import Number
 from resources.infrastructure.application_text import TextManager
@@ -14,24 +15,31 @@ from resources.infrastructure.data import DataManager
 from resources.infrastructure.log_entries import ClassLogEntry
 from app_data.data_storers.session import Session
 from app_data.analytics.application_analytics import AnalyticsManager
-from app_data.db import DBManager
+from app_data.db import DBConnector, DBManager
 
 
 
 class ObjectManager:
     """
-    The ObjectManager class is a centralized location for commonly-accessed objects throughout the app.
+    The ObjectManager class is a centralized location for commonly-accessed objects throughout the app.  Its class
+    attributes hold the app's settings for the number atlas and the database connection.
     """
     
+    _atlas_directory = os.path.join(DBConnector._main_directory, "resources", "atlas")
+    _db_synchronous = "NORMAL"
+    _db_cached_statements = 256
+    
     def __init__(self, app):
         self._logs = LogFactory()
         
         self._object_dict = {"app": app, "obj_mgr": self, "logs": self._logs}
         
         self._numbers = self.create_object(Number, "numbers", ObjectManager)
+        self._numbers.load_atlas_in_background(ObjectManager._atlas_directory)
         self._text = self.create_object(TextManager, "text", ObjectManager)
         self._data = self.create_object(DataManager, "data", ObjectManager, self._text)
-        self._db_manager = self.create_object(DBManager, "db_manager", ObjectManager, self._numbers, self._data, self._logs)
+        self._db_manager = self.create_object(DBManager, "db_manager", ObjectManager, self._numbers, self._data, self._logs,
+                                              ObjectManager._db_synchronous, ObjectManager._db_cached_statements)
         self._session = self.create_object(Session, "session", ObjectManager, self)
         if self._session.get_session_count() >= 10:
             self._analytics = self.create_object(AnalyticsManager, "analytics", ObjectManager, self)
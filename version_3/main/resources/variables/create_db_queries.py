@@ -1,7 +1,7 @@
 """
 The create_db_queries.py module is part of the variables package.  It lists the set of queries that creates
-the database for the app.  It also has a variable that collects these query variables in one group for easy
-access.
+the database for the app, followed by the indexes for the queries the app runs as it is played.  It also has
+variables that collect these query variables in groups for easy access.
 
 Variables:
     create_level_of_difficulty_type_table
@@ -14,6 +14,11 @@ Variables:
     create_guess_table
     create_outcome_table
     create_table_queries
+    create_hint_number_index
+    create_guess_game_index
+    create_outcome_game_index
+    create_index_queries
+    create_schema_version_table
 """
 
 
@@ -52,6 +57,8 @@ create_hint_table = """
             hint_type_id INTEGER,
             number INTEGER,
             hint TEXT,
+            redundant INTEGER,
+            implied_by TEXT,
             FOREIGN KEY (hint_type_id) REFERENCES hint_type (id)
         );"""
 
@@ -72,6 +79,7 @@ create_game_table = """
             time TEXT,
             error INTEGER NOT NULL,
             error_type_id INTEGER,
+            seed INTEGER,
             FOREIGN KEY (session_id) REFERENCES session (id),
             FOREIGN KEY (level_of_difficulty_type_id) REFERENCES level_of_difficulty_type (id),
             FOREIGN KEY (error_type_id) REFERENCES error_type (id)
@@ -126,6 +134,34 @@ create_table_queries = [
     ("outcome", create_outcome_table)
 ]
 
+# The indexes are created if they do not exist, so they can be added to an existing database.
+create_hint_number_index = """
+        CREATE INDEX IF NOT EXISTS hint_number_index
+        ON hint (number, hint_type_id);"""
+
+create_guess_game_index = """
+        CREATE INDEX IF NOT EXISTS guess_game_index
+        ON guess (game_id);"""
+
+create_outcome_game_index = """
+        CREATE INDEX IF NOT EXISTS outcome_game_index
+        ON outcome (game_id);"""
+
+create_index_queries = [
+    ("hint", create_hint_number_index),
+    ("guess", create_guess_game_index),
+    ("outcome", create_outcome_game_index)
+]
+
+# The schema_version table records the schema migrations applied to the database.  It is created if it does not exist,
+# so it can be added to an existing database.
+create_schema_version_table = """
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER NOT NULL PRIMARY KEY,
+            name TEXT NOT NULL,
+            time TEXT NOT NULL
+        );"""
+
 db_tables = [row[0] for row in create_table_queries]
 type_tables = [table for table in db_tables if "type" in table]
 non_type_tables = [table for table in db_tables if table not in type_tables and table != "hint"]
@@ -0,0 +1,71 @@
+import pytest
+from main.resources.infrastructure.cache import LRUCache
+
+
+
+### LRUCache Object Tests
+
+@pytest.fixture
+def cache():
+    return LRUCache(max_size=2)
+
+
+# Test get method
+def test_get_miss_computes_result(cache):
+    assert 9 == cache.get(3, pow, 3, 2)
+
+def test_get_hit_reuses_result(cache):
+    results = []
+    cache.get("key", results.append, 1)
+    cache.get("key", results.append, 2)
+    assert [1] == results
+
+def test_get_counts_hits_and_misses(cache):
+    cache.get(1, abs, 1)
+    cache.get(1, abs, 1)
+    cache.get(2, abs, 2)
+    assert (1, 2) == (cache.get_stats()["hits"], cache.get_stats()["misses"])
+
+def test_get_evicts_least_recently_used(cache):
+    cache.get(1, abs, 1)
+    cache.get(2, abs, 2)
+    cache.get(1, abs, 1)
+    cache.get(3, abs, 3)
+    assert (True, False, True) == (1 in cache, 2 in cache, 3 in cache)
+
+def test_get_counts_evictions(cache):
+    for i in range(5):
+        cache.get(i, abs, i)
+    assert 3 == cache.get_stats()["evictions"]
+
+def test_get_stays_bounded(cache):
+    for i in range(10):
+        cache.get(i, abs, i)
+    assert 2 == len(cache)
+
+def test_get_no_arguments_raises_error(cache):
+    with pytest.raises(TypeError):
+        cache.get()
+
+
+# Test get_stats method
+def test_get_stats_empty(cache):
+    assert {"hits": 0, "misses": 0, "evictions": 0, "size": 0, "max size": 2} == cache.get_stats()
+
+def test_get_stats_copy(cache):
+    cache.get_stats()["hits"] = 10
+    assert 0 == cache.get_stats()["hits"]
+
+
+# Test clear method
+def test_clear_resets_cache(cache):
+    cache.get(1, abs, 1)
+    cache.get(1, abs, 1)
+    cache.clear()
+    assert {"hits": 0, "misses": 0, "evictions": 0, "size": 0, "max size": 2} == cache.get_stats()
+
+
+# Test __init__ method
+def test_init_zero_size_raises_error():
+    with pytest.raises(ValueError):
+        LRUCache(max_size=0)
\ No newline at end of file
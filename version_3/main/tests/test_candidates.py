@@ -0,0 +1,242 @@
+import pytest
+from main.tests.tests_setup import objects_fake_global_dict
+from main.game.candidates import CandidateSet
+from concepts.concept_manager import ConceptManager
+from concepts.concept_registry import ConceptRegistry
+from concepts.hints import HintRecord
+
+
+
+### Object Manager Setup
+
+objects_fake_global = objects_fake_global_dict["medium"]
+numbers = objects_fake_global.get_object("numbers")
+data = objects_fake_global.get_object("data")
+registry = ConceptRegistry.get_registry(numbers, data)
+
+
+
+### CandidateSet Object Tests
+
+@pytest.fixture
+def candidates():
+    return CandidateSet((1, 100), numbers, ConceptManager(36, numbers, None, data))
+
+@pytest.fixture
+def perfect_square_hint():
+    return registry._perfect_square._create_hint(HintRecord.MAIN)
+
+@pytest.fixture
+def even_hint():
+    return registry._even_odd._create_hint(HintRecord.MAIN, "even")
+
+@pytest.fixture
+def factor_hint():
+    return registry._factor._create_hint(HintRecord.MAIN, 9)
+
+@pytest.fixture
+def large_candidates():
+    return CandidateSet((1, 10**12), numbers, ConceptManager(2 * 10**11, numbers, None, data))
+
+@pytest.fixture
+def multiple_hint():
+    # Only the divisors of the multiple are left, so the sample is left with no candidates but the winning number.
+    return registry._multiple._create_hint(HintRecord.MAIN, 6 * 10**11)
+
+
+# Test __init__ method
+def test_init_large_range_factor_columns_prefetched(large_candidates):
+    large_candidates._number_info._prefetch_thread.join()
+    assert True == ("factor count" in large_candidates._number_info)
+
+def test_init_full_range_factor_columns_not_prefetched(candidates):
+    assert (None, False) == (candidates._number_info._prefetch_thread, "factor count" in candidates._number_info)
+
+
+# Test get_count method
+def test_get_count_full_range(candidates):
+    assert 100 == candidates.get_count()
+
+def test_get_count_large_range_estimated(large_candidates):
+    assert 10**12 == large_candidates.get_count()
+
+def test_get_count_large_range_after_hint(large_candidates, even_hint):
+    large_candidates.apply_hint(even_hint)
+    assert 4 * 10**11 < large_candidates.get_count() < 6 * 10**11
+
+def test_get_count_large_range_sample_spent(large_candidates, multiple_hint, even_hint):
+    large_candidates.apply_hint(multiple_hint)
+    large_candidates.apply_hint(even_hint)
+    assert True == (1 <= large_candidates.get_count() < 10**12)
+
+def test_get_count_too_many_arguments_raises_error(candidates):
+    with pytest.raises(TypeError):
+        candidates.get_count("extra")
+
+
+# Test get_candidates method
+def test_get_candidates_full_range(candidates):
+    assert list(range(1, 101)) == candidates.get_candidates()
+
+def test_get_candidates_custom_range():
+    candidates = CandidateSet((-3, 3), numbers, ConceptManager(2, numbers, None, data))
+    assert [-3, -2, -1, 0, 1, 2, 3] == candidates.get_candidates()
+
+def test_get_candidates_large_range_sampled():
+    candidates = CandidateSet((1, 10**12), numbers, ConceptManager(2, numbers, None, data))
+    sample = candidates.get_candidates()
+    assert (True, True) == (len(sample) <= CandidateSet._sample_size, all(1 <= x <= 10**12 for x in sample))
+
+def test_get_candidates_window_beyond_sieve_sampled():
+    candidates = CandidateSet((10**9, 10**9 + 20000), numbers, ConceptManager(10**9, numbers, None, data))
+    assert len(candidates.get_candidates()) <= CandidateSet._sample_size
+
+def test_get_candidates_window_partly_beyond_sieve():
+    limit = numbers.get_max_sieve_limit()
+    candidates = CandidateSet((limit - 2000, limit + 500), numbers, ConceptManager(limit, numbers, None, data))
+    assert list(range(limit - 2000, limit + 501)) == candidates.get_candidates()
+
+def test_get_candidates_large_range_winning_number_sampled(large_candidates):
+    assert True == (2 * 10**11 in large_candidates.get_candidates())
+
+def test_get_candidates_large_range_sorted():
+    sample = CandidateSet((1, 10**12), numbers, ConceptManager(2, numbers, None, data)).get_candidates()
+    assert sorted(set(sample)) == sample
+
+
+# Test exclude method
+def test_exclude_guess_removed(candidates):
+    candidates.exclude(36)
+    assert (99, False) == (candidates.get_count(), 36 in candidates.get_candidates())
+
+def test_exclude_twice(candidates):
+    candidates.exclude(36)
+    candidates.exclude(36)
+    assert 99 == candidates.get_count()
+
+def test_exclude_out_of_range(candidates):
+    candidates.exclude(101)
+    candidates.exclude(0)
+    assert 100 == candidates.get_count()
+
+def test_exclude_large_range():
+    candidates = CandidateSet((1, 10**12), numbers, ConceptManager(2, numbers, None, data))
+    guess = candidates.get_candidates()[10]
+    candidates.exclude(guess)
+    candidates.exclude(10**12 + 1)
+    assert (True, False) == (candidates.get_count() < 10**12, guess in candidates.get_candidates())
+
+def test_exclude_no_arguments_raises_error(candidates):
+    with pytest.raises(TypeError):
+        candidates.exclude()
+
+
+# Test apply_hint method
+def test_apply_hint_main_hint(candidates, perfect_square_hint):
+    candidates.apply_hint(perfect_square_hint)
+    assert [x**2 for x in range(1, 11)] == candidates.get_candidates()
+
+def test_apply_hint_several_hints(candidates, perfect_square_hint, even_hint, factor_hint):
+    for hint in [perfect_square_hint, even_hint, factor_hint]:
+        candidates.apply_hint(hint)
+    assert [36] == candidates.get_candidates()
+
+def test_apply_hint_higher(candidates):
+    candidates.apply_hint(registry.check_greater_or_less(90, 95), 90)
+    assert list(range(91, 101)) == candidates.get_candidates()
+
+def test_apply_hint_lower(candidates):
+    candidates.apply_hint(registry.check_greater_or_less(10, 5), 10)
+    assert list(range(1, 10)) == candidates.get_candidates()
+
+def test_apply_hint_no_arguments_raises_error(candidates):
+    with pytest.raises(TypeError):
+        candidates.apply_hint()
+
+
+# Test narrows method
+def test_narrows_yes(candidates, perfect_square_hint):
+    assert True == candidates.narrows(perfect_square_hint)
+
+def test_narrows_hint_already_applied(candidates, perfect_square_hint):
+    candidates.apply_hint(perfect_square_hint)
+    assert False == candidates.narrows(perfect_square_hint)
+
+def test_narrows_implied_hint(candidates, even_hint, factor_hint):
+    # Every even number with a factor of 9 is divisible by 6.
+    candidates.apply_hint(even_hint)
+    candidates.apply_hint(factor_hint)
+    assert False == candidates.narrows(registry._factor._create_hint(HintRecord.MAIN, 6))
+
+def test_narrows_large_range(even_hint):
+    candidates = CandidateSet((1, 10**12), numbers, ConceptManager(2, numbers, None, data))
+    candidates.apply_hint(even_hint)
+    assert (True, False) == (candidates.narrows(registry._factor._create_hint(HintRecord.MAIN, 4)), candidates.narrows(even_hint))
+
+def test_narrows_large_range_sample_spent(large_candidates, multiple_hint, even_hint):
+    large_candidates.apply_hint(multiple_hint)
+    assert (True, False) == (large_candidates.narrows(even_hint), large_candidates.narrows(multiple_hint))
+
+def test_narrows_large_range_sample_spent_implied_hint(large_candidates, multiple_hint, even_hint):
+    large_candidates.apply_hint(even_hint)
+    large_candidates.apply_hint(multiple_hint)
+    assert (False, True) == (large_candidates.narrows(registry._factor._create_hint(HintRecord.MAIN, 2)),
+                             large_candidates.narrows(registry._factor._create_hint(HintRecord.MAIN, 5)))
+
+def test_narrows_no_arguments_raises_error(candidates):
+    with pytest.raises(TypeError):
+        candidates.narrows()
+
+
+# Test split_hints method
+def test_split_hints(candidates, perfect_square_hint, even_hint, factor_hint):
+    candidates.apply_hint(perfect_square_hint)
+    candidates.apply_hint(factor_hint)
+    assert ([even_hint], [perfect_square_hint, factor_hint]) == candidates.split_hints(
+        [perfect_square_hint, even_hint, factor_hint])
+
+def test_split_hints_empty(candidates):
+    assert ([], []) == candidates.split_hints([])
+
+def test_split_hints_no_arguments_raises_error(candidates):
+    with pytest.raises(TypeError):
+        candidates.split_hints()
+
+
+# Test get_remaining_counts method
+def test_get_remaining_counts(candidates, perfect_square_hint, even_hint, factor_hint):
+    assert [10, 50, 11] == candidates.get_remaining_counts([perfect_square_hint, even_hint, factor_hint]).tolist()
+
+def test_get_remaining_counts_after_hint(candidates, perfect_square_hint, even_hint, factor_hint):
+    candidates.apply_hint(perfect_square_hint)
+    assert [10, 5, 3] == candidates.get_remaining_counts([perfect_square_hint, even_hint, factor_hint]).tolist()
+
+def test_get_remaining_counts_large_range_estimated(large_candidates, even_hint):
+    assert True == (4 * 10**11 < large_candidates.get_remaining_counts([even_hint])[0] < 6 * 10**11)
+
+def test_get_remaining_counts_large_range_sample_spent(large_candidates, multiple_hint, even_hint):
+    large_candidates.apply_hint(multiple_hint)
+    count = large_candidates.get_count()
+    assert True == (1 <= large_candidates.get_remaining_counts([even_hint])[0] <= count)
+
+def test_get_remaining_counts_no_arguments_raises_error(candidates):
+    with pytest.raises(TypeError):
+        candidates.get_remaining_counts()
+
+
+# Test _get_hint_mask method
+def test_get_hint_mask_computed_once(candidates, perfect_square_hint):
+    assert candidates._get_hint_mask(perfect_square_hint) is candidates._get_hint_mask(perfect_square_hint)
+
+def test_get_hint_mask_number_info_computed_once(candidates, perfect_square_hint, even_hint):
+    candidates._get_hint_mask(perfect_square_hint)
+    number_info = candidates._number_info
+    candidates._get_hint_mask(even_hint)
+    assert number_info is candidates._number_info
+
+def test_get_hint_mask_only_needed_columns(candidates, perfect_square_hint):
+    candidates._get_hint_mask(perfect_square_hint)
+    assert (True, False) == ("is perfect square" in candidates._number_info, "factor count" in candidates._number_info)
+
+def test_get_hint_mask_text_hint(candidates, perfect_square_hint):
+    assert candidates._get_hint_mask(perfect_square_hint).tolist() == candidates._get_hint_mask(perfect_square_hint.render()).tolist()
\ No newline at end of file
@@ -1,14 +1,17 @@
 import pytest
+import numpy as np
 from main.tests.tests_setup import objects_fake_global_dict
 from main.resources.infrastructure.number import Number
 from main.resources.infrastructure.data import DataManager
 from main.resources.infrastructure.application_text import TextManager
-from main.tests.test_db import sqlite_db_fake, test_db_path
+from main.tests.test_db import sqlite_db_fake, test_db_path, db_manager_fake
+from main.app_data.db import PopulateHintsDBScriptor
 from resources.variables.create_db_queries import non_type_tables
 
 from main.concepts.hints import *
 from main.concepts.math_concept import MathConcept
 from concepts.concept_manager import ConceptManager
+from concepts.concept_registry import ConceptRegistry
 
 
 
@@ -17,6 +20,14 @@ from concepts.concept_manager import ConceptManager
 objects_fake_global_easy = objects_fake_global_dict["easy"]
 numbers = objects_fake_global_easy.get_object("numbers")
 data = objects_fake_global_easy.get_object("data")
+registry = ConceptRegistry.get_registry(numbers, data)
+
+
+def render_hints(hints):
+    return [hint.render() for hint in hints]
+
+def render_implication_graph(implication_graph):
+    return {hint.render(): render_hints(implying_hints) for hint, implying_hints in implication_graph.items()}
 
 
 ### Concept Component Tests
@@ -89,7 +100,7 @@ def test_get_count_based_hint_too_many_arguments_raises_error(test_digit_hint_ob
 # Test _pattern_match method
 @pytest.fixture
 def math_concept():
-    return MathConcept(10, numbers, data)
+    return MathConcept(numbers, data)
 
 @pytest.fixture
 def number_pattern():
@@ -213,26 +224,30 @@ def test_get_count_satisfying_condition_too_many_arguments_raises_error(math_con
 
 
 # Test _get_number_count method
-def test_get_number_count_digit(math_concept):
-    test_text = "Test text: 1"
-    assert "1" == math_concept._get_number_count(test_text, number=1)
+def test_get_number_count_one(math_concept):
+    hint = registry._prime._create_hint(HintRecord.DIGITS_ONE)
+    assert "1" == math_concept._get_number_count(hint)
+
+def test_get_number_count_some(math_concept):
+    hint = registry._prime._create_hint(HintRecord.DIGITS_SOME, 2)
+    assert "2" == math_concept._get_number_count(hint)
 
 def test_get_number_count_none(math_concept):
-    test_text = "None test text"
-    assert "none" == math_concept._get_number_count(test_text)
+    hint = registry._prime._create_hint(HintRecord.DIGITS_NONE)
+    assert "none" == math_concept._get_number_count(hint)
 
 def test_get_number_count_all(math_concept):
-    test_text = "All test text"
-    assert "all" == math_concept._get_number_count(test_text)
+    hint = registry._prime._create_hint(HintRecord.DIGITS_ALL)
+    assert "all" == math_concept._get_number_count(hint)
 
 def test_get_number_count_no_arguments_raises_error(math_concept):
     with pytest.raises(TypeError):
         math_concept._get_number_count()
 
-def test_get_number_count_too_many_arguments_raises_error(math_concept, number_pattern):
-    test_text = "Test text"
+def test_get_number_count_too_many_arguments_raises_error(math_concept):
+    hint = registry._prime._create_hint(HintRecord.DIGITS_ONE)
     with pytest.raises(TypeError):
-        math_concept._get_number_count(test_text, number=1, extra='no')
+        math_concept._get_number_count(hint, extra='no')
 
 
 # Test _get_guess_digit_count method
@@ -286,351 +301,351 @@ def mock_concepts_three_fifty_seven():
 
 
 # Test _get_main_hint method
-def test_get_main_hint_factor(mock_concepts_five):
-    assert "Nice try!  Hint: It is divisible by {}." == mock_concepts_five._factor._get_main_hint()
+def test_get_main_hint_factor():
+    assert "Nice try!  Hint: It is divisible by {}." == registry._factor._get_main_hint()
 
-def test_get_main_hint_multiple(mock_concepts_five):
-    assert "Nice try!  Hint: {} is a multiple." == mock_concepts_five._multiple._get_main_hint()
+def test_get_main_hint_multiple():
+    assert "Nice try!  Hint: {} is a multiple." == registry._multiple._get_main_hint()
 
-def test_get_main_hint_prime(mock_concepts_five):
-    assert "Nice try!  Hint: It is a prime number." == mock_concepts_five._prime._get_main_hint()
+def test_get_main_hint_prime():
+    assert "Nice try!  Hint: It is a prime number." == registry._prime._get_main_hint()
 
-def test_get_main_hint_even_odd(mock_concepts_five):
-    assert "Nice try!  Hint: It is an {} number." == mock_concepts_five._even_odd._get_main_hint()
+def test_get_main_hint_even_odd():
+    assert "Nice try!  Hint: It is an {} number." == registry._even_odd._get_main_hint()
 
-def test_get_main_hint_perfect_square(mock_concepts_five):
-    assert "Nice try!  Hint: It is a perfect square." == mock_concepts_five._perfect_square._get_main_hint()
+def test_get_main_hint_perfect_square():
+    assert "Nice try!  Hint: It is a perfect square." == registry._perfect_square._get_main_hint()
 
-def test_get_main_hint_perfect_cube(mock_concepts_five):
-    assert "Nice try!  Hint: It is a perfect cube." == mock_concepts_five._perfect_cube._get_main_hint()
+def test_get_main_hint_perfect_cube():
+    assert "Nice try!  Hint: It is a perfect cube." == registry._perfect_cube._get_main_hint()
 
-def test_get_main_hint_digit_sum(mock_concepts_five):
-    assert "Nice try!  Hint: The sum of its digits is {}." == mock_concepts_five._digit_sum._get_main_hint()
+def test_get_main_hint_digit_sum():
+    assert "Nice try!  Hint: The sum of its digits is {}." == registry._digit_sum._get_main_hint()
 
-def test_get_main_hint_digit_length(mock_concepts_five):
-    assert "Nice try!  Hint: It is a {}-digit number." == mock_concepts_five._digit_length._get_main_hint()
+def test_get_main_hint_digit_length():
+    assert "Nice try!  Hint: It is a {}-digit number." == registry._digit_length._get_main_hint()
 
-def test_get_main_hint_too_many_arguments_raises_error(mock_concepts_five):
+def test_get_main_hint_too_many_arguments_raises_error():
     with pytest.raises(TypeError):
-        mock_concepts_five._factor._get_main_hint("extra")
+        registry._factor._get_main_hint("extra")
 
 
 # Test include_concept method
-def test_include_concept_factor_yes_positive(mock_concepts_one):
-    assert True == mock_concepts_one._factor.include_concept()
+def test_include_concept_factor_yes_positive():
+    assert True == registry._factor.include_concept(1)
 
-def test_include_concept_factor_no_zero(mock_concepts_zero):
-    assert False == mock_concepts_zero._factor.include_concept()
+def test_include_concept_factor_no_zero():
+    assert False == registry._factor.include_concept(0)
 
-def test_include_concept_factor_yes_negative(mock_concepts_negative_sixteen):
-    assert True == mock_concepts_negative_sixteen._factor.include_concept()
+def test_include_concept_factor_yes_negative():
+    assert True == registry._factor.include_concept(-16)
 
-def test_include_concept_multiple_yes_positive(mock_concepts_five):
-    assert True == mock_concepts_five._multiple.include_concept()
+def test_include_concept_multiple_yes_positive():
+    assert True == registry._multiple.include_concept(5)
 
-def test_include_concept_multiple_no_one(mock_concepts_one):
-    assert False == mock_concepts_one._multiple.include_concept()
+def test_include_concept_multiple_no_one():
+    assert False == registry._multiple.include_concept(1)
 
-def test_include_concept_multiple_no_zero(mock_concepts_zero):
-    assert False == mock_concepts_zero._multiple.include_concept()
+def test_include_concept_multiple_no_zero():
+    assert False == registry._multiple.include_concept(0)
 
-def test_include_concept_multiple_yes_negative(mock_concepts_negative_sixteen):
-    assert True == mock_concepts_negative_sixteen._multiple.include_concept()
+def test_include_concept_multiple_yes_negative():
+    assert True == registry._multiple.include_concept(-16)
 
-def test_include_concept_prime_yes_positive(mock_concepts_five):
-    assert True == mock_concepts_five._prime.include_concept()
+def test_include_concept_prime_yes_positive():
+    assert True == registry._prime.include_concept(5)
 
-def test_include_concept_prime_yes_zero(mock_concepts_zero):
-    assert True == mock_concepts_zero._prime.include_concept()
+def test_include_concept_prime_yes_zero():
+    assert True == registry._prime.include_concept(0)
 
-def test_include_concept_prime_no_negative(mock_concepts_negative_sixteen):
-    assert False == mock_concepts_negative_sixteen._prime.include_concept()
+def test_include_concept_prime_no_negative():
+    assert False == registry._prime.include_concept(-16)
 
-def test_include_concept_even_odd_positive_yes_one_digit(mock_concepts_five):
-    assert True == mock_concepts_five._even_odd.include_concept()
+def test_include_concept_even_odd_positive_yes_one_digit():
+    assert True == registry._even_odd.include_concept(5)
 
-def test_include_concept_even_odd_positive_no_three_digits(mock_concepts_three_fifty_seven):
-    assert False == mock_concepts_three_fifty_seven._even_odd.include_concept()
+def test_include_concept_even_odd_positive_no_three_digits():
+    assert False == registry._even_odd.include_concept(357)
 
-def test_include_concept_even_odd_negative_yes_two_digits(mock_concepts_negative_sixteen):
-    assert True == mock_concepts_negative_sixteen._even_odd.include_concept()
+def test_include_concept_even_odd_negative_yes_two_digits():
+    assert True == registry._even_odd.include_concept(-16)
 
-def test_include_concept_even_odd_negative_no_four_digits(mock_concepts_negative_one_thousand):
-    assert False == mock_concepts_negative_one_thousand._even_odd.include_concept()
+def test_include_concept_even_odd_negative_no_four_digits():
+    assert False == registry._even_odd.include_concept(-1000)
 
-def test_include_concept_perfect_square_yes_positive(mock_concepts_five):
-    assert True == mock_concepts_five._perfect_square.include_concept()
+def test_include_concept_perfect_square_yes_positive():
+    assert True == registry._perfect_square.include_concept(5)
 
-def test_include_concept_perfect_square_yes_zero(mock_concepts_zero):
-    assert True == mock_concepts_zero._perfect_square.include_concept()
+def test_include_concept_perfect_square_yes_zero():
+    assert True == registry._perfect_square.include_concept(0)
 
-def test_include_concept_perfect_square_no_negative(mock_concepts_negative_sixteen):
-    assert False == mock_concepts_negative_sixteen._perfect_square.include_concept()
+def test_include_concept_perfect_square_no_negative():
+    assert False == registry._perfect_square.include_concept(-16)
 
-def test_include_concept_perfect_cube_yes_positive(mock_concepts_five):
-    assert True == mock_concepts_five._perfect_cube.include_concept()
+def test_include_concept_perfect_cube_yes_positive():
+    assert True == registry._perfect_cube.include_concept(5)
 
-def test_include_concept_perfect_cube_yes_zero(mock_concepts_zero):
-    assert True == mock_concepts_zero._perfect_cube.include_concept()
+def test_include_concept_perfect_cube_yes_zero():
+    assert True == registry._perfect_cube.include_concept(0)
 
-def test_include_concept_perfect_cube_yes_negative(mock_concepts_negative_sixteen):
-    assert True == mock_concepts_negative_sixteen._perfect_cube.include_concept()
+def test_include_concept_perfect_cube_yes_negative():
+    assert True == registry._perfect_cube.include_concept(-16)
 
-def test_include_concept_digit_sum_no_single_digit(mock_concepts_five):
-    assert False == mock_concepts_five._digit_sum.include_concept()
+def test_include_concept_digit_sum_no_single_digit():
+    assert False == registry._digit_sum.include_concept(5)
 
-def test_include_concept_digit_sum_yes_positive(mock_concepts_twenty_four):
-    assert True == mock_concepts_twenty_four._digit_sum.include_concept()
+def test_include_concept_digit_sum_yes_positive():
+    assert True == registry._digit_sum.include_concept(24)
 
-def test_include_concept_digit_sum_yes_negative(mock_concepts_negative_sixteen):
-    assert True == mock_concepts_negative_sixteen._digit_sum.include_concept()
+def test_include_concept_digit_sum_yes_negative():
+    assert True == registry._digit_sum.include_concept(-16)
 
-def test_include_concept_digit_length_positive_no_single_digit(mock_concepts_five):
-    assert False == mock_concepts_five._digit_length.include_concept()
+def test_include_concept_digit_length_positive_no_single_digit():
+    assert False == registry._digit_length.include_concept(5)
 
-def test_include_concept_digit_length_positive_yes_three_digits(mock_concepts_three_fifty_seven):
-    assert True == mock_concepts_three_fifty_seven._digit_length.include_concept()
+def test_include_concept_digit_length_positive_yes_three_digits():
+    assert True == registry._digit_length.include_concept(357)
 
-def test_include_concept_digit_length_negative_no_two_digits(mock_concepts_negative_sixteen):
-    assert False == mock_concepts_negative_sixteen._digit_length.include_concept()
+def test_include_concept_digit_length_negative_no_two_digits():
+    assert False == registry._digit_length.include_concept(-16)
 
-def test_include_concept_digit_length_negative_yes_four_digits(mock_concepts_negative_one_thousand):
-    assert True == mock_concepts_negative_one_thousand._digit_length.include_concept()
+def test_include_concept_digit_length_negative_yes_four_digits():
+    assert True == registry._digit_length.include_concept(-1000)
 
-def test_include_concept_too_many_arguments_raises_error(mock_concepts_one):
+def test_include_concept_too_many_arguments_raises_error():
     with pytest.raises(TypeError):
-        mock_concepts_one._factor.include_concept("extra")
+        registry._factor.include_concept(1, "extra")
 
 
 # Test _satisfies_condition method
-def test_satisfies_condition_factor_yes(mock_concepts_twenty_four):
-    assert True == mock_concepts_twenty_four._factor._satisfies_condition(6)
+def test_satisfies_condition_factor_yes():
+    assert True == registry._factor._satisfies_condition(6, 24)
 
-def test_satisfies_condition_factor_no(mock_concepts_twenty_four):
-    assert False == mock_concepts_twenty_four._factor._satisfies_condition(20)
+def test_satisfies_condition_factor_no():
+    assert False == registry._factor._satisfies_condition(20, 24)
 
-def test_satisfies_condition_prime_no_arg_yes(mock_concepts_five):
-    assert True == mock_concepts_five._prime._satisfies_condition()
+def test_satisfies_condition_prime_profile_yes():
+    assert True == registry._prime._satisfies_condition(numbers.get_number_profile(5))
 
-def test_satisfies_condition_prime_no_arg_no(mock_concepts_twenty_four):
-    assert False == mock_concepts_twenty_four._prime._satisfies_condition()
+def test_satisfies_condition_prime_profile_no():
+    assert False == registry._prime._satisfies_condition(numbers.get_number_profile(24))
 
-def test_satisfies_condition_prime_arg_no(mock_concepts_five):
-    assert False == mock_concepts_five._prime._satisfies_condition(24)
+def test_satisfies_condition_prime_arg_no():
+    assert False == registry._prime._satisfies_condition(24)
 
-def test_satisfies_condition_prime_arg_yes(mock_concepts_twenty_four):
-    assert True == mock_concepts_twenty_four._prime._satisfies_condition(5)
+def test_satisfies_condition_prime_arg_yes():
+    assert True == registry._prime._satisfies_condition(5)
 
-def test_satisfies_condition_prime_arg_zero_no(mock_concepts_five):
-    assert False == mock_concepts_five._prime._satisfies_condition(0)
+def test_satisfies_condition_prime_arg_zero_no():
+    assert False == registry._prime._satisfies_condition(0)
 
-def test_satisfies_condition_even_odd_no_arg_no(mock_concepts_five):
-    assert False == mock_concepts_five._even_odd._satisfies_condition()
+def test_satisfies_condition_even_odd_profile_no():
+    assert False == registry._even_odd._satisfies_condition(numbers.get_number_profile(5))
 
-def test_satisfies_condition_even_odd_no_arg_yes(mock_concepts_twenty_four):
-    assert True == mock_concepts_twenty_four._even_odd._satisfies_condition()
+def test_satisfies_condition_even_odd_profile_yes():
+    assert True == registry._even_odd._satisfies_condition(numbers.get_number_profile(24))
 
-def test_satisfies_condition_even_odd_arg_yes(mock_concepts_five):
-    assert True == mock_concepts_five._even_odd._satisfies_condition(24)
+def test_satisfies_condition_even_odd_arg_yes():
+    assert True == registry._even_odd._satisfies_condition(24)
 
-def test_satisfies_condition_even_odd_arg_no(mock_concepts_twenty_four):
-    assert False == mock_concepts_twenty_four._even_odd._satisfies_condition(5)
+def test_satisfies_condition_even_odd_arg_no():
+    assert False == registry._even_odd._satisfies_condition(5)
 
-def test_satisfies_condition_even_odd_arg_zero_yes(mock_concepts_five):
-    assert True == mock_concepts_five._even_odd._satisfies_condition(0)
+def test_satisfies_condition_even_odd_arg_zero_yes():
+    assert True == registry._even_odd._satisfies_condition(0)
 
-def test_satisfies_condition_perfect_square_no_arg_no(mock_concepts_five):
-    assert False == mock_concepts_five._perfect_square._satisfies_condition()
+def test_satisfies_condition_perfect_square_profile_no():
+    assert False == registry._perfect_square._satisfies_condition(numbers.get_number_profile(5))
 
-def test_satisfies_condition_perfect_square_no_arg_yes(mock_concepts_one):
-    assert True == mock_concepts_one._perfect_square._satisfies_condition()
+def test_satisfies_condition_perfect_square_profile_yes():
+    assert True == registry._perfect_square._satisfies_condition(numbers.get_number_profile(1))
 
-def test_satisfies_condition_perfect_square_arg_yes(mock_concepts_five):
-    assert True == mock_concepts_five._perfect_square._satisfies_condition(1)
+def test_satisfies_condition_perfect_square_arg_yes():
+    assert True == registry._perfect_square._satisfies_condition(1)
 
-def test_satisfies_condition_perfect_square_arg_no(mock_concepts_one):
-    assert False == mock_concepts_one._perfect_square._satisfies_condition(5)
+def test_satisfies_condition_perfect_square_arg_no():
+    assert False == registry._perfect_square._satisfies_condition(5)
 
-def test_satisfies_condition_perfect_square_arg_zero_yes(mock_concepts_five):
-    assert True == mock_concepts_five._perfect_square._satisfies_condition(0)
+def test_satisfies_condition_perfect_square_arg_zero_yes():
+    assert True == registry._perfect_square._satisfies_condition(0)
 
-def test_satisfies_condition_perfect_cube_no_arg_no(mock_concepts_five):
-    assert False == mock_concepts_five._perfect_cube._satisfies_condition()
+def test_satisfies_condition_perfect_cube_profile_no():
+    assert False == registry._perfect_cube._satisfies_condition(numbers.get_number_profile(5))
 
-def test_satisfies_condition_perfect_cube_no_arg_yes(mock_concepts_one):
-    assert True == mock_concepts_one._perfect_cube._satisfies_condition()
+def test_satisfies_condition_perfect_cube_profile_yes():
+    assert True == registry._perfect_cube._satisfies_condition(numbers.get_number_profile(1))
 
-def test_satisfies_condition_perfect_cube_arg_yes(mock_concepts_five):
-    assert True == mock_concepts_five._perfect_cube._satisfies_condition(1)
+def test_satisfies_condition_perfect_cube_arg_yes():
+    assert True == registry._perfect_cube._satisfies_condition(1)
 
-def test_satisfies_condition_perfect_cube_arg_no(mock_concepts_one):
-    assert False == mock_concepts_one._perfect_cube._satisfies_condition(5)
+def test_satisfies_condition_perfect_cube_arg_no():
+    assert False == registry._perfect_cube._satisfies_condition(5)
 
-def test_satisfies_condition_perfect_cube_arg_zero_yes(mock_concepts_five):
-    assert True == mock_concepts_five._perfect_cube._satisfies_condition(0)
+def test_satisfies_condition_perfect_cube_arg_zero_yes():
+    assert True == registry._perfect_cube._satisfies_condition(0)
 
-def test_satisfies_condition_too_many_arguments_raises_error(mock_concepts_one):
+def test_satisfies_condition_too_many_arguments_raises_error():
     with pytest.raises(TypeError):
-        mock_concepts_one._prime._satisfies_condition(1, "extra")
+        registry._prime._satisfies_condition(1, "extra")
 
-def test_satisfies_condition_factor_no_arguments_raises_error(mock_concepts_one):
+def test_satisfies_condition_factor_no_arguments_raises_error():
     with pytest.raises(TypeError):
-        mock_concepts_one._factor._satisfies_condition()
+        registry._factor._satisfies_condition()
 
-def test_satisfies_condition_factor_too_many_arguments_raises_error(mock_concepts_one):
+def test_satisfies_condition_factor_too_many_arguments_raises_error():
     with pytest.raises(TypeError):
-        mock_concepts_one._factor._satisfies_condition(1, "extra")
+        registry._factor._satisfies_condition(1, 1, "extra")
 
 
 # Test _get_count_satisfying_condition method
-def test_get_count_satisfying_condition_some_meet_condition(mock_concepts_one):
+def test_get_count_satisfying_condition_some_meet_condition():
     test_list = [1,2,3,4,5]
-    assert 3 == mock_concepts_one._prime._get_count_satisfying_condition(test_list)
+    assert 3 == registry._prime._get_count_satisfying_condition(test_list)
 
-def test_get_count_satisfying_condition_all_meet_condition(mock_concepts_one):
+def test_get_count_satisfying_condition_all_meet_condition():
     test_list = [3,5,7,11,13]
-    assert 5 == mock_concepts_one._prime._get_count_satisfying_condition(test_list)
+    assert 5 == registry._prime._get_count_satisfying_condition(test_list)
 
-def test_get_count_satisfying_condition_none_meet_condition(mock_concepts_one):
+def test_get_count_satisfying_condition_none_meet_condition():
     test_list = [10,12,14,15,16,18]
-    assert 0 == mock_concepts_one._prime._get_count_satisfying_condition(test_list)
+    assert 0 == registry._prime._get_count_satisfying_condition(test_list)
 
-def test_get_count_satisfying_condition_no_arguments_raises_error(mock_concepts_one):
+def test_get_count_satisfying_condition_no_arguments_raises_error():
     with pytest.raises(TypeError):
-        mock_concepts_one._prime._get_count_satisfying_condition()
+        registry._prime._get_count_satisfying_condition()
 
-def test_get_count_satisfying_condition_too_many_arguments_raises_error(mock_concepts_one):
+def test_get_count_satisfying_condition_too_many_arguments_raises_error():
     test_list = [1,2,3,4,5]
     with pytest.raises(TypeError):
-        mock_concepts_one._prime._get_count_satisfying_condition(test_list, "extra")
+        registry._prime._get_count_satisfying_condition(test_list, "extra")
 
 
 # Test _get_digit_hint_feedback method
-def test_get_digit_hint_feedback_prime_good_one(mock_concepts_one):
-    test_text = "Test text: 1"
-    assert "good" == mock_concepts_one._prime._get_digit_hint_feedback(test_text, 1, 17)
+def test_get_digit_hint_feedback_prime_good_one():
+    hint = registry._prime._create_hint(HintRecord.DIGITS_ONE)
+    assert "good" == registry._prime._get_digit_hint_feedback(hint, 17)
 
-def test_get_digit_hint_feedback_prime_good_all(mock_concepts_one):
-    test_text = "Test text: All"
-    assert "good" == mock_concepts_one._prime._get_digit_hint_feedback(test_text, None, 23)
+def test_get_digit_hint_feedback_prime_good_all():
+    hint = registry._prime._create_hint(HintRecord.DIGITS_ALL)
+    assert "good" == registry._prime._get_digit_hint_feedback(hint, 23)
 
-def test_get_digit_hint_feedback_prime_good_none(mock_concepts_one):
-    test_text = "Test text: None"
-    assert "good" == mock_concepts_one._prime._get_digit_hint_feedback(test_text, None, 48)
+def test_get_digit_hint_feedback_prime_good_none():
+    hint = registry._prime._create_hint(HintRecord.DIGITS_NONE)
+    assert "good" == registry._prime._get_digit_hint_feedback(hint, 48)
 
-def test_get_digit_hint_feedback_prime_bad_mismatch(mock_concepts_one):
-    test_text = "Test text: 2"
-    assert "bad" == mock_concepts_one._prime._get_digit_hint_feedback(test_text, 2, 17)
+def test_get_digit_hint_feedback_prime_bad_mismatch():
+    hint = registry._prime._create_hint(HintRecord.DIGITS_SOME, 2)
+    assert "bad" == registry._prime._get_digit_hint_feedback(hint, 17)
 
-def test_get_digit_hint_feedback_even_odd_good_one(mock_concepts_one):
-    test_text = "Test text: 1"
-    assert "good" == mock_concepts_one._even_odd._get_digit_hint_feedback(test_text, 1, 18)
+def test_get_digit_hint_feedback_even_odd_good_one():
+    hint = registry._even_odd._create_hint(HintRecord.DIGITS_ONE)
+    assert "good" == registry._even_odd._get_digit_hint_feedback(hint, 18)
 
-def test_get_digit_hint_feedback_even_odd_good_all(mock_concepts_one):
-    test_text = "Test text: All"
-    assert "good" == mock_concepts_one._even_odd._get_digit_hint_feedback(test_text, None, 20)
+def test_get_digit_hint_feedback_even_odd_good_all():
+    hint = registry._even_odd._create_hint(HintRecord.DIGITS_ALL)
+    assert "good" == registry._even_odd._get_digit_hint_feedback(hint, 20)
 
-def test_get_digit_hint_feedback_even_odd_good_none(mock_concepts_one):
-    test_text = "Test text: None"
-    assert "good" == mock_concepts_one._even_odd._get_digit_hint_feedback(test_text, None, 31)
+def test_get_digit_hint_feedback_even_odd_good_none():
+    hint = registry._even_odd._create_hint(HintRecord.DIGITS_NONE)
+    assert "good" == registry._even_odd._get_digit_hint_feedback(hint, 31)
 
-def test_get_digit_hint_feedback_even_odd_bad_mismatch(mock_concepts_one):
-    test_text = "Test text: 2"
-    assert "bad" == mock_concepts_one._even_odd._get_digit_hint_feedback(test_text, 2, 18)
+def test_get_digit_hint_feedback_even_odd_bad_mismatch():
+    hint = registry._even_odd._create_hint(HintRecord.DIGITS_SOME, 2)
+    assert "bad" == registry._even_odd._get_digit_hint_feedback(hint, 18)
 
-def test_get_digit_hint_feedback_perfect_square_good_one(mock_concepts_one):
-    test_text = "Test text: 1"
-    assert "good" == mock_concepts_one._perfect_square._get_digit_hint_feedback(test_text, 1, 18)
+def test_get_digit_hint_feedback_perfect_square_good_one():
+    hint = registry._perfect_square._create_hint(HintRecord.DIGITS_ONE)
+    assert "good" == registry._perfect_square._get_digit_hint_feedback(hint, 18)
 
-def test_get_digit_hint_feedback_perfect_square_good_all(mock_concepts_one):
-    test_text = "Test text: All"
-    assert "good" == mock_concepts_one._perfect_square._get_digit_hint_feedback(test_text, None, 40)
+def test_get_digit_hint_feedback_perfect_square_good_all():
+    hint = registry._perfect_square._create_hint(HintRecord.DIGITS_ALL)
+    assert "good" == registry._perfect_square._get_digit_hint_feedback(hint, 40)
 
-def test_get_digit_hint_feedback_perfect_square_good_none(mock_concepts_one):
-    test_text = "Test text: None"
-    assert "good" == mock_concepts_one._perfect_square._get_digit_hint_feedback(test_text, None, 36)
+def test_get_digit_hint_feedback_perfect_square_good_none():
+    hint = registry._perfect_square._create_hint(HintRecord.DIGITS_NONE)
+    assert "good" == registry._perfect_square._get_digit_hint_feedback(hint, 36)
 
-def test_get_digit_hint_feedback_perfect_square_bad_mismatch(mock_concepts_one):
-    test_text = "Test text: 2"
-    assert "bad" == mock_concepts_one._perfect_square._get_digit_hint_feedback(test_text, 2, 18)
+def test_get_digit_hint_feedback_perfect_square_bad_mismatch():
+    hint = registry._perfect_square._create_hint(HintRecord.DIGITS_SOME, 2)
+    assert "bad" == registry._perfect_square._get_digit_hint_feedback(hint, 18)
 
-def test_get_digit_hint_feedback_perfect_cube_good_one(mock_concepts_one):
-    test_text = "Test text: 1"
-    assert "good" == mock_concepts_one._perfect_cube._get_digit_hint_feedback(test_text, 1, 17)
+def test_get_digit_hint_feedback_perfect_cube_good_one():
+    hint = registry._perfect_cube._create_hint(HintRecord.DIGITS_ONE)
+    assert "good" == registry._perfect_cube._get_digit_hint_feedback(hint, 17)
 
-def test_get_digit_hint_feedback_perfect_cube_good_all(mock_concepts_one):
-    test_text = "Test text: All"
-    assert "good" == mock_concepts_one._perfect_cube._get_digit_hint_feedback(test_text, None, 80)
+def test_get_digit_hint_feedback_perfect_cube_good_all():
+    hint = registry._perfect_cube._create_hint(HintRecord.DIGITS_ALL)
+    assert "good" == registry._perfect_cube._get_digit_hint_feedback(hint, 80)
 
-def test_get_digit_hint_feedback_perfect_cube_good_none(mock_concepts_one):
-    test_text = "Test text: None"
-    assert "good" == mock_concepts_one._perfect_cube._get_digit_hint_feedback(test_text, None, 34)
+def test_get_digit_hint_feedback_perfect_cube_good_none():
+    hint = registry._perfect_cube._create_hint(HintRecord.DIGITS_NONE)
+    assert "good" == registry._perfect_cube._get_digit_hint_feedback(hint, 34)
 
-def test_get_digit_hint_feedback_perfect_cube_bad_mismatch(mock_concepts_one):
-    test_text = "Test text: 2"
-    assert "bad" == mock_concepts_one._perfect_cube._get_digit_hint_feedback(test_text, 2, 17)
+def test_get_digit_hint_feedback_perfect_cube_bad_mismatch():
+    hint = registry._perfect_cube._create_hint(HintRecord.DIGITS_SOME, 2)
+    assert "bad" == registry._perfect_cube._get_digit_hint_feedback(hint, 17)
 
-def test_get_digit_hint_feedback_no_arguments_raises_error(mock_concepts_one):
+def test_get_digit_hint_feedback_no_arguments_raises_error():
     with pytest.raises(TypeError):
-        mock_concepts_one._prime._get_digit_hint_feedback()
+        registry._prime._get_digit_hint_feedback()
 
-def test_get_digit_hint_feedback_too_many_arguments_raises_error(mock_concepts_one):
-    test_text = "Test text: 1"
+def test_get_digit_hint_feedback_too_many_arguments_raises_error():
+    hint = registry._prime._create_hint(HintRecord.DIGITS_ONE)
     with pytest.raises(TypeError):
-        mock_concepts_one._prime._get_digit_hint_feedback(test_text, 1, 17, "extra")
+        registry._prime._get_digit_hint_feedback(hint, 17, "extra")
 
 
 # Test _get_non_digit_hint_feedback method
-def test_get_non_digit_hint_feedback_prime_no_number_bad(mock_concepts_one):
-    assert "bad" == mock_concepts_one._prime._get_non_digit_hint_feedback(None, 24)
+def test_get_non_digit_hint_feedback_prime_no_number_bad():
+    assert "bad" == registry._prime._get_non_digit_hint_feedback(registry._prime._create_hint(HintRecord.MAIN), 24)
 
-def test_get_non_digit_hint_feedback_prime_no_number_good(mock_concepts_one):
-    assert "good" == mock_concepts_one._prime._get_non_digit_hint_feedback(None, 5)
+def test_get_non_digit_hint_feedback_prime_no_number_good():
+    assert "good" == registry._prime._get_non_digit_hint_feedback(registry._prime._create_hint(HintRecord.MAIN), 5)
 
-def test_get_non_digit_hint_feedback_prime_number_good(mock_concepts_one):
-    assert "good" == mock_concepts_one._prime._get_non_digit_hint_feedback(2, 24)
+def test_get_non_digit_hint_feedback_prime_number_good():
+    assert "good" == registry._prime._get_non_digit_hint_feedback(registry._prime._create_hint(HintRecord.FACTOR, 2), 24)
 
-def test_get_non_digit_hint_feedback_prime_number_bad(mock_concepts_one):
-    assert "bad" == mock_concepts_one._prime._get_non_digit_hint_feedback(8, 24)
+def test_get_non_digit_hint_feedback_prime_number_bad():
+    assert "bad" == registry._prime._get_non_digit_hint_feedback(registry._prime._create_hint(HintRecord.FACTOR, 8), 24)
 
-def test_get_non_digit_hint_feedback_even_odd_good_even(mock_concepts_one):
-    assert "good" == mock_concepts_one._even_odd._get_non_digit_hint_feedback("Test text: even", 24)
+def test_get_non_digit_hint_feedback_even_odd_good_even():
+    assert "good" == registry._even_odd._get_non_digit_hint_feedback(registry._even_odd._create_hint(HintRecord.MAIN, "even"), 24)
 
-def test_get_non_digit_hint_feedback_even_odd_good_odd(mock_concepts_one):
-    assert "good" == mock_concepts_one._even_odd._get_non_digit_hint_feedback("Test text: odd", 5)
+def test_get_non_digit_hint_feedback_even_odd_good_odd():
+    assert "good" == registry._even_odd._get_non_digit_hint_feedback(registry._even_odd._create_hint(HintRecord.MAIN, "odd"), 5)
 
-def test_get_non_digit_hint_feedback_even_odd_bad(mock_concepts_one):
-    assert "bad" == mock_concepts_one._even_odd._get_non_digit_hint_feedback("Test text: even", 5)
+def test_get_non_digit_hint_feedback_even_odd_bad():
+    assert "bad" == registry._even_odd._get_non_digit_hint_feedback(registry._even_odd._create_hint(HintRecord.MAIN, "even"), 5)
 
-def test_get_non_digit_hint_feedback_perfect_square_good(mock_concepts_one):
-    assert "good" == mock_concepts_one._perfect_square._get_non_digit_hint_feedback(4)
+def test_get_non_digit_hint_feedback_perfect_square_good():
+    assert "good" == registry._perfect_square._get_non_digit_hint_feedback(registry._perfect_square._create_hint(HintRecord.MAIN), 4)
 
-def test_get_non_digit_hint_feedback_perfect_square_bad(mock_concepts_one):
-    assert "bad" == mock_concepts_one._perfect_square._get_non_digit_hint_feedback(8)
+def test_get_non_digit_hint_feedback_perfect_square_bad():
+    assert "bad" == registry._perfect_square._get_non_digit_hint_feedback(registry._perfect_square._create_hint(HintRecord.MAIN), 8)
 
-def test_get_non_digit_hint_feedback_perfect_cube_good(mock_concepts_one):
-    assert "good" == mock_concepts_one._perfect_cube._get_non_digit_hint_feedback(8)
+def test_get_non_digit_hint_feedback_perfect_cube_good():
+    assert "good" == registry._perfect_cube._get_non_digit_hint_feedback(registry._perfect_cube._create_hint(HintRecord.MAIN), 8)
 
-def test_get_non_digit_hint_feedback_perfect_cube_bad(mock_concepts_one):
-    assert "bad" == mock_concepts_one._perfect_cube._get_non_digit_hint_feedback(4)
+def test_get_non_digit_hint_feedback_perfect_cube_bad():
+    assert "bad" == registry._perfect_cube._get_non_digit_hint_feedback(registry._perfect_cube._create_hint(HintRecord.MAIN), 4)
 
-def test_get_non_digit_hint_feedback_no_arguments_raises_error(mock_concepts_one):
+def test_get_non_digit_hint_feedback_no_arguments_raises_error():
     with pytest.raises(TypeError):
-        mock_concepts_one._prime._get_non_digit_hint_feedback()
+        registry._prime._get_non_digit_hint_feedback()
 
-def test_get_non_digit_hint_feedback_too_many_arguments_raises_error(mock_concepts_one):
+def test_get_non_digit_hint_feedback_too_many_arguments_raises_error():
     with pytest.raises(TypeError):
-        mock_concepts_one._prime._get_non_digit_hint_feedback(4, "extra")
+        registry._prime._get_non_digit_hint_feedback(registry._prime._create_hint(HintRecord.MAIN), 4, "extra")
 
 
 # Test _generate_main_hints method
 @pytest.fixture
-def factor_list_twenty_four(mock_concepts_twenty_four):
+def factor_list_twenty_four():
     return [1, 2, 3, 4, 6, 8, 12, 24]
 
 @pytest.fixture
-def main_hints_factor_twenty_four(mock_concepts_twenty_four, factor_list_twenty_four):
-    return mock_concepts_twenty_four._factor._generate_main_hints(factor_list_twenty_four)
+def main_hints_factor_twenty_four(factor_list_twenty_four):
+    return render_hints(registry._factor._generate_main_hints(factor_list_twenty_four))
 
 def test_generate_main_hints_factor_in_list(main_hints_factor_twenty_four):
     assert "Nice try!  Hint: It is divisible by 12." in main_hints_factor_twenty_four
@@ -644,25 +659,25 @@ def test_generate_main_hints_factor_not_in_list_high_endpoint(main_hints_factor_
 def test_generate_main_hints_factor_not_in_list_unformatted(main_hints_factor_twenty_four):
     assert "Nice try!  Hint: It is divisible by {}." not in main_hints_factor_twenty_four
 
-def test_generate_main_hints_factor_no_arguments_raises_error(mock_concepts_twenty_four):
+def test_generate_main_hints_factor_no_arguments_raises_error():
     with pytest.raises(TypeError):
-        mock_concepts_twenty_four._factor._generate_main_hints()
+        registry._factor._generate_main_hints()
 
-def test_generate_main_hints_factor_too_many_arguments_raises_error(mock_concepts_twenty_four):
+def test_generate_main_hints_factor_too_many_arguments_raises_error():
     with pytest.raises(TypeError):
-        mock_concepts_twenty_four._factor._generate_main_hints([1, 2, 4], "extra")
+        registry._factor._generate_main_hints([1, 2, 4], "extra")
 
 @pytest.fixture
-def main_hints_multiple_five_unfiltered(mock_concepts_five):
-    return mock_concepts_five._multiple._generate_main_hints(filter_results=False)
+def main_hints_multiple_five_unfiltered():
+    return render_hints(registry._multiple._generate_main_hints(5, filter_results=False))
 
 @pytest.fixture
-def main_hints_multiple_five_filtered(mock_concepts_five):
-    return mock_concepts_five._multiple._generate_main_hints()
+def main_hints_multiple_five_filtered():
+    return render_hints(registry._multiple._generate_main_hints(5))
 
 @pytest.fixture
-def main_hints_multiple_zero(mock_concepts_zero):
-    return mock_concepts_zero._multiple._generate_main_hints(filter_results=False)
+def main_hints_multiple_zero():
+    return render_hints(registry._multiple._generate_main_hints(0, filter_results=False))
 
 def test_generate_main_hints_multiple_in_list(main_hints_multiple_five_unfiltered):
     assert "Nice try!  Hint: 10 is a multiple." in main_hints_multiple_five_unfiltered
@@ -683,12 +698,12 @@ def test_generate_main_hints_multiple_zero_length_of_one(main_hints_multiple_zer
     assert 1 == len(main_hints_multiple_zero)
 
 @pytest.fixture
-def main_hints_prime_five(mock_concepts_five):
-    return mock_concepts_five._prime._generate_main_hints()
+def main_hints_prime_five():
+    return render_hints(registry._prime._generate_main_hints(5))
 
 @pytest.fixture
-def main_hints_prime_twenty_four(mock_concepts_twenty_four):
-    return mock_concepts_twenty_four._prime._generate_main_hints()
+def main_hints_prime_twenty_four():
+    return render_hints(registry._prime._generate_main_hints(24))
 
 def test_generate_main_hints_prime_in_list(main_hints_prime_five):
     assert "Nice try!  Hint: It is a prime number." in main_hints_prime_five
@@ -700,12 +715,12 @@ def test_generate_main_hints_prime_not_prime_empty(main_hints_prime_twenty_four)
     assert 0 == len(main_hints_prime_twenty_four)
 
 @pytest.fixture
-def main_hints_even_odd_five(mock_concepts_five):
-    return mock_concepts_five._even_odd._generate_main_hints()
+def main_hints_even_odd_five():
+    return render_hints(registry._even_odd._generate_main_hints(5))
 
 @pytest.fixture
-def main_hints_even_odd_twenty_four(mock_concepts_twenty_four):
-    return mock_concepts_twenty_four._even_odd._generate_main_hints()
+def main_hints_even_odd_twenty_four():
+    return render_hints(registry._even_odd._generate_main_hints(24))
 
 def test_generate_main_hints_even_odd_odd_in_list(main_hints_even_odd_five):
     assert "Nice try!  Hint: It is an odd number." in main_hints_even_odd_five
@@ -723,12 +738,12 @@ def test_generate_main_hints_even_odd_not_in_list_unformatted(main_hints_even_od
     assert "Nice try!  Hint: It is an {} number." not in main_hints_even_odd_twenty_four
 
 @pytest.fixture
-def main_hints_perfect_square_five(mock_concepts_five):
-    return mock_concepts_five._perfect_square._generate_main_hints()
+def main_hints_perfect_square_five():
+    return render_hints(registry._perfect_square._generate_main_hints(5))
 
 @pytest.fixture
-def main_hints_perfect_square_one(mock_concepts_one):
-    return mock_concepts_one._perfect_square._generate_main_hints()
+def main_hints_perfect_square_one():
+    return render_hints(registry._perfect_square._generate_main_hints(1))
 
 def test_generate_main_hints_perfect_square_in_list(main_hints_perfect_square_one):
     assert "Nice try!  Hint: It is a perfect square." in main_hints_perfect_square_one
@@ -740,12 +755,12 @@ def test_generate_main_hints_perfect_square_not_perfect_square_empty(main_hints_
     assert 0 == len(main_hints_perfect_square_five)
 
 @pytest.fixture
-def main_hints_perfect_cube_five(mock_concepts_five):
-    return mock_concepts_five._perfect_cube._generate_main_hints()
+def main_hints_perfect_cube_five():
+    return render_hints(registry._perfect_cube._generate_main_hints(5))
 
 @pytest.fixture
-def main_hints_perfect_cube_one(mock_concepts_one):
-    return mock_concepts_one._perfect_cube._generate_main_hints()
+def main_hints_perfect_cube_one():
+    return render_hints(registry._perfect_cube._generate_main_hints(1))
 
 def test_generate_main_hints_perfect_cube_in_list(main_hints_perfect_cube_one):
     assert "Nice try!  Hint: It is a perfect cube." in main_hints_perfect_cube_one
@@ -757,12 +772,12 @@ def test_generate_main_hints_perfect_cube_not_perfect_cube_empty(main_hints_perf
     assert 0 == len(main_hints_perfect_cube_five)
 
 @pytest.fixture
-def main_hints_digit_sum_three_fifty_seven(mock_concepts_three_fifty_seven):
-    return mock_concepts_three_fifty_seven._digit_sum._generate_main_hints()
+def main_hints_digit_sum_three_fifty_seven():
+    return render_hints(registry._digit_sum._generate_main_hints(357))
 
 @pytest.fixture
-def main_hints_digit_sum_negative_one_thousand(mock_concepts_negative_one_thousand):
-    return mock_concepts_negative_one_thousand._digit_sum._generate_main_hints()
+def main_hints_digit_sum_negative_one_thousand():
+    return render_hints(registry._digit_sum._generate_main_hints(-1000))
 
 def test_generate_main_hints_digit_sum_three_fifty_seven_in_list(main_hints_digit_sum_three_fifty_seven):
     assert "Nice try!  Hint: The sum of its digits is 15." in main_hints_digit_sum_three_fifty_seven
@@ -777,12 +792,12 @@ def test_generate_main_hints_digit_sum_negative_one_thousand_in_list(main_hints_
     assert "Nice try!  Hint: The sum of its digits is 1." in main_hints_digit_sum_negative_one_thousand
 
 @pytest.fixture
-def main_hints_digit_length_three_fifty_seven(mock_concepts_three_fifty_seven):
-    return mock_concepts_three_fifty_seven._digit_length._generate_main_hints()
+def main_hints_digit_length_three_fifty_seven():
+    return render_hints(registry._digit_length._generate_main_hints(357))
 
 @pytest.fixture
-def main_hints_digit_length_negative_one_thousand(mock_concepts_negative_one_thousand):
-    return mock_concepts_negative_one_thousand._digit_length._generate_main_hints()
+def main_hints_digit_length_negative_one_thousand():
+    return render_hints(registry._digit_length._generate_main_hints(-1000))
 
 def test_generate_main_hints_digit_length_three_fifty_seven_in_list(main_hints_digit_length_three_fifty_seven):
     assert "Nice try!  Hint: It is a 3-digit number." in main_hints_digit_length_three_fifty_seven
@@ -799,8 +814,8 @@ def test_generate_main_hints_digit_length_negative_one_thousand_in_list(main_hin
 
 # Test _generate_factor_hints method
 @pytest.fixture
-def factor_hints_factor_twenty_four(mock_concepts_twenty_four, factor_list_twenty_four):
-    return mock_concepts_twenty_four._factor._generate_factor_hints(factor_list_twenty_four)
+def factor_hints_factor_twenty_four(factor_list_twenty_four):
+    return render_hints(registry._factor._generate_factor_hints(factor_list_twenty_four))
 
 def test_generate_factor_hints_factor_in_list(factor_hints_factor_twenty_four):
     assert "Nice try!  Hint: It has 8 factor(s)." in factor_hints_factor_twenty_four
@@ -812,8 +827,8 @@ def test_generate_factor_hints_factor_not_in_list_unformatted(factor_hints_facto
     assert "Nice try!  Hint: It has {} factor(s)." not in factor_hints_factor_twenty_four
 
 @pytest.fixture
-def factor_hints_prime_twenty_four(mock_concepts_twenty_four, factor_list_twenty_four):
-    return mock_concepts_twenty_four._prime._generate_factor_hints(factor_list_twenty_four)
+def factor_hints_prime_twenty_four(factor_list_twenty_four):
+    return render_hints(registry._prime._generate_factor_hints(factor_list_twenty_four))
 
 def test_generate_factor_hints_prime_in_list(factor_hints_prime_twenty_four):
     assert "Nice try!  Hint: It has 2 prime factor(s)." in factor_hints_prime_twenty_four
@@ -824,13 +839,13 @@ def test_generate_factor_hints_prime_length_of_one(factor_hints_prime_twenty_fou
 def test_generate_factor_hints_prime_not_in_list_unformatted(factor_hints_prime_twenty_four):
     assert "Nice try!  Hint: It has {} factor(s)." not in factor_hints_prime_twenty_four
 
-def test_generate_factor_hints_factor_no_arguments_raises_error(mock_concepts_twenty_four):
+def test_generate_factor_hints_factor_no_arguments_raises_error():
     with pytest.raises(TypeError):
-        mock_concepts_twenty_four._prime._generate_factor_hints()
+        registry._prime._generate_factor_hints()
 
-def test_generate_factor_hints_factor_too_many_arguments_raises_error(mock_concepts_twenty_four):
+def test_generate_factor_hints_factor_too_many_arguments_raises_error():
     with pytest.raises(TypeError):
-        mock_concepts_twenty_four._prime._generate_factor_hints([1, 2, 4], "extra")
+        registry._prime._generate_factor_hints([1, 2, 4], "extra")
 
 
 # Test _generate_digit_hints method
@@ -839,8 +854,8 @@ def digit_list_twenty_four():
     return [2, 4]
 
 @pytest.fixture
-def digit_hints_factor_twenty_four(mock_concepts_twenty_four, factor_list_twenty_four, digit_list_twenty_four):
-    return mock_concepts_twenty_four._factor._generate_digit_hints(factor_list_twenty_four, digit_list_twenty_four)
+def digit_hints_factor_twenty_four():
+    return render_hints(registry._factor._generate_digit_hints(24))
 
 def test_generate_digit_hints_factor_in_list(digit_hints_factor_twenty_four):
     assert "Nice try!  Hint: All of its digits are factors." in digit_hints_factor_twenty_four
@@ -852,8 +867,8 @@ def test_generate_digit_hints_factor_not_in_list_unformatted(digit_hints_factor_
     assert "Nice try!  Hint: All of its digits are {}s." not in digit_hints_factor_twenty_four
 
 @pytest.fixture
-def digit_hints_prime_twenty_four(mock_concepts_twenty_four, digit_list_twenty_four):
-    return mock_concepts_twenty_four._prime._generate_digit_hints(digit_list_twenty_four)
+def digit_hints_prime_twenty_four(digit_list_twenty_four):
+    return render_hints(registry._prime._generate_digit_hints(digit_list_twenty_four))
 
 def test_generate_digit_hints_prime_in_list(digit_hints_prime_twenty_four):
     assert "Nice try!  Hint: 1 of its digits is a prime number." in digit_hints_prime_twenty_four
@@ -865,8 +880,8 @@ def test_generate_digit_hints_prime_not_in_list_unformatted(digit_hints_prime_tw
     assert "Nice try!  Hint: 1 of its digits is a {}." not in digit_hints_prime_twenty_four
 
 @pytest.fixture
-def digit_hints_even_odd_twenty_four(mock_concepts_twenty_four, digit_list_twenty_four):
-    return mock_concepts_twenty_four._even_odd._generate_digit_hints(digit_list_twenty_four)
+def digit_hints_even_odd_twenty_four(digit_list_twenty_four):
+    return render_hints(registry._even_odd._generate_digit_hints(digit_list_twenty_four))
 
 def test_generate_digit_hints_even_odd_in_list(digit_hints_even_odd_twenty_four):
     assert "Nice try!  Hint: All of its digits are even numbers." in digit_hints_even_odd_twenty_four
@@ -878,8 +893,8 @@ def test_generate_digit_hints_even_odd_not_in_list_unformatted(digit_hints_even_
     assert "Nice try!  Hint: All of its digits are {}s." not in digit_hints_even_odd_twenty_four
 
 @pytest.fixture
-def digit_hints_perfect_square_twenty_four(mock_concepts_twenty_four, digit_list_twenty_four):
-    return mock_concepts_twenty_four._perfect_square._generate_digit_hints(digit_list_twenty_four)
+def digit_hints_perfect_square_twenty_four(digit_list_twenty_four):
+    return render_hints(registry._perfect_square._generate_digit_hints(digit_list_twenty_four))
 
 def test_generate_digit_hints_perfect_square_in_list(digit_hints_perfect_square_twenty_four):
     assert "Nice try!  Hint: 1 of its digits is a perfect square." in digit_hints_perfect_square_twenty_four
@@ -891,8 +906,8 @@ def test_generate_digit_hints_perfect_square_not_in_list_unformatted(digit_hints
     assert "Nice try!  Hint: 1 of its digits is a {}." not in digit_hints_perfect_square_twenty_four
 
 @pytest.fixture
-def digit_hints_perfect_cube_twenty_four(mock_concepts_twenty_four, digit_list_twenty_four):
-    return mock_concepts_twenty_four._perfect_cube._generate_digit_hints(digit_list_twenty_four)
+def digit_hints_perfect_cube_twenty_four(digit_list_twenty_four):
+    return render_hints(registry._perfect_cube._generate_digit_hints(digit_list_twenty_four))
 
 def test_generate_digit_hints_perfect_cube_in_list(digit_hints_perfect_cube_twenty_four):
     assert "Nice try!  Hint: None of its digits are perfect cubes." in digit_hints_perfect_cube_twenty_four
@@ -903,19 +918,19 @@ def test_generate_digit_hints_perfect_cube_length_of_one(digit_hints_perfect_cub
 def test_generate_digit_hints_perfect_cube_not_in_list_unformatted(digit_hints_perfect_cube_twenty_four):
     assert "Nice try!  Hint: None of its digits are {}s." not in digit_hints_perfect_cube_twenty_four
 
-def test_generate_digit_hints_perfect_cube_no_arguments_raises_error(mock_concepts_twenty_four):
+def test_generate_digit_hints_perfect_cube_no_arguments_raises_error():
     with pytest.raises(TypeError):
-        mock_concepts_twenty_four._perfect_cube._generate_digit_hints()
+        registry._perfect_cube._generate_digit_hints()
 
-def test_generate_digit_hints_perfect_cube_too_many_arguments_raises_error(mock_concepts_twenty_four):
+def test_generate_digit_hints_perfect_cube_too_many_arguments_raises_error():
     with pytest.raises(TypeError):
-        mock_concepts_twenty_four._perfect_cube._generate_digit_hints([2, 4], "extra")
+        registry._perfect_cube._generate_digit_hints([2, 4], "extra")
 
 
 # Test generate_hints method
 @pytest.fixture
-def all_hints_factor_twenty_four(mock_concepts_twenty_four):
-    return mock_concepts_twenty_four._factor.generate_hints()
+def all_hints_factor_twenty_four():
+    return render_hints(registry._factor.generate_hints(24))
 
 def test_generate_hints_factor_main_hint_in_list(all_hints_factor_twenty_four):
     assert "Nice try!  Hint: It is divisible by 12." in all_hints_factor_twenty_four
@@ -929,9 +944,28 @@ def test_generate_hints_factor_digit_hint_in_list(all_hints_factor_twenty_four):
 def test_generate_hints_factor_correct_length(all_hints_factor_twenty_four):
     assert 8 == len(all_hints_factor_twenty_four)
 
+
+# Test iter_hints method
+def test_iter_hints_factor_matches_generate_hints():
+    for i in [1, 7, 24, 360, 997]:
+        assert registry._factor.generate_hints(i) == list(registry._factor.iter_hints(i))
+
+def test_iter_hints_factor_lazy():
+    # 963761198400 has 6720 factors, but only the hints requested are created.
+    hint_stream = registry._factor.iter_hints(963761198400)
+    assert ["Nice try!  Hint: It is divisible by 2.", "Nice try!  Hint: It is divisible by 3."] == render_hints(
+        [next(hint_stream), next(hint_stream)])
+
+def test_iter_hints_base_class_matches_generate_hints():
+    assert registry._prime.generate_hints(24) == list(registry._prime.iter_hints(24))
+
+def test_iter_hints_factor_no_arguments_raises_error():
+    with pytest.raises(TypeError):
+        next(registry._factor.iter_hints())
+
 @pytest.fixture
-def all_hints_multiple_five(mock_concepts_five):
-    return mock_concepts_five._multiple.generate_hints(filter_results=False)
+def all_hints_multiple_five():
+    return render_hints(registry._multiple.generate_hints(5, filter_results=False))
 
 def test_generate_hints_multiple_main_hint_in_list(all_hints_multiple_five):
     assert "Nice try!  Hint: 10 is a multiple." in all_hints_multiple_five
@@ -940,12 +974,12 @@ def test_generate_hints_multiple_correct_length(all_hints_multiple_five):
     assert 5 == len(all_hints_multiple_five)
 
 @pytest.fixture
-def all_hints_prime_five(mock_concepts_five):
-    return mock_concepts_five._prime.generate_hints()
+def all_hints_prime_five():
+    return render_hints(registry._prime.generate_hints(5))
 
 @pytest.fixture
-def all_hints_prime_twenty_four(mock_concepts_twenty_four):
-    return mock_concepts_twenty_four._prime.generate_hints()
+def all_hints_prime_twenty_four():
+    return render_hints(registry._prime.generate_hints(24))
 
 def test_generate_hints_prime_five_main_hint_in_list(all_hints_prime_five):
     assert "Nice try!  Hint: It is a prime number." in all_hints_prime_five
@@ -963,8 +997,8 @@ def test_generate_hints_prime_twenty_four_correct_length(all_hints_prime_twenty_
     assert 2 == len(all_hints_prime_twenty_four)
 
 @pytest.fixture
-def all_hints_even_odd_twenty_four(mock_concepts_twenty_four):
-    return mock_concepts_twenty_four._even_odd.generate_hints()
+def all_hints_even_odd_twenty_four():
+    return render_hints(registry._even_odd.generate_hints(24))
 
 def test_generate_hints_even_odd_main_hint_in_list(all_hints_even_odd_twenty_four):
     assert "Nice try!  Hint: It is an even number." in all_hints_even_odd_twenty_four
@@ -976,12 +1010,12 @@ def test_generate_hints_even_odd_correct_length(all_hints_even_odd_twenty_four):
     assert 2 == len(all_hints_even_odd_twenty_four)
 
 @pytest.fixture
-def all_hints_perfect_square_one(mock_concepts_one):
-    return mock_concepts_one._perfect_square.generate_hints()
+def all_hints_perfect_square_one():
+    return render_hints(registry._perfect_square.generate_hints(1))
 
 @pytest.fixture
-def all_hints_perfect_square_twenty_four(mock_concepts_twenty_four):
-    return mock_concepts_twenty_four._perfect_square.generate_hints()
+def all_hints_perfect_square_twenty_four():
+    return render_hints(registry._perfect_square.generate_hints(24))
 
 def test_generate_hints_perfect_square_one_main_hint_in_list(all_hints_perfect_square_one):
     assert "Nice try!  Hint: It is a perfect square." in all_hints_perfect_square_one
@@ -996,12 +1030,12 @@ def test_generate_hints_perfect_square_twenty_four_correct_length(all_hints_perf
     assert 1 == len(all_hints_perfect_square_twenty_four)
 
 @pytest.fixture
-def all_hints_perfect_cube_one(mock_concepts_one):
-    return mock_concepts_one._perfect_cube.generate_hints()
+def all_hints_perfect_cube_one():
+    return render_hints(registry._perfect_cube.generate_hints(1))
 
 @pytest.fixture
-def all_hints_perfect_cube_twenty_four(mock_concepts_twenty_four):
-    return mock_concepts_twenty_four._perfect_cube.generate_hints()
+def all_hints_perfect_cube_twenty_four():
+    return render_hints(registry._perfect_cube.generate_hints(24))
 
 def test_generate_hints_perfect_cube_one_main_hint_in_list(all_hints_perfect_cube_one):
     assert "Nice try!  Hint: It is a perfect cube." in all_hints_perfect_cube_one
@@ -1016,8 +1050,8 @@ def test_generate_hints_perfect_cube_twenty_four_correct_length(all_hints_perfec
     assert 1 == len(all_hints_perfect_cube_twenty_four)
 
 @pytest.fixture
-def all_hints_digit_sum_three_fifty_seven(mock_concepts_three_fifty_seven):
-    return mock_concepts_three_fifty_seven._digit_sum.generate_hints()
+def all_hints_digit_sum_three_fifty_seven():
+    return render_hints(registry._digit_sum.generate_hints(357))
 
 def test_generate_hints_digit_sum_main_hint_in_list(all_hints_digit_sum_three_fifty_seven):
     assert "Nice try!  Hint: The sum of its digits is 15." in all_hints_digit_sum_three_fifty_seven
@@ -1026,8 +1060,8 @@ def test_generate_hints_digit_sum_correct_length(all_hints_digit_sum_three_fifty
     assert 1 == len(all_hints_digit_sum_three_fifty_seven)
 
 @pytest.fixture
-def all_hints_digit_length_three_fifty_seven(mock_concepts_three_fifty_seven):
-    return mock_concepts_three_fifty_seven._digit_length.generate_hints()
+def all_hints_digit_length_three_fifty_seven():
+    return render_hints(registry._digit_length.generate_hints(357))
 
 def test_generate_hints_digit_length_main_hint_in_list(all_hints_digit_length_three_fifty_seven):
     assert "Nice try!  Hint: It is a 3-digit number." in all_hints_digit_length_three_fifty_seven
@@ -1035,9 +1069,9 @@ def test_generate_hints_digit_length_main_hint_in_list(all_hints_digit_length_th
 def test_generate_hints_digit_length_correct_length(all_hints_digit_length_three_fifty_seven):
     assert 1 == len(all_hints_digit_length_three_fifty_seven)
 
-def test_generate_hints_digit_length_too_many_arguments_raises_error(mock_concepts_three_fifty_seven):
+def test_generate_hints_digit_length_too_many_arguments_raises_error():
     with pytest.raises(TypeError):
-        mock_concepts_three_fifty_seven._digit_length.generate_hints("extra")
+        registry._digit_length.generate_hints(357, "extra")
 
 
 # Test evaluate_guess method
@@ -1045,159 +1079,355 @@ def test_generate_hints_digit_length_too_many_arguments_raises_error(mock_concep
 def factor_main_hint():
     return "Nice try!  Hint: It is divisible by 7."
 
-def test_evaluate_guess_factor_main_hint_good(mock_concepts_one, factor_main_hint):
-    assert "good" == mock_concepts_one._factor.evaluate_guess(21, factor_main_hint)
+def test_evaluate_guess_factor_main_hint_good(factor_main_hint):
+    assert "good" == registry._factor.evaluate_guess(21, factor_main_hint)
 
-def test_evaluate_guess_factor_main_hint_bad(mock_concepts_one, factor_main_hint):
-    assert "bad" == mock_concepts_one._factor.evaluate_guess(10, factor_main_hint)
+def test_evaluate_guess_factor_main_hint_bad(factor_main_hint):
+    assert "bad" == registry._factor.evaluate_guess(10, factor_main_hint)
 
 @pytest.fixture
 def factor_factor_hint():
     return "Nice try!  Hint: It has 4 factor(s)."
 
-def test_evaluate_guess_factor_factor_hint_good(mock_concepts_one, factor_factor_hint):
-    assert "good" == mock_concepts_one._factor.evaluate_guess(15, factor_factor_hint)
+def test_evaluate_guess_factor_factor_hint_good(factor_factor_hint):
+    assert "good" == registry._factor.evaluate_guess(15, factor_factor_hint)
 
-def test_evaluate_guess_factor_factor_hint_bad(mock_concepts_one, factor_factor_hint):
-    assert "bad" == mock_concepts_one._factor.evaluate_guess(9, factor_factor_hint)
+def test_evaluate_guess_factor_factor_hint_bad(factor_factor_hint):
+    assert "bad" == registry._factor.evaluate_guess(9, factor_factor_hint)
 
 @pytest.fixture
 def factor_digit_hint():
     return "Nice try!  Hint: 1 of its digits is a factor."
 
-def test_evaluate_guess_factor_digit_hint_good(mock_concepts_one, factor_digit_hint):
-    assert "good" == mock_concepts_one._factor.evaluate_guess(63, factor_digit_hint)
+def test_evaluate_guess_factor_digit_hint_good(factor_digit_hint):
+    assert "good" == registry._factor.evaluate_guess(63, factor_digit_hint)
 
-def test_evaluate_guess_factor_digit_hint_bad(mock_concepts_one, factor_digit_hint):
-    assert "bad" == mock_concepts_one._factor.evaluate_guess(36, factor_digit_hint)
+def test_evaluate_guess_factor_digit_hint_bad(factor_digit_hint):
+    assert "bad" == registry._factor.evaluate_guess(36, factor_digit_hint)
 
 @pytest.fixture
 def multiple_main_hint():
     return "Nice try!  Hint: 30 is a multiple."
 
-def test_evaluate_guess_multiple_main_hint_good(mock_concepts_one, multiple_main_hint):
-    assert "good" == mock_concepts_one._multiple.evaluate_guess(2, multiple_main_hint)
+def test_evaluate_guess_multiple_main_hint_good(multiple_main_hint):
+    assert "good" == registry._multiple.evaluate_guess(2, multiple_main_hint)
 
-def test_evaluate_guess_multiple_main_hint_bad(mock_concepts_one, multiple_main_hint):
-    assert "bad" == mock_concepts_one._multiple.evaluate_guess(4, multiple_main_hint)
+def test_evaluate_guess_multiple_main_hint_bad(multiple_main_hint):
+    assert "bad" == registry._multiple.evaluate_guess(4, multiple_main_hint)
 
 @pytest.fixture
 def prime_main_hint():
     return "Nice try!  Hint: It is a prime number."
 
-def test_evaluate_guess_prime_main_hint_good(mock_concepts_one, prime_main_hint):
-    assert "good" == mock_concepts_one._prime.evaluate_guess(5, prime_main_hint)
+def test_evaluate_guess_prime_main_hint_good(prime_main_hint):
+    assert "good" == registry._prime.evaluate_guess(5, prime_main_hint)
 
-def test_evaluate_guess_prime_main_hint_bad(mock_concepts_one, prime_main_hint):
-    assert "bad" == mock_concepts_one._prime.evaluate_guess(1, prime_main_hint)
+def test_evaluate_guess_prime_main_hint_bad(prime_main_hint):
+    assert "bad" == registry._prime.evaluate_guess(1, prime_main_hint)
 
 @pytest.fixture
 def prime_factor_hint():
     return "Nice try!  Hint: It has 1 prime factor(s)."
 
-def test_evaluate_guess_prime_factor_hint_good(mock_concepts_one, prime_factor_hint):
-    assert "good" == mock_concepts_one._prime.evaluate_guess(9, prime_factor_hint)
+def test_evaluate_guess_prime_factor_hint_good(prime_factor_hint):
+    assert "good" == registry._prime.evaluate_guess(9, prime_factor_hint)
 
-def test_evaluate_guess_prime_factor_hint_bad(mock_concepts_one, prime_factor_hint):
-    assert "bad" == mock_concepts_one._prime.evaluate_guess(18, prime_factor_hint)
+def test_evaluate_guess_prime_factor_hint_bad(prime_factor_hint):
+    assert "bad" == registry._prime.evaluate_guess(18, prime_factor_hint)
 
 @pytest.fixture
 def prime_digit_hint():
     return "Nice try!  Hint: None of its digits are prime numbers."
 
-def test_evaluate_guess_prime_digit_hint_good(mock_concepts_one, prime_digit_hint):
-    assert "good" == mock_concepts_one._prime.evaluate_guess(48, prime_digit_hint)
+def test_evaluate_guess_prime_digit_hint_good(prime_digit_hint):
+    assert "good" == registry._prime.evaluate_guess(48, prime_digit_hint)
 
-def test_evaluate_guess_prime_digit_hint_bad(mock_concepts_one, prime_digit_hint):
-    assert "bad" == mock_concepts_one._prime.evaluate_guess(25, prime_digit_hint)
+def test_evaluate_guess_prime_digit_hint_bad(prime_digit_hint):
+    assert "bad" == registry._prime.evaluate_guess(25, prime_digit_hint)
 
 @pytest.fixture
 def even_odd_main_hint():
     return "Nice try!  Hint: It is an odd number."
 
-def test_evaluate_guess_even_odd_main_hint_good(mock_concepts_one, even_odd_main_hint):
-    assert "good" == mock_concepts_one._even_odd.evaluate_guess(1, even_odd_main_hint)
+def test_evaluate_guess_even_odd_main_hint_good(even_odd_main_hint):
+    assert "good" == registry._even_odd.evaluate_guess(1, even_odd_main_hint)
 
-def test_evaluate_guess_even_odd_main_hint_bad(mock_concepts_one, even_odd_main_hint):
-    assert "bad" == mock_concepts_one._even_odd.evaluate_guess(24, even_odd_main_hint)
+def test_evaluate_guess_even_odd_main_hint_bad(even_odd_main_hint):
+    assert "bad" == registry._even_odd.evaluate_guess(24, even_odd_main_hint)
 
 @pytest.fixture
 def even_odd_digit_hint():
     return "Nice try!  Hint: All of its digits are even numbers."
 
-def test_evaluate_guess_even_odd_digit_hint_good(mock_concepts_one, even_odd_digit_hint):
-    assert "good" == mock_concepts_one._even_odd.evaluate_guess(48, even_odd_digit_hint)
+def test_evaluate_guess_even_odd_digit_hint_good(even_odd_digit_hint):
+    assert "good" == registry._even_odd.evaluate_guess(48, even_odd_digit_hint)
 
-def test_evaluate_guess_even_odd_digit_hint_bad(mock_concepts_one, even_odd_digit_hint):
-    assert "bad" == mock_concepts_one._even_odd.evaluate_guess(218, even_odd_digit_hint)
+def test_evaluate_guess_even_odd_digit_hint_bad(even_odd_digit_hint):
+    assert "bad" == registry._even_odd.evaluate_guess(218, even_odd_digit_hint)
 
 @pytest.fixture
 def perfect_square_main_hint():
     return "Nice try!  Hint: It is a perfect square."
 
-def test_evaluate_guess_perfect_square_main_hint_good(mock_concepts_one, perfect_square_main_hint):
-    assert "good" == mock_concepts_one._perfect_square.evaluate_guess(49, perfect_square_main_hint)
+def test_evaluate_guess_perfect_square_main_hint_good(perfect_square_main_hint):
+    assert "good" == registry._perfect_square.evaluate_guess(49, perfect_square_main_hint)
 
-def test_evaluate_guess_perfect_square_main_hint_bad(mock_concepts_one, perfect_square_main_hint):
-    assert "bad" == mock_concepts_one._perfect_square.evaluate_guess(27, perfect_square_main_hint)
+def test_evaluate_guess_perfect_square_main_hint_bad(perfect_square_main_hint):
+    assert "bad" == registry._perfect_square.evaluate_guess(27, perfect_square_main_hint)
 
 @pytest.fixture
 def perfect_square_digit_hint():
     return "Nice try!  Hint: 2 of its digits are perfect squares."
 
-def test_evaluate_guess_perfect_square_digit_hint_good(mock_concepts_one, perfect_square_digit_hint):
-    assert "good" == mock_concepts_one._perfect_square.evaluate_guess(493, perfect_square_digit_hint)
+def test_evaluate_guess_perfect_square_digit_hint_good(perfect_square_digit_hint):
+    assert "good" == registry._perfect_square.evaluate_guess(493, perfect_square_digit_hint)
 
-def test_evaluate_guess_perfect_square_digit_hint_bad(mock_concepts_one, perfect_square_digit_hint):
-    assert "bad" == mock_concepts_one._perfect_square.evaluate_guess(114, perfect_square_digit_hint)
+def test_evaluate_guess_perfect_square_digit_hint_bad(perfect_square_digit_hint):
+    assert "bad" == registry._perfect_square.evaluate_guess(114, perfect_square_digit_hint)
 
 @pytest.fixture
 def perfect_cube_main_hint():
     return "Nice try!  Hint: It is a perfect cube."
 
-def test_evaluate_guess_perfect_cube_main_hint_good(mock_concepts_one, perfect_cube_main_hint):
-    assert "good" == mock_concepts_one._perfect_cube.evaluate_guess(8, perfect_cube_main_hint)
+def test_evaluate_guess_perfect_cube_main_hint_good(perfect_cube_main_hint):
+    assert "good" == registry._perfect_cube.evaluate_guess(8, perfect_cube_main_hint)
 
-def test_evaluate_guess_perfect_cube_main_hint_bad(mock_concepts_one, perfect_cube_main_hint):
-    assert "bad" == mock_concepts_one._perfect_cube.evaluate_guess(4, perfect_cube_main_hint)
+def test_evaluate_guess_perfect_cube_main_hint_bad(perfect_cube_main_hint):
+    assert "bad" == registry._perfect_cube.evaluate_guess(4, perfect_cube_main_hint)
 
 @pytest.fixture
 def perfect_cube_digit_hint():
     return "Nice try!  Hint: All of its digits are perfect cubes."
 
-def test_evaluate_guess_perfect_cube_digit_hint_good(mock_concepts_one, perfect_cube_digit_hint):
-    assert "good" == mock_concepts_one._perfect_cube.evaluate_guess(80, perfect_cube_digit_hint)
+def test_evaluate_guess_perfect_cube_digit_hint_good(perfect_cube_digit_hint):
+    assert "good" == registry._perfect_cube.evaluate_guess(80, perfect_cube_digit_hint)
 
-def test_evaluate_guess_perfect_cube_digit_hint_bad(mock_concepts_one, perfect_cube_digit_hint):
-    assert "bad" == mock_concepts_one._perfect_cube.evaluate_guess(41, perfect_cube_digit_hint)
+def test_evaluate_guess_perfect_cube_digit_hint_bad(perfect_cube_digit_hint):
+    assert "bad" == registry._perfect_cube.evaluate_guess(41, perfect_cube_digit_hint)
 
 @pytest.fixture
 def digit_sum_main_hint():
     return "Nice try!  Hint: The sum of the digits is 8."
 
-def test_evaluate_guess_digit_sum_main_hint_good(mock_concepts_one, digit_sum_main_hint):
-    assert "good" == mock_concepts_one._digit_sum.evaluate_guess(26, digit_sum_main_hint)
+def test_evaluate_guess_digit_sum_main_hint_good(digit_sum_main_hint):
+    assert "good" == registry._digit_sum.evaluate_guess(26, digit_sum_main_hint)
 
-def test_evaluate_guess_digit_sum_main_hint_bad(mock_concepts_one, digit_sum_main_hint):
-    assert "bad" == mock_concepts_one._digit_sum.evaluate_guess(45, digit_sum_main_hint)
+def test_evaluate_guess_digit_sum_main_hint_bad(digit_sum_main_hint):
+    assert "bad" == registry._digit_sum.evaluate_guess(45, digit_sum_main_hint)
 
 @pytest.fixture
 def digit_length_main_hint():
     return "Nice try!  Hint: It is a 3-digit number."
 
-def test_evaluate_guess_digit_length_main_hint_good(mock_concepts_one, digit_length_main_hint):
-    assert "good" == mock_concepts_one._digit_length.evaluate_guess(108, digit_length_main_hint)
+def test_evaluate_guess_digit_length_main_hint_good(digit_length_main_hint):
+    assert "good" == registry._digit_length.evaluate_guess(108, digit_length_main_hint)
+
+def test_evaluate_guess_digit_length_main_hint_bad(digit_length_main_hint):
+    assert "bad" == registry._digit_length.evaluate_guess(2455, digit_length_main_hint)
+
+def test_evaluate_guess_digit_length_no_arguments_raises_error():
+    with pytest.raises(TypeError):
+        registry._digit_length.evaluate_guess()
+
+def test_evaluate_guess_digit_length_too_many_arguments_raises_error():
+    with pytest.raises(TypeError):
+        registry._digit_length.evaluate_guess(108, digit_length_main_hint, "extra")
+
+def test_evaluate_guess_factor_main_hint_record_good():
+    assert "good" == registry._factor.evaluate_guess(21, registry._factor._create_hint(HintRecord.MAIN, 7))
+
+def test_evaluate_guess_prime_factor_hint_record_bad():
+    assert "bad" == registry._prime.evaluate_guess(30, registry._prime._create_hint(HintRecord.FACTOR, 2))
+
+def test_evaluate_guess_even_odd_digit_hint_record_good():
+    assert "good" == registry._even_odd.evaluate_guess(24, registry._even_odd._create_hint(HintRecord.DIGITS_ALL))
+
+def test_evaluate_guess_digit_sum_main_hint_record_good():
+    assert "good" == registry._digit_sum.evaluate_guess(125, registry._digit_sum._create_hint(HintRecord.MAIN, 8))
+
+
+# Test render_hint method
+def test_render_hint_factor_main_hint():
+    hint = registry._factor._create_hint(HintRecord.MAIN, 7)
+    assert "Nice try!  Hint: It is divisible by 7." == registry._factor.render_hint(hint)
+
+def test_render_hint_factor_factor_hint():
+    hint = registry._factor._create_hint(HintRecord.FACTOR, 4)
+    assert "Nice try!  Hint: It has 4 factor(s)." == registry._factor.render_hint(hint)
+
+def test_render_hint_factor_digit_hint():
+    hint = registry._factor._create_hint(HintRecord.DIGITS_SOME, 2)
+    assert "Nice try!  Hint: 2 of its digits are factors." == registry._factor.render_hint(hint)
+
+def test_render_hint_prime_factor_hint():
+    hint = registry._prime._create_hint(HintRecord.FACTOR, 2)
+    assert "Nice try!  Hint: It has 2 prime factor(s)." == registry._prime.render_hint(hint)
+
+def test_render_hint_even_odd_main_hint():
+    hint = registry._even_odd._create_hint(HintRecord.MAIN, "odd")
+    assert "Nice try!  Hint: It is an odd number." == registry._even_odd.render_hint(hint)
+
+def test_render_hint_even_odd_digit_hint_one():
+    hint = registry._even_odd._create_hint(HintRecord.DIGITS_ONE)
+    assert "Nice try!  Hint: 1 of its digits is an even number." == registry._even_odd.render_hint(hint)
 
-def test_evaluate_guess_digit_length_main_hint_bad(mock_concepts_one, digit_length_main_hint):
-    assert "bad" == mock_concepts_one._digit_length.evaluate_guess(2455, digit_length_main_hint)
+def test_render_hint_perfect_cube_digit_hint_none():
+    hint = registry._perfect_cube._create_hint(HintRecord.DIGITS_NONE)
+    assert "Nice try!  Hint: None of its digits are perfect cubes." == registry._perfect_cube.render_hint(hint)
 
-def test_evaluate_guess_digit_length_no_arguments_raises_error(mock_concepts_one):
+def test_render_hint_no_arguments_raises_error():
     with pytest.raises(TypeError):
-        mock_concepts_one._digit_length.evaluate_guess()
+        registry._factor.render_hint()
+
+
+# Test parse_hint method
+def test_parse_hint_factor_main_hint(factor_main_hint):
+    assert registry._factor._create_hint(HintRecord.MAIN, 7) == registry._factor.parse_hint(factor_main_hint)
+
+def test_parse_hint_factor_factor_hint(factor_factor_hint):
+    assert registry._factor._create_hint(HintRecord.FACTOR, 4) == registry._factor.parse_hint(factor_factor_hint)
+
+def test_parse_hint_prime_main_hint(prime_main_hint):
+    assert registry._prime._create_hint(HintRecord.MAIN) == registry._prime.parse_hint(prime_main_hint)
+
+def test_parse_hint_prime_digit_hint(prime_digit_hint):
+    assert registry._prime._create_hint(HintRecord.DIGITS_NONE) == registry._prime.parse_hint(prime_digit_hint)
+
+def test_parse_hint_even_odd_main_hint(even_odd_main_hint):
+    assert registry._even_odd._create_hint(HintRecord.MAIN, "odd") == registry._even_odd.parse_hint(even_odd_main_hint)
+
+def test_parse_hint_perfect_square_digit_hint(perfect_square_digit_hint):
+    expected_hint = registry._perfect_square._create_hint(HintRecord.DIGITS_SOME, 2)
+    assert expected_hint == registry._perfect_square.parse_hint(perfect_square_digit_hint)
+
+def test_parse_hint_matches_generated_hints():
+    for number in range(1, 101):
+        for hint in registry.generate_hints(number, filter_results=False):
+            assert hint == registry.get_concept(hint.get_type()).parse_hint(hint.render())
+
+def test_parse_hint_no_arguments_raises_error():
+    with pytest.raises(TypeError):
+        registry._factor.parse_hint()
+
 
-def test_evaluate_guess_digit_length_too_many_arguments_raises_error(mock_concepts_one):
+# Test get_hint_mask method
+@pytest.fixture
+def mask_numbers():
+    return np.arange(1, 31)
+
+@pytest.fixture
+def mask_number_info(mask_numbers):
+    return numbers.get_batch_number_info(mask_numbers)
+
+def get_masked_numbers(concept, hint, mask_numbers, mask_number_info):
+    return mask_numbers[concept.get_hint_mask(hint, mask_numbers, mask_number_info)].tolist()
+
+def test_get_hint_mask_factor_main_hint(mask_numbers, mask_number_info):
+    hint = registry._factor._create_hint(HintRecord.MAIN, 7)
+    assert [7, 14, 21, 28] == get_masked_numbers(registry._factor, hint, mask_numbers, mask_number_info)
+
+def test_get_hint_mask_factor_factor_hint(mask_numbers, mask_number_info):
+    hint = registry._factor._create_hint(HintRecord.FACTOR, 3)
+    assert [4, 9, 25] == get_masked_numbers(registry._factor, hint, mask_numbers, mask_number_info)
+
+def test_get_hint_mask_multiple(mask_numbers, mask_number_info):
+    hint = registry._multiple._create_hint(HintRecord.MAIN, 12)
+    assert [1, 2, 3, 4, 6, 12] == get_masked_numbers(registry._multiple, hint, mask_numbers, mask_number_info)
+
+def test_get_hint_mask_prime_factor_hint(mask_numbers, mask_number_info):
+    hint = registry._prime._create_hint(HintRecord.FACTOR, 3)
+    assert [30] == get_masked_numbers(registry._prime, hint, mask_numbers, mask_number_info)
+
+def test_get_hint_mask_even_odd_main_hint(mask_numbers, mask_number_info):
+    hint = registry._even_odd._create_hint(HintRecord.MAIN, "odd")
+    assert list(range(1, 31, 2)) == get_masked_numbers(registry._even_odd, hint, mask_numbers, mask_number_info)
+
+def test_get_hint_mask_perfect_square_main_hint(mask_numbers, mask_number_info):
+    hint = registry._perfect_square._create_hint(HintRecord.MAIN)
+    assert [1, 4, 9, 16, 25] == get_masked_numbers(registry._perfect_square, hint, mask_numbers, mask_number_info)
+
+def test_get_hint_mask_perfect_cube_digit_hint_all(mask_numbers, mask_number_info):
+    hint = registry._perfect_cube._create_hint(HintRecord.DIGITS_ALL)
+    assert [1, 8, 10, 11, 18] == get_masked_numbers(registry._perfect_cube, hint, mask_numbers, mask_number_info)
+
+def test_get_hint_mask_digit_sum(mask_numbers, mask_number_info):
+    hint = registry._digit_sum._create_hint(HintRecord.MAIN, 3)
+    assert [3, 12, 21, 30] == get_masked_numbers(registry._digit_sum, hint, mask_numbers, mask_number_info)
+
+def test_get_hint_mask_text_hint(mask_numbers, mask_number_info, factor_main_hint):
+    assert [7, 14, 21, 28] == get_masked_numbers(registry._factor, factor_main_hint, mask_numbers, mask_number_info)
+
+def test_get_hint_mask_scalar_fallback_matches(mask_numbers, mask_number_info):
+    hint = registry._prime._create_hint(HintRecord.DIGITS_ONE)
+    expected_mask = MathConcept.get_hint_mask(registry._prime, hint, mask_numbers, mask_number_info)
+    assert expected_mask.tolist() == registry._prime.get_hint_mask(hint, mask_numbers, mask_number_info).tolist()
+
+def test_get_hint_mask_matches_evaluate_guess():
+    mask_numbers = np.arange(-20, 301)
+    mask_number_info = numbers.get_batch_number_info(mask_numbers)
+    hints = {hint for number in range(1, 301) for hint in registry.generate_hints(number, filter_results=False)}
+    for hint in hints:
+        concept = registry.get_concept(hint.get_type())
+        expected_mask = [concept.evaluate_guess(int(x), hint) == "good" for x in mask_numbers]
+        assert expected_mask == concept.get_hint_mask(hint, mask_numbers, mask_number_info).tolist()
+
+def test_get_hint_mask_no_arguments_raises_error():
     with pytest.raises(TypeError):
-        mock_concepts_one._digit_length.evaluate_guess(108, digit_length_main_hint, "extra")
+        registry._factor.get_hint_mask()
+
+
+
+### Hint Record Tests
+
+@pytest.fixture
+def factor_hint_record():
+    return registry._factor._create_hint(HintRecord.MAIN, 7)
+
+# Test get_key method
+def test_get_key(factor_hint_record):
+    assert (1, HintRecord.MAIN, (7,)) == factor_hint_record.get_key()
+
+
+# Test get_type method
+def test_get_type(factor_hint_record):
+    assert "factor" == factor_hint_record.get_type()
+
+
+# Test is_digit_hint method
+def test_is_digit_hint_yes():
+    assert True == registry._prime._create_hint(HintRecord.DIGITS_ALL).is_digit_hint()
+
+def test_is_digit_hint_no(factor_hint_record):
+    assert False == factor_hint_record.is_digit_hint()
+
+
+# Test render method
+def test_render(factor_hint_record):
+    assert "Nice try!  Hint: It is divisible by 7." == factor_hint_record.render()
+
+def test_render_str(factor_hint_record):
+    assert "Nice try!  Hint: It is divisible by 7." == str(factor_hint_record)
+
+
+# Test __eq__ and __hash__ methods
+def test_eq_same_key(factor_hint_record):
+    assert factor_hint_record == registry._factor._create_hint(HintRecord.MAIN, 7)
+
+def test_eq_different_params(factor_hint_record):
+    assert factor_hint_record != registry._factor._create_hint(HintRecord.MAIN, 3)
+
+def test_eq_different_template(factor_hint_record):
+    assert factor_hint_record != registry._factor._create_hint(HintRecord.FACTOR, 7)
+
+def test_eq_text(factor_hint_record):
+    assert factor_hint_record != "Nice try!  Hint: It is divisible by 7."
+
+def test_hash_same_key(factor_hint_record):
+    assert hash(factor_hint_record) == hash(registry._factor._create_hint(HintRecord.MAIN, 7))
+
+def test_set_intersection(factor_hint_record):
+    hints = {factor_hint_record, registry._factor._create_hint(HintRecord.FACTOR, 4)}
+    assert {factor_hint_record} == hints.intersection({registry._factor._create_hint(HintRecord.MAIN, 7)})
 
 
 
@@ -1206,106 +1436,106 @@ def test_evaluate_guess_digit_length_too_many_arguments_raises_error(mock_concep
 # Test _create_hint_concept_list method
 def test_create_hint_concept_list_concepts_one_no_arg(mock_concepts_one):
     concept_list = [
-        mock_concepts_one._factor,
-        mock_concepts_one._prime,
-        mock_concepts_one._even_odd,
-        mock_concepts_one._perfect_square,
-        mock_concepts_one._perfect_cube
+        registry._factor,
+        registry._prime,
+        registry._even_odd,
+        registry._perfect_square,
+        registry._perfect_cube
     ]
     assert concept_list == mock_concepts_one._create_hint_concept_list()
 
 def test_create_hint_concept_list_concepts_zero_no_arg(mock_concepts_zero):
     concept_list = [
-        mock_concepts_zero._prime,
-        mock_concepts_zero._even_odd,
-        mock_concepts_zero._perfect_square,
-        mock_concepts_zero._perfect_cube
+        registry._prime,
+        registry._even_odd,
+        registry._perfect_square,
+        registry._perfect_cube
     ]
     assert concept_list == mock_concepts_zero._create_hint_concept_list()
 
 def test_create_hint_concept_list_concepts_five_no_arg(mock_concepts_five):
     concept_list = [
-        mock_concepts_five._factor,
-        mock_concepts_five._multiple,
-        mock_concepts_five._prime,
-        mock_concepts_five._even_odd,
-        mock_concepts_five._perfect_square,
-        mock_concepts_five._perfect_cube
+        registry._factor,
+        registry._multiple,
+        registry._prime,
+        registry._even_odd,
+        registry._perfect_square,
+        registry._perfect_cube
     ]
     assert concept_list == mock_concepts_five._create_hint_concept_list()
 
 def test_create_hint_concept_list_concepts_twenty_four_no_arg(mock_concepts_twenty_four):
     concept_list = [
-        mock_concepts_twenty_four._factor,
-        mock_concepts_twenty_four._multiple,
-        mock_concepts_twenty_four._prime,
-        mock_concepts_twenty_four._even_odd,
-        mock_concepts_twenty_four._perfect_square,
-        mock_concepts_twenty_four._perfect_cube,
-        mock_concepts_twenty_four._digit_sum
+        registry._factor,
+        registry._multiple,
+        registry._prime,
+        registry._even_odd,
+        registry._perfect_square,
+        registry._perfect_cube,
+        registry._digit_sum
     ]
     assert concept_list == mock_concepts_twenty_four._create_hint_concept_list()
 
 def test_create_hint_concept_list_concepts_three_fifty_seven_no_arg(mock_concepts_three_fifty_seven):
     concept_list = [
-        mock_concepts_three_fifty_seven._factor,
-        mock_concepts_three_fifty_seven._multiple,
-        mock_concepts_three_fifty_seven._prime,
-        mock_concepts_three_fifty_seven._perfect_square,
-        mock_concepts_three_fifty_seven._perfect_cube,
-        mock_concepts_three_fifty_seven._digit_sum,
-        mock_concepts_three_fifty_seven._digit_length
+        registry._factor,
+        registry._multiple,
+        registry._prime,
+        registry._perfect_square,
+        registry._perfect_cube,
+        registry._digit_sum,
+        registry._digit_length
     ]
     assert concept_list == mock_concepts_three_fifty_seven._create_hint_concept_list()
 
 def test_create_hint_concept_list_concepts_three_fifty_seven_arg_main_concepts(mock_concepts_three_fifty_seven):
     concept_list = [
-        mock_concepts_three_fifty_seven._factor,
-        mock_concepts_three_fifty_seven._multiple,
-        mock_concepts_three_fifty_seven._prime,
-        mock_concepts_three_fifty_seven._perfect_square,
-        mock_concepts_three_fifty_seven._perfect_cube,
-        mock_concepts_three_fifty_seven._digit_sum,
-        mock_concepts_three_fifty_seven._digit_length
+        registry._factor,
+        registry._multiple,
+        registry._prime,
+        registry._perfect_square,
+        registry._perfect_cube,
+        registry._digit_sum,
+        registry._digit_length
     ]
-    main_concepts = mock_concepts_three_fifty_seven._main_concepts
+    main_concepts = registry._main_concepts
     assert concept_list == mock_concepts_three_fifty_seven._create_hint_concept_list(concepts=main_concepts)
 
 def test_create_hint_concept_list_concepts_three_fifty_seven_arg_factor_concepts(mock_concepts_three_fifty_seven):
     concept_list = [
-        mock_concepts_three_fifty_seven._factor,
-        mock_concepts_three_fifty_seven._prime
+        registry._factor,
+        registry._prime
     ]
-    factor_concepts = mock_concepts_three_fifty_seven._factor_concepts
+    factor_concepts = registry._factor_concepts
     assert concept_list == mock_concepts_three_fifty_seven._create_hint_concept_list(concepts=factor_concepts)
 
 def test_create_hint_concept_list_concepts_three_fifty_seven_arg_digit_concepts(mock_concepts_three_fifty_seven):
     concept_list = [
-        mock_concepts_three_fifty_seven._factor,
-        mock_concepts_three_fifty_seven._prime,
-        mock_concepts_three_fifty_seven._perfect_square,
-        mock_concepts_three_fifty_seven._perfect_cube
+        registry._factor,
+        registry._prime,
+        registry._perfect_square,
+        registry._perfect_cube
     ]
-    digit_concepts = mock_concepts_three_fifty_seven._digit_concepts
+    digit_concepts = registry._digit_concepts
     assert concept_list == mock_concepts_three_fifty_seven._create_hint_concept_list(concepts=digit_concepts)
 
 def test_create_hint_concept_list_concepts_negative_sixteen_no_arg(mock_concepts_negative_sixteen):
     concept_list = [
-        mock_concepts_negative_sixteen._factor,
-        mock_concepts_negative_sixteen._multiple,
-        mock_concepts_negative_sixteen._even_odd,
-        mock_concepts_negative_sixteen._perfect_cube,
-        mock_concepts_negative_sixteen._digit_sum
+        registry._factor,
+        registry._multiple,
+        registry._even_odd,
+        registry._perfect_cube,
+        registry._digit_sum
     ]
     assert concept_list == mock_concepts_negative_sixteen._create_hint_concept_list()
 
 def test_create_hint_concept_list_concepts_negative_one_thousand_no_arg(mock_concepts_negative_one_thousand):
     concept_list = [
-        mock_concepts_negative_one_thousand._factor,
-        mock_concepts_negative_one_thousand._multiple,
-        mock_concepts_negative_one_thousand._perfect_cube,
-        mock_concepts_negative_one_thousand._digit_sum,
-        mock_concepts_negative_one_thousand._digit_length
+        registry._factor,
+        registry._multiple,
+        registry._perfect_cube,
+        registry._digit_sum,
+        registry._digit_length
     ]
     assert concept_list == mock_concepts_negative_one_thousand._create_hint_concept_list()
 
@@ -1314,6 +1544,35 @@ def test_create_hint_concept_list_concepts_too_many_arguments_raises_error(mock_
         mock_concepts_one._create_hint_concept_list(concepts=mock_concepts_zero, extra="no")
 
 
+# Test get_hint_mask method
+def test_get_hint_mask_concepts(mock_concepts_one):
+    mask_numbers = np.arange(1, 11)
+    hint = registry._even_odd._create_hint(HintRecord.MAIN, "even")
+    mask = mock_concepts_one.get_hint_mask(hint, mask_numbers, numbers.get_batch_number_info(mask_numbers))
+    assert [2, 4, 6, 8, 10] == mask_numbers[mask].tolist()
+
+def test_get_hint_mask_concepts_too_many_arguments_raises_error(mock_concepts_one):
+    with pytest.raises(TypeError):
+        mock_concepts_one.get_hint_mask(None, None, None, "extra")
+
+
+# Test evaluate_guesses method
+def test_evaluate_guesses_concepts_hint_record(mock_concepts_one):
+    hint = registry._even_odd._create_hint(HintRecord.MAIN, "odd")
+    assert [True, False, True, False] == mock_concepts_one.evaluate_guesses(hint, np.array([1, 2, 3, 4])).tolist()
+
+def test_evaluate_guesses_concepts_text_hint(mock_concepts_one, factor_main_hint):
+    assert [False, True, True, False] == mock_concepts_one.evaluate_guesses(factor_main_hint, np.array([1, 7, 21, 22])).tolist()
+
+def test_evaluate_guesses_concepts_no_arguments_raises_error(mock_concepts_one):
+    with pytest.raises(TypeError):
+        mock_concepts_one.evaluate_guesses()
+
+def test_evaluate_guesses_concepts_too_many_arguments_raises_error(mock_concepts_one, factor_main_hint):
+    with pytest.raises(TypeError):
+        mock_concepts_one.evaluate_guesses(factor_main_hint, np.array([21]), None, "extra")
+
+
 # Test check_greater_or_less method
 @pytest.fixture
 def higher_text():
@@ -1324,16 +1583,16 @@ def lower_text():
     return "Nice try!  Lower."
 
 def test_check_greater_or_less_concepts_positive_higher(mock_concepts_one, higher_text):
-    assert higher_text == mock_concepts_one.check_greater_or_less(2, 5)
+    assert higher_text == mock_concepts_one.check_greater_or_less(2, 5).render()
 
 def test_check_greater_or_less_concepts_positive_lower(mock_concepts_one, lower_text):
-    assert lower_text == mock_concepts_one.check_greater_or_less(8, 5)
+    assert lower_text == mock_concepts_one.check_greater_or_less(8, 5).render()
 
 def test_check_greater_or_less_concepts_negative_higher(mock_concepts_one, higher_text):
-    assert higher_text == mock_concepts_one.check_greater_or_less(-17, -16)
+    assert higher_text == mock_concepts_one.check_greater_or_less(-17, -16).render()
 
 def test_check_greater_or_less_concepts_negative_lower(mock_concepts_one, lower_text):
-    assert lower_text == mock_concepts_one.check_greater_or_less(0, -16)
+    assert lower_text == mock_concepts_one.check_greater_or_less(0, -16).render()
 
 def test_check_greater_or_less_concepts_no_arguments_raises_error(mock_concepts_one):
     with pytest.raises(TypeError):
@@ -1347,7 +1606,7 @@ def test_check_greater_or_less_concepts_too_many_arguments_raises_error(mock_con
 # Test generate_hints method
 @pytest.fixture
 def all_hints_three_fifty_seven(mock_concepts_three_fifty_seven):
-    return mock_concepts_three_fifty_seven.generate_hints(check_db=False, filter_results=False)
+    return render_hints(mock_concepts_three_fifty_seven.generate_hints(check_db=False, filter_results=False))
 
 def test_generate_hints_concepts_factor_in_list(all_hints_three_fifty_seven):
     assert "Nice try!  Hint: 2 of its digits are factors." in all_hints_three_fifty_seven
@@ -1384,6 +1643,41 @@ def test_generate_hints_concepts_too_many_arguments_raises_error(mock_concepts_t
     with pytest.raises(TypeError):
         mock_concepts_three_fifty_seven.generate_hints(check_db=False, filter_results=False, extra="no")
 
+def test_generate_hints_concepts_share_registry(mock_concepts_three_fifty_seven, mock_concepts_five):
+    assert mock_concepts_three_fifty_seven._registry is mock_concepts_five._registry
+
+@pytest.fixture
+def all_hints_expert_prime():
+    return render_hints(ConceptManager(999999999989, numbers, None, data).generate_hints(check_db=False, filter_results=False))
+
+def test_generate_hints_concepts_expert_prime_in_list(all_hints_expert_prime):
+    assert "Nice try!  Hint: It is a prime number." in all_hints_expert_prime
+
+def test_generate_hints_concepts_expert_digit_length_in_list(all_hints_expert_prime):
+    assert "Nice try!  Hint: It is a 12-digit number." in all_hints_expert_prime
+
+def test_generate_hints_concepts_64_bit_prime_in_list():
+    hint_list = render_hints(ConceptManager(2**61 - 1, numbers, None, data).generate_hints(check_db=False, filter_results=False))
+    assert "Nice try!  Hint: It is a prime number." in hint_list
+
+def test_generate_hints_concepts_expert_perfect_square_in_list():
+    hint_list = render_hints(ConceptManager(10**12, numbers, None, data).generate_hints(check_db=False, filter_results=False))
+    assert "Nice try!  Hint: It is a perfect square." in hint_list
+
+
+# Test iter_hints method
+def test_iter_hints_concepts_same_hints_as_generate_hints(mock_concepts_three_fifty_seven):
+    hint_list = mock_concepts_three_fifty_seven.generate_hints(check_db=False, filter_results=False)
+    hint_stream = mock_concepts_three_fifty_seven.iter_hints(check_db=False, filter_results=False)
+    assert set(hint_list) == set(hint_stream)
+
+def test_iter_hints_concepts_filter_results_correct_length(mock_concepts_three_fifty_seven):
+    assert 16 == len(list(mock_concepts_three_fifty_seven.iter_hints(check_db=False)))
+
+def test_iter_hints_concepts_too_many_arguments_raises_error(mock_concepts_three_fifty_seven):
+    with pytest.raises(TypeError):
+        next(mock_concepts_three_fifty_seven.iter_hints(check_db=False, filter_results=False, extra="no"))
+
 
 # Test evaluate_guess method
 def test_evaluate_guess_concepts_factor_good(mock_concepts_one, factor_main_hint):
@@ -1444,6 +1738,215 @@ def test_evaluate_guess_concepts_too_many_arguments_raises_error(mock_concepts_o
 
 
 
+### Concept Registry Tests
+
+# Test get_registry method
+def test_get_registry_same_objects_same_registry():
+    assert registry is ConceptRegistry.get_registry(numbers, data)
+
+def test_get_registry_other_numbers_other_registry():
+    other_numbers = Number()
+    assert registry is not ConceptRegistry.get_registry(other_numbers, data)
+
+def test_get_registry_no_arguments_raises_error():
+    with pytest.raises(TypeError):
+        ConceptRegistry.get_registry()
+
+
+# Test generate_hints method
+def test_generate_hints_registry_matches_concept_manager():
+    expected_hints = ConceptManager(357, numbers, None, data).generate_hints(check_db=False, filter_results=False)
+    assert expected_hints == registry.generate_hints(357, filter_results=False)
+
+def test_generate_hints_registry_filter_results_correct_length():
+    assert 16 == len(registry.generate_hints(357))
+
+def test_generate_hints_registry_no_arguments_raises_error():
+    with pytest.raises(TypeError):
+        registry.generate_hints()
+
+
+# Test iter_hints method
+def test_iter_hints_registry_same_hints_as_generate_hints():
+    for i in [1, 24, 357, 997]:
+        hint_list = registry.generate_hints(i, filter_results=False)
+        hint_stream = list(registry.iter_hints(i, filter_results=False))
+        assert (len(hint_list), set(hint_list)) == (len(hint_stream), set(hint_stream))
+
+def test_iter_hints_registry_one_hint_per_concept_first():
+    concept_count = len(registry.get_concepts(numbers.get_number_profile(360)))
+    hint_stream = registry.iter_hints(360, filter_results=False)
+    first_hints = [next(hint_stream) for i in range(concept_count)]
+    assert concept_count == len({hint.get_type() for hint in first_hints})
+
+def test_iter_hints_registry_highly_composite_number():
+    hint_stream = registry.iter_hints(963761198400)
+    assert 8 == len([next(hint_stream) for i in range(8)])
+
+def test_iter_hints_registry_no_arguments_raises_error():
+    with pytest.raises(TypeError):
+        next(registry.iter_hints())
+
+
+# Test interleave_hints method
+def test_interleave_hints():
+    hint_streams = [iter(["a1", "a2", "a3"]), iter(["b1"]), iter(["c1", "c2"])]
+    assert ["a1", "b1", "c1", "a2", "c2", "a3"] == list(ConceptRegistry.interleave_hints(hint_streams))
+
+def test_interleave_hints_empty():
+    assert [] == list(ConceptRegistry.interleave_hints([]))
+
+def test_interleave_hints_no_arguments_raises_error():
+    with pytest.raises(TypeError):
+        next(ConceptRegistry.interleave_hints())
+
+
+# Test evaluate_guess method
+def test_evaluate_guess_registry_good(factor_main_hint):
+    assert "good" == registry.evaluate_guess("factor", 21, factor_main_hint)
+
+def test_evaluate_guess_registry_bad(factor_main_hint):
+    assert "bad" == registry.evaluate_guess("factor", 22, factor_main_hint)
+
+def test_evaluate_guess_registry_unknown_hint_type_raises_error(factor_main_hint):
+    with pytest.raises(KeyError):
+        registry.evaluate_guess("unknown", 21, factor_main_hint)
+
+
+# Test evaluate_guesses method
+def test_evaluate_guesses_registry_list_of_guesses():
+    hint = registry._perfect_square._create_hint(HintRecord.MAIN)
+    assert [False, True, False, True] == registry.evaluate_guesses(hint, [2, 4, 8, 9]).tolist()
+
+def test_evaluate_guesses_registry_number_info_passed_in():
+    guesses = np.arange(1, 11)
+    hint = registry._multiple._create_hint(HintRecord.MAIN, 6)
+    assert [1, 2, 3, 6] == guesses[registry.evaluate_guesses(hint, guesses, numbers.get_batch_number_info(guesses))].tolist()
+
+def test_evaluate_guesses_registry_empty():
+    hint = registry._prime._create_hint(HintRecord.MAIN)
+    assert [] == registry.evaluate_guesses(hint, np.array([], dtype=np.int64)).tolist()
+
+def test_evaluate_guesses_registry_matches_evaluate_guess():
+    guesses = np.arange(-20, 201)
+    hints = {hint for number in range(1, 201) for hint in registry.generate_hints(number, filter_results=False)}
+    for hint in list(hints) + [hint.render() for hint in hints]:
+        hint_type = data.get_hint_obj_from_hint(hint).get_name() if isinstance(hint, str) else hint.get_type()
+        expected_mask = [registry.evaluate_guess(hint_type, int(x), hint) == "good" for x in guesses]
+        assert expected_mask == registry.evaluate_guesses(hint, guesses).tolist()
+
+def test_evaluate_guesses_registry_greater_less_hint_raises_error():
+    with pytest.raises(KeyError):
+        registry.evaluate_guesses(registry.check_greater_or_less(5, 9), np.array([1, 2]))
+
+def test_evaluate_guesses_registry_no_arguments_raises_error():
+    with pytest.raises(TypeError):
+        registry.evaluate_guesses()
+
+
+# Test get_hint_mask method
+def test_get_hint_mask_registry():
+    mask_numbers = np.arange(1, 11)
+    hint = registry._perfect_cube._create_hint(HintRecord.MAIN)
+    mask = registry.get_hint_mask(hint, mask_numbers, numbers.get_batch_number_info(mask_numbers))
+    assert [1, 8] == mask_numbers[mask].tolist()
+
+def test_get_hint_mask_registry_no_arguments_raises_error():
+    with pytest.raises(TypeError):
+        registry.get_hint_mask()
+
+
+# Test check_greater_or_less method
+def test_check_greater_or_less_registry_higher():
+    assert HintRecord.HIGHER == registry.check_greater_or_less(2, 5).template_id
+
+def test_check_greater_or_less_registry_lower():
+    assert HintRecord.LOWER == registry.check_greater_or_less(8, 5).template_id
+
+def test_check_greater_or_less_registry_hint_type():
+    assert "greater_less" == registry.check_greater_or_less(2, 5).get_type()
+
+
+# Test parse_hint method
+def test_parse_hint_registry(factor_main_hint):
+    assert registry._factor._create_hint(HintRecord.MAIN, 7) == registry.parse_hint("factor", factor_main_hint)
+
+def test_parse_hint_registry_parsed_once(factor_main_hint):
+    assert registry.parse_hint("factor", factor_main_hint) is registry.parse_hint("factor", factor_main_hint)
+
+def test_parse_hint_registry_unknown_hint_type_raises_error(factor_main_hint):
+    with pytest.raises(KeyError):
+        registry.parse_hint("unknown", factor_main_hint)
+
+
+# Test get_concepts method
+def test_get_concepts_registry_one():
+    assert [registry._factor, registry._prime, registry._even_odd, registry._perfect_square,
+            registry._perfect_cube] == registry.get_concepts(1)
+
+def test_get_concepts_registry_profile():
+    assert registry.get_concepts(24) == registry.get_concepts(numbers.get_number_profile(24))
+
+
+# Test find_implied_hints method
+@pytest.fixture
+def divisibility_hints():
+    return [
+        registry._factor._create_hint(HintRecord.MAIN, 2),
+        registry._even_odd._create_hint(HintRecord.MAIN, "even"),
+        registry._factor._create_hint(HintRecord.MAIN, 4)
+        ]
+
+def test_find_implied_hints(divisibility_hints):
+    # Every number divisible by 4 is even and divisible by 2.
+    assert {0: [2], 1: [2]} == registry.find_implied_hints(divisibility_hints)
+
+def test_find_implied_hints_none_implied(divisibility_hints):
+    hints = [divisibility_hints[2], registry._perfect_square._create_hint(HintRecord.MAIN)]
+    assert {} == registry.find_implied_hints(hints)
+
+def test_find_implied_hints_empty():
+    assert {} == registry.find_implied_hints([])
+
+def test_find_implied_hints_implied_by_combination():
+    # The only factors of both 6 and 9 are 1 and 3, which are the factors of 3.
+    hints = [registry._multiple._create_hint(HintRecord.MAIN, x) for x in [3, 6, 9]]
+    assert {0: [1, 2]} == registry.find_implied_hints(hints)
+
+def test_find_implied_hints_same_numbers_ruled_out():
+    low, high = registry.get_implication_range()
+    mask_numbers = np.arange(low, high + 1)
+    mask_number_info = numbers.get_batch_number_info(mask_numbers)
+    for number in range(1, 61):
+        hints = registry.generate_hints(number, filter_results=False)
+        implied_hints = registry.find_implied_hints(hints)
+        masks = [registry.evaluate_guesses(hint, mask_numbers, mask_number_info) for hint in hints]
+        kept_masks = [mask for index, mask in enumerate(masks) if index not in implied_hints]
+        assert np.all(masks, axis=0).tolist() == np.all(kept_masks, axis=0).tolist()
+        for index, implying_hints in implied_hints.items():
+            assert True == all(i not in implied_hints for i in implying_hints)
+            implying_mask = np.all([masks[i] for i in implying_hints] + [np.ones(len(mask_numbers), dtype=bool)], axis=0)
+            assert False == bool(np.any(implying_mask & ~masks[index]))
+
+def test_find_implied_hints_no_arguments_raises_error():
+    with pytest.raises(TypeError):
+        registry.find_implied_hints()
+
+
+# Test get_implication_range method
+def test_get_implication_range():
+    assert (1, 1000) == registry.get_implication_range()
+
+
+# Test get_concept method
+def test_get_concept_found():
+    assert registry._digit_sum is registry.get_concept("digit_sum")
+
+def test_get_concept_not_found():
+    assert None == registry.get_concept("unknown")
+
+
+
 ### Tests Incorporating DB
 
 @pytest.fixture
@@ -1497,7 +2000,7 @@ def test_get_hints_from_db_without_multiple(mock_concepts_three, test_db_path):
     actual_hints = mock_concepts_three._get_hints_from_db(["prime", "even_odd"], _db_path=test_db_path)
     expected_hints = ["Nice try!  Hint: It is a prime number.",
                       "Nice try!  Hint: It is an odd number."]
-    assert expected_hints == actual_hints
+    assert expected_hints == render_hints(actual_hints)
 
 def test_get_hints_from_db_with_multiple_correct_length(mock_concepts_three, test_db_path):
     actual_hints = mock_concepts_three._get_hints_from_db(["multiple", "prime", "even_odd"], _db_path=test_db_path)
@@ -1505,7 +2008,7 @@ def test_get_hints_from_db_with_multiple_correct_length(mock_concepts_three, tes
 
 def test_get_hints_from_db_with_multiple_two_multiple_hints(mock_concepts_three, test_db_path):
     actual_hints = mock_concepts_three._get_hints_from_db(["multiple", "prime", "even_odd"], _db_path=test_db_path)
-    multiple_hints = [hint for hint in actual_hints if "multiple" in hint]
+    multiple_hints = [hint for hint in actual_hints if hint.get_type() == "multiple"]
     assert 2 == len(multiple_hints)
 
 def test_get_hints_from_db_no_arguments_raises_error(mock_concepts_three):
@@ -1520,7 +2023,7 @@ def test_get_hints_from_db_too_many_arguments_raises_error(mock_concepts_three,
 # Test generate_hints method
 @pytest.fixture
 def all_hints_three(mock_concepts_three, test_db_path):
-    return mock_concepts_three.generate_hints(check_db=True, _db_path=test_db_path)
+    return render_hints(mock_concepts_three.generate_hints(check_db=True, _db_path=test_db_path))
 
 def test_generate_hints_concepts_db_prime_in_list(all_hints_three):
     assert "Nice try!  Hint: It is a prime number." in all_hints_three
@@ -1532,4 +2035,36 @@ def test_generate_hints_concepts_db_correct_length(all_hints_three):
     assert 4 == len(all_hints_three)
 
 
+# Test iter_hints method
+def test_iter_hints_concepts_db_same_hints(mock_concepts_three, test_db_path):
+    hint_list = render_hints(mock_concepts_three.iter_hints(check_db=True, _db_path=test_db_path))
+    assert (4, True) == (len(hint_list), "Nice try!  Hint: It is a prime number." in hint_list)
 
+def test_iter_hints_concepts_db_interleaved(mock_concepts_three, test_db_path):
+    hint_types = [hint.get_type() for hint in mock_concepts_three.iter_hints(check_db=True, _db_path=test_db_path)]
+    assert 3 == len(set(hint_types[:3]))
+
+
+# Test get_implication_graph method
+@pytest.fixture
+def implied_hints_stored(db_manager_fake, test_db_path):
+    PopulateHintsDBScriptor(db_manager_fake, None, data, numbers).store_implied_hints((1, 5), _db_path=test_db_path)
+
+def test_get_implication_graph(mock_concepts_three, implied_hints_stored, test_db_path):
+    expected_graph = {
+        "Nice try!  Hint: 3 is a multiple.": ["Nice try!  Hint: 12 is a multiple.", "Nice try!  Hint: It is an odd number."],
+        "Nice try!  Hint: 6 is a multiple.": ["Nice try!  Hint: 12 is a multiple.", "Nice try!  Hint: It is a prime number."],
+        "Nice try!  Hint: 9 is a multiple.": ["Nice try!  Hint: 12 is a multiple.", "Nice try!  Hint: It is an odd number."],
+        "Nice try!  Hint: 15 is a multiple.": ["Nice try!  Hint: 12 is a multiple.", "Nice try!  Hint: It is an odd number."]
+        }
+    assert expected_graph == render_implication_graph(mock_concepts_three.get_implication_graph((1, 100), _db_path=test_db_path))
+
+def test_get_implication_graph_range_not_covered(mock_concepts_three, implied_hints_stored, test_db_path):
+    assert {} == mock_concepts_three.get_implication_graph((1, 10**12), _db_path=test_db_path)
+
+def test_get_implication_graph_no_db(mock_concepts_one):
+    assert {} == mock_concepts_one.get_implication_graph((1, 10))
+
+def test_get_implication_graph_no_arguments_raises_error(mock_concepts_three):
+    with pytest.raises(TypeError):
+        mock_concepts_three.get_implication_graph()
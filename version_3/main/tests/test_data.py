@@ -1,4 +1,5 @@
 import pytest
+import os, re, timeit
 from main.tests.tests_setup import objects_fake_global_dict
 from main.resources.infrastructure.data import *
 
@@ -10,6 +11,7 @@ from main.tests.test_concepts import perfect_square_main_hint, perfect_square_di
 from main.tests.test_concepts import perfect_cube_main_hint, perfect_cube_digit_hint
 from main.tests.test_concepts import digit_sum_main_hint
 from main.tests.test_concepts import digit_length_main_hint
+from main.tests.test_concepts import registry
 
 
 
@@ -247,6 +249,10 @@ def test_get_level_obj_custom(levels):
     custom_level = levels.get_level_obj("custom")
     assert "custom" == custom_level.get_name()
 
+def test_get_level_obj_expert(levels):
+    expert_level = levels.get_level_obj("expert")
+    assert (1, 10**12) == expert_level.get_number_range()
+
 def test_get_level_obj_not_found(levels):
     assert None == levels.get_level_obj("eazy")
 
@@ -476,6 +482,39 @@ def test_get_hint_obj_from_hint_too_many_arguments_raises_error(hints, digit_len
     with pytest.raises(TypeError):
         hints.get_hint_obj_from_hint(digit_length_main_hint, "extra")
 
+def test_get_hint_obj_from_hint_greater_less(hints):
+    assert "greater_less" == hints.get_hint_obj_from_hint("Nice try!  Higher.").get_name()
+
+def test_get_hint_obj_from_hint_not_found(hints):
+    assert None == hints.get_hint_obj_from_hint("Nice try!")
+
+
+# Benchmark get_hint_obj_from_hint method
+def get_hint_obj_from_hint_loop(hints, hint):
+    # The version of get_hint_obj_from_hint that searched for each hint type in turn, kept to compare against.
+    hint_objs = [hints._subclass_list[i] for i in [1, 2, 0, 4, 5, 3, 8, 6, 7]]
+    for hint_obj in hint_objs:
+        match = re.findall(re.compile(hint_obj.get_hint_display_name()), hint)
+        if match:
+            return hint_obj
+
+@pytest.fixture
+def benchmark_hints():
+    hint_list = [hint.render() for i in range(1, 101) for hint in registry.generate_hints(i, filter_results=False)]
+    return hint_list + ["Nice try!  Higher.", "Nice try!  Lower.", "Nice try!"]
+
+def test_get_hint_obj_from_hint_matches_loop(hints, benchmark_hints):
+    for hint in benchmark_hints:
+        assert get_hint_obj_from_hint_loop(hints, hint) is hints.get_hint_obj_from_hint(hint)
+
+@pytest.mark.skipif(not os.environ.get("RUN_BENCHMARKS"), reason="timing benchmark, set RUN_BENCHMARKS=1 to run it")
+def test_get_hint_obj_from_hint_faster_than_loop(hints, benchmark_hints):
+    loop_time = min(timeit.repeat(lambda: [get_hint_obj_from_hint_loop(hints, hint) for hint in benchmark_hints],
+                                  number=5, repeat=5))
+    compiled_time = min(timeit.repeat(lambda: [hints.get_hint_obj_from_hint(hint) for hint in benchmark_hints],
+                                      number=5, repeat=5))
+    assert compiled_time < loop_time
+
 
 # Test get_feedback_display_name method
 feedback_display_names = [
@@ -5,6 +5,7 @@ from main.app_data.data_storers.data_storer_components import *
 from main.app_data.data_storers.game_data_storers import *
 from main.app_data.data_storers.guess_data_storers import *
 from main.app_data.data_storers.outcome_data_storers import *
+from concepts.concept_registry import ConceptRegistry
 
 
 
@@ -38,6 +39,46 @@ def test_get_parameters_too_many_arguments_raises_error(data_storer_fake):
         data_storer_fake.get_parameters("extra")
 
 
+class WriterFake:
+    def __init__(self):
+        self.queries = []
+    
+    def add(self, query, parameters=None):
+        self.queries.append((query, parameters))
+    
+    def insert(self, query, parameters=None):
+        self.queries.append((query, parameters))
+        return len(self.queries)
+
+
+# Test set_writer method
+def test_set_writer_query_added(data_storer_fake):
+    writer = WriterFake()
+    data_storer_fake.set_writer(writer)
+    data_storer_fake._write("SELECT 1;", {"session_id": 1})
+    assert [("SELECT 1;", {"session_id": 1})] == writer.queries
+
+def test_set_writer_insert_row_id_saved(data_storer_fake):
+    writer = WriterFake()
+    data_storer_fake.set_writer(writer)
+    data_storer_fake._write("SELECT 1;")
+    data_storer_fake._insert("SELECT 2;")
+    assert 2 == data_storer_fake.get_row_id()
+
+def test_set_writer_no_arguments_raises_error(data_storer_fake):
+    with pytest.raises(TypeError):
+        data_storer_fake.set_writer()
+
+
+# Test get_row_id method
+def test_get_row_id_nothing_inserted(data_storer_fake):
+    assert None == data_storer_fake.get_row_id()
+
+def test_get_row_id_too_many_arguments_raises_error(data_storer_fake):
+    with pytest.raises(TypeError):
+        data_storer_fake.get_row_id("extra")
+
+
 
 ### ErrorStorer Tests
 
@@ -127,9 +168,13 @@ def test_set_parameters_game_entry_winning_number(game_entry_copy):
     game_entry_copy._set_parameters()
     assert game_entry_copy._parameters["winning_number"] in range(1, 11)
 
+def test_set_parameters_game_entry_seed(game_entry_copy):
+    game_entry_copy._set_parameters()
+    assert settings.get_setting("seed") == game_entry_copy._parameters["seed"]
+
 def test_set_parameters_game_entry_length(game_entry_copy):
     game_entry_copy._set_parameters()
-    assert 6 == len(game_entry_copy._parameters)
+    assert 7 == len(game_entry_copy._parameters)
 
 def test_set_parameters_game_entry_too_many_arguments_raises_error(game_entry_copy):
     with pytest.raises(TypeError):
@@ -144,6 +189,12 @@ def test_update_db_table_game_entry(game_entry_copy, sqlite_db_fake, test_db_pat
     db_entry = sqlite_db_fake.run_query(game_table_query, fetch="all", _db_path=test_db_path)
     assert [(1, 1, '1', '10', 0)] == db_entry
 
+def test_update_db_table_game_entry_row_id_saved(game_entry_copy, sqlite_db_fake, test_db_path):
+    sqlite_db_fake.run_query("DELETE FROM game;", _db_path=test_db_path)
+    sqlite_db_fake.run_query("INSERT INTO game(session_id, error) VALUES(1, 0);", _db_path=test_db_path)
+    game_entry_copy.update_db_table()
+    assert 2 == game_entry_copy.get_row_id()
+
 def test_update_db_table_game_entry_too_many_arguments_raises_error(game_entry_copy):
     with pytest.raises(TypeError):
         game_entry_copy.update_db_table("extra")
@@ -196,6 +247,17 @@ def test_update_database_game_error(game_storage_manager_copy, sqlite_db_fake, t
     db_entry = sqlite_db_fake.run_query(game_table_query, fetch="all", _db_path=test_db_path)
     assert [(1, 1, 3)] == db_entry
 
+def test_update_database_game_id_kept(game_storage_manager_copy, session_fake):
+    session_fake.current_outcome_id = 1
+    game_storage_manager_copy.update_database({"settings": settings, "error": False, "error_type": None})
+    game_storage_manager_copy.update_database({"settings": settings, "error": False, "error_type": None})
+    assert (2, None) == (session_fake.current_game_id, session_fake.current_outcome_id)
+
+def test_update_database_game_hint_count_reset(game_storage_manager_copy, session_fake):
+    session_fake.current_hint_count = 3
+    game_storage_manager_copy.update_database({"settings": settings, "error": False, "error_type": None})
+    assert 0 == session_fake.current_hint_count
+
 def test_update_database_game_no_arguments_raises_error(game_storage_manager_copy):
     with pytest.raises(TypeError):
         game_storage_manager_copy.update_database()
@@ -221,6 +283,19 @@ def guess_hint_entry_copy(session_fake, sqlite_db_fake, test_db_path):
     yield guess_hint_entry
     guess_hint_entry._parameters.clear()
 
+@pytest.fixture
+def guess_hint_record_entry_copy(session_fake, sqlite_db_fake, test_db_path):
+    for table in ["game", "guess"]:
+        sqlite_db_fake.run_query(f"DELETE FROM {table};", _db_path=test_db_path)
+    session_fake.update_database("game", {"settings": settings, "error": False, "error_type": None})
+    data = session_fake._objects.get_object("data")
+    hints_obj = data.get_data_object("hint_types")
+    registry = ConceptRegistry.get_registry(objects_fake_global_easy.get_object("numbers"), data)
+    hint = registry.parse_hint("prime", prime_hint)
+    guess_hint_entry = GuessHintEntry(session_fake, "6", "good", hint, hints_obj)
+    yield guess_hint_entry
+    guess_hint_entry._parameters.clear()
+
 
 # Test _set_parameters method
 @pytest.mark.parametrize("parameter, value",
@@ -235,6 +310,19 @@ def test_set_parameters_guess_hint_entry(guess_hint_entry_copy, parameter, value
     guess_hint_entry_copy._set_parameters()
     assert value == guess_hint_entry_copy._parameters[parameter]
 
+@pytest.mark.parametrize("parameter, value",
+                         [("hint_type_id", 3),
+                          ("hint", prime_hint)
+                          ])
+def test_set_parameters_guess_hint_entry_hint_record(guess_hint_record_entry_copy, parameter, value):
+    guess_hint_record_entry_copy._set_parameters()
+    assert value == guess_hint_record_entry_copy._parameters[parameter]
+
+def test_set_parameters_guess_hint_entry_hint_count(guess_hint_entry_copy, session_fake):
+    session_fake.current_hint_count = 2
+    guess_hint_entry_copy._set_parameters()
+    assert 3 == guess_hint_entry_copy._parameters["hint_number"]
+
 def test_set_parameters_guess_hint_entry_length(guess_hint_entry_copy):
     guess_hint_entry_copy._set_parameters()
     assert 8 == len(guess_hint_entry_copy._parameters)
@@ -252,6 +340,10 @@ def test_update_db_table_guess_hint_entry(guess_hint_entry_copy, sqlite_db_fake,
     db_entry = sqlite_db_fake.run_query(guess_table_query, fetch="all", _db_path=test_db_path)
     assert [(1, 1, 3, prime_hint, 1, "6", "good", 0)] == db_entry
 
+def test_update_db_table_guess_hint_entry_hint_count_kept(guess_hint_entry_copy, session_fake):
+    guess_hint_entry_copy.update_db_table()
+    assert 1 == session_fake.current_hint_count
+
 def test_update_db_table_guess_hint_entry_too_many_arguments_raises_error(guess_hint_entry_copy):
     with pytest.raises(TypeError):
         guess_hint_entry_copy.update_db_table("extra")
@@ -431,6 +523,7 @@ def play_again_update_copy(session_fake, sqlite_db_fake, test_db_path):
     outcome_obj = data.get_sub_data_object("outcomes", "lose")
     outcome_query = "INSERT INTO outcome(game_id, session_id, outcome_type_id, play_again) VALUES (1, 1, 2, 0);"
     sqlite_db_fake.run_query(outcome_query, _db_path=test_db_path)
+    session_fake.current_outcome_id = 1
     play_again_update = PlayAgainUpdate(session_fake)
     yield play_again_update
     play_again_update._parameters.clear()
@@ -460,6 +553,7 @@ def feedback_update_copy_improvement(session_fake, sqlite_db_fake, test_db_path)
     outcome_obj = data.get_sub_data_object("outcomes", "lose")
     outcome_query = "INSERT INTO outcome(game_id, session_id, outcome_type_id, play_again) VALUES (1, 1, 2, 0);"
     sqlite_db_fake.run_query(outcome_query, _db_path=test_db_path)
+    session_fake.current_outcome_id = 1
     feedback_update = FeedbackUpdate(session_fake, feedback_type="improvement", improvement_area_id=2)
     yield feedback_update
     feedback_update._parameters.clear()
@@ -516,6 +610,13 @@ def test_add_outcome_record_to_db_no_score(outcome_storage_manager_copy, sqlite_
     db_entry = sqlite_db_fake.run_query(outcome_table_query, fetch="all", _db_path=test_db_path)
     assert [(1, 1, 2, None, 0)] == db_entry
 
+def test_add_outcome_record_to_db_outcome_id_kept(outcome_storage_manager_copy, session_fake):
+    data = outcome_storage_manager_copy._objects.get_object("data")
+    outcome_obj = data.get_sub_data_object("outcomes", "lose")
+    outcome_storage_manager_copy._add_outcome_record_to_db({"outcome_obj": outcome_obj})
+    outcome_storage_manager_copy._add_outcome_record_to_db({"outcome_obj": outcome_obj})
+    assert 2 == session_fake.current_outcome_id
+
 def test_add_outcome_record_to_db_outcome_no_arguments_raises_error(outcome_storage_manager_copy):
     with pytest.raises(TypeError):
         outcome_storage_manager_copy._add_outcome_record_to_db()
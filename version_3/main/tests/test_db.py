@@ -1,7 +1,15 @@
 import pytest
 import os, subprocess as sp
+import sys
+import re
+import shutil
+import threading
 from main.tests.tests_setup import objects_fake_global_dict
 from main.app_data.db import *
+from main.app_data.data_storers.session import Session
+from main.game.game import Game
+from main.resources.infrastructure.log import LogFactory
+from main.tests.test_object_manager import ObjectManagerFake
 
 
 
@@ -106,6 +114,166 @@ def test_run_query_too_many_arguments_raises_error(sqlite_db_fake, test_db_path)
         sqlite_db_fake.run_query("SELECT 1;", parameters=None, fetch=None, include_cols=False, _db_path=test_db_path, extra="no")
 
 
+# Test run_insert method
+def test_run_insert_row_id_returned(sqlite_db_fake, test_db_path):
+    sqlite_db_fake.run_query("DROP TABLE IF EXISTS params;", _db_path=test_db_path)
+    sqlite_db_fake.run_query("CREATE TABLE params (id INTEGER NOT NULL PRIMARY KEY, name TEXT);", _db_path=test_db_path)
+    sqlite_db_fake.run_query("INSERT INTO params(id, name) VALUES(7, 'seven');", _db_path=test_db_path)
+    assert 8 == sqlite_db_fake.run_insert("INSERT INTO params(name) VALUES(:name);", {"name": "eight"}, _db_path=test_db_path)
+
+def test_run_insert_no_parameters(sqlite_db_fake, test_db_path):
+    sqlite_db_fake.run_query("DROP TABLE IF EXISTS params;", _db_path=test_db_path)
+    sqlite_db_fake.run_query("CREATE TABLE params (id INTEGER NOT NULL PRIMARY KEY, name TEXT);", _db_path=test_db_path)
+    row_id = sqlite_db_fake.run_insert("INSERT INTO params(name) VALUES('one');", _db_path=test_db_path)
+    assert (row_id, "one") == sqlite_db_fake.run_query("SELECT id, name FROM params;", fetch="one", _db_path=test_db_path)
+
+def test_run_insert_failure_rolls_back(sqlite_db_fake, test_db_path):
+    sqlite_db_fake.run_query("DROP TABLE IF EXISTS params;", _db_path=test_db_path)
+    sqlite_db_fake.run_query("CREATE TABLE params (id INTEGER NOT NULL PRIMARY KEY, name TEXT);", _db_path=test_db_path)
+    sqlite_db_fake.run_query("INSERT INTO params(id, name) VALUES(1, 'one');", _db_path=test_db_path)
+    with pytest.raises(sqlite3.IntegrityError):
+        sqlite_db_fake.run_insert("INSERT INTO params(id, name) VALUES(1, 'one');", _db_path=test_db_path)
+    assert (1,) == sqlite_db_fake.run_query("SELECT COUNT(*) FROM params;", fetch="one", _db_path=test_db_path)
+
+def test_run_insert_no_arguments_raises_error(sqlite_db_fake):
+    with pytest.raises(TypeError):
+        sqlite_db_fake.run_insert()
+
+
+# Test run_many method
+def test_run_many(sqlite_db_fake, test_db_path, create_parameter_table_query):
+    sqlite_db_fake.run_query("DROP TABLE IF EXISTS params;", _db_path=test_db_path)
+    sqlite_db_fake.run_query(create_parameter_table_query, _db_path=test_db_path)
+    sqlite_db_fake.run_many("INSERT INTO params(id, name) VALUES(?, ?);", [(4, "four"), (5, "five")], _db_path=test_db_path)
+    assert [("four",), ("five",)] == sqlite_db_fake.run_query("SELECT name FROM params WHERE id > 3 ORDER BY id;", fetch="all", _db_path=test_db_path)
+
+def test_run_many_failure_rolls_back(sqlite_db_fake, test_db_path):
+    sqlite_db_fake.run_query("DROP TABLE IF EXISTS params;", _db_path=test_db_path)
+    sqlite_db_fake.run_query("CREATE TABLE params (id INTEGER NOT NULL PRIMARY KEY, name TEXT);", _db_path=test_db_path)
+    with pytest.raises(sqlite3.IntegrityError):
+        sqlite_db_fake.run_many("INSERT INTO params(id, name) VALUES(?, ?);", [(1, "one"), (1, "one")], _db_path=test_db_path)
+    assert (0,) == sqlite_db_fake.run_query("SELECT COUNT(*) FROM params;", fetch="one", _db_path=test_db_path)
+
+def test_run_many_no_arguments_raises_error(sqlite_db_fake):
+    with pytest.raises(TypeError):
+        sqlite_db_fake.run_many()
+
+
+# Test run_batch method
+def test_run_batch(sqlite_db_fake, test_db_path, create_parameter_table_query):
+    sqlite_db_fake.run_query("DROP TABLE IF EXISTS params;", _db_path=test_db_path)
+    sqlite_db_fake.run_query(create_parameter_table_query, _db_path=test_db_path)
+    batches = [("INSERT INTO params(id, name) VALUES(?, ?);", [(4, "four"), (5, "five")]),
+               ("UPDATE params SET name = ? WHERE id = ?;", [("FOUR", 4)])]
+    sqlite_db_fake.run_batch(batches, _db_path=test_db_path)
+    assert [("FOUR",), ("five",)] == sqlite_db_fake.run_query("SELECT name FROM params WHERE id > 3 ORDER BY id;", fetch="all", _db_path=test_db_path)
+
+def test_run_batch_failure_rolls_back(sqlite_db_fake, test_db_path):
+    sqlite_db_fake.run_query("DROP TABLE IF EXISTS params;", _db_path=test_db_path)
+    sqlite_db_fake.run_query("CREATE TABLE params (id INTEGER NOT NULL PRIMARY KEY, name TEXT);", _db_path=test_db_path)
+    batches = [("INSERT INTO params(id, name) VALUES(?, ?);", [(1, "one"), (2, "two")]),
+               ("INSERT INTO params(id, name) VALUES(?, ?);", [(1, "one")])]
+    with pytest.raises(sqlite3.IntegrityError):
+        sqlite_db_fake.run_batch(batches, _db_path=test_db_path)
+    assert (0,) == sqlite_db_fake.run_query("SELECT COUNT(*) FROM params;", fetch="one", _db_path=test_db_path)
+
+def test_run_batch_no_arguments_raises_error(sqlite_db_fake):
+    with pytest.raises(TypeError):
+        sqlite_db_fake.run_batch()
+
+
+# Test connection reuse
+def test_run_query_connection_reused(sqlite_db_fake, test_db_path):
+    sqlite_db_fake.run_query("SELECT 1;", _db_path=test_db_path)
+    sqlite_db_fake.run_query("SELECT 2;", _db_path=test_db_path)
+    assert 1 == sqlite_db_fake._connections.get_connection_count()
+
+def test_run_query_failure_rolls_back(sqlite_db_fake, test_db_path):
+    sqlite_db_fake.run_query("DROP TABLE IF EXISTS params;", _db_path=test_db_path)
+    sqlite_db_fake.run_query("CREATE TABLE params (id INTEGER NOT NULL PRIMARY KEY, name TEXT);", _db_path=test_db_path)
+    sqlite_db_fake.run_query("INSERT INTO params(id, name) VALUES(1, 'one');", _db_path=test_db_path)
+    with pytest.raises(sqlite3.IntegrityError):
+        sqlite_db_fake.run_query("INSERT INTO params(id, name) VALUES(1, 'one');", _db_path=test_db_path)
+    assert False == sqlite_db_fake._connections.get_connection(test_db_path).in_transaction
+
+
+# Test close method
+def test_close(sqlite_db_fake, test_db_path):
+    sqlite_db_fake.run_query("SELECT 1;", _db_path=test_db_path)
+    sqlite_db_fake.close()
+    assert ([(1,)], 1) == (sqlite_db_fake.run_query("SELECT 1;", fetch="all", _db_path=test_db_path),
+                           sqlite_db_fake._connections.get_connection_count())
+
+
+
+### SqliteConnectionManager Tests
+
+@pytest.fixture
+def connections():
+    connections = SqliteConnectionManager()
+    yield connections
+    connections.close_all()
+
+
+# Test get_connection method
+def test_get_connection_reused(connections, test_db_path):
+    assert connections.get_connection(test_db_path) is connections.get_connection(test_db_path)
+
+def test_get_connection_one_per_thread(connections, test_db_path):
+    thread_connections = []
+    thread = threading.Thread(target=lambda: thread_connections.append(connections.get_connection(test_db_path)))
+    thread.start()
+    thread.join()
+    assert (False, 2) == (thread_connections[0] is connections.get_connection(test_db_path), connections.get_connection_count())
+
+def test_get_connection_one_per_database(connections, test_db_path):
+    assert connections.get_connection(test_db_path) is not connections.get_connection(":memory:")
+
+def test_get_connection_wal_journal_mode(connections, test_db_path):
+    assert ("wal",) == connections.get_connection(test_db_path).execute("PRAGMA journal_mode;").fetchone()
+
+def test_get_connection_synchronous_level(test_db_path):
+    connections = SqliteConnectionManager(synchronous="full")
+    assert (2,) == connections.get_connection(test_db_path).execute("PRAGMA synchronous;").fetchone()
+    connections.close_all()
+
+def test_get_connection_no_arguments_raises_error(connections):
+    with pytest.raises(TypeError):
+        connections.get_connection()
+
+
+# Test __init__ method
+def test_init_synchronous_level_not_found_raises_error():
+    with pytest.raises(ValueError):
+        SqliteConnectionManager(synchronous="sometimes")
+
+
+# Test close_all method
+def test_close_all_connection_closed(connections, test_db_path):
+    conn = connections.get_connection(test_db_path)
+    connections.close_all()
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1;")
+
+def test_close_all_other_thread(connections, test_db_path):
+    thread_connections = []
+    thread = threading.Thread(target=lambda: thread_connections.append(connections.get_connection(test_db_path)))
+    thread.start()
+    thread.join()
+    connections.close_all()
+    with pytest.raises(sqlite3.ProgrammingError):
+        thread_connections[0].execute("SELECT 1;")
+
+def test_close_all_new_connection_opened(connections, test_db_path):
+    conn = connections.get_connection(test_db_path)
+    connections.close_all()
+    assert (False, 1) == (conn is connections.get_connection(test_db_path), connections.get_connection_count())
+
+def test_close_all_too_many_arguments_raises_error(connections):
+    with pytest.raises(TypeError):
+        connections.close_all("extra")
+
+
 
 ### DBManager Tests
 
@@ -113,6 +281,57 @@ def test_run_query_too_many_arguments_raises_error(sqlite_db_fake, test_db_path)
 def db_manager_fake():
     return DBManager(numbers, data)
 
+@pytest.fixture(scope="module")
+def upgraded_and_built_db_paths(tmp_path_factory):
+    # A copy of the baseline database brought up to date by the DBManager, and a database it built from scratch.
+    directory = tmp_path_factory.mktemp("db_manager")
+    upgraded_db_path, built_db_path = str(directory / "upgraded.db"), str(directory / "built.db")
+    shutil.copyfile("tests/sqlite_guess_that_number_v0.db", upgraded_db_path)
+    DBManager(numbers, data, _db_path=upgraded_db_path)
+    DBManager(numbers, data, _db_path=built_db_path)
+    return upgraded_db_path, built_db_path
+
+def get_query_results(query, db_paths):
+    db = SqliteDBConnector()
+    return [db.run_query(query, fetch="all", _db_path=db_path) for db_path in db_paths]
+
+
+# Test __init__ method
+def test_init_tops_up_hints_single_process(monkeypatch):
+    processes = []
+    monkeypatch.setattr(PopulateHintsDBScriptor, "populate_hints", lambda self, *args, **kwargs: processes.append(
+        kwargs.get("processes")))
+    DBManager(numbers, data)
+    assert [1] == processes
+
+def test_init_connector_settings():
+    connections = DBManager(numbers, data, synchronous="full", cached_statements=64).get_database()._connections
+    assert ("FULL", 64) == (connections._synchronous, connections._cached_statements)
+
+def test_init_connector_settings_synchronous_level_not_found_raises_error():
+    with pytest.raises(ValueError):
+        DBManager(numbers, data, synchronous="fast")
+
+def test_init_baseline_upgraded_tables_match_built(upgraded_and_built_db_paths):
+    tables_query = "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name;"
+    upgraded_tables, built_tables = get_query_results(tables_query, upgraded_and_built_db_paths)
+    columns = [get_query_results(f"PRAGMA table_info({table});", upgraded_and_built_db_paths) for table, in built_tables]
+    assert (built_tables, [built for upgraded, built in columns]) == (upgraded_tables, [upgraded for upgraded, built in columns])
+
+def test_init_baseline_upgraded_indexes_match_built(upgraded_and_built_db_paths):
+    query = "SELECT name, tbl_name, sql FROM sqlite_master WHERE type = 'index' ORDER BY name;"
+    upgraded_indexes, built_indexes = get_query_results(query, upgraded_and_built_db_paths)
+    assert built_indexes == upgraded_indexes
+
+def test_init_baseline_upgraded_type_rows_match_built(upgraded_and_built_db_paths):
+    for table in ["level_of_difficulty_type", "outcome_type", "hint_type", "error_type"]:
+        upgraded_rows, built_rows = get_query_results(f"SELECT * FROM {table} ORDER BY id;", upgraded_and_built_db_paths)
+        assert built_rows == upgraded_rows
+
+def test_init_baseline_upgraded_versions_match_built(upgraded_and_built_db_paths):
+    upgraded_versions, built_versions = get_query_results(version_check_query, upgraded_and_built_db_paths)
+    assert (migration_names, migration_names) == (built_versions, upgraded_versions)
+
 
 # Test get_database method
 def test_get_database(db_manager_fake):
@@ -141,6 +360,39 @@ def test_database_build_table_list(sqlite_db_fake, test_db_path):
     tables = [row[1] for row in result]
     assert db_tables == tables
 
+def test_database_build_index_list(sqlite_db_fake, test_db_path):
+    for table, query in create_index_queries:
+        sqlite_db_fake.run_query(query, _db_path=test_db_path)
+    query = "SELECT tbl_name, name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL;"
+    result = sqlite_db_fake.run_query(query, fetch="all", _db_path=test_db_path)
+    assert sorted([(table, f"{table}_{index}_index") for table, index in
+                   [("hint", "number"), ("guess", "game"), ("outcome", "game")]]) == sorted(result)
+
+
+# Create Indexes with CreateDBScriptor
+@pytest.fixture
+def create_db_fake(db_manager_fake):
+    return CreateDBScriptor(db_manager_fake, None)
+
+
+# Test create_indexes method
+def test_create_indexes_missing_index_added(create_db_fake, sqlite_db_fake, test_db_path):
+    create_db_fake.create_indexes(_db_path=test_db_path)
+    sqlite_db_fake.run_query("DROP INDEX guess_game_index;", _db_path=test_db_path)
+    create_db_fake.create_indexes(_db_path=test_db_path)
+    query = "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND name = 'guess_game_index';"
+    assert (1,) == sqlite_db_fake.run_query(query, fetch="one", _db_path=test_db_path)
+
+def test_create_indexes_existing_indexes_kept(create_db_fake, sqlite_db_fake, test_db_path):
+    create_db_fake.create_indexes(_db_path=test_db_path)
+    create_db_fake.create_indexes(_db_path=test_db_path)
+    query = "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL;"
+    assert (len(create_index_queries),) == sqlite_db_fake.run_query(query, fetch="one", _db_path=test_db_path)
+
+def test_create_indexes_too_many_arguments_raises_error(create_db_fake):
+    with pytest.raises(TypeError):
+        create_db_fake.create_indexes("extra", "extra")
+
 
 # Populate Types
 db_error_types = [(1, 'range_entry', 'comparison', 'comparison'),
@@ -162,7 +414,8 @@ db_hint_types = [(1, 'factor', 'Factor: Any integer which divides evenly into a
 db_level_of_difficulty_types = [(1, 'easy', 'easy'),
                                 (2, 'medium', 'medium'),
                                 (3, 'hard', 'hard'),
-                                (4, 'custom', 'custom')]
+                                (4, 'custom', 'custom'),
+                                (5, 'expert', 'expert')]
 
 db_outcome_types = [(1, 'win', 'win'),
                     (2, 'lose', 'lose'),
@@ -253,20 +506,408 @@ hint_check = [(1, 1, 1, 'Nice try!  Hint: It has 1 factor(s).'),
               (34, 3, 5, 'Nice try!  Hint: It is a prime number.'),
               (35, 4, 5, 'Nice try!  Hint: It is an odd number.')]
 
+hint_check_query = "SELECT hint_id, hint_type_id, number, hint FROM hint;"
+
 def test_database_build_hints(sqlite_db_fake, test_db_path):
     sqlite_db_fake.run_query(f"DELETE FROM hint;", _db_path=test_db_path)
+    concepts = ConceptRegistry.get_registry(numbers, data)
     for i in range(1, 6):
-        concept_manager = ConceptManager(i, numbers, None, data)
-        hints = concept_manager.generate_hints(check_db=False, filter_results=False)
+        hints = concepts.generate_hints(i, filter_results=False)
         for hint in hints:
-            hint_obj = data.get_hint_obj_from_hint(hint)
-            hint_type_id = hint_obj.get_id()
             populate_hints_query = "INSERT INTO hint(hint_type_id, number, hint) VALUES (:hint_type_id, :number, :hint);"
-            parameters = {'hint_type_id': int(hint_type_id), 'number': int(i), 'hint': hint}
+            parameters = {'hint_type_id': int(hint.type_id), 'number': int(i), 'hint': hint.render()}
             sqlite_db_fake.run_query(populate_hints_query, parameters, _db_path=test_db_path)
     
-    query = "SELECT * FROM hint;"
-    result = sqlite_db_fake.run_query(query, fetch="all", _db_path=test_db_path)
+    result = sqlite_db_fake.run_query(hint_check_query, fetch="all", _db_path=test_db_path)
+    assert hint_check == result
+
+
+# Populate Hints with PopulateHintsDBScriptor
+@pytest.fixture
+def populate_hints_fake(db_manager_fake, sqlite_db_fake, test_db_path):
+    sqlite_db_fake.run_query(f"DELETE FROM hint;", _db_path=test_db_path)
+    return PopulateHintsDBScriptor(db_manager_fake, None, data, numbers)
+
+
+# Test populate_hints method
+def test_populate_hints(populate_hints_fake, sqlite_db_fake, test_db_path):
+    row_count, seconds = populate_hints_fake.populate_hints((1, 5), _db_path=test_db_path)
+    result = sqlite_db_fake.run_query(hint_check_query, fetch="all", _db_path=test_db_path)
+    assert (35, hint_check) == (row_count, result)
+
+def test_populate_hints_top_up(populate_hints_fake, sqlite_db_fake, test_db_path):
+    populate_hints_fake.populate_hints((1, 3), _db_path=test_db_path)
+    row_count, seconds = populate_hints_fake.populate_hints((1, 5), _db_path=test_db_path)
+    result = sqlite_db_fake.run_query(hint_check_query, fetch="all", _db_path=test_db_path)
+    assert (17, hint_check) == (row_count, result)
+
+def test_populate_hints_already_populated(populate_hints_fake, test_db_path):
+    populate_hints_fake.populate_hints((1, 5), _db_path=test_db_path)
+    assert 0 == populate_hints_fake.populate_hints((1, 5), _db_path=test_db_path)[0]
+
+def test_populate_hints_process_pool(populate_hints_fake, sqlite_db_fake, test_db_path, monkeypatch):
+    monkeypatch.setattr(PopulateHintsDBScriptor, "_chunk_size", 2)
+    populate_hints_fake.populate_hints((1, 5), processes=2, _db_path=test_db_path)
+    result = sqlite_db_fake.run_query(hint_check_query, fetch="all", _db_path=test_db_path)
     assert hint_check == result
 
+def test_populate_hints_entry_point_imported_by_workers_without_window():
+    pytest.importorskip("matplotlib")
+    # Spawned workers run the app's main module under the name __mp_main__ before they take any work.
+    script = ("import runpy, sys; runpy.run_path('guess_that_number.py', run_name='__mp_main__'); "
+              "print('kivy.core.window' in sys.modules)")
+    result = sp.run([sys.executable, "-c", script], capture_output=True, text=True)
+    assert "False" == result.stdout.strip().splitlines()[-1]
+
+def test_populate_hints_process_pool_from_entry_point():
+    pytest.importorskip("matplotlib")
+    # The workers are spawned as they would be with guess_that_number.py as the app's main module.
+    script = "\n".join([
+        "import os, sys",
+        "sys.modules['__main__'].__file__ = os.path.abspath('guess_that_number.py')",
+        "from resources.infrastructure.number import Number",
+        "from resources.infrastructure.application_text import TextManager",
+        "from resources.infrastructure.data import DataManager",
+        "from app_data.db import DBManager, PopulateHintsDBScriptor",
+        "if __name__ == '__main__':",
+        "    numbers, data = Number(), DataManager(TextManager())",
+        "    PopulateHintsDBScriptor._chunk_size = 2",
+        "    scriptor = PopulateHintsDBScriptor(DBManager(numbers, data), None, data, numbers)",
+        "    print(len(scriptor._generate_hint_rows([1, 2, 3, 4, 5], processes=2)))"
+        ])
+    result = sp.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=300)
+    assert "35" == result.stdout.strip().splitlines()[-1]
+
+def test_execute_script_single_process(populate_hints_fake, monkeypatch):
+    processes = []
+    monkeypatch.setattr(PopulateHintsDBScriptor, "populate_hints", lambda self, *args, **kwargs: processes.append(
+        kwargs.get("processes")))
+    monkeypatch.setattr(PopulateHintsDBScriptor, "store_implied_hints", lambda self, *args, **kwargs: None)
+    populate_hints_fake.execute_script()
+    assert [1] == processes
+
+def test_populate_hints_default_range_covers_standard_levels():
+    assert data.get_sub_data_object("levels", "hard").get_number_range()[1] == PopulateHintsDBScriptor._hints_stored
+
+
+# Test store_implied_hints method
+implied_hint_check = [('Nice try!  Hint: It is divisible by 2.', 1, '27'),
+                      ('Nice try!  Hint: It has 3 factor(s).', 0, None),
+                      ('Nice try!  Hint: 4 is a multiple.', 1, '20,27'),
+                      ('Nice try!  Hint: 8 is a multiple.', 1, '20,27'),
+                      ('Nice try!  Hint: 12 is a multiple.', 1, '20,27'),
+                      ('Nice try!  Hint: 16 is a multiple.', 1, '20,27'),
+                      ('Nice try!  Hint: 20 is a multiple.', 1, '20,27'),
+                      ('Nice try!  Hint: It has 1 prime factor(s).', 1, '20'),
+                      ('Nice try!  Hint: It is an even number.', 0, None),
+                      ('Nice try!  Hint: It is a perfect square.', 1, '20')]
+
+def test_store_implied_hints(populate_hints_fake, sqlite_db_fake, test_db_path):
+    populate_hints_fake.populate_hints((1, 5), _db_path=test_db_path)
+    row_count, seconds = populate_hints_fake.store_implied_hints((1, 5), _db_path=test_db_path)
+    query = "SELECT hint, redundant, implied_by FROM hint WHERE number = 4;"
+    result = sqlite_db_fake.run_query(query, fetch="all", _db_path=test_db_path)
+    assert (35, implied_hint_check) == (row_count, result)
+
+def test_store_implied_hints_only_unchecked_rows(populate_hints_fake, test_db_path):
+    populate_hints_fake.populate_hints((1, 3), _db_path=test_db_path)
+    populate_hints_fake.store_implied_hints((1, 5), _db_path=test_db_path)
+    populate_hints_fake.populate_hints((1, 5), _db_path=test_db_path)
+    assert 17 == populate_hints_fake.store_implied_hints((1, 5), _db_path=test_db_path)[0]
+
+def test_store_implied_hints_no_hints(populate_hints_fake, test_db_path):
+    assert 0 == populate_hints_fake.store_implied_hints((1, 5), _db_path=test_db_path)[0]
+
+
+# Test _get_missing_numbers method
+def test_get_missing_numbers(populate_hints_fake, test_db_path):
+    populate_hints_fake.populate_hints((2, 3), _db_path=test_db_path)
+    assert [1, 4, 5] == populate_hints_fake._get_missing_numbers((1, 5), _db_path=test_db_path)
+
+
+
+### Migration Tests
+
+@pytest.fixture
+def migrate_db_fake(db_manager_fake, sqlite_db_fake, test_db_path):
+    sqlite_db_fake.run_query("DROP TABLE IF EXISTS schema_version;", _db_path=test_db_path)
+    yield MigrateDBScriptor(db_manager_fake, None)
+    sqlite_db_fake.run_query("DROP TABLE IF EXISTS schema_version;", _db_path=test_db_path)
+
+@pytest.fixture
+def params_table(sqlite_db_fake, test_db_path):
+    sqlite_db_fake.run_query("DROP TABLE IF EXISTS params;", _db_path=test_db_path)
+    sqlite_db_fake.run_query("CREATE TABLE params (id INTEGER NOT NULL PRIMARY KEY, name TEXT);", _db_path=test_db_path)
+    sqlite_db_fake.run_many("INSERT INTO params(id, name) VALUES(?, ?);", [(i, str(i)) for i in range(1, 8)], _db_path=test_db_path)
+    sqlite_db_fake.run_query(create_schema_version_table, _db_path=test_db_path)
+    yield
+    for table in ["params", "schema_version"]:
+        sqlite_db_fake.run_query(f"DROP TABLE IF EXISTS {table};", _db_path=test_db_path)
+
+class BatchMigrationFake(MigrationDBScriptor):
+    _name = "Batch migration"
+    _version = 3
+    _batch_size = 3
+    
+    def _get_batch(self, _db_path=None):
+        query = "SELECT id FROM params WHERE name NOT LIKE 'number %' ORDER BY id LIMIT ?;"
+        rows = self._db.run_query(query, (self._batch_size,), fetch="all", _db_path=_db_path)
+        if not rows:
+            return []
+        return [("UPDATE params SET name = 'number ' || name WHERE id = ?;", [(row[0],) for row in rows])]
+
+class FailingMigrationFake(MigrationDBScriptor):
+    _name = "Failing migration"
+    _version = 3
+    
+    def _get_queries(self, _db_path=None):
+        return ["ALTER TABLE params ADD COLUMN extra TEXT;", "INSERT INTO missing_table VALUES (1);"]
+
+@pytest.fixture
+def baseline_db_path(tmp_path):
+    # A copy of a database built before any of the schema migrations, as it would be found on an existing install.
+    db_path = str(tmp_path / "sqlite_guess_that_number_v0.db")
+    shutil.copyfile("tests/sqlite_guess_that_number_v0.db", db_path)
+    return db_path
+
+version_check_query = "SELECT version, name FROM schema_version ORDER BY version;"
+migration_names = [(1, "Add hint implication columns"), (2, "Add indexes"), (3, "Add expert level"), (4, "Add game seed column"),
+                   (5, "Drop unused indexes")]
+
+
+# Test execute_script method
+def test_execute_script_migrate_all_applied(migrate_db_fake, sqlite_db_fake, test_db_path):
+    assert ([1, 2, 3, 4, 5], migration_names) == (
+        migrate_db_fake.execute_script(_db_path=test_db_path),
+        sqlite_db_fake.run_query(version_check_query, fetch="all", _db_path=test_db_path))
+
+def test_execute_script_migrate_up_to_date(migrate_db_fake, test_db_path):
+    migrate_db_fake.execute_script(_db_path=test_db_path)
+    assert [] == migrate_db_fake.execute_script(_db_path=test_db_path)
+
+def test_execute_script_migrate_only_newer_versions(migrate_db_fake, sqlite_db_fake, test_db_path):
+    sqlite_db_fake.run_query(create_schema_version_table, _db_path=test_db_path)
+    sqlite_db_fake.run_query("INSERT INTO schema_version VALUES (1, 'Add hint implication columns', '');", _db_path=test_db_path)
+    assert [2, 3, 4, 5] == migrate_db_fake.execute_script(_db_path=test_db_path)
+
+def test_execute_script_migrate_columns_added(migrate_db_fake, sqlite_db_fake, test_db_path):
+    sqlite_db_fake.run_query("ALTER TABLE hint DROP COLUMN implied_by;", _db_path=test_db_path)
+    sqlite_db_fake.run_query("ALTER TABLE hint DROP COLUMN redundant;", _db_path=test_db_path)
+    migrate_db_fake.execute_script(_db_path=test_db_path)
+    columns = sqlite_db_fake.run_query("PRAGMA table_info(hint);", fetch="all", _db_path=test_db_path)
+    assert ["redundant", "implied_by"] == [column[1] for column in columns][-2:]
+
+def test_execute_script_migrate_indexes_added(migrate_db_fake, sqlite_db_fake, test_db_path):
+    sqlite_db_fake.run_query("DROP INDEX IF EXISTS hint_number_index;", _db_path=test_db_path)
+    migrate_db_fake.execute_script(_db_path=test_db_path)
+    query = "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND name = 'hint_number_index';"
+    assert (1,) == sqlite_db_fake.run_query(query, fetch="one", _db_path=test_db_path)
+
+def test_execute_script_migrate_unused_indexes_dropped(migrate_db_fake, sqlite_db_fake, test_db_path):
+    sqlite_db_fake.run_query("CREATE INDEX IF NOT EXISTS session_time_index ON session (time);", _db_path=test_db_path)
+    sqlite_db_fake.run_query("CREATE INDEX IF NOT EXISTS game_session_index ON game (session_id, time);", _db_path=test_db_path)
+    migrate_db_fake.execute_script(_db_path=test_db_path)
+    query = "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND name IN ('session_time_index', 'game_session_index');"
+    assert (0,) == sqlite_db_fake.run_query(query, fetch="one", _db_path=test_db_path)
+
+def test_execute_script_migrate_baseline_all_applied(migrate_db_fake, sqlite_db_fake, baseline_db_path):
+    assert ([1, 2, 3, 4, 5], migration_names) == (
+        migrate_db_fake.execute_script(_db_path=baseline_db_path),
+        sqlite_db_fake.run_query(version_check_query, fetch="all", _db_path=baseline_db_path))
+
+def test_execute_script_migrate_baseline_seed_column_added(migrate_db_fake, sqlite_db_fake, baseline_db_path):
+    migrate_db_fake.execute_script(_db_path=baseline_db_path)
+    columns = sqlite_db_fake.run_query("PRAGMA table_info(game);", fetch="all", _db_path=baseline_db_path)
+    assert "seed" == columns[-1][1]
+
+def test_execute_script_migrate_baseline_expert_level_added(migrate_db_fake, sqlite_db_fake, baseline_db_path):
+    migrate_db_fake.execute_script(_db_path=baseline_db_path)
+    query = "SELECT * FROM level_of_difficulty_type WHERE id = 5;"
+    assert [(5, "expert", "expert")] == sqlite_db_fake.run_query(query, fetch="all", _db_path=baseline_db_path)
+
+def test_execute_script_migrate_expert_level_kept(migrate_db_fake, sqlite_db_fake, test_db_path):
+    migrate_db_fake.execute_script(_db_path=test_db_path)
+    query = "SELECT COUNT(*) FROM level_of_difficulty_type WHERE id = 5;"
+    assert (1,) == sqlite_db_fake.run_query(query, fetch="one", _db_path=test_db_path)
+
+def test_execute_script_migrate_baseline_game_played(migrate_db_fake, sqlite_db_fake, baseline_db_path):
+    migrate_db_fake.execute_script(_db_path=baseline_db_path)
+    settings = objects_fake_global_easy.get_object("settings")
+    outcome_obj = data.get_sub_data_object("outcomes", "lose")
+    session = Session(objects_fake_global_easy, baseline_db_path, False)
+    session.update_database("game", {"settings": settings, "error": False, "error_type": None})
+    session.update_database("guess", {"guess": "6", "hint": None, "feedback": None, "error": False, "error_type": None})
+    session.update_database("outcome", {"entry_type": "New", "outcome_obj": outcome_obj})
+    session.update_database("outcome", {"entry_type": "Updated", "update_type": "play_again"})
+    game_query = "SELECT game_id, level_of_difficulty_type_id, seed FROM game;"
+    outcome_query = "SELECT game_id, outcome_type_id, play_again FROM outcome;"
+    assert ([(1, 1, settings.get_setting("seed"))], (1,), [(1, 2, 1)]) == (
+        sqlite_db_fake.run_query(game_query, fetch="all", _db_path=baseline_db_path),
+        sqlite_db_fake.run_query("SELECT COUNT(*) FROM guess;", fetch="one", _db_path=baseline_db_path),
+        sqlite_db_fake.run_query(outcome_query, fetch="all", _db_path=baseline_db_path))
+
+def test_execute_script_migration_batches(db_manager_fake, params_table, sqlite_db_fake, test_db_path):
+    batch_count, seconds = BatchMigrationFake(db_manager_fake, None).execute_script(_db_path=test_db_path)
+    names = sqlite_db_fake.run_query("SELECT name FROM params ORDER BY id;", fetch="all", _db_path=test_db_path)
+    assert (3, [(f"number {i}",) for i in range(1, 8)]) == (batch_count, names)
+
+def test_execute_script_migration_version_recorded(db_manager_fake, params_table, sqlite_db_fake, test_db_path):
+    BatchMigrationFake(db_manager_fake, None).execute_script(_db_path=test_db_path)
+    assert [(3, "Batch migration")] == sqlite_db_fake.run_query(version_check_query, fetch="all", _db_path=test_db_path)
+
+def test_execute_script_migration_failure_rolls_back(db_manager_fake, params_table, sqlite_db_fake, test_db_path):
+    with pytest.raises(sqlite3.OperationalError):
+        FailingMigrationFake(db_manager_fake, None).execute_script(_db_path=test_db_path)
+    columns = sqlite_db_fake.run_query("PRAGMA table_info(params);", fetch="all", _db_path=test_db_path)
+    versions = sqlite_db_fake.run_query(version_check_query, fetch="all", _db_path=test_db_path)
+    assert (["id", "name"], []) == ([column[1] for column in columns], versions)
+
+
+# Test get_current_version method
+def test_get_current_version_no_migrations(migrate_db_fake, sqlite_db_fake, test_db_path):
+    sqlite_db_fake.run_query(create_schema_version_table, _db_path=test_db_path)
+    assert 0 == migrate_db_fake.get_current_version(_db_path=test_db_path)
+
+def test_get_current_version_migrated(migrate_db_fake, test_db_path):
+    migrate_db_fake.execute_script(_db_path=test_db_path)
+    assert 5 == migrate_db_fake.get_current_version(_db_path=test_db_path)
+
+
+# Test get_version method
+def test_get_version(db_manager_fake):
+    migrations = [ImplicationColumnsMigrationDBScriptor(db_manager_fake, None), IndexesMigrationDBScriptor(db_manager_fake, None),
+                  ExpertLevelMigrationDBScriptor(db_manager_fake, None), GameSeedColumnMigrationDBScriptor(db_manager_fake, None),
+                  UnusedIndexesMigrationDBScriptor(db_manager_fake, None)]
+    assert [1, 2, 3, 4, 5] == [migration.get_version() for migration in migrations]
+
+def test_get_version_too_many_arguments_raises_error(db_manager_fake):
+    with pytest.raises(TypeError):
+        IndexesMigrationDBScriptor(db_manager_fake, None).get_version("extra")
+
+
+
+### Query Plan Tests
+
+# The hot tables grow with the hints stored and the games played, so a query that scans one of them without an index
+# gets slower the more the app is used.
+hot_tables = ["hint", "session", "game", "guess", "outcome"]
+sql_keywords = {"WHERE", "JOIN", "LEFT", "INNER", "ON", "ORDER", "GROUP", "LIMIT"}
+# The session count has to count every row, since ids are not a count once sessions are deleted.  The session table
+# only grows by one row each time the app is opened, so the scan is allowed.
+allowed_scans = ["SELECT COUNT(*) FROM session"]
+
+
+def get_hot_table_scans(query, parameters, db_path):
+    """This function returns the hot tables that a query scans without an index, from its EXPLAIN QUERY PLAN."""
+    
+    aliases = {}
+    for table, alias in re.findall(r"(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?", query, re.IGNORECASE):
+        aliases[table] = table
+        if alias and alias.upper() not in sql_keywords:
+            aliases[alias] = table
+    
+    conn = sqlite3.connect(db_path)
+    try:
+        plan = conn.execute("EXPLAIN QUERY PLAN " + query, parameters if parameters else ()).fetchall()
+    finally:
+        conn.close()
+    
+    scans = []
+    for row in plan:
+        scan = re.fullmatch(r"SCAN (?:TABLE )?(\w+)(?: AS (\w+))?", row[3])
+        if scan:
+            table = aliases.get(scan.group(2) or scan.group(1), scan.group(1))
+            if table in hot_tables:
+                scans.append(table)
+    
+    return scans
+
+
+@pytest.fixture
+def app_queries(monkeypatch, tmp_path, sqlite_db_fake, test_db_path):
+    """This fixture plays a game with logs enabled and runs the database startup steps, and returns every query the app
+    ran through any of the connector methods."""
+    
+    os.makedirs(tmp_path / "resources" / "logs")
+    with monkeypatch.context() as patch:
+        patch.chdir(tmp_path)
+        logs = LogFactory()
+    
+    objects = objects_fake_global_dict["game_level"]
+    for obj_name in ["logs", "db_manager", "session", "settings", "stats", "hints", "guesses", "feedback"]:
+        monkeypatch.setitem(objects._object_dict, obj_name, objects.get_object(obj_name))
+    db_manager = DBManager(numbers, data, logs)
+    objects.add_object("logs", logs)
+    objects.add_object("db_manager", db_manager)
+    CreateDBScriptor(db_manager, logs).create_indexes(_db_path=test_db_path)
+    for table in ["session", "game", "guess", "outcome"]:
+        sqlite_db_fake.run_query(f"DELETE FROM {table};", _db_path=test_db_path)
+    
+    queries = []
+    connector_class = type(db_manager.get_database())
+    run_query, run_insert = connector_class.run_query, connector_class.run_insert
+    run_many, run_batch = connector_class.run_many, connector_class.run_batch
+    def run_query_recorded(self, query, parameters=None, fetch=None, include_cols=False, _db_path=None):
+        queries.append((query, parameters))
+        return run_query(self, query, parameters, fetch, include_cols, _db_path)
+    def run_insert_recorded(self, query, parameters=None, _db_path=None):
+        queries.append((query, parameters))
+        return run_insert(self, query, parameters, _db_path)
+    def run_many_recorded(self, query, parameters_list, _db_path=None):
+        queries.extend((query, parameters) for parameters in parameters_list[:1])
+        return run_many(self, query, parameters_list, _db_path)
+    def run_batch_recorded(self, batches, _db_path=None):
+        queries.extend((query, parameters) for query, parameters_list in batches for parameters in parameters_list[:1])
+        return run_batch(self, batches, _db_path)
+    monkeypatch.setattr(connector_class, "run_query", run_query_recorded)
+    monkeypatch.setattr(connector_class, "run_insert", run_insert_recorded)
+    monkeypatch.setattr(connector_class, "run_many", run_many_recorded)
+    monkeypatch.setattr(connector_class, "run_batch", run_batch_recorded)
+    
+    populate_hints = PopulateHintsDBScriptor(db_manager, logs, data, numbers)
+    populate_hints.populate_hints((1, 5), _db_path=test_db_path)
+    populate_hints.store_implied_hints((1, 5), _db_path=test_db_path)
+    session = objects.create_object(Session, "session", ObjectManagerFake, objects, test_db_path, False)
+    session.get_session_count()
+    
+    game = Game(objects)
+    game.configure_game()
+    winning_number = int(game._settings.get_setting("winning number"))
+    for guess in [number for number in range(1, 11) if number != winning_number][:3]:
+        game._text_display.display_text("dynamic", "guess", str(guess))
+        game.add_guess()
+    session.get_last_hint()
+    game._stats._score.value = 80
+    game.summarize_game("win")
+    session.update_database("outcome", {"entry_type": "Updated", "update_type": "play_again"})
+    game.clear_text_variables()
+    
+    yield queries
+    
+    for log in logs.log_dict.values():
+        for handler in log.logger.handlers[:]:
+            handler.close()
+            log.logger.removeHandler(handler)
+
+
+# Test query plans
+def test_query_plans_no_hot_table_scans(app_queries, test_db_path):
+    scans = [(query, get_hot_table_scans(query, parameters, test_db_path)) for query, parameters in app_queries
+             if query.split()[0].upper() in ["SELECT", "UPDATE", "DELETE"] and query not in allowed_scans]
+    assert [] == [(query, tables) for query, tables in scans if tables]
+
+def test_query_plans_queries_recorded(app_queries):
+    tables = {table for query, parameters in app_queries for table in hot_tables
+              if re.search(rf"\b(?:FROM|UPDATE|INTO)\s+{table}\b", query)}
+    assert {"hint", "session", "game", "guess", "outcome"} == tables
+
+def test_query_plans_no_id_lookups(app_queries):
+    assert [] == [query for query, parameters in app_queries
+                  if re.search(r"SELECT\s+(?:\w*id|MAX\(\s*\w*id\s*\))\s+FROM\s+(?:session|game|outcome)\b", query, re.IGNORECASE)]
+
+def test_get_hot_table_scans_unindexed_query(test_db_path):
+    assert ["guess"] == get_hot_table_scans("SELECT * FROM guess WHERE feedback = 'good';", None, test_db_path)
 
+def test_get_hot_table_scans_alias(test_db_path):
+    query = "SELECT g.hint FROM guess g JOIN hint_type t ON g.hint_type_id = t.id WHERE g.feedback = :feedback;"
+    assert ["guess"] == get_hot_table_scans(query, {"feedback": "good"}, test_db_path)
@@ -0,0 +1,142 @@
+import pytest
+import time
+import sqlite3
+from main.tests.test_db import sqlite_db_fake, test_db_path
+from main.app_data.data_storers.db_writer import WriteBehindWriter
+
+
+
+### WriteBehindWriter Tests
+
+insert_query = "INSERT INTO writes(id, name) VALUES(:id, :name);"
+update_query = "UPDATE writes SET name = :name WHERE id = :id;"
+select_query = "SELECT id, name FROM writes ORDER BY id;"
+
+
+@pytest.fixture
+def writes_table(sqlite_db_fake, test_db_path):
+    sqlite_db_fake.run_query("DROP TABLE IF EXISTS writes;", _db_path=test_db_path)
+    sqlite_db_fake.run_query("CREATE TABLE writes (id INTEGER NOT NULL PRIMARY KEY, name TEXT);", _db_path=test_db_path)
+    yield
+    sqlite_db_fake.run_query("DROP TABLE IF EXISTS writes;", _db_path=test_db_path)
+
+@pytest.fixture
+def writer(writes_table, sqlite_db_fake, test_db_path):
+    writer = WriteBehindWriter(sqlite_db_fake, test_db_path, batch_size=3, flush_interval=60)
+    yield writer
+    writer.close()
+
+
+def wait_for_writes(writer, timeout=5):
+    start = time.perf_counter()
+    while writer.get_pending_count() and time.perf_counter() - start < timeout:
+        time.sleep(0.01)
+    with writer._write_lock:
+        pass
+
+
+# Test add method
+def test_add_pending(writer, sqlite_db_fake, test_db_path):
+    writer.add(insert_query, {"id": 1, "name": "one"})
+    assert (1, []) == (writer.get_pending_count(), sqlite_db_fake.run_query(select_query, fetch="all", _db_path=test_db_path))
+
+def test_add_parameters_copied(writer, sqlite_db_fake, test_db_path):
+    parameters = {"id": 1, "name": "one"}
+    writer.add(insert_query, parameters)
+    parameters.clear()
+    writer.flush()
+    assert [(1, "one")] == sqlite_db_fake.run_query(select_query, fetch="all", _db_path=test_db_path)
+
+def test_add_no_parameters(writer, sqlite_db_fake, test_db_path):
+    writer.add("INSERT INTO writes(id, name) VALUES(1, 'one');")
+    writer.flush()
+    assert [(1, "one")] == sqlite_db_fake.run_query(select_query, fetch="all", _db_path=test_db_path)
+
+def test_add_batch_size_reached(writer, sqlite_db_fake, test_db_path):
+    for i in range(3):
+        writer.add(insert_query, {"id": i, "name": str(i)})
+    wait_for_writes(writer)
+    assert [(0, "0"), (1, "1"), (2, "2")] == sqlite_db_fake.run_query(select_query, fetch="all", _db_path=test_db_path)
+
+def test_add_flush_interval_reached(writes_table, sqlite_db_fake, test_db_path):
+    writer = WriteBehindWriter(sqlite_db_fake, test_db_path, flush_interval=0.05)
+    writer.add(insert_query, {"id": 1, "name": "one"})
+    wait_for_writes(writer)
+    writer.close()
+    assert [(1, "one")] == sqlite_db_fake.run_query(select_query, fetch="all", _db_path=test_db_path)
+
+def test_add_no_arguments_raises_error(writer):
+    with pytest.raises(TypeError):
+        writer.add()
+
+
+# Test flush method
+def test_flush(writer, sqlite_db_fake, test_db_path):
+    writer.add(insert_query, {"id": 1, "name": "one"})
+    writer.add(insert_query, {"id": 2, "name": "two"})
+    writer.flush()
+    assert (0, [(1, "one"), (2, "two")]) == (writer.get_pending_count(),
+                                              sqlite_db_fake.run_query(select_query, fetch="all", _db_path=test_db_path))
+
+def test_flush_order_kept(writer, sqlite_db_fake, test_db_path):
+    writer.add(insert_query, {"id": 1, "name": "one"})
+    writer.add(update_query, {"id": 1, "name": "uno"})
+    writer.flush()
+    writer.add(update_query, {"id": 1, "name": "eins"})
+    writer.add(insert_query, {"id": 2, "name": "two"})
+    writer.flush()
+    assert [(1, "eins"), (2, "two")] == sqlite_db_fake.run_query(select_query, fetch="all", _db_path=test_db_path)
+
+def test_flush_nothing_pending(writer, sqlite_db_fake, test_db_path):
+    writer.flush()
+    assert [] == sqlite_db_fake.run_query(select_query, fetch="all", _db_path=test_db_path)
+
+def test_flush_failure_raised(writer):
+    writer.add(insert_query, {"id": 1, "name": "one"})
+    writer.add(insert_query, {"id": 1, "name": "one"})
+    with pytest.raises(sqlite3.IntegrityError):
+        writer.flush()
+
+def test_flush_background_failure_raised(writer):
+    for i in range(3):
+        writer.add(insert_query, {"id": 1, "name": "one"})
+    wait_for_writes(writer)
+    with pytest.raises(sqlite3.IntegrityError):
+        writer.flush()
+
+def test_flush_too_many_arguments_raises_error(writer):
+    with pytest.raises(TypeError):
+        writer.flush("extra")
+
+
+# Test insert method
+def test_insert_row_id_returned(writer):
+    assert 5 == writer.insert(insert_query, {"id": 5, "name": "five"})
+
+def test_insert_after_pending(writer, sqlite_db_fake, test_db_path):
+    writer.add(insert_query, {"id": 1, "name": "one"})
+    writer.add(update_query, {"id": 1, "name": "uno"})
+    row_id = writer.insert("INSERT INTO writes(name) VALUES(:name);", {"name": "two"})
+    assert (0, 2, [(1, "uno"), (2, "two")]) == (writer.get_pending_count(), row_id,
+                                                 sqlite_db_fake.run_query(select_query, fetch="all", _db_path=test_db_path))
+
+def test_insert_no_arguments_raises_error(writer):
+    with pytest.raises(TypeError):
+        writer.insert()
+
+
+# Test close method
+def test_close(writer, sqlite_db_fake, test_db_path):
+    writer.add(insert_query, {"id": 1, "name": "one"})
+    writer.close()
+    assert (False, [(1, "one")]) == (writer._thread.is_alive(),
+                                      sqlite_db_fake.run_query(select_query, fetch="all", _db_path=test_db_path))
+
+def test_close_twice(writer):
+    writer.close()
+    writer.close()
+    assert False == writer._thread.is_alive()
+
+def test_close_too_many_arguments_raises_error(writer):
+    with pytest.raises(TypeError):
+        writer.close("extra")
\ No newline at end of file
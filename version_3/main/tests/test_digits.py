@@ -0,0 +1,85 @@
+import pytest
+import numpy as np
+from main.resources.infrastructure.digits import DigitAnalyzer
+
+
+
+### DigitAnalyzer Object Tests
+
+digit_properties = {
+    "prime number": {2, 3, 5, 7},
+    "even number": {0, 2, 4, 6, 8},
+    "perfect square": {0, 1, 4, 9},
+    "perfect cube": {0, 1, 8}
+    }
+
+test_numbers = list(range(-1000, 20001)) + [10**12, 10**12 + 7, 100000001, 2**63 - 1, -(2**62)]
+
+def string_digits(x):
+    return [int(d) for d in str(x) if d != "-"]
+
+
+# Test get_digits method
+def test_get_digits_matches_string_digits():
+    for x in test_numbers:
+        assert string_digits(x) == DigitAnalyzer.get_digits(x)
+
+def test_get_digits_zero():
+    assert [0] == DigitAnalyzer.get_digits(0)
+
+def test_get_digits_inner_zero_block():
+    assert [1, 0, 0, 0, 0, 0, 0, 0, 0, 1] == DigitAnalyzer.get_digits(1000000001)
+
+def test_get_digits_numpy_integer():
+    assert [4, 2] == DigitAnalyzer.get_digits(np.int64(42))
+
+def test_get_digits_no_arguments_raises_error():
+    with pytest.raises(TypeError):
+        DigitAnalyzer.get_digits()
+
+
+# Test get_digit_sum method
+def test_get_digit_sum_matches_string_digits():
+    for x in test_numbers:
+        assert sum(string_digits(x)) == DigitAnalyzer.get_digit_sum(x)
+
+
+# Test get_digit_length method
+def test_get_digit_length_matches_string_digits():
+    for x in test_numbers:
+        assert len(string_digits(x)) == DigitAnalyzer.get_digit_length(x)
+
+
+# Test get_digit_count method
+def test_get_digit_count_matches_string_digits():
+    for digit_property, property_digits in digit_properties.items():
+        for x in test_numbers[::7]:
+            expected = len([d for d in string_digits(x) if d in property_digits])
+            assert expected == DigitAnalyzer.get_digit_count(x, digit_property)
+
+def test_get_digit_count_padded_zeros():
+    assert 9 == DigitAnalyzer.get_digit_count(1000000000, "even number")
+
+def test_get_digit_count_property_not_found():
+    with pytest.raises(KeyError):
+        DigitAnalyzer.get_digit_count(10, "odd number")
+
+
+# Test get_digit_sums method
+def test_get_digit_sums_matches_scalar():
+    assert [DigitAnalyzer.get_digit_sum(x) for x in test_numbers] == DigitAnalyzer.get_digit_sums(test_numbers).tolist()
+
+def test_get_digit_sums_empty():
+    assert [] == DigitAnalyzer.get_digit_sums([]).tolist()
+
+
+# Test get_digit_lengths method
+def test_get_digit_lengths_matches_scalar():
+    assert [DigitAnalyzer.get_digit_length(x) for x in test_numbers] == DigitAnalyzer.get_digit_lengths(test_numbers).tolist()
+
+
+# Test get_digit_counts method
+def test_get_digit_counts_matches_scalar():
+    for digit_property in DigitAnalyzer.get_digit_properties():
+        expected = [DigitAnalyzer.get_digit_count(x, digit_property) for x in test_numbers]
+        assert expected == DigitAnalyzer.get_digit_counts(test_numbers, digit_property).tolist()
\ No newline at end of file
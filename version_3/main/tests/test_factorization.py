@@ -0,0 +1,202 @@
+import pytest
+from main.resources.infrastructure.factorization import SieveFactorizer, PollardRhoFactorizer, AdaptiveFactorizer
+
+
+
+### SieveFactorizer Object Tests
+
+@pytest.fixture
+def sieve():
+    return SieveFactorizer()
+
+@pytest.fixture
+def small_sieve():
+    return SieveFactorizer(upper_bound=1000)
+
+
+# Test set_upper_bound method
+def test_set_upper_bound_minimum_limit(sieve):
+    sieve.set_upper_bound(10)
+    assert 1000 == sieve.get_limit()
+
+def test_set_upper_bound_larger_range(sieve):
+    sieve.set_upper_bound(5000)
+    assert 5000 == sieve.get_limit()
+
+def test_set_upper_bound_negative_range(sieve):
+    sieve.set_upper_bound(-2000)
+    assert 2000 == sieve.get_limit()
+
+def test_set_upper_bound_does_not_shrink(sieve):
+    sieve.set_upper_bound(5000)
+    sieve.get_limit()
+    sieve.set_upper_bound(100)
+    assert 5000 == sieve.get_limit()
+
+def test_set_upper_bound_capped(sieve):
+    sieve.set_upper_bound(10**9)
+    assert SieveFactorizer._max_limit == sieve.get_limit()
+
+def test_set_upper_bound_no_arguments_raises_error(sieve):
+    with pytest.raises(TypeError):
+        sieve.set_upper_bound()
+
+
+# Test factorize method
+def test_factorize_prime(sieve):
+    assert [(13, 1)] == sieve.factorize(13)
+
+def test_factorize_repeats(sieve):
+    assert [(2, 3), (3, 2)] == sieve.factorize(72)
+
+def test_factorize_one(sieve):
+    assert [] == sieve.factorize(1)
+
+def test_factorize_zero(sieve):
+    assert [] == sieve.factorize(0)
+
+def test_factorize_negative(sieve):
+    assert [] == sieve.factorize(-12)
+
+def test_factorize_above_sieve_limit(small_sieve):
+    assert [(7, 1), (1009, 2)] == small_sieve.factorize(7 * 1009**2)
+
+def test_factorize_above_sieve_limit_squared(small_sieve):
+    assert [(1000003, 1), (1000033, 1)] == small_sieve.factorize(1000003 * 1000033)
+
+def test_factorize_returns_python_ints(sieve):
+    assert all([type(prime) == int for prime, exponent in sieve.factorize(360)])
+
+
+# Test get_factors method
+def test_get_factors_matches_linear_scan(sieve):
+    for x in range(1, 1001):
+        assert [i for i in range(1, x + 1) if x % i == 0] == sieve.get_factors(x)
+
+def test_get_factors_large_number(sieve):
+    assert [1, 2, 4, 5, 10, 20, 25, 50, 100] == sieve.get_factors(100)
+
+def test_get_factors_zero(sieve):
+    assert [] == sieve.get_factors(0)
+
+
+# Test get_prime_factors method
+def test_get_prime_factors_repeats(sieve):
+    assert [2, 3] == sieve.get_prime_factors(72)
+
+def test_get_prime_factors_one(sieve):
+    assert [] == sieve.get_prime_factors(1)
+
+
+# Test get_factor_count method
+def test_get_factor_count_highly_composite(sieve):
+    assert 32 == sieve.get_factor_count(840)
+
+def test_get_factor_count_one(sieve):
+    assert 1 == sieve.get_factor_count(1)
+
+def test_get_factor_count_zero(sieve):
+    assert 0 == sieve.get_factor_count(0)
+
+
+# Test is_prime method
+def test_is_prime_yes(sieve):
+    assert True == sieve.is_prime(997)
+
+def test_is_prime_no(sieve):
+    assert False == sieve.is_prime(999)
+
+def test_is_prime_two(sieve):
+    assert True == sieve.is_prime(2)
+
+def test_is_prime_one(sieve):
+    assert False == sieve.is_prime(1)
+
+def test_is_prime_above_sieve_limit(small_sieve):
+    assert True == small_sieve.is_prime(1000003)
+
+
+
+### PollardRhoFactorizer Object Tests
+
+@pytest.fixture
+def rho():
+    return PollardRhoFactorizer()
+
+
+# Test factorize method
+def test_rho_factorize_matches_sieve(rho, sieve):
+    for x in range(-5, 5001):
+        assert sieve.factorize(x) == rho.factorize(x)
+
+def test_rho_factorize_semiprime(rho):
+    assert [(4294967279, 1), (4294967291, 1)] == rho.factorize(4294967279 * 4294967291)
+
+def test_rho_factorize_prime_square(rho):
+    assert [(3, 1), (4294967291, 2)] == rho.factorize(3 * 4294967291**2)
+
+def test_rho_factorize_prime_cube(rho):
+    assert [(1000003, 3)] == rho.factorize(1000003**3)
+
+def test_rho_factorize_largest_64_bit(rho):
+    assert [(3, 1), (5, 1), (17, 1), (257, 1), (641, 1), (65537, 1), (6700417, 1)] == rho.factorize(2**64 - 1)
+
+def test_rho_factorize_returns_python_ints(rho):
+    assert all([type(prime) == int for prime, exponent in rho.factorize(963761198400)])
+
+
+# Test is_prime method
+def test_rho_is_prime_matches_sieve(rho, sieve):
+    for x in range(-5, 5001):
+        assert sieve.is_prime(x) == rho.is_prime(x)
+
+def test_rho_is_prime_largest_64_bit_prime(rho):
+    assert True == rho.is_prime(18446744073709551557)
+
+def test_rho_is_prime_mersenne(rho):
+    assert True == rho.is_prime(2**61 - 1)
+
+def test_rho_is_prime_strong_pseudoprime(rho):
+    assert False == rho.is_prime(3215031751)
+
+def test_rho_is_prime_carmichael(rho):
+    assert False == rho.is_prime(561)
+
+
+# Test get_factors method
+def test_rho_get_factors_large_number(rho):
+    assert [1, 999983, 999983**2] == rho.get_factors(999983**2)
+
+
+
+### AdaptiveFactorizer Object Tests
+
+@pytest.fixture
+def adaptive():
+    return AdaptiveFactorizer(upper_bound=1000)
+
+
+# Test factorize method
+def test_adaptive_factorize_within_sieve(adaptive):
+    assert [(2, 3), (3, 2)] == adaptive.factorize(72)
+
+def test_adaptive_factorize_beyond_sieve(adaptive):
+    assert [(1000003, 1), (1000033, 1)] == adaptive.factorize(1000003 * 1000033)
+
+def test_adaptive_factorize_uses_sieve(adaptive):
+    assert adaptive._sieve is adaptive._get_factorizer(1000)
+
+def test_adaptive_factorize_uses_pollard_rho(adaptive):
+    assert adaptive._large is adaptive._get_factorizer(1001)
+
+
+# Test is_prime method
+def test_adaptive_is_prime_64_bit(adaptive):
+    assert True == adaptive.is_prime(18446744073709551557)
+
+
+# Test set_upper_bound method
+def test_adaptive_set_upper_bound(adaptive):
+    adaptive.set_upper_bound(5000)
+    assert 5000 == adaptive.get_limit()
+    assert 5001 == len(adaptive.get_smallest_prime_factors())
\ No newline at end of file
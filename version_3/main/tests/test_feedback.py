@@ -56,6 +56,31 @@ def guess_feedback_copy_two_hints(sqlite_db_fake, test_db_path):
     games._games = []
 
 
+@pytest.fixture
+def guess_feedback_copy_hint_record(guess_feedback_copy_two_hints):
+    hints = guess_feedback_copy_two_hints._objects.get_object("hints")
+    hints._last_hint = hints.get_concepts(2).generate_hints(check_db=False, filter_results=False)[0]
+    guess_feedback = GuessFeedback(objects_fake_global_game_level, guess_feedback_copy_two_hints._feedback, 2)
+    
+    yield guess_feedback
+    
+    hints._last_hint = None
+
+
+# Test _get_last_hint method
+def test_get_last_hint_db(guess_feedback_copy_two_hints):
+    expected_last_hint = ("multiple", "Nice try!  Hint: 3 is a multiple.")
+    assert expected_last_hint == guess_feedback_copy_two_hints._get_last_hint()
+
+def test_get_last_hint_hint_record(guess_feedback_copy_hint_record):
+    hints = guess_feedback_copy_hint_record._objects.get_object("hints")
+    assert (hints.get_last_hint().get_type(), hints.get_last_hint()) == guess_feedback_copy_hint_record._get_last_hint()
+
+def test_get_last_hint_too_many_arguments_raises_error(guess_feedback_copy_one_hint):
+    with pytest.raises(TypeError):
+        guess_feedback_copy_one_hint._get_last_hint("extra")
+
+
 # Test _generate_guess_feedback method
 def test_generate_guess_feedback_good_one_hint(guess_feedback_copy_one_hint):
     hints = guess_feedback_copy_one_hint._objects.get_object("hints")
@@ -68,6 +93,11 @@ def test_generate_guess_feedback_bad_two_hints(guess_feedback_copy_two_hints):
     guess_concepts = hints.get_concepts(guess_feedback_copy_two_hints._guess)
     assert (2, "bad") == guess_feedback_copy_two_hints._generate_guess_feedback(guess_concepts)
 
+def test_generate_guess_feedback_good_hint_record(guess_feedback_copy_hint_record):
+    hints = guess_feedback_copy_hint_record._objects.get_object("hints")
+    guess_concepts = hints.get_concepts(guess_feedback_copy_hint_record._guess)
+    assert (1, "good") == guess_feedback_copy_hint_record._generate_guess_feedback(guess_concepts)
+
 def test_generate_guess_feedback_no_arguments_raises_error(guess_feedback_copy_one_hint):
     with pytest.raises(TypeError):
         guess_feedback_copy_one_hint._generate_guess_feedback()
@@ -271,11 +301,15 @@ def test_get_feedback_too_many_arguments_raises_error(game_feedback_copy):
 
 @pytest.fixture
 def feedback_manager_copy(sqlite_db_fake, test_db_path):
-    for table in ["game", "guess"]:
+    for table in ["game", "guess", "outcome"]:
         sqlite_db_fake.run_query(f"DELETE FROM {table};", _db_path=test_db_path)
     games = objects_fake_global_game_level.get_object("games")
     games.add_game()
     games._current_game._outcome = "lose"
+    data = objects_fake_global_game_level.get_object("data")
+    outcome_obj = data.get_sub_data_object("outcomes", "lose")
+    session = objects_fake_global_game_level.get_object("session")
+    session.update_database("outcome", {"entry_type": "New", "outcome_obj": outcome_obj})
     feedback_manager = objects_fake_global_game_level.create_object(
         FeedbackManager, "feedback", FeedbackManager, objects_fake_global_game_level)
     
@@ -298,6 +332,7 @@ def test_get_guess_feedback_good_one_hint_correct_return_value(feedback_manager_
         insert_query = f"""INSERT INTO guess(game_id, session_id, hint_type_id, hint)
                            VALUES(1, 1, 2, '{multiple_hint}');"""
         sqlite_db_fake.run_query(insert_query, _db_path=test_db_path)
+    feedback_manager_copy._session.current_hint_count = 1
     
     hints = feedback_manager_copy._objects.get_object("hints")
     guess_concepts = hints.get_concepts(2)
@@ -310,6 +345,7 @@ def test_get_guess_feedback_good_one_hint_df_updated(feedback_manager_copy, sqli
         insert_query = f"""INSERT INTO guess(game_id, session_id, hint_type_id, hint)
                            VALUES(1, 1, 2, '{multiple_hint}');"""
         sqlite_db_fake.run_query(insert_query, _db_path=test_db_path)
+    feedback_manager_copy._session.current_hint_count = 1
     
     hints = feedback_manager_copy._objects.get_object("hints")
     guess_concepts = hints.get_concepts(2)
@@ -323,6 +359,7 @@ def test_get_guess_feedback_bad_two_hints_correct_return_value(feedback_manager_
         insert_query = f"""INSERT INTO guess(game_id, session_id, hint_type_id, hint)
                            VALUES(1, 1, 2, '{multiple_hint}');"""
         sqlite_db_fake.run_query(insert_query, _db_path=test_db_path)
+    feedback_manager_copy._session.current_hint_count = 2
     
     hints = feedback_manager_copy._objects.get_object("hints")
     guess_concepts = hints.get_concepts(2)
@@ -335,6 +372,7 @@ def test_get_feedback_bad_two_hints_df_updated(feedback_manager_copy, sqlite_db_
         insert_query = f"""INSERT INTO guess(game_id, session_id, hint_type_id, hint)
                            VALUES(1, 1, 2, '{multiple_hint}');"""
         sqlite_db_fake.run_query(insert_query, _db_path=test_db_path)
+    feedback_manager_copy._session.current_hint_count = 2
     
     hints = feedback_manager_copy._objects.get_object("hints")
     guess_concepts = hints.get_concepts(2)
@@ -66,11 +66,10 @@ def test_add_guess_incorrect_hints_remaining_db(game_fake, sqlite_db_fake, test_
     insert_query = f"""INSERT INTO guess(game_id, session_id, hint_type_id, hint)
                        VALUES(1, 1, 4, 'Nice try!  Hint: It is an odd number.');"""
     sqlite_db_fake.run_query(insert_query, _db_path=test_db_path)
+    game_fake._objects.get_object("session").current_hint_count = 1
     game_fake._stats._score.value = 20
     game_fake._stats._guesses_remaining.value = 2
-    game_fake._hints._relevant_hints = []
-    game_fake._hints._redundant_hints = incorrect_guess_hints.copy()
-    game_fake._hints._hint_pool = game_fake._hints._relevant_hints + game_fake._hints._redundant_hints
+    game_fake._hints._load_hints([], incorrect_guess_hints)
     winning_number = game_fake._settings.get_setting("winning number")
     guess = "3" if int(winning_number) != 3 else "5"
     game_fake._text_display.display_text("dynamic", "guess", guess)
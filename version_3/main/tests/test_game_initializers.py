@@ -2,6 +2,7 @@ import pytest
 from main.tests.test_db import sqlite_db_fake, test_db_path
 from main.tests.tests_setup import objects_fake_global_dict, ObjectManagerFake, GameSettings
 from main.tests.test_data import data_copy, errors
+from main.tests.test_hint_manager import get_misplaced_hints
 from main.game.game_initializers import *
 
 
@@ -35,7 +36,7 @@ def test_process_game_entry_hints_more_than_two_hints(valid_selection_copy):
 
 def test_process_game_entry_hints_relevant_hints_matches_hint_pool(valid_selection_copy):
     valid_selection_copy.process_game_entry()
-    assert valid_selection_copy._hints._relevant_hints == valid_selection_copy._hints._hint_pool
+    assert [] == get_misplaced_hints(valid_selection_copy._hints)
 
 def test_process_game_entry_too_many_arguments_raises_error(valid_selection_copy):
     with pytest.raises(TypeError):
@@ -138,7 +139,7 @@ def test_initialize_game_custom_valid_hints_relevant_hints_matches_hint_pool(gam
     game_initializer_copy.initialize_game()
     
     hints = game_initializer_copy._objects.get_object("hints")
-    assert hints._relevant_hints == hints._hint_pool
+    assert [] == get_misplaced_hints(hints)
 
 def test_initialize_game_custom_error_comparison_display(game_initializer_copy):
     game_initializer_copy._text_display._variables.display_variable_text("low_range", "5")
@@ -214,7 +215,7 @@ def test_initialize_game_easy_hints_relevant_hints_matches_hint_pool(game_initia
     game_initializer_copy.initialize_game()
     
     hints = game_initializer_copy._objects.get_object("hints")
-    assert hints._relevant_hints == hints._hint_pool
+    assert [] == get_misplaced_hints(hints)
 
 def test_initialize_game_medium_db(game_initializer_copy_medium, sqlite_db_fake, test_db_path):
     sqlite_db_fake.run_query("DELETE FROM session;", _db_path=test_db_path)
@@ -250,7 +251,7 @@ def test_initialize_game_medium_hints_relevant_hints_matches_hint_pool(game_init
     game_initializer_copy_medium.initialize_game()
     
     hints = game_initializer_copy_medium._objects.get_object("hints")
-    assert hints._relevant_hints == hints._hint_pool
+    assert [] == get_misplaced_hints(hints)
 
 def test_initialize_game_hard_db(game_initializer_copy_hard, sqlite_db_fake, test_db_path):
     sqlite_db_fake.run_query("DELETE FROM session;", _db_path=test_db_path)
@@ -286,7 +287,7 @@ def test_initialize_game_hard_hints_relevant_hints_matches_hint_pool(game_initia
     game_initializer_copy_hard.initialize_game()
     
     hints = game_initializer_copy_hard._objects.get_object("hints")
-    assert hints._relevant_hints == hints._hint_pool
+    assert [] == get_misplaced_hints(hints)
 
 def test_initialize_game_too_many_arguments_raises_error(game_initializer_copy):
     with pytest.raises(TypeError):
@@ -27,6 +27,12 @@ def settings_hard(numbers, level_types):
     yield settings_hard
     settings_hard._settings.clear()
 
+@pytest.fixture
+def settings_expert(numbers, level_types):
+    settings_expert = GameSettings(numbers, level_types.get_level_obj("expert"))
+    yield settings_expert
+    settings_expert._settings.clear()
+
 @pytest.fixture
 def settings_custom(numbers, level_types):
     settings_custom = GameSettings(numbers, level_types.get_level_obj("custom"))
@@ -121,6 +127,14 @@ def test_add_level_to_settings_dict_hard_penalty(settings_custom):
     settings_custom._add_level_to_settings_dict()
     assert 10 == settings_custom.get_setting("penalty")
 
+def test_add_level_to_settings_dict_expert_id(settings_expert):
+    settings_expert._add_level_to_settings_dict()
+    assert 5 == settings_expert.get_setting("level of difficulty id")
+
+def test_add_level_to_settings_dict_expert_number_range(settings_expert):
+    settings_expert._add_level_to_settings_dict()
+    assert (1, 10**12) == settings_expert.get_setting("number range")
+
 def test_add_level_to_settings_dict_too_many_arguments_raises_error(settings_easy):
     with pytest.raises(TypeError):
         settings_easy._add_level_to_settings_dict("extra")
@@ -213,6 +227,14 @@ def test_set_winning_number_hard_in_range(winning_number_hard):
 def test_set_winning_number_hard_matches_dict(settings_hard, winning_number_hard):
     assert winning_number_hard == settings_hard.get_setting("winning number")
 
+@pytest.fixture
+def winning_number_expert(settings_expert):
+    settings_expert._set_winning_number()
+    return settings_expert._winning_number
+
+def test_set_winning_number_expert_in_range(winning_number_expert):
+    assert 1 <= winning_number_expert <= 10**12
+
 @pytest.fixture
 def winning_number_custom(settings_custom):
     settings_custom._set_range("1", "5")
@@ -225,6 +247,13 @@ def test_set_winning_number_custom_in_range(winning_number_custom):
 def test_set_winning_number_custom_matches_dict(settings_custom, winning_number_custom):
     assert winning_number_custom == settings_custom.get_setting("winning number")
 
+def test_set_winning_number_stores_seed(settings_easy, winning_number_easy):
+    assert settings_easy._numbers.get_random_seed() == settings_easy.get_setting("seed")
+
+def test_set_winning_number_replays_from_seed(settings_hard, winning_number_hard):
+    settings_hard._numbers.set_random_seed(settings_hard.get_setting("seed"))
+    assert winning_number_hard == settings_hard._numbers.get_random_numbers((1, 1001), n=1)
+
 def test_set_winning_number_too_many_arguments_raises_error(settings_easy):
     with pytest.raises(TypeError):
         settings_easy._set_winning_number("extra")
@@ -2,6 +2,7 @@ import pytest
 from main.tests.test_db import sqlite_db_fake, test_db_path
 from main.tests.tests_setup import objects_fake_global_dict
 from main.game.game_summarizers import *
+from main.app_data.data_storers.db_writer import WriteBehindWriter
 import pandas as pd
 
 
@@ -207,6 +208,17 @@ def test_run_game_summary_win_db(win_game_summarizer_copy, sqlite_db_fake, test_
     db_entry = sqlite_db_fake.run_query(outcome_table_query, fetch="all", _db_path=test_db_path)
     assert [(1, 1, 1, 1, 80, "improvement", 2, 0)] == db_entry
 
+def test_run_game_summary_win_write_behind_feedback_written(win_game_summarizer_copy, monkeypatch, sqlite_db_fake,
+                                                            test_db_path):
+    session = win_game_summarizer_copy._session
+    writer = WriteBehindWriter(session.get_database(), test_db_path)
+    monkeypatch.setattr(session, "_writer", writer)
+    win_game_summarizer_copy.run_game_summary()
+    pending_count = writer.get_pending_count()
+    feedback_type = sqlite_db_fake.run_query("SELECT feedback_type FROM outcome;", fetch="all", _db_path=test_db_path)
+    writer.close()
+    assert (0, [("improvement",)]) == (pending_count, feedback_type)
+
 def test_run_game_summary_win_end_game_message(win_game_summarizer_copy):
     win_game_summarizer_copy.run_game_summary()
     expected_text = "That's correct! Congratulations! You are a winner!!!\n\nYour Score: 80\n\n\nThanks for playing! Please come back soon."
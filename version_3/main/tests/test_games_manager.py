@@ -42,12 +42,11 @@ def test_add_guess_to_current_game_incorrect_hints_remaining_db(games_manager_co
     insert_query = f"""INSERT INTO guess(game_id, session_id, hint_type_id, hint)
                        VALUES(1, 1, 4, 'Nice try!  Hint: It is an odd number.');"""
     sqlite_db_fake.run_query(insert_query, _db_path=test_db_path)
+    games_manager_copy._objects.get_object("session").current_hint_count = 1
     game = games_manager_copy._current_game
     game._stats._score.value = 20
     game._stats._guesses_remaining.value = 2
-    game._hints._relevant_hints = []
-    game._hints._redundant_hints = incorrect_guess_hints.copy()
-    game._hints._hint_pool = game._hints._relevant_hints + game._hints._redundant_hints
+    game._hints._load_hints([], incorrect_guess_hints)
     winning_number = game._settings.get_setting("winning number")
     guess = "3" if int(winning_number) != 3 else "5"
     game._text_display.display_text("dynamic", "guess", guess)
@@ -3,6 +3,7 @@ from main.tests.test_db import sqlite_db_fake, test_db_path
 from main.tests.tests_setup import objects_fake_global_dict, GameSettings, ObjectManagerFake
 from main.game.guess import *
 from main.tests.test_data_storers import prime_hint
+from concepts.concept_registry import ConceptRegistry
 
 
 
@@ -193,7 +194,9 @@ def test_update_game_state_too_many_arguments_raises_error(guess_copy):
 
 @pytest.fixture
 def guess_manager_copy():
-    return GuessManager(objects_fake_global_dict["easy"])
+    guess_manager = GuessManager(objects_fake_global_dict["easy"])
+    guess_manager._hints._last_hint = None
+    return guess_manager
 
 @pytest.fixture
 def invalid_guess_copy_non_integer(guess_manager_copy):
@@ -322,7 +325,9 @@ def incorrect_guess_copy(guess_manager_copy):
     guess = 3 if int(winning_number) != 3 else 5
     return IncorrectGuess(guess, guess_manager_copy._objects)
 
-incorrect_guess_hints = [prime_hint]
+registry = ConceptRegistry.get_registry(objects_fake_global_dict["easy"].get_object("numbers"),
+                                       objects_fake_global_dict["easy"].get_object("data"))
+incorrect_guess_hints = [registry.parse_hint("prime", prime_hint)]
 
 
 # Test process_guess method
@@ -355,11 +360,10 @@ def test_process_guess_incorrect_no_more_hints_db(incorrect_guess_copy, sqlite_d
     insert_query = f"""INSERT INTO guess(game_id, session_id, hint_type_id, hint)
                        VALUES(1, 1, 4, 'Nice try!  Hint: It is an odd number.');"""
     sqlite_db_fake.run_query(insert_query, _db_path=test_db_path)
+    incorrect_guess_copy._session.current_hint_count = 1
     incorrect_guess_copy._stats._score.value = 20
     incorrect_guess_copy._stats._guesses_remaining.value = 2
-    incorrect_guess_copy._hints._relevant_hints = []
-    incorrect_guess_copy._hints._redundant_hints = []
-    incorrect_guess_copy._hints._hint_pool = incorrect_guess_copy._hints._relevant_hints + incorrect_guess_copy._hints._redundant_hints
+    incorrect_guess_copy._hints._load_hints([])
     
     incorrect_guess_copy.process_guess()
     
@@ -383,9 +387,7 @@ def test_process_guess_incorrect_no_more_hints_screen_text_status(incorrect_gues
     sqlite_db_fake.run_query(insert_query, _db_path=test_db_path)
     incorrect_guess_copy._stats._score.value = 20
     incorrect_guess_copy._stats._guesses_remaining.value = 2
-    incorrect_guess_copy._hints._relevant_hints = []
-    incorrect_guess_copy._hints._redundant_hints = []
-    incorrect_guess_copy._hints._hint_pool = incorrect_guess_copy._hints._relevant_hints + incorrect_guess_copy._hints._redundant_hints
+    incorrect_guess_copy._hints._load_hints([])
     
     incorrect_guess_copy.process_guess()
     
@@ -402,9 +404,7 @@ def test_process_guess_incorrect_no_more_hints_screen_text_hint(incorrect_guess_
     sqlite_db_fake.run_query(insert_query, _db_path=test_db_path)
     incorrect_guess_copy._stats._score.value = 20
     incorrect_guess_copy._stats._guesses_remaining.value = 2
-    incorrect_guess_copy._hints._relevant_hints = []
-    incorrect_guess_copy._hints._redundant_hints = []
-    incorrect_guess_copy._hints._hint_pool = incorrect_guess_copy._hints._relevant_hints + incorrect_guess_copy._hints._redundant_hints
+    incorrect_guess_copy._hints._load_hints([])
     
     incorrect_guess_copy.process_guess()
     
@@ -422,9 +422,7 @@ def test_process_guess_incorrect_no_more_hints_stats_score(incorrect_guess_copy,
     sqlite_db_fake.run_query(insert_query, _db_path=test_db_path)
     incorrect_guess_copy._stats._score.value = 20
     incorrect_guess_copy._stats._guesses_remaining.value = 2
-    incorrect_guess_copy._hints._relevant_hints = []
-    incorrect_guess_copy._hints._redundant_hints = []
-    incorrect_guess_copy._hints._hint_pool = incorrect_guess_copy._hints._relevant_hints + incorrect_guess_copy._hints._redundant_hints
+    incorrect_guess_copy._hints._load_hints([])
     
     incorrect_guess_copy.process_guess()
     
@@ -441,9 +439,7 @@ def test_process_guess_incorrect_no_more_hints_stats_guesses_remaining(incorrect
     sqlite_db_fake.run_query(insert_query, _db_path=test_db_path)
     incorrect_guess_copy._stats._score.value = 20
     incorrect_guess_copy._stats._guesses_remaining.value = 2
-    incorrect_guess_copy._hints._relevant_hints = []
-    incorrect_guess_copy._hints._redundant_hints = []
-    incorrect_guess_copy._hints._hint_pool = incorrect_guess_copy._hints._relevant_hints + incorrect_guess_copy._hints._redundant_hints
+    incorrect_guess_copy._hints._load_hints([])
     
     incorrect_guess_copy.process_guess()
     
@@ -458,11 +454,10 @@ def test_process_guess_incorrect_hints_remaining_db(incorrect_guess_copy, sqlite
     insert_query = f"""INSERT INTO guess(game_id, session_id, hint_type_id, hint)
                        VALUES(1, 1, 4, 'Nice try!  Hint: It is an odd number.');"""
     sqlite_db_fake.run_query(insert_query, _db_path=test_db_path)
+    incorrect_guess_copy._session.current_hint_count = 1
     incorrect_guess_copy._stats._score.value = 20
     incorrect_guess_copy._stats._guesses_remaining.value = 2
-    incorrect_guess_copy._hints._relevant_hints = []
-    incorrect_guess_copy._hints._redundant_hints = incorrect_guess_hints.copy()
-    incorrect_guess_copy._hints._hint_pool = incorrect_guess_copy._hints._relevant_hints + incorrect_guess_copy._hints._redundant_hints
+    incorrect_guess_copy._hints._load_hints([], incorrect_guess_hints)
     
     incorrect_guess_copy.process_guess()
     
@@ -486,9 +481,7 @@ def test_process_guess_incorrect_hints_remaining_screen_text_status(incorrect_gu
     sqlite_db_fake.run_query(insert_query, _db_path=test_db_path)
     incorrect_guess_copy._stats._score.value = 20
     incorrect_guess_copy._stats._guesses_remaining.value = 2
-    incorrect_guess_copy._hints._relevant_hints = []
-    incorrect_guess_copy._hints._redundant_hints = incorrect_guess_hints.copy()
-    incorrect_guess_copy._hints._hint_pool = incorrect_guess_copy._hints._relevant_hints + incorrect_guess_copy._hints._redundant_hints
+    incorrect_guess_copy._hints._load_hints([], incorrect_guess_hints)
     
     incorrect_guess_copy.process_guess()
     
@@ -505,9 +498,7 @@ def test_process_guess_incorrect_hints_remaining_screen_text_hint(incorrect_gues
     sqlite_db_fake.run_query(insert_query, _db_path=test_db_path)
     incorrect_guess_copy._stats._score.value = 20
     incorrect_guess_copy._stats._guesses_remaining.value = 2
-    incorrect_guess_copy._hints._relevant_hints = []
-    incorrect_guess_copy._hints._redundant_hints = incorrect_guess_hints.copy()
-    incorrect_guess_copy._hints._hint_pool = incorrect_guess_copy._hints._relevant_hints + incorrect_guess_copy._hints._redundant_hints
+    incorrect_guess_copy._hints._load_hints([], incorrect_guess_hints)
     
     incorrect_guess_copy.process_guess()
     
@@ -524,9 +515,7 @@ def test_process_guess_incorrect_hints_remaining_stats_score(incorrect_guess_cop
     sqlite_db_fake.run_query(insert_query, _db_path=test_db_path)
     incorrect_guess_copy._stats._score.value = 20
     incorrect_guess_copy._stats._guesses_remaining.value = 2
-    incorrect_guess_copy._hints._relevant_hints = []
-    incorrect_guess_copy._hints._redundant_hints = incorrect_guess_hints.copy()
-    incorrect_guess_copy._hints._hint_pool = incorrect_guess_copy._hints._relevant_hints + incorrect_guess_copy._hints._redundant_hints
+    incorrect_guess_copy._hints._load_hints([], incorrect_guess_hints)
     
     incorrect_guess_copy.process_guess()
     
@@ -543,9 +532,7 @@ def test_process_guess_incorrect_hints_remaining_stats_guesses_remaining(incorre
     sqlite_db_fake.run_query(insert_query, _db_path=test_db_path)
     incorrect_guess_copy._stats._score.value = 20
     incorrect_guess_copy._stats._guesses_remaining.value = 2
-    incorrect_guess_copy._hints._relevant_hints = []
-    incorrect_guess_copy._hints._redundant_hints = incorrect_guess_hints.copy()
-    incorrect_guess_copy._hints._hint_pool = incorrect_guess_copy._hints._relevant_hints + incorrect_guess_copy._hints._redundant_hints
+    incorrect_guess_copy._hints._load_hints([], incorrect_guess_hints)
     
     incorrect_guess_copy.process_guess()
     
@@ -657,12 +644,11 @@ def test_process_guess_manager_incorrect_no_more_hints_db(guess_manager_copy, sq
     insert_query = f"""INSERT INTO guess(game_id, session_id, hint_type_id, hint)
                        VALUES(1, 1, 4, 'Nice try!  Hint: It is an odd number.');"""
     sqlite_db_fake.run_query(insert_query, _db_path=test_db_path)
+    session.current_hint_count = 1
     stats = guess_manager_copy._objects.get_object("stats")
     stats._score.value = 20
     stats._guesses_remaining.value = 2
-    guess_manager_copy._hints._relevant_hints = []
-    guess_manager_copy._hints._redundant_hints = []
-    guess_manager_copy._hints._hint_pool = guess_manager_copy._hints._relevant_hints + guess_manager_copy._hints._redundant_hints
+    guess_manager_copy._hints._load_hints([])
     winning_number = guess_manager_copy._settings.get_setting("winning number")
     guess = "3" if int(winning_number) != 3 else "5"
     
@@ -684,12 +670,11 @@ def test_process_guess_manager_incorrect_hints_remaining_db(guess_manager_copy,
     insert_query = f"""INSERT INTO guess(game_id, session_id, hint_type_id, hint)
                        VALUES(1, 1, 4, 'Nice try!  Hint: It is an odd number.');"""
     sqlite_db_fake.run_query(insert_query, _db_path=test_db_path)
+    session.current_hint_count = 1
     stats = guess_manager_copy._objects.get_object("stats")
     stats._score.value = 20
     stats._guesses_remaining.value = 2
-    guess_manager_copy._hints._relevant_hints = []
-    guess_manager_copy._hints._redundant_hints = incorrect_guess_hints.copy()
-    guess_manager_copy._hints._hint_pool = guess_manager_copy._hints._relevant_hints + guess_manager_copy._hints._redundant_hints
+    guess_manager_copy._hints._load_hints([], incorrect_guess_hints)
     winning_number = guess_manager_copy._settings.get_setting("winning number")
     guess = "3" if int(winning_number) != 3 else "5"
     
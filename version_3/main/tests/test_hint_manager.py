@@ -1,7 +1,9 @@
 import pytest
 from main.tests.tests_setup import objects_fake_global_dict, ObjectManagerFake, GameSettings
-from main.tests.test_db import sqlite_db_fake, test_db_path
+from main.tests.test_db import sqlite_db_fake, test_db_path, db_manager_fake
+from main.app_data.db import PopulateHintsDBScriptor
 from main.game.hint_manager import *
+from concepts.concept_registry import ConceptRegistry
 from resources.variables.create_db_queries import non_type_tables
 
 
@@ -11,6 +13,26 @@ from resources.variables.create_db_queries import non_type_tables
 objects_fake_global = objects_fake_global_dict["easy"]
 numbers = objects_fake_global.get_object("numbers")
 data = objects_fake_global.get_object("data")
+registry = ConceptRegistry.get_registry(numbers, data)
+
+
+def get_hint_records(hints):
+    return [registry.parse_hint(hint_type, hint) for hint_type, hint in hints]
+
+def render_hints(hints):
+    return [hint.render() for hint in hints]
+
+def get_misplaced_hints(hints):
+    # At the start of a game, a hint is redundant if every hint that implies it was pulled with it, or if it does not
+    # rule out any numbers.  Every other hint is relevant.
+    graph = hints._implication_graph
+    implied_hints = {hint for hint, implying_hints in graph.items()
+                     if all(implying_hint in hints._hint_pool for implying_hint in implying_hints)}
+    misplaced_hints = [hint for hint in hints._relevant_hints if hint in implied_hints]
+    misplaced_hints += [hint for hint in hints._redundant_hints if hint in graph and hint not in implied_hints]
+    misplaced_hints += [hint for hint in hints._redundant_hints
+                        if hint not in graph and hints._get_candidates().narrows(hint)]
+    return misplaced_hints
 
 
 def test_settings_version_beginning():
@@ -26,8 +48,7 @@ def hints_fake(sqlite_db_fake, test_db_path):
         sqlite_db_fake.run_query(f"DELETE FROM {table};", _db_path=test_db_path)
     hints_fake = HintManager(objects_fake_global)
     yield hints_fake
-    for hints in [hints_fake._hint_pool, hints_fake._relevant_hints, hints_fake._redundant_hints, hints_fake._hints_given]:
-        hints.clear()
+    hints_fake._load_hints([])
     for table in non_type_tables:
         sqlite_db_fake.run_query(f"DELETE FROM {table};", _db_path=test_db_path)
 
@@ -35,17 +56,51 @@ def hints_fake(sqlite_db_fake, test_db_path):
 def test_settings_version(hints_fake):
     assert "easy" == hints_fake._settings.get_setting("level of difficulty name")
 
-# Test _update_hint_pool method
-def test_update_hint_pool(hints_fake):
-    hints_fake._hint_pool = []
-    hints_fake._relevant_hints = ["relevant hint"]
-    hints_fake._redundant_hints = ["redundant hint"]
-    hints_fake._update_hint_pool()
-    assert ["relevant hint", "redundant hint"] == hints_fake._hint_pool
+# Test _load_hints method
+def test_load_hints_relevant(hints_fake):
+    hints_fake._load_hints(["relevant hint"], ["redundant hint"])
+    assert ["relevant hint"] == list(hints_fake._relevant_hints)
+
+def test_load_hints_pool(hints_fake):
+    hints_fake._load_hints(["relevant hint"], ["redundant hint"])
+    assert ["relevant hint", "redundant hint"] == list(hints_fake._hint_pool)
+
+def test_load_hints_repeated_hints(hints_fake):
+    hints_fake._load_hints(["relevant hint", "relevant hint"])
+    assert 1 == hints_fake.get_hint_count("relevant")
+
+def test_load_hints_replaces_hints(hints_fake):
+    hints_fake._load_hints(["old hint"])
+    hints_fake._set_hint_state("old hint", "given")
+    hints_fake._load_hints(["new hint"])
+    assert (["new hint"], [], None) == (list(hints_fake._hint_pool), list(hints_fake._hints_given),
+                                        hints_fake.get_hint_state("old hint"))
+
+def test_load_hints_no_arguments_raises_error(hints_fake):
+    with pytest.raises(TypeError):
+        hints_fake._load_hints()
+
+
+# Test _set_hint_state method
+def test_set_hint_state_redundant(hints_fake):
+    hints_fake._load_hints(["hint 1", "hint 2"])
+    hints_fake._set_hint_state("hint 1", "redundant")
+    assert (["hint 2"], ["hint 1"], ["hint 1", "hint 2"]) == (list(hints_fake._relevant_hints),
+                                                              list(hints_fake._redundant_hints), list(hints_fake._hint_pool))
 
-def test_update_hint_pool_too_many_arguments_raises_error(hints_fake):
+def test_set_hint_state_given(hints_fake):
+    hints_fake._load_hints(["hint 1", "hint 2"])
+    hints_fake._set_hint_state("hint 1", "given")
+    assert (["hint 2"], ["hint 1"], ["hint 2"]) == (list(hints_fake._relevant_hints), list(hints_fake._hints_given),
+                                                    list(hints_fake._hint_pool))
+
+def test_set_hint_state_new_hint(hints_fake):
+    hints_fake._set_hint_state("hint 1", "redundant")
+    assert "redundant" == hints_fake.get_hint_state("hint 1")
+
+def test_set_hint_state_no_arguments_raises_error(hints_fake):
     with pytest.raises(TypeError):
-        hints_fake._update_hint_pool("extra")
+        hints_fake._set_hint_state()
 
 
 # Test _get_hint_from_list method
@@ -58,15 +113,14 @@ def test_get_hint_from_list_hint_in_original_list(hints_fake, test_hint_list):
     hint = hints_fake._get_hint_from_list(hint_list)
     assert hint in test_hint_list
 
-def test_get_hint_from_list_hint_not_in_updated_list(hints_fake, test_hint_list):
+def test_get_hint_from_list_list_not_changed(hints_fake, test_hint_list):
     hint_list = test_hint_list.copy()
-    hint = hints_fake._get_hint_from_list(hint_list)
-    assert hint not in hint_list
+    hints_fake._get_hint_from_list(hint_list)
+    assert test_hint_list == hint_list
 
-def test_get_hint_from_list_updated_list_has_1_fewer_items(hints_fake, test_hint_list):
-    hint_list = test_hint_list.copy()
-    hint = hints_fake._get_hint_from_list(hint_list)
-    assert len(hint_list) == len(test_hint_list) - 1
+def test_get_hint_from_list_view(hints_fake, test_hint_list):
+    hints_fake._load_hints(test_hint_list)
+    assert hints_fake._get_hint_from_list(hints_fake.get_hints("relevant")) in test_hint_list
 
 def test_get_hint_from_list_empty(hints_fake):
     with pytest.raises(ValueError):
@@ -81,21 +135,33 @@ def test_get_hint_from_list_too_many_arguments_raises_error(hints_fake, test_hin
         hints_fake._get_hint_from_list(test_hint_list, "extra")
 
 
+def test_get_hint_from_list_selection_time(hints_fake, test_hint_list):
+    hints_fake._get_hint_from_list(test_hint_list.copy())
+    assert hints_fake._selection_time >= 0
+
+def test_get_hint_from_list_information_gain(hints_fake, relevant_hints_two):
+    # Only 1 is a factor of 1, so that hint rules out the most numbers.
+    hints_fake.set_hint_policy("information gain")
+    hint = hints_fake._get_hint_from_list(relevant_hints_two.copy())
+    assert "Nice try!  Hint: 1 is a multiple." == hint.render()
+
+
 # Test _select_hint method
 def test_select_hint_relevant(hints_fake):
-    hints_fake._relevant_hints = ["relevant hint 1", "relevant hint 2"]
-    hints_fake._redundant_hints = ["redundant hint 1", "redundant hint 2"]
-    hints_fake._update_hint_pool()
+    hints_fake._load_hints(["relevant hint 1", "relevant hint 2"], ["redundant hint 1", "redundant hint 2"])
     hint = hints_fake._select_hint()
     assert hint in ["relevant hint 1", "relevant hint 2"]
 
 def test_select_hint_redundant(hints_fake):
-    hints_fake._relevant_hints = []
-    hints_fake._redundant_hints = ["redundant hint 1", "redundant hint 2"]
-    hints_fake._update_hint_pool()
+    hints_fake._load_hints([], ["redundant hint 1", "redundant hint 2"])
     hint = hints_fake._select_hint()
     assert hint in ["redundant hint 1", "redundant hint 2"]
 
+def test_select_hint_state_given(hints_fake):
+    hints_fake._load_hints(["relevant hint 1", "relevant hint 2"], ["redundant hint 1"])
+    hint = hints_fake._select_hint()
+    assert ("given", False) == (hints_fake.get_hint_state(hint), hint in hints_fake.get_hints("pool"))
+
 def test_select_hint_too_many_arguments_raises_error(hints_fake):
     with pytest.raises(TypeError):
         hints_fake._select_hint("extra")
@@ -106,144 +172,195 @@ def test_select_hint_too_many_arguments_raises_error(hints_fake):
 def mock_concepts_four():
     return ConceptManager(4, numbers, None, data)
 
-def test_get_relevant_hints_redundant_hints_added(hints_fake, mock_concepts_four):
-    hints_fake._relevant_hints = [
-        "Nice try!  Hint: It is a perfect square.",
-        "Nice try!  Hint: It is a perfect cube.",
-        "Nice try!  Hint: It is an odd number.",
-        "Nice try!  Hint: 1 is a multiple.",
-        "Nice try!  Hint: 2 is a multiple."
-        ]
-    hints_fake._redundant_hints = []
-    hints_fake._update_hint_pool()
-    hints_fake._get_relevant_hints(mock_concepts_four, _check_db=False)
-    assert "Nice try!  Hint: It is a perfect square." in hints_fake._redundant_hints
-
-def test_get_relevant_hints_relevant_hints_reduced(hints_fake, mock_concepts_four):
-    hints_fake._relevant_hints = [
-        "Nice try!  Hint: It is a perfect square.",
-        "Nice try!  Hint: It is a perfect cube.",
-        "Nice try!  Hint: It is an odd number.",
-        "Nice try!  Hint: 1 is a multiple.",
-        "Nice try!  Hint: 2 is a multiple."
-        ]
-    hints_fake._redundant_hints = []
-    hints_fake._update_hint_pool()
-    hints_fake._get_relevant_hints(mock_concepts_four, _check_db=False)
-    assert "Nice try!  Hint: It is a perfect square." not in hints_fake._relevant_hints
-
-def test_get_relevant_hints_relevant_hints_correct_length(hints_fake, mock_concepts_four):
-    hints_fake._relevant_hints = [
-        "Nice try!  Hint: It is a perfect square.",
-        "Nice try!  Hint: It is a perfect cube.",
-        "Nice try!  Hint: It is an odd number.",
-        "Nice try!  Hint: 1 is a multiple.",
-        "Nice try!  Hint: 2 is a multiple."
-        ]
-    hints_fake._redundant_hints = []
-    hints_fake._update_hint_pool()
-    hints_fake._get_relevant_hints(mock_concepts_four, _check_db=False)
+@pytest.fixture
+def relevant_hints_two():
+    return get_hint_records([
+        ("perfect_square", "Nice try!  Hint: It is a perfect square."),
+        ("perfect_cube", "Nice try!  Hint: It is a perfect cube."),
+        ("even_odd", "Nice try!  Hint: It is an odd number."),
+        ("multiple", "Nice try!  Hint: 1 is a multiple."),
+        ("multiple", "Nice try!  Hint: 2 is a multiple.")
+        ])
+
+@pytest.fixture
+def relevant_hints_four():
+    return get_hint_records([
+        ("perfect_square", "Nice try!  Hint: It is a perfect square."),
+        ("perfect_cube", "Nice try!  Hint: It is a perfect cube."),
+        ("even_odd", "Nice try!  Hint: It is an odd number."),
+        ("multiple", "Nice try!  Hint: 1 is a multiple."),
+        ("multiple", "Nice try!  Hint: 4 is a multiple.")
+        ])
+
+def test_get_relevant_hints_all_relevant_before_any_hints(hints_fake, relevant_hints_two):
+    hints_fake._load_hints(relevant_hints_two)
+    hints_fake._get_relevant_hints()
+    assert (5, 0) == (len(hints_fake._relevant_hints), len(hints_fake._redundant_hints))
+
+def test_get_relevant_hints_redundant_hints_added(hints_fake, relevant_hints_two):
+    hints_fake._load_hints(relevant_hints_two)
+    hints_fake._get_candidates().apply_hint(relevant_hints_two[0])
+    hints_fake._get_relevant_hints()
+    assert "Nice try!  Hint: It is a perfect square." in render_hints(hints_fake._redundant_hints)
+
+def test_get_relevant_hints_relevant_hints_reduced(hints_fake, relevant_hints_two):
+    hints_fake._load_hints(relevant_hints_two)
+    hints_fake._get_candidates().apply_hint(relevant_hints_two[0])
+    hints_fake._get_relevant_hints()
+    assert "Nice try!  Hint: It is a perfect square." not in render_hints(hints_fake._relevant_hints)
+
+def test_get_relevant_hints_relevant_hints_correct_length(hints_fake, relevant_hints_two):
+    hints_fake._load_hints(relevant_hints_two)
+    hints_fake._get_candidates().apply_hint(relevant_hints_two[0])
+    hints_fake._get_relevant_hints()
     assert 4 == len(hints_fake._relevant_hints)
 
-def test_get_relevant_hints_multiple_redundant_hints_added(hints_fake, mock_concepts_four):
-    hints_fake._relevant_hints = [
-        "Nice try!  Hint: It is a perfect square.",
-        "Nice try!  Hint: It is a perfect cube.",
-        "Nice try!  Hint: It is an odd number.",
-        "Nice try!  Hint: 1 is a multiple.",
-        "Nice try!  Hint: 4 is a multiple."
-        ]
-    hints_fake._redundant_hints = []
-    hints_fake._update_hint_pool()
-    hints_fake._get_relevant_hints(mock_concepts_four, _check_db=False)
-    assert "Nice try!  Hint: It is a perfect square." in hints_fake._redundant_hints
-    assert "Nice try!  Hint: 4 is a multiple." in hints_fake._redundant_hints
-
-def test_get_relevant_hints_multiple_relevant_hints_reduced(hints_fake, mock_concepts_four):
-    hints_fake._relevant_hints = [
-        "Nice try!  Hint: It is a perfect square.",
-        "Nice try!  Hint: It is a perfect cube.",
-        "Nice try!  Hint: It is an odd number.",
-        "Nice try!  Hint: 1 is a multiple.",
-        "Nice try!  Hint: 4 is a multiple."
-        ]
-    hints_fake._redundant_hints = []
-    hints_fake._update_hint_pool()
-    hints_fake._get_relevant_hints(mock_concepts_four, _check_db=False)
-    assert "Nice try!  Hint: It is a perfect square." not in hints_fake._relevant_hints
-    assert "Nice try!  Hint: 4 is a multiple." not in hints_fake._relevant_hints
-
-def test_get_relevant_hints_multiple_relevant_hints_correct_length(hints_fake, mock_concepts_four):
-    hints_fake._relevant_hints = [
-        "Nice try!  Hint: It is a perfect square.",
-        "Nice try!  Hint: It is a perfect cube.",
-        "Nice try!  Hint: It is an odd number.",
-        "Nice try!  Hint: 1 is a multiple.",
-        "Nice try!  Hint: 4 is a multiple."
-        ]
-    hints_fake._redundant_hints = []
-    hints_fake._update_hint_pool()
-    hints_fake._get_relevant_hints(mock_concepts_four, _check_db=False)
+def test_get_relevant_hints_multiple_redundant_hints_added(hints_fake, relevant_hints_four):
+    hints_fake._load_hints(relevant_hints_four)
+    hints_fake._get_candidates().apply_hint(relevant_hints_four[0])
+    hints_fake._get_candidates().apply_hint(relevant_hints_four[4])
+    hints_fake._get_relevant_hints()
+    assert "Nice try!  Hint: It is a perfect square." in render_hints(hints_fake._redundant_hints)
+    assert "Nice try!  Hint: 4 is a multiple." in render_hints(hints_fake._redundant_hints)
+
+def test_get_relevant_hints_multiple_relevant_hints_reduced(hints_fake, relevant_hints_four):
+    hints_fake._load_hints(relevant_hints_four)
+    hints_fake._get_candidates().apply_hint(relevant_hints_four[0])
+    hints_fake._get_candidates().apply_hint(relevant_hints_four[4])
+    hints_fake._get_relevant_hints()
+    assert "Nice try!  Hint: It is a perfect square." not in render_hints(hints_fake._relevant_hints)
+    assert "Nice try!  Hint: 4 is a multiple." not in render_hints(hints_fake._relevant_hints)
+
+def test_get_relevant_hints_multiple_relevant_hints_correct_length(hints_fake, relevant_hints_four):
+    hints_fake._load_hints(relevant_hints_four)
+    hints_fake._get_candidates().apply_hint(relevant_hints_four[0])
+    hints_fake._get_candidates().apply_hint(relevant_hints_four[4])
+    hints_fake._get_relevant_hints()
     assert 3 == len(hints_fake._relevant_hints)
 
-def test_get_relevant_hints_no_arguments_raises_error(hints_fake):
-    with pytest.raises(TypeError):
-        hints_fake._get_relevant_hints()
+def test_get_relevant_hints_implied_hint_redundant(hints_fake, relevant_hints_two):
+    # Once the number is known to be a factor of 1, every other hint about it is implied.
+    hints_fake._load_hints(relevant_hints_two)
+    hints_fake._get_candidates().apply_hint(relevant_hints_two[3])
+    hints_fake._get_relevant_hints()
+    assert (0, 5) == (len(hints_fake._relevant_hints), len(hints_fake._redundant_hints))
 
 def test_get_relevant_hints_too_many_arguments_raises_error(hints_fake, mock_concepts_four):
     with pytest.raises(TypeError):
-        hints_fake._get_relevant_hints(mock_concepts_four, False, "extra")
+        hints_fake._get_relevant_hints(mock_concepts_four)
+
+
+# Test _pull_hints method
+def test_pull_hints_stops_at_lookahead(hints_fake):
+    hints_fake._hint_stream = registry.iter_hints(963761198400)
+    hints_fake._pull_hints()
+    assert (HintManager._lookahead, True) == (hints_fake.get_hint_count("relevant"), hints_fake._hint_stream is not None)
+
+def test_pull_hints_stream_runs_out(hints_fake, relevant_hints_two):
+    hints_fake._hint_stream = iter(relevant_hints_two)
+    hints_fake._pull_hints()
+    assert (5, None) == (hints_fake.get_hint_count("pool"), hints_fake._hint_stream)
+
+def test_pull_hints_redundant_hint(hints_fake, relevant_hints_two):
+    hints_fake._get_candidates().apply_hint(relevant_hints_two[0])
+    hints_fake._hint_stream = iter(relevant_hints_two[:2])
+    hints_fake._pull_hints()
+    assert "redundant" == hints_fake.get_hint_state(relevant_hints_two[0])
+
+def test_pull_hints_repeated_hint_skipped(hints_fake, relevant_hints_two):
+    hints_fake._load_hints(relevant_hints_two[:1])
+    hints_fake._set_hint_state(relevant_hints_two[0], "given")
+    hints_fake._hint_stream = iter(relevant_hints_two[:2])
+    hints_fake._pull_hints()
+    assert ("given", 1) == (hints_fake.get_hint_state(relevant_hints_two[0]), hints_fake.get_hint_count("pool"))
+
+def test_pull_hints_implied_hint(hints_fake, relevant_hints_two):
+    hints_fake._set_implication_graph({relevant_hints_two[3]: [relevant_hints_two[0]]})
+    hints_fake._hint_stream = iter(relevant_hints_two)
+    hints_fake._pull_hints()
+    assert ("redundant", 4) == (hints_fake.get_hint_state(relevant_hints_two[3]), hints_fake.get_hint_count("relevant"))
+
+def test_pull_hints_implying_hint_pulled_last(hints_fake, relevant_hints_two):
+    hints_fake._set_implication_graph({relevant_hints_two[0]: [relevant_hints_two[3]]})
+    hints_fake._hint_stream = iter(relevant_hints_two)
+    hints_fake._pull_hints()
+    assert ("redundant", 4) == (hints_fake.get_hint_state(relevant_hints_two[0]), hints_fake.get_hint_count("relevant"))
+
+def test_pull_hints_no_stream(hints_fake):
+    hints_fake._pull_hints()
+    assert 0 == hints_fake.get_hint_count("pool")
+
+def test_pull_hints_too_many_arguments_raises_error(hints_fake):
+    with pytest.raises(TypeError):
+        hints_fake._pull_hints("extra")
+
+
+# Test _is_relevant method
+def test_is_relevant_narrows(hints_fake, relevant_hints_two):
+    assert True == hints_fake._is_relevant(relevant_hints_two[0])
+
+def test_is_relevant_implying_hints_pulled(hints_fake, relevant_hints_two):
+    hints_fake._load_hints(relevant_hints_two[:2])
+    hints_fake._set_implication_graph({relevant_hints_two[3]: relevant_hints_two[:2]})
+    assert False == hints_fake._is_relevant(relevant_hints_two[3])
+
+def test_is_relevant_implying_hints_not_pulled(hints_fake, relevant_hints_two):
+    hints_fake._load_hints(relevant_hints_two[:1])
+    hints_fake._set_implication_graph({relevant_hints_two[3]: relevant_hints_two[:2]})
+    assert True == hints_fake._is_relevant(relevant_hints_two[3])
+
+def test_is_relevant_implied_by_no_hints(hints_fake, relevant_hints_two):
+    hints_fake._set_implication_graph({relevant_hints_two[3]: []})
+    assert False == hints_fake._is_relevant(relevant_hints_two[3])
+
+def test_is_relevant_no_arguments_raises_error(hints_fake):
+    with pytest.raises(TypeError):
+        hints_fake._is_relevant()
+
+
+# Test _set_implication_graph method
+def test_set_implication_graph_implied_hints(hints_fake, relevant_hints_two):
+    hints_fake._set_implication_graph({relevant_hints_two[0]: relevant_hints_two[3:], relevant_hints_two[1]: relevant_hints_two[3:4]})
+    expected_implied_hints = {relevant_hints_two[3]: relevant_hints_two[:2], relevant_hints_two[4]: relevant_hints_two[:1]}
+    assert expected_implied_hints == hints_fake._implied_hints
+
+def test_set_implication_graph_no_arguments_raises_error(hints_fake):
+    with pytest.raises(TypeError):
+        hints_fake._set_implication_graph()
 
 
 # Test get_hints method
-def test_get_hints_pool(hints_fake):
-    hints_fake._relevant_hints = ["relevant hint"]
-    hints_fake._redundant_hints = ["redundant hint"]
-    hints_fake._update_hint_pool()
-    hints_fake._hints_given = ["hints given"]
-    hint_list = hints_fake.get_hints("pool")
-    assert hint_list == hints_fake._hint_pool
-
-def test_get_hints_relevant(hints_fake):
-    hints_fake._relevant_hints = ["relevant hint"]
-    hints_fake._redundant_hints = ["redundant hint"]
-    hints_fake._update_hint_pool()
-    hints_fake._hints_given = ["hints given"]
-    hint_list = hints_fake.get_hints("relevant")
-    assert hint_list == hints_fake._relevant_hints
-
-def test_get_hints_redundant(hints_fake):
-    hints_fake._relevant_hints = ["relevant hint"]
-    hints_fake._redundant_hints = ["redundant hint"]
-    hints_fake._update_hint_pool()
-    hints_fake._hints_given = ["hints given"]
-    hint_list = hints_fake.get_hints("redundant")
-    assert hint_list == hints_fake._redundant_hints
-
-def test_get_hints_given(hints_fake):
-    hints_fake._relevant_hints = ["relevant hint"]
-    hints_fake._redundant_hints = ["redundant hint"]
-    hints_fake._update_hint_pool()
-    hints_fake._hints_given = ["hints given"]
-    hint_list = hints_fake.get_hints("given")
-    assert hint_list == hints_fake._hints_given
-
-def test_get_hints_not_found(hints_fake):
-    hints_fake._relevant_hints = ["relevant hint"]
-    hints_fake._redundant_hints = ["redundant hint"]
-    hints_fake._update_hint_pool()
-    hints_fake._hints_given = ["hints given"]
-    hint_list = hints_fake.get_hints("not found")
+@pytest.fixture
+def hints_fake_loaded(hints_fake):
+    hints_fake._load_hints(["relevant hint", "hint given"], ["redundant hint"])
+    hints_fake._set_hint_state("hint given", "given")
+    return hints_fake
+
+def test_get_hints_pool(hints_fake_loaded):
+    assert ["relevant hint", "redundant hint"] == list(hints_fake_loaded.get_hints("pool"))
+
+def test_get_hints_relevant(hints_fake_loaded):
+    assert ["relevant hint"] == list(hints_fake_loaded.get_hints("relevant"))
+
+def test_get_hints_redundant(hints_fake_loaded):
+    assert ["redundant hint"] == list(hints_fake_loaded.get_hints("redundant"))
+
+def test_get_hints_given(hints_fake_loaded):
+    assert ["hint given"] == list(hints_fake_loaded.get_hints("given"))
+
+def test_get_hints_not_found(hints_fake_loaded):
+    hint_list = hints_fake_loaded.get_hints("not found")
     assert hint_list == None
 
-def test_get_hints_copy(hints_fake):
-    hints_fake._relevant_hints = ["relevant hint"]
-    hints_fake._redundant_hints = ["redundant hint"]
-    hints_fake._update_hint_pool()
-    hints_fake._hints_given = ["hints given"]
-    hint_list = hints_fake.get_hints("pool")
-    hint_list.remove("redundant hint")
-    assert hint_list != hints_fake._hint_pool
+def test_get_hints_read_only(hints_fake_loaded):
+    hint_list = hints_fake_loaded.get_hints("pool")
+    with pytest.raises(AttributeError):
+        hint_list.remove("redundant hint")
+
+def test_get_hints_view(hints_fake_loaded):
+    hint_list = hints_fake_loaded.get_hints("pool")
+    hints_fake_loaded._set_hint_state("relevant hint", "given")
+    assert ["redundant hint"] == list(hint_list)
 
 def test_get_hints_no_arguments_raises_error(hints_fake):
     with pytest.raises(TypeError):
@@ -256,9 +373,12 @@ def test_get_hints_too_many_arguments_raises_error(hints_fake):
 
 # Test get_hint_count method
 def test_get_hint_count(hints_fake):
-    hints_fake._hint_pool = ["relevant hint", "redundant hint"]
+    hints_fake._load_hints(["relevant hint"], ["redundant hint"])
     assert 2 == hints_fake.get_hint_count("pool")
 
+def test_get_hint_count_given(hints_fake_loaded):
+    assert 1 == hints_fake_loaded.get_hint_count("given")
+
 def test_get_hint_count_no_arguments_raises_error(hints_fake):
     with pytest.raises(TypeError):
         hints_fake.get_hint_count()
@@ -268,56 +388,179 @@ def test_get_hint_count_too_many_arguments_raises_error(hints_fake):
         hints_fake.get_hint_count("pool", "extra")
 
 
+# Test get_relevant_hint_total method
+def test_get_relevant_hint_total(hints_fake):
+    hints_fake._load_hints(["relevant hint 1", "relevant hint 2"], ["redundant hint"])
+    hints_fake._set_hint_state("relevant hint 1", "given")
+    hints_fake._set_hint_state("relevant hint 2", "redundant")
+    assert (2, 0) == (hints_fake.get_relevant_hint_total(), hints_fake.get_hint_count("relevant"))
+
+def test_get_relevant_hint_total_reset(hints_fake):
+    hints_fake._load_hints(["relevant hint 1"])
+    hints_fake._load_hints([])
+    assert 0 == hints_fake.get_relevant_hint_total()
+
+def test_get_relevant_hint_total_too_many_arguments_raises_error(hints_fake):
+    with pytest.raises(TypeError):
+        hints_fake.get_relevant_hint_total("extra")
+
+
 # Test get_new_hint method
-def test_get_new_hint_hint_in_original_list(hints_fake, mock_concepts_four):
-    hints_fake._relevant_hints = [
-        "Nice try!  Hint: It is a perfect square.",
-        "Nice try!  Hint: It is a perfect cube.",
-        "Nice try!  Hint: It is an odd number.",
-        "Nice try!  Hint: 1 is a multiple.",
-        "Nice try!  Hint: 2 is a multiple."
-        ]
-    hints_fake._redundant_hints = []
-    hints_fake._update_hint_pool()
-    original_hint_list = hints_fake._hint_pool.copy()
-    hint = hints_fake.get_new_hint(mock_concepts_four, 4, _check_db=False)
+def test_get_new_hint_hint_in_original_list(hints_fake, mock_concepts_four, relevant_hints_two):
+    hints_fake._load_hints(relevant_hints_two)
+    original_hint_list = list(hints_fake._hint_pool)
+    hint = hints_fake.get_new_hint(mock_concepts_four, 4)
     assert hint in original_hint_list
 
-def test_get_new_hint_hint_added_to_hints_given(hints_fake, mock_concepts_four):
-    hints_fake._relevant_hints = [
-        "Nice try!  Hint: It is a perfect square.",
-        "Nice try!  Hint: It is a perfect cube.",
-        "Nice try!  Hint: It is an odd number.",
-        "Nice try!  Hint: 1 is a multiple.",
-        "Nice try!  Hint: 2 is a multiple."
-        ]
-    hints_fake._redundant_hints = []
-    hints_fake._update_hint_pool()
-    original_hint_list = hints_fake._hint_pool.copy()
-    hint = hints_fake.get_new_hint(mock_concepts_four, 4, _check_db=False)
+def test_get_new_hint_hint_added_to_hints_given(hints_fake, mock_concepts_four, relevant_hints_two):
+    hints_fake._load_hints(relevant_hints_two)
+    original_hint_list = list(hints_fake._hint_pool)
+    hint = hints_fake.get_new_hint(mock_concepts_four, 4)
     assert hint in hints_fake._hints_given
 
 def test_get_new_hint_hint_pool_empty_correct_hint(hints_fake, mock_concepts_four):
-    hints_fake._relevant_hints = []
-    hints_fake._redundant_hints = []
-    hints_fake._update_hint_pool()
-    hint = hints_fake.get_new_hint(mock_concepts_four, 15, _check_db=False)
-    assert "Nice try!  Lower." == hint
+    hints_fake._load_hints([])
+    hint = hints_fake.get_new_hint(mock_concepts_four, 15)
+    assert "Nice try!  Lower." == hint.render()
 
 def test_get_new_hint_hint_pool_empty_hints_given_not_updated(hints_fake, mock_concepts_four):
-    hints_fake._relevant_hints = []
-    hints_fake._redundant_hints = []
-    hints_fake._update_hint_pool()
-    hint = hints_fake.get_new_hint(mock_concepts_four, 4, _check_db=False)
+    hints_fake._load_hints([])
+    hint = hints_fake.get_new_hint(mock_concepts_four, 4)
     assert not hints_fake._hints_given
 
+def test_get_new_hint_candidates_narrowed(hints_fake, mock_concepts_four, relevant_hints_two):
+    hints_fake._load_hints(relevant_hints_two)
+    hints_fake.get_new_hint(mock_concepts_four, 4)
+    assert 4 not in hints_fake._get_candidates().get_candidates()
+    assert hints_fake.get_candidate_count() < 9
+
+def test_get_new_hint_hint_pool_empty_candidates_narrowed(hints_fake, mock_concepts_four):
+    hints_fake._load_hints([])
+    hint = hints_fake.get_new_hint(mock_concepts_four, 5)
+    candidates = hints_fake._get_candidates().get_candidates()
+    if hint.render() == "Nice try!  Higher.":
+        assert [6, 7, 8, 9, 10] == candidates
+    else:
+        assert [1, 2, 3, 4] == candidates
+
+def test_get_new_hint_hints_pulled(hints_fake, mock_concepts_four, relevant_hints_two):
+    hints_fake._load_hints([])
+    hints_fake._hint_stream = iter(relevant_hints_two)
+    hint = hints_fake.get_new_hint(mock_concepts_four, 4)
+    assert ("given", 4) == (hints_fake.get_hint_state(hint), hints_fake.get_hint_count("pool"))
+
 def test_get_new_hint_no_arguments_raises_error(hints_fake):
     with pytest.raises(TypeError):
         hints_fake.get_new_hint()
 
 def test_get_new_hint_too_many_arguments_raises_error(hints_fake, mock_concepts_four):
     with pytest.raises(TypeError):
-        hints_fake.get_new_hint(mock_concepts_four, 4, False, "extra")
+        hints_fake.get_new_hint(mock_concepts_four, 4, "extra")
+
+
+# Test get_last_hint method
+def test_get_last_hint_no_hints(hints_fake):
+    assert None == hints_fake.get_last_hint()
+
+def test_get_last_hint_new_hint(hints_fake, mock_concepts_four, relevant_hints_two):
+    hints_fake._load_hints(relevant_hints_two)
+    hint = hints_fake.get_new_hint(mock_concepts_four, 4)
+    assert hint == hints_fake.get_last_hint()
+
+def test_get_last_hint_hint_pool_empty(hints_fake, mock_concepts_four):
+    hints_fake._load_hints([])
+    hints_fake.get_new_hint(mock_concepts_four, 15)
+    assert "greater_less" == hints_fake.get_last_hint().get_type()
+
+def test_get_last_hint_too_many_arguments_raises_error(hints_fake):
+    with pytest.raises(TypeError):
+        hints_fake.get_last_hint("extra")
+
+
+# Test set_hint_policy method
+def test_set_hint_policy(hints_fake):
+    hints_fake.set_hint_policy("information gain")
+    assert "information gain" == hints_fake.get_hint_policy()
+
+def test_set_hint_policy_unknown_policy_raises_error(hints_fake):
+    with pytest.raises(ValueError):
+        hints_fake.set_hint_policy("unknown")
+
+def test_set_hint_policy_no_arguments_raises_error(hints_fake):
+    with pytest.raises(TypeError):
+        hints_fake.set_hint_policy()
+
+
+# Test get_hint_policy method
+def test_get_hint_policy_default(hints_fake):
+    assert "random" == hints_fake.get_hint_policy()
+
+
+# Test get_selection_stats method
+def test_get_selection_stats_no_hints(hints_fake):
+    assert None == hints_fake.get_selection_stats()
+
+def test_get_selection_stats_new_hint(hints_fake, mock_concepts_four, relevant_hints_two):
+    hints_fake._load_hints(relevant_hints_two)
+    hints_fake.get_new_hint(mock_concepts_four, 4)
+    policy_name, selection_time = hints_fake.get_selection_stats()
+    assert ("random", True) == (policy_name, selection_time >= 0)
+
+def test_get_selection_stats_hint_pool_empty(hints_fake, mock_concepts_four, test_hint_list):
+    hints_fake._get_hint_from_list(test_hint_list.copy())
+    hints_fake.get_new_hint(mock_concepts_four, 5)
+    assert None == hints_fake.get_selection_stats()
+
+def test_get_selection_stats_too_many_arguments_raises_error(hints_fake):
+    with pytest.raises(TypeError):
+        hints_fake.get_selection_stats("extra")
+
+
+# Test get_hint_state method
+def test_get_hint_state(hints_fake):
+    hints_fake._load_hints(["relevant hint"], ["redundant hint"])
+    assert ("relevant", "redundant") == (hints_fake.get_hint_state("relevant hint"), hints_fake.get_hint_state("redundant hint"))
+
+def test_get_hint_state_not_found(hints_fake):
+    assert None == hints_fake.get_hint_state("unknown hint")
+
+def test_get_hint_state_no_arguments_raises_error(hints_fake):
+    with pytest.raises(TypeError):
+        hints_fake.get_hint_state()
+
+
+# Test get_candidate_count method
+def test_get_candidate_count_no_hints(hints_fake):
+    assert 10 == hints_fake.get_candidate_count()
+
+def test_get_candidate_count_after_hint(hints_fake, relevant_hints_two):
+    hints_fake._get_candidates().apply_hint(relevant_hints_two[0])
+    assert 3 == hints_fake.get_candidate_count()
+
+@pytest.mark.parametrize("policy_name", ["random", "information gain"])
+def test_get_candidate_count_expert_game_never_zero(policy_name):
+    objects = ObjectManagerFake()
+    for obj_name in ["numbers", "data", "session"]:
+        objects.add_object(obj_name, objects_fake_global.get_object(obj_name))
+    settings = GameSettings(numbers, data.get_sub_data_object("levels", "expert"))
+    settings.set_game_settings("", "")
+    objects.add_object("settings", settings)
+    hints = HintManager(objects)
+    hints.set_hint_policy(policy_name)
+    hints.get_hint_list(_db=False)
+    winning_number = int(settings.get_setting("winning number"))
+    low, high = settings.get_setting("number range")
+    
+    counts = []
+    for guess in numbers.get_random_numbers((low, high + 1), n=12):
+        if guess != winning_number:
+            hints.get_new_hint(hints.get_concepts(guess, _db=False), guess)
+            counts.append(hints.get_candidate_count())
+    assert 0 == counts.count(0)
+
+def test_get_candidate_count_too_many_arguments_raises_error(hints_fake):
+    with pytest.raises(TypeError):
+        hints_fake.get_candidate_count("extra")
 
 
 # Test get_concepts method
@@ -351,13 +594,25 @@ def test_get_hint_list_more_than_two_hints(hints_fake):
 
 def test_get_hint_list_two_multiple_hints(hints_fake):
     hints_fake.get_hint_list(_db=False)
-    multiple_hints = [hint for hint in hints_fake._hint_pool if "multiple" in hint]
+    multiple_hints = [hint for hint in hints_fake._hint_pool if hint.get_type() == "multiple"]
     assert 2 == len(multiple_hints)
 
 def test_get_hint_list_relevant_hints_matches_hint_pool(hints_fake):
     hints_fake.get_hint_list(_db=False)
     assert hints_fake._relevant_hints == hints_fake._hint_pool
 
+def test_get_hint_list_stream_set(hints_fake):
+    hints_fake.get_hint_list(_db=False)
+    assert hints_fake.get_hint_count("relevant") <= HintManager._lookahead
+
+def test_get_hint_list_no_implication_graph(hints_fake):
+    hints_fake.get_hint_list(_db=False)
+    assert {} == hints_fake._implication_graph
+
+def test_get_hint_list_candidates_cover_range(hints_fake):
+    hints_fake.get_hint_list(_db=False)
+    assert list(range(1, 11)) == hints_fake._candidates.get_candidates()
+
 def test_get_hint_list_too_many_arguments_raises_error(hints_fake, mock_concepts_four):
     with pytest.raises(TypeError):
         hints_fake.get_hint_list(False, "extra")
@@ -391,13 +646,24 @@ def test_get_hint_list_db_more_than_two_hints(hints_fake):
 def test_get_hint_list_db_two_multiple_hints(hints_fake):
     hints_fake._settings._level_obj = level_custom
     hints_fake.get_hint_list()
-    multiple_hints = [hint for hint in hints_fake._hint_pool if "multiple" in hint]
+    multiple_hints = [hint for hint in hints_fake._hint_pool if hint.get_type() == "multiple"]
     assert 2 == len(multiple_hints)
 
 def test_get_hint_list_db_relevant_hints_matches_hint_pool(hints_fake):
     hints_fake._settings._level_obj = level_custom
     hints_fake.get_hint_list()
-    assert hints_fake._relevant_hints == hints_fake._hint_pool
+    assert [] == get_misplaced_hints(hints_fake)
+
+def test_get_hint_list_db_implied_hints_redundant(hints_fake, db_manager_fake, test_db_path, monkeypatch):
+    # Every multiple hint for 2 is implied by it being an even prime number.
+    hints_fake._settings._level_obj = level_custom
+    monkeypatch.setitem(hints_fake._settings._settings, "winning number", 2)
+    populate_hints = PopulateHintsDBScriptor(db_manager_fake, None, data, numbers)
+    populate_hints.populate_hints((2, 2), _db_path=test_db_path)
+    populate_hints.store_implied_hints((2, 2), _db_path=test_db_path)
+    hints_fake.get_hint_list()
+    assert (["Nice try!  Hint: It is a prime number.", "Nice try!  Hint: It is an even number."], 2) == (
+        sorted(render_hints(hints_fake._relevant_hints), key=len), hints_fake.get_hint_count("redundant"))
 
 
 def test_settings_version_end():
@@ -0,0 +1,119 @@
+import pytest
+import numpy as np
+from main.tests.tests_setup import objects_fake_global_dict
+from main.game.hint_policies import *
+from main.game.candidates import CandidateSet
+from concepts.concept_manager import ConceptManager
+from concepts.concept_registry import ConceptRegistry
+from concepts.hints import HintRecord
+
+
+
+### Object Manager Setup
+
+objects_fake_global = objects_fake_global_dict["medium"]
+numbers = objects_fake_global.get_object("numbers")
+data = objects_fake_global.get_object("data")
+registry = ConceptRegistry.get_registry(numbers, data)
+
+
+
+### HintPolicy Object Tests
+
+@pytest.fixture
+def candidates():
+    return CandidateSet((1, 100), numbers, ConceptManager(36, numbers, None, data))
+
+@pytest.fixture
+def policy_hints():
+    return [
+        registry._perfect_square._create_hint(HintRecord.MAIN),
+        registry._even_odd._create_hint(HintRecord.MAIN, "even"),
+        registry._factor._create_hint(HintRecord.MAIN, 9)
+        ]
+
+@pytest.fixture
+def random_policy():
+    return RandomHintPolicy(numbers)
+
+@pytest.fixture
+def information_gain_policy():
+    return InformationGainHintPolicy(numbers)
+
+
+# Test get_name method
+def test_get_name_random(random_policy):
+    assert "random" == random_policy.get_name()
+
+def test_get_name_information_gain(information_gain_policy):
+    assert "information gain" == information_gain_policy.get_name()
+
+
+# Test select_hint method
+def test_select_hint_random_in_range(random_policy, policy_hints, candidates):
+    for i in range(20):
+        assert random_policy.select_hint(policy_hints, candidates) in range(len(policy_hints))
+
+def test_select_hint_random_text_hints(random_policy, candidates):
+    assert 0 == random_policy.select_hint(["hint 1"], candidates)
+
+def test_select_hint_random_empty(random_policy, candidates):
+    with pytest.raises(ValueError):
+        random_policy.select_hint([], candidates)
+
+def test_select_hint_information_gain_most_candidates_ruled_out(information_gain_policy, policy_hints, candidates):
+    # Only 10 numbers from 1 to 100 are perfect squares, compared to 11 with a factor of 9 and 50 even numbers.
+    assert 0 == information_gain_policy.select_hint(policy_hints, candidates)
+
+def test_select_hint_information_gain_after_hint(information_gain_policy, policy_hints, candidates):
+    # Of the perfect squares, 5 are even and 3 have a factor of 9.
+    candidates.apply_hint(policy_hints[0])
+    assert 2 == information_gain_policy.select_hint(policy_hints, candidates)
+
+def test_select_hint_information_gain_ties_broken_at_random(information_gain_policy, policy_hints, candidates):
+    hints = [policy_hints[1], policy_hints[1], policy_hints[1]]
+    assert {0, 1, 2} == {information_gain_policy.select_hint(hints, candidates) for i in range(50)}
+
+def test_select_hint_information_gain_empty(information_gain_policy, candidates):
+    with pytest.raises(ValueError):
+        information_gain_policy.select_hint([], candidates)
+
+def test_select_hint_no_arguments_raises_error(random_policy):
+    with pytest.raises(TypeError):
+        random_policy.select_hint()
+
+
+# Test get_information_gains method
+def test_get_information_gains(policy_hints, candidates):
+    expected_gains = np.log2([100 / 10, 100 / 50, 100 / 11])
+    assert np.allclose(expected_gains, InformationGainHintPolicy.get_information_gains(policy_hints, candidates))
+
+def test_get_information_gains_redundant_hint(policy_hints, candidates):
+    candidates.apply_hint(policy_hints[0])
+    assert 0 == InformationGainHintPolicy.get_information_gains(policy_hints[:1], candidates)[0]
+
+def test_get_information_gains_no_arguments_raises_error():
+    with pytest.raises(TypeError):
+        InformationGainHintPolicy.get_information_gains()
+
+
+
+### HintPolicyManager Object Tests
+
+@pytest.fixture
+def policies():
+    return HintPolicyManager(numbers)
+
+
+# Test select_hint method
+def test_select_hint_manager_information_gain(policies, policy_hints, candidates):
+    assert 0 == policies.select_hint("information gain", policy_hints, candidates)
+
+def test_select_hint_manager_unknown_policy_raises_error(policies, policy_hints, candidates):
+    with pytest.raises(KeyError):
+        policies.select_hint("unknown", policy_hints, candidates)
+
+
+# Test get_policy_names method
+def test_get_policy_names(policies):
+    assert ["random", "information gain"] == policies.get_policy_names()
\ No newline at end of file
@@ -1,5 +1,7 @@
 import pytest
+import numpy as np
 from main.tests.tests_setup import objects_fake_global_dict
+from main.resources.infrastructure.number import Number, RandomNumberGenerator
 
 
 
@@ -68,6 +70,12 @@ def test_is_in_range_outside_low(validator):
 def test_is_in_range_outside_high(validator):
     assert False == validator._is_in_range('101', (1, 100))
 
+def test_is_in_range_huge_range(validator):
+    assert True == validator._is_in_range('999999999999', (1, 10**12))
+
+def test_is_in_range_outside_huge_range(validator):
+    assert False == validator._is_in_range('1000000000001', (1, 10**12))
+
 def test_is_in_range_no_arguments_raises_error(validator):
     with pytest.raises(TypeError):
         validator._is_in_range()
@@ -216,6 +224,18 @@ def test_unique_random_numbers_no_repeats(random_number_list_2):
 def test_unique_random_numbers_each_in_range(random_number_list_2):
     assert True == all([n in range(1, 6) for n in random_number_list_2])
 
+def test_unique_random_numbers_whole_range(random):
+    assert list(range(1, 11)) == sorted(random.unique_random_numbers((1, 11), 10))
+
+def test_unique_random_numbers_huge_range(random):
+    random_numbers = random.unique_random_numbers((1, 10**12 + 1), 5)
+    assert 5 == len(set(random_numbers))
+    assert True == all([1 <= n <= 10**12 for n in random_numbers])
+
+def test_unique_random_numbers_too_many_raises_error(random):
+    with pytest.raises(ValueError):
+        random.unique_random_numbers((1, 5), 5)
+
 def test_unique_random_numbers_no_arguments_raises_error(random):
     with pytest.raises(TypeError):
         random.unique_random_numbers()
@@ -225,6 +245,49 @@ def test_unique_random_numbers_too_many_arguments_raises_error(random):
         random.unique_random_numbers((1, 5), 2, 3)
 
 
+# Test generate_random_numbers method
+def test_generate_random_numbers_length(random):
+    assert 20 == len(random.generate_random_numbers((1, 5), 20))
+
+def test_generate_random_numbers_each_in_range(random):
+    assert True == all([n in range(1, 5) for n in random.generate_random_numbers((1, 5), 20)])
+
+def test_generate_random_numbers_no_arguments_raises_error(random):
+    with pytest.raises(TypeError):
+        random.generate_random_numbers()
+
+
+# Test new_seed method
+def test_new_seed_changes_seed(random):
+    first_seed = random.new_seed()
+    assert first_seed != random.new_seed()
+
+def test_new_seed_same_session_seed_same_seeds():
+    first_session = RandomNumberGenerator(session_seed=1234)
+    second_session = RandomNumberGenerator(session_seed=1234)
+    assert [first_session.new_seed() for i in range(3)] == [second_session.new_seed() for i in range(3)]
+
+def test_new_seed_fits_in_database(random):
+    assert 0 <= random.new_seed() < 2**32
+
+
+# Test set_seed method
+def test_set_seed_replays_numbers(random):
+    seed = random.new_seed()
+    first_draws = [random.generate_random_number((1, 1000)) for i in range(5)] + random.unique_random_numbers((1, 50), 3)
+    random.set_seed(seed)
+    second_draws = [random.generate_random_number((1, 1000)) for i in range(5)] + random.unique_random_numbers((1, 50), 3)
+    assert first_draws == second_draws
+
+def test_set_seed_get_seed(random):
+    random.set_seed(42)
+    assert 42 == random.get_seed()
+
+def test_set_seed_no_arguments_raises_error(random):
+    with pytest.raises(TypeError):
+        random.set_seed()
+
+
 # Test get_random_numbers method
 def test_get_random_numbers_one(numbers):
     assert False == isinstance(numbers.get_random_numbers((1, 10), 1), list)
@@ -434,6 +497,9 @@ def test_is_perfect_square_yes_one(info):
 def test_is_perfect_square_no_negative(info):
     assert False == info._is_perfect_square(-4)
 
+def test_is_perfect_square_large_number(info):
+    assert True == info._is_perfect_square((10**12 + 39)**2)
+
 def test_is_perfect_square_no_arguments_raises_error(info):
     with pytest.raises(TypeError):
         info._is_perfect_square()
@@ -462,6 +528,9 @@ def test_is_perfect_cube_yes_zero(info):
 def test_is_perfect_cube_yes_one(info):
     assert True == info._is_perfect_cube(1)
 
+def test_is_perfect_cube_large_number(info):
+    assert False == info._is_perfect_cube(10**12 + 1)
+
 def test_is_perfect_cube_no_arguments_raises_error(info):
     with pytest.raises(TypeError):
         info._is_perfect_cube()
@@ -508,6 +577,21 @@ def test_get_number_info_is_perfect_cube(numbers):
     assert True == isinstance(result, bool)
     assert True == result
 
+def test_get_number_info_is_perfect_power(numbers):
+    assert True == numbers.get_number_info('is perfect power', 81, 4)
+
+def test_get_number_info_factor_count(numbers):
+    assert 6 == numbers.get_number_info('factor count', 12)
+
+def test_get_number_info_prime_factor_count(numbers):
+    assert 2 == numbers.get_number_info('prime factor count', 12)
+
+def test_get_number_info_digit_sum(numbers):
+    assert 9 == numbers.get_number_info('digit sum', -45)
+
+def test_get_number_info_digit_length(numbers):
+    assert 3 == numbers.get_number_info('digit length', 450)
+
 def test_get_number_info_first_argument_not_found(numbers):
     with pytest.raises(KeyError):
         numbers.get_number_info('factor', 21, 7)
@@ -517,6 +601,228 @@ def test_get_number_info_no_arguments_raises_error(numbers):
         numbers.get_number_info()
 
 
+
+### BatchNumberInfo Object Tests
+
+@pytest.fixture
+def batch_info(numbers):
+    return numbers._batch_info
+
+@pytest.fixture
+def batch_range():
+    return np.arange(-50, 1001)
+
+
+# Test get_number_info method
+def test_batch_get_number_info_columns(batch_info, batch_range):
+    assert batch_info.get_columns() == list(batch_info.get_number_info(batch_range).keys())
+
+def test_batch_get_number_info_factor_count(batch_info, info, batch_range):
+    result = batch_info.get_number_info(batch_range)["factor count"]
+    assert [len(info._get_factors(int(x))) for x in batch_range] == result.tolist()
+
+def test_batch_get_number_info_prime_factor_count(batch_info, info, batch_range):
+    result = batch_info.get_number_info(batch_range)["prime factor count"]
+    assert [len(info._get_prime_factors(int(x))) for x in batch_range] == result.tolist()
+
+def test_batch_get_number_info_is_prime(batch_info, info, batch_range):
+    result = batch_info.get_number_info(batch_range)["is prime"]
+    assert [info._is_prime(int(x)) for x in batch_range] == result.tolist()
+
+def test_batch_get_number_info_is_perfect_square(batch_info, info, batch_range):
+    result = batch_info.get_number_info(batch_range)["is perfect square"]
+    assert [info._is_perfect_square(int(x)) for x in batch_range] == result.tolist()
+
+def test_batch_get_number_info_is_perfect_cube(batch_info, info):
+    numbers = np.arange(-200, 201)
+    result = batch_info.get_number_info(numbers)["is perfect cube"]
+    assert [info._is_perfect_cube(int(x)) for x in numbers] == result.tolist()
+
+def test_batch_get_number_info_digit_sum(batch_info, info, batch_range):
+    result = batch_info.get_number_info(batch_range)["digit sum"]
+    assert [sum(info._get_digits(int(x))) for x in batch_range] == result.tolist()
+
+def test_batch_get_number_info_digit_length(batch_info, info, batch_range):
+    result = batch_info.get_number_info(batch_range)["digit length"]
+    assert [len(info._get_digits(int(x))) for x in batch_range] == result.tolist()
+
+def test_batch_get_number_info_digit_factors(batch_info, info, batch_range):
+    result = batch_info.get_number_info(batch_range)["digit factors"]
+    assert [info._get_digit_factor_count(int(x)) for x in batch_range] == result.tolist()
+
+def test_batch_get_number_info_digit_property_counts(batch_info, info, batch_range):
+    result = batch_info.get_number_info(batch_range)
+    for column, formula in [("prime number digits", info._is_prime), ("perfect square digits", info._is_perfect_square),
+                            ("perfect cube digits", info._is_perfect_cube)]:
+        assert [len([d for d in info._get_digits(int(x)) if formula(d)]) for x in batch_range] == result[column].tolist()
+
+def test_batch_get_number_info_even_number_digits(batch_info, info, batch_range):
+    result = batch_info.get_number_info(batch_range)["even number digits"]
+    assert [len([d for d in info._get_digits(int(x)) if d % 2 == 0]) for x in batch_range] == result.tolist()
+
+def test_batch_get_number_info_above_sieve_limit(batch_info):
+    result = batch_info.get_number_info([1000003, 7 * 1009**2, 10**12])
+    assert [2, 6, 169] == result["factor count"].tolist()
+    assert [1, 2, 2] == result["prime factor count"].tolist()
+    assert [False, False, True] == result["is perfect square"].tolist()
+    assert [False, False, True] == result["is perfect cube"].tolist()
+
+def test_batch_get_number_info_empty(batch_info):
+    result = batch_info.get_number_info([])
+    assert all([len(column) == 0 for column in result.values()])
+
+def test_batch_get_number_info_no_arguments_raises_error(batch_info):
+    with pytest.raises(TypeError):
+        batch_info.get_number_info()
+
+
+# Test get_group_columns method
+def test_batch_get_group_columns(batch_info):
+    assert ["factor count", "prime factor count", "is prime"] == batch_info.get_group_columns("is prime")
+
+def test_batch_get_group_columns_unknown_column(batch_info):
+    with pytest.raises(KeyError):
+        batch_info.get_group_columns("factors")
+
+def test_batch_get_group_columns_no_arguments_raises_error(batch_info):
+    with pytest.raises(TypeError):
+        batch_info.get_group_columns()
+
+
+# Test enable_cache method
+@pytest.fixture
+def cached_numbers():
+    cached_numbers = Number()
+    cached_numbers.enable_cache(max_size=2)
+    return cached_numbers
+
+def test_enable_cache_same_results(cached_numbers):
+    assert [1, 2, 3, 4, 6, 12] == cached_numbers.get_number_info('factors', 12)
+    assert [1, 2, 3, 4, 6, 12] == cached_numbers.get_number_info('factors', 12)
+
+def test_enable_cache_counts_hits_and_misses(cached_numbers):
+    for i in range(3):
+        cached_numbers.get_number_info('is prime', 13)
+    assert (2, 1) == (cached_numbers.cache_stats()["hits"], cached_numbers.cache_stats()["misses"])
+
+def test_enable_cache_keys_include_arguments(cached_numbers):
+    assert (True, False) == (cached_numbers.get_number_info('is factor', 21, 7), cached_numbers.get_number_info('is factor', 21, 8))
+
+def test_enable_cache_evicts(cached_numbers):
+    for x in range(5):
+        cached_numbers.get_number_info('digits', x)
+    assert (3, 2) == (cached_numbers.cache_stats()["evictions"], cached_numbers.cache_stats()["size"])
+
+def test_enable_cache_returns_copies(cached_numbers):
+    cached_numbers.get_number_info('factors', 12).append(24)
+    assert [1, 2, 3, 4, 6, 12] == cached_numbers.get_number_info('factors', 12)
+
+def test_enable_cache_default_size():
+    cached_numbers = Number()
+    cached_numbers.enable_cache()
+    assert Number._formula_cache_size == cached_numbers.cache_stats()["max size"]
+
+
+# Test disable_cache method
+def test_disable_cache(cached_numbers):
+    cached_numbers.disable_cache()
+    assert None == cached_numbers.cache_stats()
+
+
+# Test cache_stats method
+def test_cache_stats_off_by_default():
+    assert None == Number().cache_stats()
+
+def test_cache_stats_cache_size_argument():
+    assert 10 == Number(cache_size=10).cache_stats()["max size"]
+
+def test_cache_stats_too_many_arguments_raises_error(cached_numbers):
+    with pytest.raises(TypeError):
+        cached_numbers.cache_stats("extra")
+
+
+# Test get_number_profile method
+def test_get_number_profile_number(numbers):
+    assert 36 == numbers.get_number_profile(36).number
+
+def test_get_number_profile_cached(numbers):
+    assert numbers.get_number_profile(36) is numbers.get_number_profile(36)
+
+def test_get_number_profile_cached_factors_unchanged(numbers):
+    with pytest.raises(AttributeError):
+        numbers.get_number_profile(36).factors.append(72)
+    assert (1, 2, 3, 4, 6, 9, 12, 18, 36) == numbers.get_number_profile(36).factors
+
+def test_get_number_profile_numpy_integer(numbers):
+    assert numbers.get_number_profile(36) is numbers.get_number_profile(np.int64(36))
+
+def test_get_number_profile_bounded(numbers):
+    for x in range(2000):
+        numbers.get_number_profile(x)
+    assert numbers._profiles.get_max_size() == len(numbers._profiles)
+
+def test_get_number_profile_string_raises_error(numbers):
+    with pytest.raises(TypeError):
+        numbers.get_number_profile("36")
+
+def test_get_number_profile_no_arguments_raises_error(numbers):
+    with pytest.raises(TypeError):
+        numbers.get_number_profile()
+
+
+# Test get_batch_number_info method
+def test_get_batch_number_info_matches_get_number_info(numbers):
+    result = numbers.get_batch_number_info([12, 13, 36])
+    assert [6, 2, 9] == result["factor count"].tolist()
+    assert [False, True, False] == result["is prime"].tolist()
+    assert [2, 1, 2] == result["digit factors"].tolist()
+
+def test_get_batch_number_info_no_arguments_raises_error(numbers):
+    with pytest.raises(TypeError):
+        numbers.get_batch_number_info()
+
+
+# Test get_lazy_batch_number_info method
+def test_get_lazy_batch_number_info_matches_get_batch_number_info(numbers):
+    number_info = numbers.get_batch_number_info(range(-20, 200))
+    lazy_number_info = numbers.get_lazy_batch_number_info(range(-20, 200))
+    assert {column: values.tolist() for column, values in number_info.items()} == {
+        column: lazy_number_info[column].tolist() for column in number_info}
+
+def test_get_lazy_batch_number_info_computes_column_group(numbers):
+    lazy_number_info = numbers.get_lazy_batch_number_info([12, 13, 36])
+    assert [6, 2, 9] == lazy_number_info["factor count"].tolist()
+    assert ["factor count", "prime factor count", "is prime"] == list(lazy_number_info)
+
+def test_get_lazy_batch_number_info_unknown_column(numbers):
+    with pytest.raises(KeyError):
+        numbers.get_lazy_batch_number_info([12])["factors"]
+
+def test_get_lazy_batch_number_info_prefetch(numbers):
+    lazy_number_info = numbers.get_lazy_batch_number_info([12, 13, 36, 10**12 + 39])
+    lazy_number_info.prefetch("factor count")
+    lazy_number_info._prefetch_thread.join()
+    assert (["factor count", "prime factor count", "is prime"], [False, True, False, True]) == (
+        list(lazy_number_info), lazy_number_info["is prime"].tolist())
+
+def test_get_lazy_batch_number_info_prefetch_waited_for(numbers):
+    lazy_number_info = numbers.get_lazy_batch_number_info([12, 13, 36])
+    lazy_number_info.prefetch("factor count")
+    assert [6, 2, 9] == lazy_number_info["factor count"].tolist()
+
+def test_get_lazy_batch_number_info_prefetch_unknown_column(numbers):
+    with pytest.raises(KeyError):
+        numbers.get_lazy_batch_number_info([12]).prefetch("factors")
+
+def test_get_lazy_batch_number_info_no_arguments_raises_error(numbers):
+    with pytest.raises(TypeError):
+        numbers.get_lazy_batch_number_info()
+
+
+# Test get_max_sieve_limit method
+def test_get_max_sieve_limit(numbers):
+    assert numbers.get_max_sieve_limit() >= numbers._factorizer.get_limit()
+
 def test_settings_version_end():
     objects_fake_global = objects_fake_global_dict["easy"]
     settings = objects_fake_global.get_object("settings")
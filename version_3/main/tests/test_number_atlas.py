@@ -0,0 +1,157 @@
+import pytest
+import numpy as np
+from main.resources.infrastructure.number import Number, BatchNumberInfo
+from main.resources.infrastructure.factorization import SieveFactorizer
+from main.resources.infrastructure.number_atlas import NumberAtlas
+from main.resources.infrastructure.number_profile import NumberProfile
+
+
+
+### NumberAtlas Object Tests
+
+@pytest.fixture
+def batch_info():
+    return BatchNumberInfo(SieveFactorizer())
+
+@pytest.fixture
+def atlas(tmp_path, batch_info):
+    atlas = NumberAtlas(str(tmp_path / "atlas"), size=2000)
+    atlas.load(batch_info)
+    return atlas
+
+
+# Test build method
+def test_build_saves_every_column(tmp_path, batch_info):
+    atlas = NumberAtlas(str(tmp_path / "atlas"), size=100)
+    atlas.build(batch_info)
+    assert sorted([column.replace(" ", "_") + ".npy" for column in NumberAtlas.get_columns()]) == sorted(
+        [file.name for file in (tmp_path / "atlas").iterdir()])
+
+def test_build_no_arguments_raises_error(atlas):
+    with pytest.raises(TypeError):
+        atlas.build()
+
+
+# Test load method
+def test_load_without_build(tmp_path):
+    atlas = NumberAtlas(str(tmp_path / "atlas"), size=100)
+    assert (False, False) == (atlas.load(), atlas.is_loaded())
+
+def test_load_builds_missing_atlas(tmp_path, batch_info):
+    atlas = NumberAtlas(str(tmp_path / "atlas"), size=100)
+    assert (True, True) == (atlas.load(batch_info), atlas.exists())
+
+def test_load_memory_maps_columns(atlas):
+    assert True == isinstance(atlas._columns["factor count"], np.memmap)
+
+def test_load_existing_atlas(tmp_path, atlas):
+    reopened_atlas = NumberAtlas(str(tmp_path / "atlas"), size=2000)
+    assert True == reopened_atlas.load()
+
+
+# Test exists method
+def test_exists_too_small(tmp_path, atlas):
+    assert False == NumberAtlas(str(tmp_path / "atlas"), size=3000).exists()
+
+def test_exists_missing_directory(tmp_path):
+    assert False == NumberAtlas(str(tmp_path / "missing")).exists()
+
+
+# Test get_value method
+def test_get_value_matches_batch_info(atlas, batch_info):
+    number_info = batch_info.get_number_info(np.arange(1, 2001))
+    for column in NumberAtlas.get_columns():
+        assert number_info[column].tolist() == [atlas.get_value(column, x) for x in range(1, 2001)]
+
+def test_get_value_python_types(atlas):
+    assert (bool, int) == (type(atlas.get_value("is prime", 7)), type(atlas.get_value("factor count", 7)))
+
+def test_get_value_not_covered(atlas):
+    assert (None, None) == (atlas.get_value("is prime", 0), atlas.get_value("is prime", 2001))
+
+def test_get_value_not_loaded(tmp_path):
+    assert None == NumberAtlas(str(tmp_path / "atlas")).get_value("is prime", 7)
+
+
+# Test get_values method
+def test_get_values(atlas):
+    assert [False, True, True, False] == atlas.get_values("is prime", [1, 2, 3, 4]).tolist()
+
+
+# Test load_atlas method of the Number class
+def test_load_atlas_number_info_uses_atlas(tmp_path):
+    numbers = Number()
+    assert True == numbers.load_atlas(str(tmp_path / "atlas"), size=500)
+    numbers._info._atlas._columns["factor count"] = np.zeros(500, dtype=np.uint16)
+    assert (0, 4) == (numbers.get_number_info("factor count", 12), numbers.get_number_info("factor count", 501))
+
+def test_load_atlas_without_build(tmp_path):
+    numbers = Number()
+    assert (False, None) == (numbers.load_atlas(str(tmp_path / "atlas"), build=False), numbers._info._atlas)
+
+def test_load_atlas_same_results(tmp_path):
+    numbers = Number()
+    expected = [numbers.get_number_info("is prime", x) for x in range(-10, 600)]
+    numbers.load_atlas(str(tmp_path / "atlas"), size=500)
+    assert expected == [numbers.get_number_info("is prime", x) for x in range(-10, 600)]
+def test_load_atlas_sets_batch_info_atlas(tmp_path):
+    numbers = Number()
+    numbers.load_atlas(str(tmp_path / "atlas"), size=500)
+    assert numbers._atlas is numbers._batch_info._atlas
+
+
+# Test load_atlas_in_background method of the Number class
+def test_load_atlas_in_background_builds_atlas(tmp_path):
+    numbers = Number()
+    thread = numbers.load_atlas_in_background(str(tmp_path / "atlas"), size=500)
+    thread.join()
+    assert (True, True) == (numbers._atlas.exists(), numbers._info._atlas is numbers._atlas)
+
+def test_load_atlas_in_background_existing_atlas(tmp_path, batch_info):
+    NumberAtlas(str(tmp_path / "atlas"), size=500).build(batch_info)
+    numbers = Number()
+    assert (None, True) == (numbers.load_atlas_in_background(str(tmp_path / "atlas"), size=500),
+                            numbers._atlas.is_loaded())
+
+def test_load_atlas_in_background_not_ready(tmp_path):
+    numbers = Number()
+    thread = numbers.load_atlas_in_background(str(tmp_path / "atlas"), size=10**5)
+    assert 6 == numbers.get_number_info("factor count", 12)
+    thread.join()
+
+
+# Test get_number_info method of the BatchNumberInfo class with an atlas
+def test_batch_get_number_info_uses_atlas(atlas, batch_info):
+    batch_info.set_atlas(atlas)
+    atlas._columns["factor count"] = np.zeros(2000, dtype=np.uint16)
+    assert [0, 0, 2, 12] == batch_info.get_number_info([1, 12, 2003, 2004])["factor count"].tolist()
+
+def test_batch_get_number_info_same_results(atlas):
+    numbers = np.arange(-50, 2500)
+    expected = BatchNumberInfo(SieveFactorizer()).get_number_info(numbers)
+    batch_info = BatchNumberInfo(SieveFactorizer())
+    batch_info.set_atlas(atlas)
+    number_info = batch_info.get_number_info(numbers)
+    assert {column: values.tolist() for column, values in expected.items()} == {
+        column: values.tolist() for column, values in number_info.items()}
+
+def test_batch_get_number_info_atlas_skips_sieve(atlas):
+    factorizer = SieveFactorizer()
+    batch_info = BatchNumberInfo(factorizer)
+    batch_info.set_atlas(atlas)
+    batch_info.get_number_info(np.arange(1, 2001))
+    assert None == factorizer._smallest_prime_factors
+
+
+# Test NumberProfile objects made with an atlas
+def test_number_profile_reads_atlas(atlas):
+    atlas._columns["digit factors"] = np.zeros(2000, dtype=np.uint8)
+    profile = NumberProfile(72, SieveFactorizer(), atlas)
+    assert (0, 1) == (profile.digit_factor_count, NumberProfile(72, SieveFactorizer()).digit_factor_count)
+
+def test_number_profile_atlas_same_results(atlas):
+    factorizer = SieveFactorizer()
+    for x in range(-10, 2100):
+        with_atlas, without_atlas = NumberProfile(x, factorizer, atlas), NumberProfile(x, factorizer)
+        assert [getattr(without_atlas, name) for name in NumberProfile.__slots__] == [
+            getattr(with_atlas, name) for name in NumberProfile.__slots__]
@@ -0,0 +1,74 @@
+import pytest
+from main.resources.infrastructure.number import NumberInfo
+from main.resources.infrastructure.factorization import SieveFactorizer
+from main.resources.infrastructure.number_profile import NumberProfile
+
+
+
+### NumberProfile Object Tests
+
+@pytest.fixture
+def factorizer():
+    return SieveFactorizer()
+
+@pytest.fixture
+def profile_seventy_two(factorizer):
+    return NumberProfile(72, factorizer)
+
+
+# Test __init__ method
+def test_init_factors(profile_seventy_two):
+    assert (1, 2, 3, 4, 6, 8, 9, 12, 18, 24, 36, 72) == profile_seventy_two.factors
+
+def test_init_prime_factors(profile_seventy_two):
+    assert (2, 3) == profile_seventy_two.prime_factors
+
+def test_init_digits(profile_seventy_two):
+    assert ((7, 2), 9, 2) == (profile_seventy_two.digits, profile_seventy_two.digit_sum, profile_seventy_two.digit_length)
+
+def test_init_digit_factor_count(profile_seventy_two):
+    assert 1 == profile_seventy_two.digit_factor_count
+
+def test_init_flags(profile_seventy_two):
+    assert (False, False, False) == (profile_seventy_two.is_prime, profile_seventy_two.is_perfect_square,
+                                     profile_seventy_two.is_perfect_cube)
+
+def test_init_negative(factorizer):
+    profile = NumberProfile(-27, factorizer)
+    assert ((), (), (2, 7), True) == (profile.factors, profile.prime_factors, profile.digits, profile.is_perfect_cube)
+
+def test_init_matches_number_info(factorizer):
+    info = NumberInfo(factorizer)
+    for x in range(-100, 501):
+        profile = NumberProfile(x, factorizer)
+        assert tuple(info.get_formula("factors")(x)) == profile.factors
+        assert tuple(info.get_formula("prime factors")(x)) == profile.prime_factors
+        assert tuple(info.get_formula("digits")(x)) == profile.digits
+        assert info.get_formula("digit factors")(x) == profile.digit_factor_count
+        assert info.get_formula("is prime")(x) == profile.is_prime
+        assert info.get_formula("is perfect square")(x) == profile.is_perfect_square
+        assert info.get_formula("is perfect cube")(x) == profile.is_perfect_cube
+
+def test_init_sequences_immutable(profile_seventy_two):
+    assert all(isinstance(sequence, tuple) for sequence in (profile_seventy_two.factorization, profile_seventy_two.factors,
+                                                           profile_seventy_two.prime_factors, profile_seventy_two.digits))
+
+def test_init_uses_slots(profile_seventy_two):
+    with pytest.raises(AttributeError):
+        profile_seventy_two.extra = 1
+
+def test_init_no_arguments_raises_error():
+    with pytest.raises(TypeError):
+        NumberProfile()
+
+
+# Test get_info method
+def test_get_info_factors(profile_seventy_two):
+    assert profile_seventy_two.factors == profile_seventy_two.get_info("factors")
+
+def test_get_info_is_perfect_square(factorizer):
+    assert True == NumberProfile(49, factorizer).get_info("is perfect square")
+
+def test_get_info_not_found(profile_seventy_two):
+    with pytest.raises(KeyError):
+        profile_seventy_two.get_info("factor")
\ No newline at end of file
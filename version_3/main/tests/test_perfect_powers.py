@@ -0,0 +1,97 @@
+import pytest
+from main.resources.infrastructure.perfect_powers import PerfectPowers
+
+
+
+### PerfectPowers Object Tests
+
+# Test integer_root method
+def test_integer_root_exact_square():
+    assert 7 == PerfectPowers.integer_root(49, 2)
+
+def test_integer_root_rounds_down():
+    assert 7 == PerfectPowers.integer_root(63, 2)
+
+def test_integer_root_exact_cube():
+    assert 12 == PerfectPowers.integer_root(1728, 3)
+
+def test_integer_root_cube_rounds_down():
+    assert 12 == PerfectPowers.integer_root(2196, 3)
+
+def test_integer_root_negative_cube():
+    assert -3 == PerfectPowers.integer_root(-27, 3)
+
+def test_integer_root_higher_power():
+    assert 3 == PerfectPowers.integer_root(3**7, 7)
+
+def test_integer_root_zero():
+    assert 0 == PerfectPowers.integer_root(0, 3)
+
+def test_integer_root_first_power():
+    assert 15 == PerfectPowers.integer_root(15, 1)
+
+def test_integer_root_above_float_precision():
+    x = 2**53 + 1
+    assert x == PerfectPowers.integer_root(x**3, 3)
+
+def test_integer_root_big_integer():
+    x = 10**40 + 7
+    assert x == PerfectPowers.integer_root(x**5 + 1, 5)
+
+def test_integer_root_matches_linear_scan():
+    for k in range(2, 6):
+        for x in range(0, 2000):
+            assert max([i for i in range(0, x + 1) if i**k <= x]) == PerfectPowers.integer_root(x, k)
+
+def test_integer_root_negative_even_power_raises_error():
+    with pytest.raises(ValueError):
+        PerfectPowers.integer_root(-4, 2)
+
+def test_integer_root_zero_power_raises_error():
+    with pytest.raises(ValueError):
+        PerfectPowers.integer_root(4, 0)
+
+def test_integer_root_no_arguments_raises_error():
+    with pytest.raises(TypeError):
+        PerfectPowers.integer_root()
+
+
+# Test is_perfect_power method
+def test_is_perfect_power_yes():
+    assert True == PerfectPowers.is_perfect_power(2**10, 5)
+
+def test_is_perfect_power_no():
+    assert False == PerfectPowers.is_perfect_power(2**10 + 1, 5)
+
+def test_is_perfect_power_negative_odd_power():
+    assert True == PerfectPowers.is_perfect_power(-32, 5)
+
+def test_is_perfect_power_negative_even_power():
+    assert False == PerfectPowers.is_perfect_power(-16, 4)
+
+
+# Test is_perfect_square method
+def test_is_perfect_square_matches_linear_scan():
+    squares = {i**2 for i in range(0, 101)}
+    for x in range(-100, 10001):
+        assert (x in squares) == PerfectPowers.is_perfect_square(x)
+
+def test_is_perfect_square_above_float_precision():
+    x = 2**53 + 1
+    assert True == PerfectPowers.is_perfect_square(x**2)
+    assert False == PerfectPowers.is_perfect_square(x**2 + 1)
+
+def test_is_perfect_square_returns_bool():
+    assert True == isinstance(PerfectPowers.is_perfect_square(16), bool)
+
+
+# Test is_perfect_cube method
+def test_is_perfect_cube_matches_linear_scan():
+    cubes = {i**3 for i in range(-25, 26)}
+    for x in range(-10000, 10001):
+        assert (x in cubes) == PerfectPowers.is_perfect_cube(x)
+
+def test_is_perfect_cube_big_integer():
+    x = -(10**20 + 3)
+    assert True == PerfectPowers.is_perfect_cube(x**3)
+    assert False == PerfectPowers.is_perfect_cube(x**3 - 1)
\ No newline at end of file
@@ -0,0 +1,37 @@
+import pytest
+from main.tests.test_db import sqlite_db_fake, test_db_path
+from main.tests.tests_setup import objects_fake_global_dict
+from main.game.recommendation import *
+
+
+
+### Object Manager Setup
+
+objects_fake_global = objects_fake_global_dict["game_level"]
+
+
+
+### Recommendation Tests
+
+@pytest.fixture
+def recommendation_copy():
+    games = objects_fake_global.get_object("games")
+    games.add_game()
+    yield Recommendation(objects_fake_global, 90)
+    games._games = []
+
+def set_level_id(level_id, sqlite_db_fake, test_db_path):
+    session = objects_fake_global.get_object("session")
+    query = "UPDATE game SET level_of_difficulty_type_id = :level_id WHERE game_id = :game_id;"
+    sqlite_db_fake.run_query(query, {"level_id": level_id, "game_id": session.current_game_id}, _db_path=test_db_path)
+
+
+# Test _get_next_level_of_difficulty method
+@pytest.mark.parametrize("level_id, next_level", [(1, "medium"), (2, "hard"), (3, "expert"), (5, "expert"), (4, "custom")])
+def test_get_next_level_of_difficulty(recommendation_copy, sqlite_db_fake, test_db_path, level_id, next_level):
+    set_level_id(level_id, sqlite_db_fake, test_db_path)
+    assert next_level == recommendation_copy._get_next_level_of_difficulty()
+
+def test_get_next_level_of_difficulty_too_many_arguments_raises_error(recommendation_copy):
+    with pytest.raises(TypeError):
+        recommendation_copy._get_next_level_of_difficulty("extra")
\ No newline at end of file
@@ -37,20 +37,14 @@ def test_add_session_record_to_db(session_fake, sqlite_db_fake, test_db_path):
     session_fake.add_session_record_to_db()
     assert session_count + 1 == sqlite_db_fake.run_query("SELECT COUNT(*) FROM session;", fetch="one", _db_path=test_db_path)[0]
 
-def test_add_session_record_to_db_too_many_arguments_raises_error(session_fake):
-    with pytest.raises(TypeError):
-        session_fake.add_session_record_to_db("extra")
-
-
-# Test _get_session_id method
-def test_get_session_id(session_fake, sqlite_db_fake, test_db_path):
+def test_add_session_record_to_db_session_id_returned(session_fake, sqlite_db_fake, test_db_path):
     sqlite_db_fake.run_query("DELETE FROM session;", _db_path=test_db_path)
-    session_fake.add_session_record_to_db()
-    assert 1 == session_fake._get_session_id()
+    sqlite_db_fake.run_query("INSERT INTO session(time) VALUES (datetime('now', 'localtime'));", _db_path=test_db_path)
+    assert 2 == session_fake.add_session_record_to_db()
 
-def test_get_session_id_too_many_arguments_raises_error(session_fake):
+def test_add_session_record_to_db_too_many_arguments_raises_error(session_fake):
     with pytest.raises(TypeError):
-        session_fake._get_session_id("extra")
+        session_fake.add_session_record_to_db("extra")
 
 
 # Test get_database method
@@ -63,24 +57,42 @@ def test_get_database_too_many_arguments_raises_error(session_fake):
         session_fake.get_database("extra")
 
 
-# Test _get_game_id method
-def test_get_game_id_correct_value(session_fake, sqlite_db_fake, test_db_path):
-    insert_query = f"""INSERT INTO game(session_id, error) VALUES(1, 0);"""
-    sqlite_db_fake.run_query(insert_query, _db_path=test_db_path)
-    assert 1 == session_fake._get_game_id()
+# Test update_database method
+def test_update_database_game_id_kept(session_fake, sqlite_db_fake, test_db_path):
+    sqlite_db_fake.run_query("DELETE FROM game;", _db_path=test_db_path)
+    sqlite_db_fake.run_query("INSERT INTO game(session_id, error) VALUES(1, 0);", _db_path=test_db_path)
+    session_fake.update_database("game", {"settings": settings, "error": False, "error_type": None})
+    assert (2, 2) == (session_fake.current_game_id, session_fake._game_ids[-1])
+
+def test_update_database_game_id_not_read_back(session_fake, sqlite_db_fake, test_db_path, monkeypatch):
+    queries = []
+    run_query = session_fake._db.run_query
+    def run_query_recorded(query, *args, **kwargs):
+        queries.append(query)
+        return run_query(query, *args, **kwargs)
+    monkeypatch.setattr(session_fake._db, "run_query", run_query_recorded)
+    session_fake.update_database("game", {"settings": settings, "error": False, "error_type": None})
+    assert [] == [query for query in queries if "FROM game" in query]
 
-def test_get_game_id_added_to_list(session_fake, sqlite_db_fake, test_db_path):
-    insert_query = f"""INSERT INTO game(session_id, error) VALUES(1, 0);"""
-    sqlite_db_fake.run_query(insert_query, _db_path=test_db_path)
-    game_id = session_fake._get_game_id()
-    assert game_id == session_fake._game_ids[-1]
+def test_update_database_game_error_id_kept(session_fake, sqlite_db_fake, test_db_path):
+    sqlite_db_fake.run_query("DELETE FROM game;", _db_path=test_db_path)
+    session_fake.update_database("game", {"settings": None, "error": True, "error_type": "invalid"})
+    assert 1 == session_fake.current_game_id
 
-def test_get_game_id_too_many_arguments_raises_error(session_fake):
-    with pytest.raises(TypeError):
-        session_fake._get_game_id("extra")
+def test_update_database_outcome_id_kept(session_fake, sqlite_db_fake, test_db_path):
+    for table in ["game", "outcome"]:
+        sqlite_db_fake.run_query(f"DELETE FROM {table};", _db_path=test_db_path)
+    session_fake.update_database("game", {"settings": settings, "error": False, "error_type": None})
+    outcome_obj = session_fake._objects.get_object("data").get_sub_data_object("outcomes", "lose")
+    session_fake.update_database("outcome", {"entry_type": "New", "outcome_obj": outcome_obj})
+    session_fake.update_database("outcome", {"entry_type": "Updated", "update_type": "play_again"})
+    assert 1 == session_fake.current_outcome_id
 
+def test_update_database_outcome_id_cleared_new_game(session_fake):
+    session_fake.current_outcome_id = 1
+    session_fake.update_database("game", {"settings": settings, "error": False, "error_type": None})
+    assert None == session_fake.current_outcome_id
 
-# Test update_database method
 def test_update_database_game_no_error(session_fake, sqlite_db_fake, test_db_path):
     sqlite_db_fake.run_query("DELETE FROM game;", _db_path=test_db_path)
     db_update_params = {"settings": settings, "error": False, "error_type": None}
@@ -276,12 +288,110 @@ def test_get_session_count_two(session_fake, sqlite_db_fake, test_db_path):
     sqlite_db_fake.run_query("INSERT INTO session(time) VALUES (datetime('now', 'localtime'));", _db_path=test_db_path)
     assert 2 == session_fake.get_session_count()
 
+def test_get_session_count_after_delete(session_fake, sqlite_db_fake, test_db_path):
+    for i in range(3):
+        sqlite_db_fake.run_query("INSERT INTO session(time) VALUES (datetime('now', 'localtime'));", _db_path=test_db_path)
+    sqlite_db_fake.run_query("DELETE FROM session WHERE id = (SELECT MIN(id) FROM session);", _db_path=test_db_path)
+    assert 2 == session_fake.get_session_count()
+
 def test_get_session_count_too_many_arguments_raises_error(session_fake):
     with pytest.raises(TypeError):
         session_fake.get_session_count("extra")
 
 
 
+### Write-Behind Session Tests
+
+@pytest.fixture
+def write_behind_session(session_fake, test_db_path):
+    session = Session(objects_fake_global, test_db_path)
+    yield session
+    session.close()
+
+@pytest.fixture
+def guess_params():
+    return {"guess": "6", "hint": None, "feedback": None, "error": False, "error_type": None}
+
+
+# Test get_writer method
+def test_get_writer_write_behind(write_behind_session):
+    assert True == isinstance(write_behind_session.get_writer(), WriteBehindWriter)
+
+def test_get_writer_no_write_behind(session_fake):
+    assert None == session_fake.get_writer()
+
+
+# Test update_database method
+def test_update_database_write_behind_pending(write_behind_session, guess_params):
+    write_behind_session.update_database("game", {"settings": settings, "error": False, "error_type": None})
+    write_behind_session.update_database("guess", guess_params)
+    write_behind_session.update_database("guess", guess_params)
+    assert 2 == write_behind_session.get_writer().get_pending_count()
+
+def test_update_database_write_behind_game_end(write_behind_session, guess_params, sqlite_db_fake, test_db_path):
+    write_behind_session.update_database("game", {"settings": settings, "error": False, "error_type": None})
+    write_behind_session.update_database("guess", guess_params)
+    outcome_obj = write_behind_session._objects.get_object("data").get_sub_data_object("outcomes", "lose")
+    write_behind_session.update_database("outcome", {"entry_type": "New", "outcome_obj": outcome_obj})
+    guess_count_query = f"SELECT COUNT(*) FROM guess WHERE session_id = {write_behind_session.session_id};"
+    outcome_count_query = f"SELECT COUNT(*) FROM outcome WHERE session_id = {write_behind_session.session_id};"
+    assert (0, (1,), (1,)) == (write_behind_session.get_writer().get_pending_count(),
+                               sqlite_db_fake.run_query(guess_count_query, fetch="one", _db_path=test_db_path),
+                               sqlite_db_fake.run_query(outcome_count_query, fetch="one", _db_path=test_db_path))
+
+
+def test_update_database_write_behind_hinted_guess_not_flushed(write_behind_session, guess_params, monkeypatch):
+    write_behind_session.update_database("game", {"settings": settings, "error": False, "error_type": None})
+    flushes = []
+    monkeypatch.setattr(write_behind_session.get_writer(), "flush", lambda: flushes.append(True))
+    guess_params.update({"hint": prime_hint, "feedback": "good"})
+    write_behind_session.update_database("guess", guess_params)
+    write_behind_session.update_database("guess", guess_params)
+    assert ([], 2, 2) == (flushes, write_behind_session.get_writer().get_pending_count(),
+                          write_behind_session.current_hint_count)
+
+
+# Test get_total_hints_given method
+def test_get_total_hints_given_write_behind(write_behind_session, guess_params):
+    write_behind_session.update_database("game", {"settings": settings, "error": False, "error_type": None})
+    guess_params.update({"hint": prime_hint, "feedback": "good"})
+    write_behind_session.update_database("guess", guess_params)
+    write_behind_session.update_database("guess", guess_params)
+    assert (2,) == write_behind_session.get_total_hints_given()
+
+
+# Test flush_writes method
+def test_flush_writes(write_behind_session, guess_params, sqlite_db_fake, test_db_path):
+    write_behind_session.update_database("game", {"settings": settings, "error": False, "error_type": None})
+    write_behind_session.update_database("guess", guess_params)
+    write_behind_session.flush_writes()
+    guess_count_query = f"SELECT COUNT(*) FROM guess WHERE session_id = {write_behind_session.session_id};"
+    assert (1,) == sqlite_db_fake.run_query(guess_count_query, fetch="one", _db_path=test_db_path)
+
+def test_flush_writes_no_write_behind(session_fake):
+    session_fake.flush_writes()
+    assert None == session_fake.get_writer()
+
+def test_flush_writes_too_many_arguments_raises_error(write_behind_session):
+    with pytest.raises(TypeError):
+        write_behind_session.flush_writes("extra")
+
+
+# Test close method
+def test_close(write_behind_session, guess_params, sqlite_db_fake, test_db_path):
+    write_behind_session.update_database("game", {"settings": settings, "error": False, "error_type": None})
+    write_behind_session.update_database("guess", guess_params)
+    write_behind_session.close()
+    guess_count_query = f"SELECT COUNT(*) FROM guess WHERE session_id = {write_behind_session.session_id};"
+    assert (False, (1,)) == (write_behind_session.get_writer()._thread.is_alive(),
+                             sqlite_db_fake.run_query(guess_count_query, fetch="one", _db_path=test_db_path))
+
+def test_close_too_many_arguments_raises_error(write_behind_session):
+    with pytest.raises(TypeError):
+        write_behind_session.close("extra")
+
+
+
 def test_settings_version_end():
     objects_fake_global = objects_fake_global_dict["easy"]
     settings = objects_fake_global.get_object("settings")
@@ -58,7 +58,7 @@ for level, objects_fake_global in zip(["easy", "medium", "hard"], objects_list):
     
     db_manager = objects_fake_global.create_object(DBManager, "db_manager", ObjectManagerFake, numbers, data)
     db_path = "tests/sqlite_guess_that_number.db"
-    session = objects_fake_global.create_object(Session, "session", ObjectManagerFake, objects_fake_global, db_path)
+    session = objects_fake_global.create_object(Session, "session", ObjectManagerFake, objects_fake_global, db_path, False)
     db_connector = SqliteDBConnector()
     db_connector.run_query(f"DELETE FROM session;", _db_path=db_path)
     
@@ -86,7 +86,7 @@ text_display = objects_game_level.create_object(TextDisplayManager, "text_displa
 
 db_manager = objects_game_level.create_object(DBManager, "db_manager", ObjectManagerFake, numbers, data)
 db_path = "tests/sqlite_guess_that_number.db"
-session = objects_game_level.create_object(Session, "session", ObjectManagerFake, objects_game_level, db_path)
+session = objects_game_level.create_object(Session, "session", ObjectManagerFake, objects_game_level, db_path, False)
 db_connector = SqliteDBConnector()
 db_connector.run_query(f"DELETE FROM session;", _db_path=db_path)
 